@@ -745,7 +745,7 @@ class Device(abc.ABC):
 
         # Check whether the circuit was broadcasted (then the Hamiltonian-expanded
         # ones will be as well) and whether broadcasting is supported
-        if circuit.batch_size is None or self.capabilities().get("supports_broadcasting"):
+        if circuit.batch_size is None or all(self._supports_broadcasting(c) for c in circuits):
             # If the circuit wasn't broadcasted or broadcasting is supported, no action required
             return circuits, hamiltonian_fn
 
@@ -762,6 +762,29 @@ class Device(abc.ABC):
 
         return expanded_tapes, total_processing
 
+    def _supports_broadcasting(self, circuit):
+        """Whether a broadcasted circuit can be executed without expanding it in
+        :meth:`~.batch_transform`.
+
+        Gradient transforms and device gradients differentiate unbroadcasted circuits. Broadcasted
+        circuits with trainable parameters are thus only executed as they are by devices that are
+        differentiated with backpropagation.
+
+        Args:
+            circuit (.QuantumTape): the broadcasted circuit
+
+        Returns:
+            bool: whether the circuit can be executed without expanding it
+        """
+        capabilities = self.capabilities()
+
+        if "passthru_interface" not in capabilities and qml.math.get_trainable_indices(
+            circuit.get_parameters(trainable_only=False)
+        ):
+            return False
+
+        return bool(capabilities.get("supports_broadcasting"))
+
     @property
     def op_queue(self):
         """The operation queue to be applied.
@@ -19,8 +19,11 @@ This module contains the :class:`QubitDevice` abstract base class.
 # e.g. instead of expval(self, observable, wires, par) have expval(self, observable)
 # pylint: disable=arguments-differ, abstract-method, no-value-for-parameter,too-many-instance-attributes,too-many-branches, no-member, bad-option-value, arguments-renamed
 import abc
+import copy
+import functools
 import itertools
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 import numpy as np
 
@@ -46,6 +49,77 @@ from pennylane.wires import Wires
 from pennylane.measurements import MeasurementProcess
 
 
+_FINAL_STATE_ATTRIBUTES = ("_state", "_pre_rotated_state", "_binary_samples", "_packed_samples")
+"""tuple[str]: attributes holding the device state after an execution, which are copied back
+from the workers of a parallel batch to the device that distributed it"""
+
+
+def _execute_chunk(device, circuits, seed=None, return_state=False, keep_states=False):
+    """Executes a sequence of circuits one after another on a (cloned) device.
+
+    This function is used by :meth:`QubitDevice.batch_execute` to distribute the
+    circuits of a batch across workers. It is defined at the module level
+    so that it can be pickled and sent to worker processes.
+
+    Args:
+        device (QubitDevice): device clone owned by the worker
+        circuits (list[.tapes.QuantumTape]): circuits to execute on the device
+        seed (None, int): If provided, the global NumPy random number generator of the
+            worker is seeded with this value, so that worker processes forked from the
+            same parent draw independent samples.
+        return_state (bool): whether to return the device state after the last execution
+        keep_states (bool): whether to return the pre-rotated state after each execution
+
+    Returns:
+        tuple[list[array[float]], dict or None, list[array[complex]] or None]: list of measured
+        value(s), the attributes of the device listed in ``_FINAL_STATE_ATTRIBUTES`` if
+        ``return_state=True``, and the pre-rotated states of the circuits if ``keep_states=True``
+    """
+    if seed is not None:
+        np.random.seed(seed)
+
+    # executions are tracked by the device that distributed the batch
+    device.tracker = qml.Tracker()
+
+    results = []
+    states = [] if keep_states else None
+    for circuit in circuits:
+        device.reset()
+        results.append(device.execute(circuit))
+
+        if keep_states:
+            states.append(device._pre_rotated_state)  # pylint: disable=protected-access
+
+    if not return_state:
+        return results, None, states
+
+    return (
+        results,
+        {attr: getattr(device, attr) for attr in _FINAL_STATE_ATTRIBUTES if hasattr(device, attr)},
+        states,
+    )
+
+
+def _sample_chunk(cdf, shots, seed):
+    """Samples basis states from a cumulative probability distribution.
+
+    This function is used by :meth:`QubitDevice.generate_packed_samples` to draw the
+    samples of a single chunk. Each chunk uses its own random number generator,
+    so chunks can be sampled concurrently and in any order.
+
+    Args:
+        cdf (array[float]): cumulative probabilities of the computational basis states,
+            normalized such that the last entry is one
+        shots (int): number of samples to draw
+        seed (numpy.random.SeedSequence): seed of the random number generator of the chunk
+
+    Returns:
+        array[int]: the sampled basis states in base 10 representation
+    """
+    uniform = np.random.default_rng(seed).random(shots)
+    return np.searchsorted(cdf, uniform, side="right")
+
+
 class QubitDevice(Device):
     """Abstract base class for PennyLane qubit devices.
 
@@ -84,6 +158,21 @@ class QubitDevice(Device):
             If a list of integers is passed, the circuit evaluations are batched over the list of shots.
         r_dtype: Real floating point precision type.
         c_dtype: Complex floating point precision type.
+        max_workers (None, int): Number of workers used to execute the circuits of a batch in
+            parallel in :meth:`~.batch_execute`. If ``None`` (the default), the circuits of a
+            batch are executed one after another.
+        batch_executor (str, concurrent.futures.Executor): Executor used to distribute the circuits
+            of a batch when ``max_workers`` is set. Either ``"thread"`` for a thread pool, which is
+            suited for devices whose simulation kernels release the GIL, ``"process"`` for a
+            process pool, which requires the device and circuits to be picklable, or a user-provided
+            executor instance. Pools are created on the first parallel batch and reused by the
+            following ones.
+        packed_samples (bool): If ``True``, samples are drawn with :meth:`~.generate_packed_samples`
+            and stored as one integer per shot. Probabilities, counts and expectation values are
+            then computed directly from these integers, and the array of bits of
+            each shot is only created when raw samples are requested.
+        sampling_workers (None, int): Number of threads used to draw packed samples.
+            Defaults to ``None``, in which case the samples are drawn in the calling thread.
     """
 
     # pylint: disable=too-many-public-methods
@@ -118,6 +207,25 @@ class QubitDevice(Device):
         """Data type preserving multiply operation"""
         return qmlmul(constant, array, dtype=array.dtype)
 
+    @staticmethod
+    def _get_batch_size(tensor, expected_ndim):
+        """Determine the size of the broadcasting axis of a tensor.
+
+        Args:
+            tensor (tensor_like): the tensor
+            expected_ndim (int): number of dimensions of the tensor without broadcasting
+
+        Returns:
+            int or None: the size of the leading axis if the tensor has one more dimension
+            than expected, else ``None``
+        """
+        shape = qml.math.shape(tensor)
+
+        if len(shape) > expected_ndim:
+            return shape[0]
+
+        return None
+
     def _permute_wires(self, observable):
         r"""Given an observable which acts on multiple wires, permute the wires to
           be consistent with the device wire order.
@@ -192,7 +300,17 @@ class QubitDevice(Device):
     }
 
     def __init__(
-        self, wires=1, shots=None, *, r_dtype=np.float64, c_dtype=np.complex128, analytic=None
+        self,
+        wires=1,
+        shots=None,
+        *,
+        r_dtype=np.float64,
+        c_dtype=np.complex128,
+        analytic=None,
+        max_workers=None,
+        batch_executor="thread",
+        packed_samples=False,
+        sampling_workers=None,
     ):
         super().__init__(wires=wires, shots=shots, analytic=analytic)
 
@@ -204,9 +322,54 @@ class QubitDevice(Device):
         self.C_DTYPE = c_dtype
         self.R_DTYPE = r_dtype
 
-        self._samples = None
+        if max_workers is not None and max_workers < 1:
+            raise DeviceError("The number of workers must be a positive integer.")
+        if not isinstance(batch_executor, Executor) and batch_executor not in ("thread", "process"):
+            raise DeviceError(
+                f"Unknown batch executor {batch_executor}. Must be one of 'thread', 'process' "
+                "or a concurrent.futures.Executor instance."
+            )
+
+        if sampling_workers is not None and sampling_workers < 1:
+            raise DeviceError("The number of sampling workers must be a positive integer.")
+
+        self.max_workers = max_workers
+        self.batch_executor = batch_executor
+        self.packed_samples = packed_samples
+        self.sampling_workers = sampling_workers
+
+        self._binary_samples = None
+        self._packed_samples = None
+        """None or array[int]: stores the samples generated by :meth:`~.generate_packed_samples`
+        in base 10 representation, *after* rotation to diagonalize the observables."""
+
+        self._kept_states = None
+        """None or list[array[complex]]: if a list, :meth:`~.batch_execute` appends the
+        pre-rotated state of every executed circuit to it"""
+
+        self._executor = None
+        """None or concurrent.futures.Executor: the pool that executes the parallel batches"""
+
+    # Number of shots drawn by a single random number generator in generate_packed_samples
+    _sample_chunk_size = 2**16
+
+    @property
+    def _samples(self):
         """None or array[int]: stores the samples generated by the device
-        *after* rotation to diagonalize the observables."""
+        *after* rotation to diagonalize the observables.
+
+        If the samples are stored in packed form, their binary representation
+        is created on first access.
+        """
+        if self._binary_samples is None and self._packed_samples is not None:
+            self._binary_samples = self.states_to_binary(self._packed_samples, self.num_wires)
+
+        return self._binary_samples
+
+    @_samples.setter
+    def _samples(self, samples):
+        self._binary_samples = samples
+        self._packed_samples = None
 
     @classmethod
     def capabilities(cls):
@@ -261,7 +424,11 @@ class QubitDevice(Device):
 
         # generate computational basis samples
         if self.shots is not None or circuit.is_sampled:
-            self._samples = self.generate_samples()
+            if self.packed_samples:
+                self._samples = None
+                self._packed_samples = self.generate_packed_samples()
+            else:
+                self._samples = self.generate_samples()
 
         multiple_sampled_jobs = circuit.is_sampled and self._has_partitioned_shots()
 
@@ -299,6 +466,11 @@ class QubitDevice(Device):
         else:
             results = self.statistics(circuit.observables)
 
+            if circuit.batch_size:
+                # move the broadcasting axis in front of the measurements, such that the results
+                # have the same shape as those of the expanded circuits
+                results = results[0] if len(results) == 1 else qml.math.stack(results, axis=1)
+
         if not circuit.is_sampled:
 
             ret_types = [m.return_type for m in circuit.measurements]
@@ -341,6 +513,12 @@ class QubitDevice(Device):
         The circuits are represented by tapes, and they are executed one-by-one using the
         device's ``execute`` method. The results are collected in a list.
 
+        If the device was created with ``max_workers``, the batch is split into contiguous
+        chunks that are executed in parallel by the ``batch_executor``, each on its own
+        clone of the device. The results are returned in the order the circuits were submitted,
+        and the state and samples of the last circuit are copied back to the device, as for
+        a sequential batch.
+
         For plugin developers: This function should be overwritten if the device can efficiently run multiple
         circuits on a backend, for example using parallel and/or asynchronous executions.
 
@@ -353,14 +531,20 @@ class QubitDevice(Device):
         # TODO: This method and the tests can be globally implemented by Device
         # once it has the same signature in the execute() method
 
-        results = []
-        for circuit in circuits:
-            # we need to reset the device here, else it will
-            # not start the next computation in the zero state
-            self.reset()
+        if self.max_workers is not None and len(circuits) > 1:
+            results = self._parallel_batch_execute(circuits)
+        else:
+            results = []
+            for circuit in circuits:
+                # we need to reset the device here, else it will
+                # not start the next computation in the zero state
+                self.reset()
 
-            res = self.execute(circuit)
-            results.append(res)
+                res = self.execute(circuit)
+                results.append(res)
+
+                if self._kept_states is not None:
+                    self._kept_states.append(self._pre_rotated_state)
 
         if self.tracker.active:
             self.tracker.update(batches=1, batch_len=len(circuits))
@@ -368,6 +552,90 @@ class QubitDevice(Device):
 
         return results
 
+    def _get_executor(self):
+        """Return the executor that distributes the circuits of a batch over the workers.
+
+        A user-provided ``batch_executor`` is returned as it is. Otherwise, a thread or process
+        pool with ``max_workers`` workers is created on the first call, and reused by all
+        following batches.
+
+        Returns:
+            concurrent.futures.Executor: the executor
+        """
+        if isinstance(self.batch_executor, Executor):
+            return self.batch_executor
+
+        if self._executor is None:
+            pool = ThreadPoolExecutor if self.batch_executor == "thread" else ProcessPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+
+        return self._executor
+
+    def __getstate__(self):
+        # the pool of the device is neither copied nor pickled along with it
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def _parallel_batch_execute(self, circuits):
+        """Execute a batch of quantum circuits in parallel using the device's batch executor.
+
+        Args:
+            circuits (list[.tapes.QuantumTape]): circuits to execute on the device
+
+        Returns:
+            list[array[float]]: list of measured value(s), in the order of ``circuits``
+        """
+        num_chunks = min(self.max_workers, len(circuits))
+        bounds = np.linspace(0, len(circuits), num_chunks + 1, dtype=int)
+        chunks = [circuits[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        # every chunk is executed on its own copy of the device, such that workers
+        # never share a state; the tracker and executors are not copied along
+        tracker, self.tracker = self.tracker, qml.Tracker()
+        batch_executor, self.batch_executor = self.batch_executor, "thread"
+        kept_states, self._kept_states = self._kept_states, None
+        try:
+            clones = [copy.deepcopy(self) for _ in chunks]
+        finally:
+            self.tracker = tracker
+            self.batch_executor = batch_executor
+            self._kept_states = kept_states
+
+        executor = self._get_executor()
+
+        # threads share the random number generator of this process
+        seeds = [None] * len(chunks)
+        if isinstance(executor, ProcessPoolExecutor):
+            seeds = np.random.randint(2**31, size=len(chunks)).tolist()
+
+        # only the worker executing the last circuit sends its device state back
+        return_state = [False] * (len(chunks) - 1) + [True]
+        keep_states = [kept_states is not None] * len(chunks)
+
+        chunk_results = list(
+            executor.map(_execute_chunk, clones, chunks, seeds, return_state, keep_states)
+        )
+
+        results = [res for chunk, _, _ in chunk_results for res in chunk]
+
+        if kept_states is not None:
+            kept_states.extend(state for _, _, states in chunk_results for state in states)
+
+        # leave the device in the state of the last circuit, as a sequential batch would
+        for attr, value in chunk_results[-1][1].items():
+            setattr(self, attr, value)
+
+        # the executions took place on the clones, so we record them on this device
+        self._num_executions += len(circuits)
+
+        if self.tracker.active:
+            for _ in circuits:
+                self.tracker.update(executions=1, shots=self._shots)
+                self.tracker.record()
+
+        return results
+
     @abc.abstractmethod
     def apply(self, operations, **kwargs):
         """Apply quantum operations, rotate the circuit into the measurement
@@ -605,6 +873,84 @@ class QubitDevice(Device):
         basis_states = np.arange(number_of_states)
         return np.random.choice(basis_states, shots, p=state_probability)
 
+    def generate_packed_samples(self):
+        r"""Returns the computational basis samples generated for all wires in base 10
+        representation.
+
+        Unlike :meth:`~.generate_samples`, the samples are not converted to binary, so that
+        only a single integer is stored per shot. Each sample is drawn by a binary search of
+        a uniform random number in the cumulative probability distribution. The shots are
+        split into chunks of fixed size, each of which is sampled with an independent
+        random number generator; if ``sampling_workers`` is set, the chunks are sampled
+        in a thread pool. The generators are seeded from the global NumPy random state,
+        so the samples do not depend on the number of workers.
+
+        Returns:
+             array[int]: array of samples in the shape ``(dev.shots,)``
+        """
+        if self.shots is None:
+            raise qml.QuantumFunctionError(
+                "The number of shots has to be explicitly set on the device "
+                "when using sample-based measurements."
+            )
+
+        cdf = np.cumsum(np.asarray(self.analytic_probability(), dtype=np.float64))
+        cdf /= cdf[-1]
+
+        chunk_sizes = [self._sample_chunk_size] * (self.shots // self._sample_chunk_size)
+        if self.shots % self._sample_chunk_size:
+            chunk_sizes.append(self.shots % self._sample_chunk_size)
+
+        entropy = np.random.randint(2**32, size=4, dtype=np.uint64)
+        seeds = np.random.SeedSequence(entropy).spawn(len(chunk_sizes))
+
+        if self.sampling_workers is None or len(chunk_sizes) < 2:
+            chunks = map(_sample_chunk, [cdf] * len(chunk_sizes), chunk_sizes, seeds)
+            return np.concatenate(list(chunks))
+
+        with ThreadPoolExecutor(max_workers=self.sampling_workers) as executor:
+            chunks = executor.map(_sample_chunk, [cdf] * len(chunk_sizes), chunk_sizes, seeds)
+            return np.concatenate(list(chunks))
+
+    def _marginal_packed_samples(self, device_wires, sample_slice=Ellipsis):
+        """Extracts the bits of the given wires from the packed samples.
+
+        Args:
+            device_wires (Iterable[int]): device wires whose bits are extracted, with the
+                first wire corresponding to the most significant bit of the result
+            sample_slice (slice): the samples to consider
+
+        Returns:
+            array[int]: the samples restricted to ``device_wires``, in base 10 representation
+        """
+        samples = self._packed_samples[sample_slice]
+        indices = np.zeros_like(samples)
+
+        for wire in np.array(device_wires, dtype=np.int64):
+            indices = (indices << 1) | ((samples >> (self.num_wires - 1 - wire)) & 1)
+
+        return indices
+
+    def _packed_parity(self, device_wires, sample_slice=Ellipsis):
+        r"""Computes the eigenvalue of a product of observables with eigenvalues :math:`\pm 1`
+        for each of the packed samples.
+
+        Args:
+            device_wires (Iterable[int]): device wires the observables act on
+            sample_slice (slice): the samples to consider
+
+        Returns:
+            array[int]: the eigenvalue :math:`(-1)^p` of each sample, where :math:`p` is the
+            parity of the bits of the sample on ``device_wires``
+        """
+        samples = self._packed_samples[sample_slice]
+        parity = np.zeros_like(samples)
+
+        for wire in np.array(device_wires, dtype=np.int64):
+            parity ^= samples >> (self.num_wires - 1 - wire)
+
+        return 1 - 2 * (parity & 1)
+
     @staticmethod
     def generate_basis_states(num_wires, dtype=np.uint32):
         """
@@ -799,15 +1145,19 @@ class QubitDevice(Device):
         device_wires = self.map_wires(wires)
 
         sample_slice = Ellipsis if shot_range is None else slice(*shot_range)
-        samples = self._samples[sample_slice, device_wires]
 
-        # convert samples from a list of 0, 1 integers, to base 10 representation
-        powers_of_two = 2 ** np.arange(len(device_wires))[::-1]
-        indices = samples @ powers_of_two
+        if self._packed_samples is not None:
+            indices = self._marginal_packed_samples(device_wires, sample_slice)
+        else:
+            samples = self._samples[sample_slice, device_wires]
+
+            # convert samples from a list of 0, 1 integers, to base 10 representation
+            powers_of_two = 2 ** np.arange(len(device_wires))[::-1]
+            indices = samples @ powers_of_two
 
         # count the basis state occurrences, and construct the probability vector
         if bin_size is not None:
-            bins = len(samples) // bin_size
+            bins = len(indices) // bin_size
 
             indices = indices.reshape((bins, -1))
             prob = np.zeros([2 ** len(device_wires), bins], dtype=np.float64)
@@ -820,7 +1170,7 @@ class QubitDevice(Device):
         else:
             basis_states, counts = np.unique(indices, return_counts=True)
             prob = np.zeros([2 ** len(device_wires)], dtype=np.float64)
-            prob[basis_states] = counts / len(samples)
+            prob[basis_states] = counts / len(indices)
 
         return self._asarray(prob, dtype=self.R_DTYPE)
 
@@ -891,16 +1241,22 @@ class QubitDevice(Device):
         device_wires = self.map_wires(wires)
         inactive_device_wires = self.map_wires(inactive_wires)
 
-        # reshape the probability so that each axis corresponds to a wire
-        prob = self._reshape(prob, [2] * self.num_wires)
-
-        # sum over all inactive wires
         # hotfix to catch when default.qubit uses this method
         # since then device_wires is a list
         if isinstance(inactive_device_wires, Wires):
-            prob = self._flatten(self._reduce_sum(prob, inactive_device_wires.labels))
-        else:
+            inactive_device_wires = inactive_device_wires.labels
+
+        # reshape the probability so that each axis corresponds to a wire
+        batch_size = self._get_batch_size(prob, 1)
+
+        if batch_size is None:
+            prob = self._reshape(prob, [2] * self.num_wires)
             prob = self._flatten(self._reduce_sum(prob, inactive_device_wires))
+        else:
+            # the leading axis of broadcasted probabilities is kept
+            prob = self._reshape(prob, [batch_size] + [2] * self.num_wires)
+            prob = self._reduce_sum(prob, [w + 1 for w in inactive_device_wires])
+            prob = self._reshape(prob, [batch_size, -1])
 
         # The wires provided might not be in consecutive order (i.e., wires might be [2, 0]).
         # If this is the case, we must permute the marginalized probability so that
@@ -911,6 +1267,10 @@ class QubitDevice(Device):
 
         powers_of_two = 2 ** np.arange(len(device_wires))[::-1]
         perm = basis_states @ powers_of_two
+
+        if batch_size is not None:
+            return prob[:, perm]
+
         return self._gather(prob, perm)
 
     def expval(self, observable, shot_range=None, bin_size=None):
@@ -921,7 +1281,8 @@ class QubitDevice(Device):
             probs = self.probability(
                 wires=observable.wires, shot_range=shot_range, bin_size=bin_size
             )
-            return probs[idx]
+            # analytic probabilities may be broadcasted along a leading axis
+            return probs[idx] if self.shots is not None else probs[..., idx]
 
         # exact expectation value
         if self.shots is None:
@@ -936,7 +1297,7 @@ class QubitDevice(Device):
             permuted_wires = self._permute_wires(observable)
 
             prob = self.probability(wires=permuted_wires)
-            return self._dot(eigvals, prob)
+            return self._dot(prob, eigvals)
 
         # estimate the ev
         samples = self.sample(observable, shot_range=shot_range, bin_size=bin_size)
@@ -950,7 +1311,9 @@ class QubitDevice(Device):
             probs = self.probability(
                 wires=observable.wires, shot_range=shot_range, bin_size=bin_size
             )
-            return probs[idx] - probs[idx] ** 2
+            # analytic probabilities may be broadcasted along a leading axis
+            prob = probs[idx] if self.shots is not None else probs[..., idx]
+            return prob - prob**2
 
         # exact variance value
         if self.shots is None:
@@ -966,7 +1329,7 @@ class QubitDevice(Device):
             permuted_wires = self._permute_wires(observable)
 
             prob = self.probability(wires=permuted_wires)
-            return self._dot((eigvals**2), prob) - self._dot(eigvals, prob) ** 2
+            return self._dot(prob, eigvals**2) - self._dot(prob, eigvals) ** 2
 
         # estimate the variance
         samples = self.sample(observable, shot_range=shot_range, bin_size=bin_size)
@@ -994,15 +1357,41 @@ class QubitDevice(Device):
             states, counts = np.unique(samples, return_counts=True)
             return dict(zip(states, counts))
 
+        def _packed_samples_to_counts(indices, num_wires):
+            """Group packed samples into a dictionary keyed by their binary representation."""
+            states, counts = np.unique(indices, return_counts=True)
+            return {format(state, f"0{num_wires}b"): count for state, count in zip(states, counts)}
+
         # translate to wire labels used by device
         device_wires = self.map_wires(observable.wires)
         name = observable.name
         sample_slice = Ellipsis if shot_range is None else slice(*shot_range)
         no_observable_provided = isinstance(observable, MeasurementProcess)
+        packed = self._packed_samples is not None
+        pauli_names = {"PauliX", "PauliY", "PauliZ", "Hadamard"}
 
-        if isinstance(name, str) and name in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
+        if isinstance(name, str) and name in pauli_names:
             # Process samples for observables with eigenvalues {1, -1}
-            samples = 1 - 2 * self._samples[sample_slice, device_wires[0]]
+            if packed:
+                samples = self._packed_parity(device_wires, sample_slice)
+            else:
+                samples = 1 - 2 * self._samples[sample_slice, device_wires[0]]
+
+        elif no_observable_provided and packed and counts:
+            # count the packed samples without converting them to binary
+            wires = device_wires if len(observable.wires) != 0 else range(self.num_wires)
+            indices = self._marginal_packed_samples(wires, sample_slice)
+
+            if bin_size is None:
+                return _packed_samples_to_counts(indices, len(wires))
+            return [
+                _packed_samples_to_counts(bin_indices, len(wires))
+                for bin_indices in indices.reshape((-1, bin_size))
+            ]
+
+        elif packed and isinstance(name, list) and set(name) <= pauli_names:
+            # Process samples for Pauli words, whose eigenvalue is the parity of the sampled bits
+            samples = self._packed_parity(device_wires, sample_slice)
 
         elif no_observable_provided:  # if no observable was provided then return the raw samples
             if (
@@ -1016,12 +1405,15 @@ class QubitDevice(Device):
 
             # Replace the basis state in the computational basis with the correct eigenvalue.
             # Extract only the columns of the basis samples required based on ``wires``.
-            samples = self._samples[
-                sample_slice, np.array(device_wires)
-            ]  # Add np.array here for Jax support.
-            powers_of_two = 2 ** np.arange(samples.shape[-1])[::-1]
-            indices = samples @ powers_of_two
-            indices = np.array(indices)  # Add np.array here for Jax support.
+            if packed:
+                indices = self._marginal_packed_samples(device_wires, sample_slice)
+            else:
+                samples = self._samples[
+                    sample_slice, np.array(device_wires)
+                ]  # Add np.array here for Jax support.
+                powers_of_two = 2 ** np.arange(samples.shape[-1])[::-1]
+                indices = samples @ powers_of_two
+                indices = np.array(indices)  # Add np.array here for Jax support.
             try:
                 samples = observable.eigvals()[indices]
             except qml.operation.EigvalsUndefinedError as e:
@@ -1046,7 +1438,40 @@ class QubitDevice(Device):
             else samples.reshape((bin_size, -1))
         )
 
-    def adjoint_jacobian(self, tape, starting_state=None, use_device_state=False):
+    def _adjoint_bra(self, ket, observable):
+        """Applies an observable to a state, as required to initialize the bra states of
+        :meth:`~.adjoint_jacobian`.
+
+        The factors of tensor products are applied one after another, and the terms of a
+        :class:`~.Hamiltonian` are summed up with their coefficients, so that the matrix of the
+        full observable is never constructed.
+
+        Args:
+            ket (array[complex]): the state to apply the observable to
+            observable (.Observable): the observable
+
+        Returns:
+            array[complex]: the state after application of the observable
+        """
+        if observable.name == "Hamiltonian":
+            # the coefficients are not differentiated, and may still be wrapped by an interface
+            coeffs = qml.math.unwrap(observable.coeffs)
+
+            bra = 0
+            for coeff, term in zip(coeffs, observable.ops):
+                bra = bra + coeff * self._adjoint_bra(ket, term)
+            return bra
+
+        if isinstance(observable, qml.operation.Tensor):
+            for factor in observable.obs:
+                ket = self._apply_operation(ket, factor)
+            return ket
+
+        return self._apply_operation(ket, observable)
+
+    def adjoint_jacobian(
+        self, tape, starting_state=None, use_device_state=False, obs_batch_size=None
+    ):
         """Implements the adjoint method outlined in
         `Jones and Gacon <https://arxiv.org/abs/2009.02823>`__ to differentiate an input tape.
 
@@ -1061,8 +1486,15 @@ class QubitDevice(Device):
 
             * Only expectation values are supported as measurements.
 
-            * Does not work for parametrized observables like
-              :class:`~.Hamiltonian` or :class:`~.Hermitian`.
+            * Does not differentiate with respect to the parameters of observables like
+              :class:`~.Hermitian`. :class:`~.Hamiltonian` observables are supported only if
+              their coefficients are not trainable.
+
+        The observables are processed in batches of at most ``obs_batch_size`` observables,
+        each of which requires one state per observable in memory. For every batch, the circuit
+        is scanned backwards starting from the same final state, while the derivatives of the
+        operations are computed only once and shared by all batches. A :class:`~.Hamiltonian`
+        is folded into a single state by summing its terms weighted with their coefficients.
 
         Args:
             tape (.QuantumTape): circuit that the function takes the gradient of
@@ -1073,20 +1505,145 @@ class QubitDevice(Device):
             use_device_state (bool): use current device state to initialize. A forward pass of the same
                 circuit should be the last thing the device has executed. If a ``starting_state`` is
                 provided, that takes precedence.
+            obs_batch_size (None, int): maximum number of observables whose states are kept in memory
+                at the same time. If ``None`` (the default), all observables are processed in a
+                single batch.
 
         Returns:
             array: the derivative of the tape with respect to trainable parameters.
             Dimensions are ``(len(observables), len(trainable_params))``.
 
+        Raises:
+            QuantumFunctionError: if the input tape has measurements that are not expectation values,
+                contains a multi-parameter operation aside from :class:`~.Rot`, or measures a
+                :class:`~.Hamiltonian` with trainable coefficients
+        """
+        if obs_batch_size is not None and obs_batch_size < 1:
+            raise ValueError("The observable batch size must be a positive integer.")
+
+        expanded_ops, d_op_matrices, num_params = self._adjoint_operations(tape)
+        ket = self._adjoint_ket(tape, starting_state, use_device_state)
+
+        n_obs = len(tape.observables)
+        obs_batch_size = obs_batch_size or max(n_obs, 1)
+        jac = np.zeros((n_obs, num_params))
+
+        for start in range(0, n_obs, obs_batch_size):
+            observables = tape.observables[start : start + obs_batch_size]
+
+            bras = np.empty([len(observables)] + [2] * self.num_wires, dtype=np.complex128)
+            for kk, obs in enumerate(observables):
+                bras[kk, ...] = self._adjoint_bra(ket, obs)
+
+            jac[start : start + len(observables)] = self._adjoint_sweep(
+                ket, bras, expanded_ops, d_op_matrices, num_params
+            )
+
+        return jac
+
+    def adjoint_vjp(self, tape, dy, starting_state=None, use_device_state=False):
+        r"""Computes the vector-Jacobian product of a tape with the adjoint method.
+
+        Instead of scanning backwards with one bra per observable :math:`O_i` as
+        in :meth:`~.adjoint_jacobian`, the output gradient :math:`dy` is contracted with the
+        observables into the single bra :math:`\sum_i dy_i O_i |\psi\rangle`. The backward sweep
+        thus costs as much as for a tape with a single observable, independently of the
+        number of measured observables.
+
+        Args:
+            tape (.QuantumTape): circuit that the function takes the gradient of
+            dy (array[float]): gradient of a cost function with respect to the expectation
+                values of the tape. Must have one entry per observable of the tape.
+
+        Keyword Args:
+            starting_state (tensor_like): post-forward pass state to start execution with. It should be
+                complex-valued. Takes precedence over ``use_device_state``.
+            use_device_state (bool): use current device state to initialize. A forward pass of the same
+                circuit should be the last thing the device has executed. If a ``starting_state`` is
+                provided, that takes precedence.
+
+        Returns:
+            array: the vector-Jacobian product, with one entry per trainable parameter
+
         Raises:
             QuantumFunctionError: if the input tape has measurements that are not expectation values
                 or contains a multi-parameter operation aside from :class:`~.Rot`
         """
-        # broadcasted inner product not summing over first dimension of b
-        sum_axes = tuple(range(1, self.num_wires + 1))
-        # pylint: disable=unnecessary-lambda-assignment)
-        dot_product_real = lambda b, k: self._real(qmlsum(self._conj(b) * k, axis=sum_axes))
+        expanded_ops, d_op_matrices, num_params = self._adjoint_operations(tape)
+        dy = np.reshape(qml.math.toarray(dy), [-1])
+
+        if np.allclose(dy, 0):
+            # a zero output gradient requires no simulation
+            return np.zeros(num_params)
+
+        ket = self._adjoint_ket(tape, starting_state, use_device_state)
+
+        bra = np.zeros([2] * self.num_wires, dtype=np.complex128)
+        for coeff, obs in zip(dy, tape.observables):
+            if coeff != 0:
+                bra = bra + coeff * self._adjoint_bra(ket, obs)
+
+        return self._adjoint_sweep(ket, bra[np.newaxis], expanded_ops, d_op_matrices, num_params)[0]
+
+    def execute_and_vjp(self, circuits, method="adjoint_jacobian", **kwargs):
+        """Execute a batch of quantum circuits on the device, and return the results
+        together with functions that compute the vector-Jacobian products of the circuits.
+
+        The circuits are executed with :meth:`~.batch_execute`, in parallel if the device was
+        created with ``max_workers``. With the adjoint method, the final state of each forward
+        pass is kept, such that the vector-Jacobian product of a circuit only requires the
+        backward sweep of :meth:`~.adjoint_vjp`. For any other ``method``, the Jacobian is
+        computed when the vector-Jacobian product is requested.
+
+        Args:
+            circuits (list[.tape.QuantumTape]): circuits to execute on the device
+            method (str): the device method to call to compute the Jacobian of a single circuit
+            **kwargs: keyword argument to pass when calling ``method``
 
+        Returns:
+            tuple[list[array[float]], list[callable]]: Tuple containing list of measured value(s)
+            and list of functions, which map the output gradient ``dy`` of the corresponding
+            circuit to its vector-Jacobian product.
+        """
+        if method != "adjoint_jacobian":
+            gradient_method = getattr(self, method)
+            vjp_fns = [
+                lambda dy, circuit=circuit: qml.gradients.compute_vjp(
+                    dy, gradient_method(circuit, **kwargs)
+                )
+                for circuit in circuits
+            ]
+
+            return self.batch_execute(circuits), vjp_fns
+
+        # the final state is overwritten by the next execution, and is thus kept for each circuit
+        self._kept_states = []
+        try:
+            res = self.batch_execute(circuits)
+            states = self._kept_states
+        finally:
+            self._kept_states = None
+
+        vjp_fns = [
+            functools.partial(self.adjoint_vjp, circuit, starting_state=state)
+            for circuit, state in zip(circuits, states)
+        ]
+
+        return res, vjp_fns
+
+    def _adjoint_operations(self, tape):
+        """Validates a tape for the adjoint method, and collects the operations to
+        scan backwards through together with the derivatives of the trainable operations.
+
+        Args:
+            tape (.QuantumTape): circuit that is differentiated
+
+        Returns:
+            tuple[list[.Operation], list[tuple[int, array] or None], int]: the operations in
+            reversed order, the Jacobian column and derivative matrix of each operation
+            (``None`` for operations that are not trainable), and the number of trainable
+            parameters
+        """
         for m in tape.measurements:
             if m.return_type is not Expectation:
                 raise qml.QuantumFunctionError(
@@ -1094,11 +1651,6 @@ class QubitDevice(Device):
                     f" measurement {m.return_type.value}"
                 )
 
-            if m.obs.name == "Hamiltonian":
-                raise qml.QuantumFunctionError(
-                    "Adjoint differentiation method does not support Hamiltonian observables."
-                )
-
             if not hasattr(m.obs, "base_name"):
                 m.obs.base_name = None  # This is needed for when the observable is a tensor product
 
@@ -1109,20 +1661,6 @@ class QubitDevice(Device):
                 UserWarning,
             )
 
-        # Initialization of state
-        if starting_state is not None:
-            ket = self._reshape(starting_state, [2] * self.num_wires)
-        else:
-            if not use_device_state:
-                self.reset()
-                self.execute(tape)
-            ket = self._pre_rotated_state
-
-        n_obs = len(tape.observables)
-        bras = np.empty([n_obs] + [2] * self.num_wires, dtype=np.complex128)
-        for kk in range(n_obs):
-            bras[kk, ...] = self._apply_operation(ket, tape.observables[kk])
-
         expanded_ops = []
         for op in reversed(tape.operations):
             if op.num_params > 1:
@@ -1141,6 +1679,13 @@ class QubitDevice(Device):
         trainable_params = []
         for k in tape.trainable_params:
             # pylint: disable=protected-access
+            if tape._par_info[k]["op"].name == "Hamiltonian":
+                raise qml.QuantumFunctionError(
+                    "Adjoint differentiation method does not support Hamiltonian observables "
+                    "with trainable coefficients. Mark the coefficients as non-trainable to "
+                    "differentiate with respect to the circuit parameters."
+                )
+
             if hasattr(tape._par_info[k]["op"], "return_type"):
                 warnings.warn(
                     "Differentiating with respect to the input parameters of "
@@ -1154,30 +1699,78 @@ class QubitDevice(Device):
             else:
                 trainable_params.append(k)
 
-        jac = np.zeros((len(tape.observables), len(trainable_params)))
-
+        # the Jacobian column and the derivative of each operation are shared by all bras
+        d_op_matrices = []
         param_number = len(tape.get_parameters(trainable_only=False, operations_only=True)) - 1
         trainable_param_number = len(trainable_params) - 1
         for op in expanded_ops:
+            d_op = None
 
-            if (op.grad_method is not None) and (param_number in trainable_params):
-                d_op_matrix = operation_derivative(op)
+            if op.grad_method is not None:
+                if param_number in trainable_params:
+                    d_op = (trainable_param_number, operation_derivative(op))
+                    trainable_param_number -= 1
+                param_number -= 1
+
+            d_op_matrices.append(d_op)
+
+        return expanded_ops, d_op_matrices, len(trainable_params)
+
+    def _adjoint_ket(self, tape, starting_state=None, use_device_state=False):
+        """Returns the final state of a tape, from which the adjoint method scans backwards.
+
+        Args:
+            tape (.QuantumTape): circuit that is differentiated
+            starting_state (tensor_like): post-forward pass state. Takes precedence over
+                ``use_device_state``.
+            use_device_state (bool): use the current device state
+
+        Returns:
+            array[complex]: the final state of the tape
+        """
+        if starting_state is not None:
+            return self._reshape(starting_state, [2] * self.num_wires)
+
+        if not use_device_state:
+            self.reset()
+            self.execute(tape)
+
+        return self._pre_rotated_state
+
+    def _adjoint_sweep(self, ket, bras, expanded_ops, d_op_matrices, num_params):
+        """Scans backwards through a circuit, starting from its final state and a batch of bras.
+
+        Args:
+            ket (array[complex]): the final state of the circuit
+            bras (array[complex]): the bras, stacked along the first dimension
+            expanded_ops (list[.Operation]): the operations of the circuit in reversed order
+            d_op_matrices (list[tuple[int, array] or None]): the Jacobian column and derivative
+                matrix of each operation, as returned by ``_adjoint_operations``
+            num_params (int): the number of trainable parameters
+
+        Returns:
+            array[float]: the derivatives of the expectation values of the bras, of shape
+            ``(len(bras), num_params)``
+        """
+        # broadcasted inner product not summing over first dimension of b
+        sum_axes = tuple(range(1, self.num_wires + 1))
+        # pylint: disable=unnecessary-lambda-assignment)
+        dot_product_real = lambda b, k: self._real(qmlsum(self._conj(b) * k, axis=sum_axes))
 
+        jac = np.zeros((len(bras), num_params))
+
+        for op, d_op in zip(expanded_ops, d_op_matrices):
             op.inv()
             # Ideally use use op.adjoint() here
             # then we don't have to re-invert the operation at the end
             ket = self._apply_operation(ket, op)
 
-            if op.grad_method is not None:
-                if param_number in trainable_params:
-                    ket_temp = self._apply_unitary(ket, d_op_matrix, op.wires)
-
-                    jac[:, trainable_param_number] = 2 * dot_product_real(bras, ket_temp)
-
-                    trainable_param_number -= 1
-                param_number -= 1
+            if d_op is not None:
+                column, d_op_matrix = d_op
+                ket_temp = self._apply_unitary(ket, d_op_matrix, op.wires)
+                jac[:, column] = 2 * dot_product_real(bras, ket_temp)
 
-            for kk in range(n_obs):
+            for kk in range(len(bras)):
                 bras[kk, ...] = self._apply_operation(bras[kk, ...], op)
             op.inv()
 
@@ -0,0 +1,275 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+Utility functions for representing Pauli words as integer bitmasks.
+
+A Pauli word is stored as a pair of integer bitmasks :math:`(x, z)` representing the operator
+:math:`i^{|x \wedge z|} X^x Z^z`, where bit :math:`k` of :math:`x` (:math:`z`) applies
+:math:`X` (:math:`Z`) to the wire with label :math:`k` in a wire map, and :math:`|x \wedge z|`
+counts the wires acted on by :math:`Y`. The action of the Pauli word on a computational basis
+state is then
+
+.. math::
+
+    i^{|x \wedge z|} X^x Z^z |j\rangle = i^{|x \wedge z|}(-1)^{|j \wedge z|}|j \oplus x\rangle,
+
+where the wire labels of the wire map determine the bits of the basis state :math:`j`.
+
+Bitmasks are stored as unsigned 64-bit integers, unless they act on more than 63 wires, in
+which case arrays of Python integers are used.
+"""
+import itertools as it
+
+import numpy as np
+from autograd.extend import defvjp, primitive
+
+import pennylane as qml
+
+_PAULI_BITS = {"Identity": (0, 0), "PauliX": (1, 0), "PauliY": (1, 1), "PauliZ": (0, 1)}
+"""dict[str, tuple[int, int]]: the X and Z bits of the single-qubit Pauli operators"""
+
+_PAULI_SYMBOLS = {1: "X", 2: "Z", 3: "Y"}
+"""dict[int, str]: the symbols of the Pauli operators, indexed by their X bit plus twice their
+Z bit"""
+
+# parity of the number of set bits of all 16-bit integers
+_PARITY_TABLE = (
+    np.unpackbits(np.arange(2**16, dtype=">u2").view(np.uint8)).reshape(-1, 16).sum(axis=1) % 2
+    == 1
+)
+
+
+def _mask_dtype(num_bits):
+    """Returns the dtype of arrays of bitmasks with the given number of bits."""
+    return object if num_bits > 63 else np.uint64
+
+
+def pauli_word_masks(ops, wire_map):
+    r"""Encodes a sequence of Pauli words as pairs of bitmasks.
+
+    Args:
+        ops (Iterable[.Observable]): the Pauli words
+        wire_map (dict): dictionary containing all wire labels used in the Pauli words as keys,
+            and the positions of their bits in the bitmasks as values
+
+    Returns:
+        tuple[array[int], array[int]] or None: the X and Z bitmasks of the Pauli words, or
+        ``None`` if one of the operators is not a tensor product of Pauli operators acting on
+        distinct wires in ``wire_map``
+
+    **Example**
+
+    >>> pauli_word_masks([qml.PauliX(0) @ qml.PauliY(1), qml.PauliZ(2)], {0: 0, 1: 1, 2: 2})
+    (array([3, 0], dtype=uint64), array([2, 4], dtype=uint64))
+    """
+    x_masks, z_masks = [], []
+
+    for op in ops:
+        x_op, z_op, seen = 0, 0, 0
+
+        for o in qml.operation.Tensor(op).obs:
+            if o.name not in _PAULI_BITS or len(o.wires) != 1 or o.wires[0] not in wire_map:
+                return None
+
+            bit = 1 << wire_map[o.wires[0]]
+
+            if seen & bit:
+                return None
+
+            seen |= bit
+            x, z = _PAULI_BITS[o.name]
+            x_op |= bit * x
+            z_op |= bit * z
+
+        x_masks.append(x_op)
+        z_masks.append(z_op)
+
+    dtype = _mask_dtype(max(wire_map.values(), default=0) + 1)
+    return np.array(x_masks, dtype=dtype), np.array(z_masks, dtype=dtype)
+
+
+def pauli_word_symbols(x, z):
+    r"""Decodes the Pauli word represented by a pair of bitmasks.
+
+    Args:
+        x (int): X bitmask of the Pauli word
+        z (int): Z bitmask of the Pauli word
+
+    Returns:
+        list[tuple[int, str]]: the bit positions and symbols of the Pauli operators in the word
+
+    **Example**
+
+    >>> pauli_word_symbols(3, 6)
+    [(0, 'X'), (1, 'Y'), (2, 'Z')]
+    """
+    x, z = int(x), int(z)
+    return [
+        (wire, _PAULI_SYMBOLS[(x >> wire & 1) | (z >> wire & 1) << 1])
+        for wire in range((x | z).bit_length())
+        if (x | z) >> wire & 1
+    ]
+
+
+def popcount(masks):
+    r"""Counts the number of set bits in each element of an array of bitmasks.
+
+    Args:
+        masks (array[int]): the bitmasks
+
+    Returns:
+        array[int]: the number of set bits of each bitmask
+    """
+    masks = np.asarray(masks)
+
+    if masks.dtype == object:
+        return np.vectorize(lambda mask: bin(mask).count("1"), otypes=[int])(masks)
+
+    masks = masks.astype(np.uint64)
+    masks = masks - ((masks >> 1) & 0x5555555555555555)
+    masks = (masks & 0x3333333333333333) + ((masks >> 2) & 0x3333333333333333)
+    masks = (masks + (masks >> 4)) & 0x0F0F0F0F0F0F0F0F
+
+    return ((masks * 0x0101010101010101) >> 56).astype(int)
+
+
+def parity(masks):
+    """Computes the parity of the number of set bits of each element of an array of bitmasks.
+
+    Args:
+        masks (array[int]): array of non-negative integers
+
+    Returns:
+        array[bool]: ``True`` for the elements with an odd number of set bits
+    """
+    masks = np.asarray(masks)
+
+    if masks.dtype == object:
+        return popcount(masks) % 2 == 1
+
+    quarters = np.ascontiguousarray(masks, dtype=np.uint64).view(np.uint16)
+    quarters = quarters.reshape(np.shape(masks) + (4,))
+
+    return _PARITY_TABLE[quarters[..., 0] ^ quarters[..., 1] ^ quarters[..., 2] ^ quarters[..., 3]]
+
+
+def pack_rows(binary_matrix):
+    """Packs each row of a binary matrix into an array of 64-bit integers.
+
+    This is used to store the X and Z components of the binary symplectic representation of
+    Pauli words acting on any number of wires.
+
+    Args:
+        binary_matrix (array[bool]): the binary matrix
+
+    Returns:
+        array[int]: array of shape ``(rows, ceil(columns / 64))`` with the packed rows
+    """
+    rows, cols = binary_matrix.shape
+    padded = np.zeros((rows, -(-cols // 64) * 64), dtype=bool)
+    padded[:, :cols] = binary_matrix
+
+    return np.packbits(padded, axis=1).view(np.uint64)
+
+
+def jordan_wigner_words(operators):
+    r"""Map fermionic operators with the same number of indices to Pauli words using the
+    Jordan-Wigner mapping.
+
+    The first half of the indices of each fermionic operator label creation operators and the
+    second half label annihilation operators. Fermionic mode :math:`k` is mapped to bit
+    :math:`k` of the bitmasks.
+
+    Args:
+        operators (list[list[int]]): fermionic operators with the same number of indices
+
+    Returns:
+        tuple(array[int], array[int], array[complex]): the X bitmasks, Z bitmasks and coefficients
+        of the Pauli words, each with shape ``(len(operators), 2**m)`` for operators with ``m``
+        indices
+
+    **Example**
+
+    >>> x, z, c = jordan_wigner_words([[1, 0]])
+    >>> x, z, c
+    (array([[3, 3, 3, 3]], dtype=uint64), array([[1, 0, 3, 2]], dtype=uint64),
+     array([[0.  +0.25j, 0.25+0.j  , 0.25+0.j  , 0.  -0.25j]]))
+    """
+    operators = np.array(operators, dtype=int)
+    k, m = operators.shape
+    dtype = _mask_dtype(operators.max() + 1 if m else 0)
+
+    bits = np.left_shift(np.ones((k, m), dtype=dtype), operators.astype(dtype))
+    choices = np.array(list(it.product([False, True], repeat=m)), dtype=bool).reshape(2**m, m)
+
+    x = np.zeros((k, 2**m), dtype=dtype)
+    z = np.zeros((k, 2**m), dtype=dtype)
+    phase = np.zeros((k, 2**m), dtype=int)
+    coeffs = np.ones((k, 2**m), dtype=complex)
+
+    for f in range(m):
+        # a_p^dagger = Z_0...Z_{p-1} (X_p - iY_p) / 2 and a_p = Z_0...Z_{p-1} (X_p + iY_p) / 2
+        x_f = bits[:, f, None]
+        z_f = np.where(choices[:, f], (x_f << 1) - 1, x_f - 1)
+
+        # X^x Z^z X^x_f Z^z_f = (-1)^{|z & x_f|} X^{x ^ x_f} Z^{z ^ z_f}
+        phase = phase + choices[:, f] + 2 * popcount(z & x_f)
+        x = x ^ x_f
+        z = z ^ z_f
+        coeffs = coeffs * np.where(choices[:, f], -0.5j if f < (m + 1) // 2 else 0.5j, 0.5)
+
+    coeffs = coeffs * 1j ** ((phase - popcount(x & z)) % 4)
+
+    return x, z, coeffs
+
+
+def merge_words(x, z, coeffs):
+    r"""Add together the coefficients of identical Pauli words.
+
+    Args:
+        x (array[int]): X bitmasks of the Pauli words
+        z (array[int]): Z bitmasks of the Pauli words
+        coeffs (array[complex]): coefficients of the Pauli words
+
+    Returns:
+        tuple(list[tuple[int, int]], array[complex]): the distinct Pauli words, in the order of
+        their first appearance, and their summed coefficients
+    """
+    index = {}
+    inverse = np.array([index.setdefault(w, len(index)) for w in zip(x.tolist(), z.tolist())])
+
+    order = np.argsort(inverse, kind="stable")
+    starts = np.cumsum(np.bincount(inverse)) - np.bincount(inverse)
+
+    return list(index), _segment_sum(coeffs[order], starts)
+
+
+@primitive
+def _segment_sum(values, starts):
+    r"""Sum the consecutive segments of an array that begin at the given positions.
+
+    Args:
+        values (array[complex]): the array to be summed
+        starts (array[int]): the position of the first element of each segment
+
+    Returns:
+        array[complex]: the sum of each segment
+    """
+    return np.add.reduceat(values, starts)
+
+
+defvjp(
+    _segment_sum,
+    lambda ans, values, starts: lambda g: np.repeat(g, np.diff(np.append(starts, len(values)))),
+)
@@ -36,6 +36,83 @@ ABC_ARRAY = np.array(list(ABC))
 tolerance = 1e-10
 
 
+@functools.lru_cache()
+def _channel_indices(num_wires, channel_wires):
+    """Returns the einsum indices used to apply Kraus operators to a density matrix.
+
+    The indices only depend on the number of device wires and the target wires, and are
+    cached so that they are not rebuilt for every operation.
+
+    Args:
+        num_wires (int): number of wires of the device
+        channel_wires (tuple[int]): consecutive indices of the target wires
+
+    Returns:
+        str: the einsum indices contracting the Kraus operators, the density matrix
+        and the adjoints of the Kraus operators
+    """
+    rho_dim = 2 * num_wires
+    num_ch_wires = len(channel_wires)
+
+    # Tensor indices of the state. For each qubit, need an index for rows *and* columns
+    state_indices = ABC[:rho_dim]
+
+    # row indices of the quantum state affected by this operation
+    row_indices = "".join(ABC_ARRAY[list(channel_wires)].tolist())
+
+    # column indices are shifted by the number of wires
+    col_wires_list = [w + num_wires for w in channel_wires]
+    col_indices = "".join(ABC_ARRAY[col_wires_list].tolist())
+
+    # indices in einsum must be replaced with new ones
+    new_row_indices = ABC[rho_dim : rho_dim + num_ch_wires]
+    new_col_indices = ABC[rho_dim + num_ch_wires : rho_dim + 2 * num_ch_wires]
+
+    # index for summation over Kraus operators
+    kraus_index = ABC[rho_dim + 2 * num_ch_wires : rho_dim + 2 * num_ch_wires + 1]
+
+    # new state indices replace row and column indices with new ones
+    new_state_indices = functools.reduce(
+        lambda old_string, idx_pair: old_string.replace(idx_pair[0], idx_pair[1]),
+        zip(col_indices + row_indices, new_col_indices + new_row_indices),
+        state_indices,
+    )
+
+    # index mapping for einsum, e.g., 'iga,abcdef,idh->gbchef'
+    return (
+        f"{kraus_index}{new_row_indices}{row_indices}, {state_indices},"
+        f"{kraus_index}{col_indices}{new_col_indices}->{new_state_indices}"
+    )
+
+
+@functools.lru_cache()
+def _diagonal_indices(num_wires, channel_wires):
+    """Returns the einsum indices used to apply operations that act elementwise on the
+    density matrix.
+
+    Args:
+        num_wires (int): number of wires of the device
+        channel_wires (tuple[int]): consecutive indices of the target wires
+
+    Returns:
+        tuple[str]: the einsum indices that multiply the rows and columns with a diagonal,
+        that multiply the density matrix elementwise with a superoperator acting on the
+        target wires, that trace out the target wires, and that take the tensor product of
+        the traced-out density matrix with a matrix on the target wires
+    """
+    state_indices = ABC[: 2 * num_wires]
+    row_indices = "".join(ABC_ARRAY[list(channel_wires)].tolist())
+    col_indices = "".join(ABC_ARRAY[[w + num_wires for w in channel_wires]].tolist())
+
+    traced_indices = "".join(i for i in state_indices if i not in row_indices + col_indices)
+
+    diagonal_einsum = f"{row_indices},{state_indices},{col_indices}->{state_indices}"
+    superop_einsum = f"{row_indices}{col_indices},{state_indices}->{state_indices}"
+    trace_einsum = f"{state_indices},{row_indices}{col_indices}->{traced_indices}"
+    identity_einsum = f"{traced_indices},{row_indices}{col_indices}->{state_indices}"
+    return diagonal_einsum, superop_einsum, trace_einsum, identity_einsum
+
+
 class DefaultMixed(QubitDevice):
     """Default qubit device for performing mixed-state computations in PennyLane.
 
@@ -46,6 +123,10 @@ class DefaultMixed(QubitDevice):
         shots (None, int): Number of times the circuit should be evaluated (or sampled) to estimate
             the expectation values. Defaults to ``None`` if not specified, which means that
             outputs are computed exactly.
+        fuse_channels (bool): If ``True``, runs of unitary operations directly preceding a
+            channel and acting only on the wires of the channel are absorbed into its Kraus
+            operators, so that they are applied to the density matrix in a single pass.
+            Defaults to ``False``.
     """
 
     name = "Default mixed-state qubit PennyLane plugin"
@@ -110,6 +191,10 @@ class DefaultMixed(QubitDevice):
         "ECR",
     }
 
+    _dephasing_channels = {"PhaseDamping", "PhaseFlip"}
+    """set[str]: single-qubit channels that only scale the off-diagonal elements of the
+    density matrix, and are applied as an elementwise product"""
+
     _reshape = staticmethod(qnp.reshape)
     _flatten = staticmethod(qnp.flatten)
     _gather = staticmethod(qnp.gather)
@@ -134,7 +219,14 @@ class DefaultMixed(QubitDevice):
         return res
 
     def __init__(
-        self, wires, *, r_dtype=np.float64, c_dtype=np.complex128, shots=None, analytic=None
+        self,
+        wires,
+        *,
+        r_dtype=np.float64,
+        c_dtype=np.complex128,
+        shots=None,
+        analytic=None,
+        fuse_channels=False,
     ):
         if isinstance(wires, int) and wires > 23:
             raise ValueError(
@@ -144,6 +236,7 @@ class DefaultMixed(QubitDevice):
         # call QubitDevice init
         super().__init__(wires, shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic)
         self._debugger = None
+        self.fuse_channels = fuse_channels
 
         # Create the initial state.
         self._state = self._create_basis_state(0)
@@ -234,7 +327,6 @@ class DefaultMixed(QubitDevice):
             wires (Wires): target wires
         """
         channel_wires = self.map_wires(wires)
-        rho_dim = 2 * self.num_wires
         num_ch_wires = len(channel_wires)
 
         # Computes K^\dagger, needed for the transformation K \rho K^\dagger
@@ -248,36 +340,7 @@ class DefaultMixed(QubitDevice):
         kraus = qnp.cast(qnp.reshape(kraus, kraus_shape), dtype=self.C_DTYPE)
         kraus_dagger = qnp.cast(qnp.reshape(kraus_dagger, kraus_shape), dtype=self.C_DTYPE)
 
-        # Tensor indices of the state. For each qubit, need an index for rows *and* columns
-        state_indices = ABC[:rho_dim]
-
-        # row indices of the quantum state affected by this operation
-        row_wires_list = channel_wires.tolist()
-        row_indices = "".join(ABC_ARRAY[row_wires_list].tolist())
-
-        # column indices are shifted by the number of wires
-        col_wires_list = [w + self.num_wires for w in row_wires_list]
-        col_indices = "".join(ABC_ARRAY[col_wires_list].tolist())
-
-        # indices in einsum must be replaced with new ones
-        new_row_indices = ABC[rho_dim : rho_dim + num_ch_wires]
-        new_col_indices = ABC[rho_dim + num_ch_wires : rho_dim + 2 * num_ch_wires]
-
-        # index for summation over Kraus operators
-        kraus_index = ABC[rho_dim + 2 * num_ch_wires : rho_dim + 2 * num_ch_wires + 1]
-
-        # new state indices replace row and column indices with new ones
-        new_state_indices = functools.reduce(
-            lambda old_string, idx_pair: old_string.replace(idx_pair[0], idx_pair[1]),
-            zip(col_indices + row_indices, new_col_indices + new_row_indices),
-            state_indices,
-        )
-
-        # index mapping for einsum, e.g., 'iga,abcdef,idh->gbchef'
-        einsum_indices = (
-            f"{kraus_index}{new_row_indices}{row_indices}, {state_indices},"
-            f"{kraus_index}{col_indices}{new_col_indices}->{new_state_indices}"
-        )
+        einsum_indices = _channel_indices(self.num_wires, tuple(channel_wires.tolist()))
 
         self._state = qnp.einsum(einsum_indices, kraus, self._state, kraus_dagger)
 
@@ -297,20 +360,55 @@ class DefaultMixed(QubitDevice):
         # reshape vectors
         eigvals = qnp.cast(qnp.reshape(eigvals, [2] * len(channel_wires)), dtype=self.C_DTYPE)
 
-        # Tensor indices of the state. For each qubit, need an index for rows *and* columns
-        state_indices = ABC[: 2 * self.num_wires]
+        einsum_indices = _diagonal_indices(self.num_wires, tuple(channel_wires.tolist()))[0]
 
-        # row indices of the quantum state affected by this operation
-        row_wires_list = channel_wires.tolist()
-        row_indices = "".join(ABC_ARRAY[row_wires_list].tolist())
+        self._state = qnp.einsum(einsum_indices, eigvals, self._state, qnp.conj(eigvals))
 
-        # column indices are shifted by the number of wires
-        col_wires_list = [w + self.num_wires for w in row_wires_list]
-        col_indices = "".join(ABC_ARRAY[col_wires_list].tolist())
+    def _apply_dephasing(self, operation):
+        r"""Apply a dephasing channel, which multiplies the off-diagonal elements
+        :math:`\rho_{01}` and :math:`\rho_{10}` of the target qubit by a factor :math:`f`.
+        The channel is diagonal as a superoperator, and is applied as an elementwise product
+        instead of a sum over its Kraus operators.
 
-        einsum_indices = f"{row_indices},{state_indices},{col_indices}->{state_indices}"
+        Args:
+            operation (.Channel): a :class:`~.PhaseDamping` or :class:`~.PhaseFlip` channel
+        """
+        channel_wires = self.map_wires(operation.wires)
+        einsum_indices = _diagonal_indices(self.num_wires, tuple(channel_wires.tolist()))[1]
 
-        self._state = qnp.einsum(einsum_indices, eigvals, self._state, qnp.conj(eigvals))
+        p = operation.parameters[0]
+        factor = qnp.sqrt(1 - p) if operation.name == "PhaseDamping" else 1 - 2 * p
+
+        one = qnp.ones_like(factor)
+        superop = qnp.reshape(qnp.stack([one, factor, factor, one]), [2, 2])
+        superop = qnp.cast(superop, dtype=self.C_DTYPE)
+
+        self._state = qnp.einsum(einsum_indices, superop, self._state)
+
+    def _apply_depolarizing(self, operation):
+        r"""Apply a single-qubit depolarizing channel with probability :math:`p`, using that
+
+        .. math:: \mathcal{E}(\rho) = \left(1 - \frac{4p}{3}\right)\rho
+            + \frac{2p}{3} \operatorname{Tr}_w(\rho) \otimes I_w,
+
+        where :math:`\operatorname{Tr}_w` is the partial trace over the target wire :math:`w`.
+
+        Args:
+            operation (.DepolarizingChannel): the depolarizing channel
+        """
+        channel_wires = self.map_wires(operation.wires)
+        _, _, trace_einsum, identity_einsum = _diagonal_indices(
+            self.num_wires, tuple(channel_wires.tolist())
+        )
+
+        p = operation.parameters[0]
+        coeffs = qnp.cast(qnp.stack([1 - 4 * p / 3, 2 * p / 3]), dtype=self.C_DTYPE)
+        identity = qnp.cast(qnp.eye(2, like=self._state), dtype=self.C_DTYPE)
+
+        traced = qnp.einsum(trace_einsum, self._state, identity)
+        self._state = coeffs[0] * self._state + coeffs[1] * qnp.einsum(
+            identity_einsum, traced, identity
+        )
 
     def _apply_basis_state(self, state, wires):
         """Initialize the device in a specified computational basis state.
@@ -485,6 +583,14 @@ class DefaultMixed(QubitDevice):
                     self._debugger.snapshots[len(self._debugger.snapshots)] = density_matrix
             return
 
+        if operation.name in self._dephasing_channels:
+            self._apply_dephasing(operation)
+            return
+
+        if operation.name == "DepolarizingChannel":
+            self._apply_depolarizing(operation)
+            return
+
         matrices = self._get_kraus(operation)
 
         if operation in diagonal_in_z_basis:
@@ -492,6 +598,71 @@ class DefaultMixed(QubitDevice):
         else:
             self._apply_channel(matrices, wires)
 
+    def _fuse_channels(self, operations):
+        """Absorbs runs of unitary operations into the Kraus operators of the channel
+        that follows them.
+
+        A unitary operation is absorbed if it acts only on the wires of the channel, and is
+        followed by the channel or by other operations that are absorbed into it. Dephasing
+        and depolarizing channels are not fused, since they are applied more efficiently on
+        their own.
+
+        Args:
+            operations (list[~.Operation]): operations to fuse
+
+        Returns:
+            list[tuple[~.Operation, list[array] or None]]: the operations paired with the
+            Kraus operators to apply on their wires instead, or ``None`` if the operation
+            is applied as is
+        """
+        fused = []
+
+        for operation in operations:
+            # dephasing and depolarizing channels are not applied via their Kraus operators
+            shortcut = operation.name in self._dephasing_channels | {"DepolarizingChannel"}
+
+            if shortcut or not isinstance(operation, Channel):
+                fused.append((operation, None))
+                continue
+
+            block = []
+            while fused and self._is_fusable(fused[-1][0], operation.wires):
+                block.insert(0, fused.pop()[0])
+
+            if not block:
+                fused.append((operation, None))
+                continue
+
+            matrix = qnp.cast(block[0].matrix(wire_order=operation.wires), dtype=self.C_DTYPE)
+            for op in block[1:]:
+                op_matrix = qnp.cast(op.matrix(wire_order=operation.wires), dtype=self.C_DTYPE)
+                matrix = qnp.dot(op_matrix, matrix)
+
+            kraus = [
+                qnp.dot(qnp.cast(k, dtype=self.C_DTYPE), matrix) for k in operation.kraus_matrices()
+            ]
+            fused.append((operation, kraus))
+
+        return fused
+
+    @staticmethod
+    def _is_fusable(operation, wires):
+        """Returns whether a unitary operation can be absorbed into a channel acting on ``wires``.
+
+        Args:
+            operation (~.Operation): the operation
+            wires (Wires): the wires of the channel
+
+        Returns:
+            bool: whether the operation can be absorbed into the channel
+        """
+        excluded = (Channel, QubitStateVector, BasisState, QubitDensityMatrix, Snapshot)
+        return (
+            not isinstance(operation, excluded)
+            and operation.has_matrix
+            and set(operation.wires) <= set(wires)
+        )
+
     # pylint: disable=arguments-differ
     def apply(self, operations, rotations=None, **kwargs):
 
@@ -506,8 +677,15 @@ class DefaultMixed(QubitDevice):
                     f"on a {self.short_name} device."
                 )
 
-        for operation in operations:
-            self._apply_operation(operation)
+        if self.fuse_channels:
+            for operation, kraus in self._fuse_channels(operations):
+                if kraus is None:
+                    self._apply_operation(operation)
+                else:
+                    self._apply_channel(kraus, operation.wires)
+        else:
+            for operation in operations:
+                self._apply_operation(operation)
 
         # store the pre-rotated state
         self._pre_rotated_state = self._state
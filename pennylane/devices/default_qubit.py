@@ -27,8 +27,10 @@ from scipy.sparse import csr_matrix
 
 import pennylane as qml
 from pennylane import QubitDevice, DeviceError, QubitStateVector, BasisState, Snapshot
+from pennylane.bitmasks import parity, pauli_word_masks, popcount
+from pennylane.measurements import Expectation, Probability, State, Variance
 from pennylane.ops.qubit.attributes import diagonal_in_z_basis
-from pennylane.wires import WireError
+from pennylane.wires import WireError, Wires
 from .._version import __version__
 
 ABC_ARRAY = np.array(list(ABC))
@@ -79,6 +81,20 @@ class DefaultQubit(QubitDevice):
         shots (None, int): How many times the circuit should be evaluated (or sampled) to estimate
             the expectation values. Defaults to ``None`` if not specified, which means that the device
             returns analytical results.
+        fusion_max_wires (None, int): If provided, runs of adjacent operations that jointly act
+            on at most ``fusion_max_wires`` wires are merged into a single dense unitary before
+            being applied to the state, so that each pass over the state vector does more work.
+            Defaults to ``None``, in which case every operation is applied individually.
+        max_workers (None, int): Number of workers used to execute the circuits of a batch in
+            parallel. Defaults to ``None``, in which case the circuits are executed one after another.
+        batch_executor (str, concurrent.futures.Executor): Executor used to distribute the circuits
+            of a batch when ``max_workers`` is set. One of ``"thread"`` (default), ``"process"``,
+            or an executor instance.
+        packed_samples (bool): If ``True``, samples are stored as one integer per shot, and
+            probabilities, counts and expectation values are computed from these integers
+            without converting them to arrays of bits. Defaults to ``False``.
+        sampling_workers (None, int): Number of threads used to draw packed samples.
+            Defaults to ``None``, in which case the samples are drawn in the calling thread.
     """
 
     name = "Default qubit PennyLane plugin"
@@ -156,15 +172,42 @@ class DefaultQubit(QubitDevice):
         "Projector",
         "SparseHamiltonian",
         "Hamiltonian",
+        "FactorizedHamiltonian",
         "Sum",
     }
 
     def __init__(
-        self, wires, *, r_dtype=np.float64, c_dtype=np.complex128, shots=None, analytic=None
+        self,
+        wires,
+        *,
+        r_dtype=np.float64,
+        c_dtype=np.complex128,
+        shots=None,
+        analytic=None,
+        fusion_max_wires=None,
+        max_workers=None,
+        batch_executor="thread",
+        packed_samples=False,
+        sampling_workers=None,
     ):
-        super().__init__(wires, shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic)
+        super().__init__(
+            wires,
+            shots,
+            r_dtype=r_dtype,
+            c_dtype=c_dtype,
+            analytic=analytic,
+            max_workers=max_workers,
+            batch_executor=batch_executor,
+            packed_samples=packed_samples,
+            sampling_workers=sampling_workers,
+        )
         self._debugger = None
 
+        if fusion_max_wires is not None and fusion_max_wires < 1:
+            raise ValueError("The maximum number of wires of a fused operation must be positive.")
+
+        self.fusion_max_wires = fusion_max_wires
+
         # Create the initial state. Internally, we store the
         # state as an array of dimension [2]*wires.
         self._state = self._create_basis_state(0)
@@ -208,7 +251,8 @@ class DefaultQubit(QubitDevice):
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
 
-        # apply the circuit operations
+        # state preparations are validated before fusion, which removes identities
+        # and merges the operations preceding them
         for i, operation in enumerate(operations):
 
             if i > 0 and isinstance(operation, (QubitStateVector, BasisState)):
@@ -217,13 +261,19 @@ class DefaultQubit(QubitDevice):
                     f"on a {self.short_name} device."
                 )
 
+        if self.fusion_max_wires is not None:
+            operations = self._fuse_operations(operations)
+
+        # apply the circuit operations
+        for operation in operations:
+
             if isinstance(operation, QubitStateVector):
                 self._apply_state_vector(operation.parameters[0], operation.wires)
             elif isinstance(operation, BasisState):
                 self._apply_basis_state(operation.parameters[0], operation.wires)
             elif isinstance(operation, Snapshot):
                 if self._debugger and self._debugger.active:
-                    state_vector = np.array(self._flatten(self._state))
+                    state_vector = np.array(self._flatten_state(self._state))
                     if operation.tag:
                         self._debugger.snapshots[operation.tag] = state_vector
                     else:
@@ -238,6 +288,79 @@ class DefaultQubit(QubitDevice):
         for operation in rotations:
             self._state = self._apply_operation(self._state, operation)
 
+    def _fuse_operations(self, operations):
+        """Merges runs of adjacent operations into single :class:`~.QubitUnitary` operations.
+
+        Consecutive operations are collected into a block as long as the union of their wires
+        contains at most ``fusion_max_wires`` wires. Each block of two or more operations is then
+        replaced by the product of their matrices, expanded onto the wires of the block.
+        State preparations, snapshots, broadcasted operations and operations acting on more than
+        ``fusion_max_wires`` wires interrupt a block and are kept as they are.
+
+        Args:
+            operations (list[~.Operation]): operations to fuse
+
+        Returns:
+            list[~.Operation]: the fused operations
+        """
+        fused_operations = []
+        block = []
+        block_wires = Wires([])
+
+        for operation in operations:
+            if operation.base_name == "Identity":
+                continue
+
+            fusable = (
+                not isinstance(operation, (QubitStateVector, BasisState, Snapshot))
+                and operation.has_matrix
+                and operation.batch_size is None
+                and len(operation.wires) <= self.fusion_max_wires
+            )
+
+            if fusable:
+                new_wires = Wires.all_wires([block_wires, operation.wires])
+
+                if len(new_wires) <= self.fusion_max_wires:
+                    block.append(operation)
+                    block_wires = new_wires
+                    continue
+
+            fused_operations.extend(self._fuse_block(block, block_wires))
+
+            if fusable:
+                block = [operation]
+                block_wires = operation.wires
+            else:
+                fused_operations.append(operation)
+                block = []
+                block_wires = Wires([])
+
+        fused_operations.extend(self._fuse_block(block, block_wires))
+        return fused_operations
+
+    def _fuse_block(self, block, wires):
+        """Returns the product of a sequence of operations as a single operation.
+
+        Args:
+            block (list[~.Operation]): operations to fuse, in the order they are applied
+            wires (Wires): wires that the operations jointly act on
+
+        Returns:
+            list[~.Operation]: a list containing the fused operation, or the original
+            operation if the block does not contain more than one operation
+        """
+        if len(block) < 2:
+            return block
+
+        matrix = self._asarray(block[0].matrix(wire_order=wires), dtype=self.C_DTYPE)
+
+        for operation in block[1:]:
+            op_matrix = self._asarray(operation.matrix(wire_order=wires), dtype=self.C_DTYPE)
+            matrix = self._dot(op_matrix, matrix)
+
+        return [qml.QubitUnitary(matrix, wires=wires, do_queue=False)]
+
     def _apply_operation(self, state, operation):
         """Applies operations to the input state.
 
@@ -253,7 +376,9 @@ class DefaultQubit(QubitDevice):
         wires = operation.wires
 
         if operation.base_name in self._apply_ops:
-            axes = self.wires.indices(wires)
+            # the axes of a broadcasted state are shifted by its leading broadcasting axis
+            shift = int(len(state.shape) > self.num_wires)
+            axes = [ax + shift for ax in self.wires.indices(wires)]
             return self._apply_ops[operation.base_name](state, axes, inverse=operation.inverse)
 
         matrix = self._asarray(self._get_unitary_matrix(operation), dtype=self.C_DTYPE)
@@ -359,8 +484,9 @@ class DefaultQubit(QubitDevice):
         Returns:
             array[complex]: output state
         """
-        sl_0 = _get_slice(0, axes[0], self.num_wires)
-        sl_1 = _get_slice(1, axes[0], self.num_wires)
+        ndim = len(state.shape)
+        sl_0 = _get_slice(0, axes[0], ndim)
+        sl_1 = _get_slice(1, axes[0], ndim)
 
         # We will be slicing into the state according to state[sl_1], giving us all of the
         # amplitudes with a |1> for the control qubit. The resulting array has lost an axis
@@ -392,12 +518,13 @@ class DefaultQubit(QubitDevice):
         Returns:
             array[complex]: output state
         """
+        ndim = len(state.shape)
         cntrl_max = np.argmax(axes[:2])
         cntrl_min = cntrl_max ^ 1
-        sl_a0 = _get_slice(0, axes[cntrl_max], self.num_wires)
-        sl_a1 = _get_slice(1, axes[cntrl_max], self.num_wires)
-        sl_b0 = _get_slice(0, axes[cntrl_min], self.num_wires - 1)
-        sl_b1 = _get_slice(1, axes[cntrl_min], self.num_wires - 1)
+        sl_a0 = _get_slice(0, axes[cntrl_max], ndim)
+        sl_a1 = _get_slice(1, axes[cntrl_max], ndim)
+        sl_b0 = _get_slice(0, axes[cntrl_min], ndim - 1)
+        sl_b1 = _get_slice(1, axes[cntrl_min], ndim - 1)
 
         # If both controls are smaller than the target, shift the target axis down by two. If one
         # control is greater and one control is smaller than the target, shift the target axis
@@ -440,8 +567,9 @@ class DefaultQubit(QubitDevice):
         Returns:
             array[complex]: output state
         """
-        sl_0 = _get_slice(0, axes[0], self.num_wires)
-        sl_1 = _get_slice(1, axes[0], self.num_wires)
+        ndim = len(state.shape)
+        sl_0 = _get_slice(0, axes[0], ndim)
+        sl_1 = _get_slice(1, axes[0], ndim)
 
         if axes[1] > axes[0]:
             target_axes = [axes[1] - 1]
@@ -473,7 +601,8 @@ class DefaultQubit(QubitDevice):
     def expval(self, observable, shot_range=None, bin_size=None):
         """Returns the expectation value of a Hamiltonian observable. When the observable is a
         ``Hamiltonian`` or ``SparseHamiltonian`` object, the expectation value is computed directly
-        from the sparse matrix representation, which leads to faster execution.
+        from the sparse matrix representation, which leads to faster execution. Hamiltonians
+        consisting of Pauli words are evaluated without constructing any matrix.
 
         Args:
             observable (~.Observable): a PennyLane observable
@@ -492,6 +621,16 @@ class DefaultQubit(QubitDevice):
         if observable.name in ("Hamiltonian", "SparseHamiltonian"):
             assert self.shots is None, f"{observable.name} must be used with shots=None"
 
+            if observable.name == "Hamiltonian" and observable.ops:
+                # the first wire corresponds to the most significant bit of the basis states
+                wire_map = {w: self.num_wires - 1 - i for i, w in enumerate(self.wires)}
+                masks = pauli_word_masks(observable.ops, wire_map)
+
+                if masks is not None:
+                    # Note: as below, we use the Hamiltonian's data rather than the coeffs
+                    # attribute, since only the data is unwrapped as required by the interfaces.
+                    return self._pauli_words_expval(observable.data, *masks)
+
             backprop_mode = (
                 not isinstance(self.state, np.ndarray)
                 or any(not isinstance(d, (float, np.ndarray)) for d in observable.data)
@@ -546,8 +685,151 @@ class DefaultQubit(QubitDevice):
 
             return qml.math.real(res)
 
+        if observable.name == "FactorizedHamiltonian":
+            assert self.shots is None, f"{observable.name} must be used with shots=None"
+
+            return self._factorized_hamiltonian_expval(*observable.data, observable.wires)
+
         return super().expval(observable, shot_range=shot_range, bin_size=bin_size)
 
+    def _factorized_hamiltonian_expval(self, core_constant, one, factors, wires):
+        r"""Computes the expectation value of a :class:`~.FactorizedHamiltonian` from the factors
+        of its two-electron integrals, without constructing its Pauli words.
+
+        Each one-body operator :math:`O = \sum_{pq} M_{pq} E_{pq}`, with the spin-summed
+        excitation operators :math:`E_{pq}` under the Jordan-Wigner mapping, is applied to the
+        state as a sum of permutations of its amplitudes. The excitation
+        :math:`c_i^{\dagger} c_j + c_j^{\dagger} c_i` maps :math:`|k \oplus x\rangle` to
+        :math:`(-1)^{|k \wedge b|}|k\rangle` if exactly one of the two spin orbitals is occupied
+        in :math:`|k\rangle`, where :math:`x` flips both spin orbitals and :math:`b` contains the
+        spin orbitals between them. With :math:`|\phi_0\rangle` and :math:`|\phi_r\rangle` the
+        results of applying the one-electron operator and the factors to the state, the
+        expectation value is
+
+        .. math::
+
+            \langle H \rangle = E + \langle\psi|\phi_0\rangle
+            + \frac{1}{2} \sum_r \langle\phi_r|\phi_r\rangle.
+
+        Args:
+            core_constant (float): the contribution of the core orbitals and nuclei
+            one (array[float]): one-electron integrals
+            factors (array[float]): symmetric factors of the two-electron integrals
+            wires (.Wires): wires of the spin orbitals
+
+        Returns:
+            float: the expectation value
+        """
+        state = self.state
+        one, factors = qml.math.toarray(one), qml.math.toarray(factors)
+        n_orbitals = len(one)
+
+        # the one-electron operator absorbs the exchange-like term of the squared factors
+        one = one - 0.5 * np.einsum("rps,rsq->pq", factors, factors)
+        matrices = np.concatenate([one[np.newaxis], factors])
+
+        axes = [self.wire_map[w] for w in wires]
+        indices = np.arange(2**self.num_wires, dtype=np.int64)
+        occupations = (
+            (indices >> (self.num_wires - 1 - np.array(axes)[:, np.newaxis])) & 1
+        ).astype(np.int8)
+        # parity of the occupations of the spin orbitals up to and including each spin orbital
+        parities = np.bitwise_xor.accumulate(occupations, axis=0)
+
+        pairs = list(zip(*np.triu_indices(n_orbitals, k=1)))
+        tensor = self._reshape(state, [2] * self.num_wires)
+        chunk_size = max(1, 4 * qml.utils._SPARSE_CHUNK_SIZE // len(indices))
+        res = 0.0
+
+        for start in range(0, len(matrices), chunk_size):
+            chunk = matrices[start : start + chunk_size]
+
+            diagonal = np.diagonal(chunk, axis1=1, axis2=2) @ (occupations[::2] + occupations[1::2])
+            phi = qml.math.cast(qml.math.convert_like(diagonal, state), self.C_DTYPE) * state
+
+            for pair_start in range(0, len(pairs), chunk_size):
+                excitations = []
+
+                for p, q in pairs[pair_start : pair_start + chunk_size]:
+                    excitation = 0.0
+
+                    for i, j in [(2 * p, 2 * q), (2 * p + 1, 2 * q + 1)]:
+                        signs = (1 - 2 * (parities[j - 1] ^ parities[i])) * (
+                            occupations[i] ^ occupations[j]
+                        )
+                        flipped = self._roll(self._roll(tensor, 1, axes[i]), 1, axes[j])
+                        flipped = self._flatten(flipped)
+                        excitation = excitation + qml.math.convert_like(signs, state) * flipped
+
+                    excitations.append(excitation)
+
+                p, q = np.array(pairs[pair_start : pair_start + chunk_size]).T
+                coeffs = qml.math.cast(qml.math.convert_like(chunk[:, p, q], state), self.C_DTYPE)
+                phi = phi + qml.math.tensordot(coeffs, qml.math.stack(excitations), axes=[[1], [0]])
+
+            if start == 0:
+                res = res + qml.math.real(qml.math.sum(qml.math.conj(state) * phi[0]))
+                phi = phi[1:]
+
+            res = res + 0.5 * qml.math.sum(qml.math.real(qml.math.conj(phi) * phi))
+
+        return qml.math.convert_like(core_constant, res) + res
+
+    def _pauli_words_expval(self, coeffs, x_masks, z_masks):
+        r"""Computes the expectation value of a linear combination of Pauli words
+        without constructing their matrices.
+
+        A Pauli word with X-mask :math:`x`, Z-mask :math:`z` and :math:`n_Y = |x \wedge z|`
+        Pauli-Y factors maps :math:`|j\rangle` to
+        :math:`i^{n_Y}(-1)^{|j \wedge z|}|j \oplus x\rangle`, such that
+
+        .. math::
+
+            \langle\psi|P|\psi\rangle = i^{n_Y}\sum_j (-1)^{|j \wedge z|}
+            \psi^*_{j \oplus x}\psi_j.
+
+        Terms are grouped by their X-mask, so that a single permuted copy of the
+        state serves all terms of a group. All operations on the state and the coefficients
+        are dispatched via ``qml.math``, such that the result is differentiable.
+
+        Args:
+            coeffs (Sequence[tensor_like]): coefficients of the Pauli words
+            x_masks (array[int]): X-masks of the Pauli words
+            z_masks (array[int]): Z-masks of the Pauli words
+
+        Returns:
+            float: the expectation value
+        """
+        state = self.state
+        indices = np.arange(2**self.num_wires, dtype=np.int64)
+        phases = np.array([1, 1j, -1, -1j])[popcount(x_masks & z_masks) % 4]
+
+        # the masks are used as indices of the computational basis states
+        x_masks, z_masks = x_masks.astype(np.int64), z_masks.astype(np.int64)
+        chunk_size = max(1, qml.utils._SPARSE_CHUNK_SIZE // len(indices))
+
+        order = np.argsort(x_masks, kind="stable")
+        x_unique, starts = np.unique(x_masks[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+
+        values = []
+
+        for x, start, end in zip(x_unique, starts, ends):
+            permuted = state if x == 0 else qml.math.gather(state, indices ^ x)
+            product = qml.math.conj(permuted) * state
+
+            for chunk_start in range(start, end, chunk_size):
+                terms = order[chunk_start : min(chunk_start + chunk_size, end)]
+                signs = 1 - 2 * parity(indices & z_masks[terms, np.newaxis])
+                signs = qml.math.cast(
+                    qml.math.convert_like(signs * phases[terms, np.newaxis], state), self.C_DTYPE
+                )
+                values.append(qml.math.real(qml.math.tensordot(signs, product, axes=[[1], [0]])))
+
+        values = qml.math.concatenate(values)
+        coeffs = qml.math.convert_like(qml.math.stack([coeffs[i] for i in order]), values)
+        return qml.math.sum(qml.math.cast_like(coeffs, values) * values)
+
     def _get_unitary_matrix(self, unitary):  # pylint: disable=no-self-use
         """Return the matrix representing a unitary operation.
 
@@ -572,6 +854,7 @@ class DefaultQubit(QubitDevice):
             supports_reversible_diff=True,
             supports_inverse_operations=True,
             supports_analytic_computation=True,
+            supports_broadcasting=True,
             returns_state=True,
             passthru_devices={
                 "tf": "default.qubit.tf",
@@ -582,6 +865,33 @@ class DefaultQubit(QubitDevice):
         )
         return capabilities
 
+    def _supports_broadcasting(self, circuit):
+        """Whether a broadcasted circuit can be simulated with a broadcasted state.
+
+        This is the case for analytic expectation values and variances of observables that are
+        not Hamiltonians, as well as for a single probability or state measurement.
+
+        Args:
+            circuit (.QuantumTape): the broadcasted circuit
+
+        Returns:
+            bool: whether the circuit can be executed without expanding it
+        """
+        if self.shots is not None or not super()._supports_broadcasting(circuit):
+            return False
+
+        return_types = [m.return_type for m in circuit.measurements]
+
+        if len(return_types) == 1 and return_types[0] in (Probability, State):
+            # the density matrix of a subsystem is not broadcasted
+            return return_types[0] is Probability or not circuit.measurements[0].wires
+
+        hamiltonians = ("Hamiltonian", "SparseHamiltonian", "FactorizedHamiltonian", "Sum")
+        return all(
+            ret in (Expectation, Variance) and m.obs.name not in hamiltonians
+            for ret, m in zip(return_types, circuit.measurements)
+        )
+
     def _create_basis_state(self, index):
         """Return a computational basis state over all wires.
 
@@ -599,7 +909,22 @@ class DefaultQubit(QubitDevice):
 
     @property
     def state(self):
-        return self._flatten(self._pre_rotated_state)
+        return self._flatten_state(self._pre_rotated_state)
+
+    def _flatten_state(self, state):
+        """Flattens a state of shape ``[2]*self.num_wires``, keeping the leading axis of a
+        broadcasted state of shape ``[batch_size] + [2]*self.num_wires``.
+
+        Args:
+            state (array[complex]): state to flatten
+
+        Returns:
+            array[complex]: the state vector, or the broadcasted state vectors
+        """
+        if len(state.shape) > self.num_wires:
+            return self._reshape(state, [state.shape[0], 2**self.num_wires])
+
+        return self._flatten(state)
 
     def _apply_state_vector(self, state, device_wires):
         """Initialize the internal state vector in a specified state.
@@ -614,19 +939,23 @@ class DefaultQubit(QubitDevice):
         device_wires = self.map_wires(device_wires)
 
         state = self._asarray(state, dtype=self.C_DTYPE)
-        n_state_vector = state.shape[0]
+        batch_size = self._get_batch_size(state, 1)
+        n_state_vector = state.shape[-1]
 
-        if len(qml.math.shape(state)) != 1 or n_state_vector != 2 ** len(device_wires):
+        if len(qml.math.shape(state)) > 2 or n_state_vector != 2 ** len(device_wires):
             raise ValueError("State vector must be of length 2**wires.")
 
-        norm = qml.math.linalg.norm(state, ord=2)
+        norm = qml.math.linalg.norm(state, ord=2, axis=-1)
         if not qml.math.is_abstract(norm):
             if not qml.math.allclose(norm, 1.0, atol=tolerance):
                 raise ValueError("Sum of amplitudes-squared does not equal one.")
 
+        # broadcasted states keep their leading axis
+        batch_shape = [] if batch_size is None else [batch_size]
+
         if len(device_wires) == self.num_wires and sorted(device_wires) == device_wires:
             # Initialize the entire wires with the state
-            self._state = self._reshape(state, [2] * self.num_wires)
+            self._state = self._reshape(state, batch_shape + [2] * self.num_wires)
             return
 
         # generate basis states on subset of qubits via the cartesian product
@@ -639,8 +968,11 @@ class DefaultQubit(QubitDevice):
         # get indices for which the state is changed to input state vector elements
         ravelled_indices = np.ravel_multi_index(unravelled_indices.T, [2] * self.num_wires)
 
-        state = self._scatter(ravelled_indices, state, [2**self.num_wires])
-        state = self._reshape(state, [2] * self.num_wires)
+        if batch_size is not None:
+            ravelled_indices = (slice(None), ravelled_indices)
+
+        state = self._scatter(ravelled_indices, state, batch_shape + [2**self.num_wires])
+        state = self._reshape(state, batch_shape + [2] * self.num_wires)
         self._state = self._asarray(state, dtype=self.C_DTYPE)
 
     def _apply_basis_state(self, state, wires):
@@ -681,19 +1013,27 @@ class DefaultQubit(QubitDevice):
         Returns:
             array[complex]: output state
         """
+        if self._get_batch_size(mat, 2) is not None:
+            # a broadcasted matrix is applied with einsum, which contracts the batch axes
+            return self._apply_unitary_einsum(state, mat, wires)
+
         # translate to wire labels used by device
         device_wires = self.map_wires(wires)
 
+        # the axes of a broadcasted state are shifted by its leading broadcasting axis
+        shift = int(len(state.shape) > self.num_wires)
+        state_axes = [w + shift for w in device_wires]
+
         mat = self._cast(self._reshape(mat, [2] * len(device_wires) * 2), dtype=self.C_DTYPE)
-        axes = (np.arange(len(device_wires), 2 * len(device_wires)), device_wires)
+        axes = (np.arange(len(device_wires), 2 * len(device_wires)), state_axes)
         tdot = self._tensordot(mat, state, axes=axes)
 
         # tensordot causes the axes given in `wires` to end up in the first positions
         # of the resulting tensor. This corresponds to a (partial) transpose of
         # the correct output state
         # We'll need to invert this permutation to put the indices in the correct place
-        unused_idxs = [idx for idx in range(self.num_wires) if idx not in device_wires]
-        perm = list(device_wires) + unused_idxs
+        unused_idxs = [idx for idx in range(len(state.shape)) if idx not in state_axes]
+        perm = state_axes + unused_idxs
         inv_perm = np.argsort(perm)  # argsort gives inverse permutation
         return self._transpose(tdot, inv_perm)
 
@@ -701,7 +1041,8 @@ class DefaultQubit(QubitDevice):
         r"""Apply multiplication of a matrix to subsystems of the quantum state.
 
         This function uses einsum instead of tensordot. This approach is only
-        faster for single- and two-qubit gates.
+        faster for single- and two-qubit gates. Both the state and the matrix may be
+        broadcasted along a leading axis.
 
         Args:
             state (array[complex]): input state
@@ -714,7 +1055,10 @@ class DefaultQubit(QubitDevice):
         # translate to wire labels used by device
         device_wires = self.map_wires(wires)
 
-        mat = self._cast(self._reshape(mat, [2] * len(device_wires) * 2), dtype=self.C_DTYPE)
+        batch_size = self._get_batch_size(mat, 2)
+        shape = [2] * len(device_wires) * 2
+        shape = shape if batch_size is None else [batch_size] + shape
+        mat = self._cast(self._reshape(mat, shape), dtype=self.C_DTYPE)
 
         # Tensor indices of the quantum state
         state_indices = ABC[: self.num_wires]
@@ -733,8 +1077,11 @@ class DefaultQubit(QubitDevice):
             state_indices,
         )
 
-        # We now put together the indices in the notation numpy's einsum requires
-        einsum_indices = f"{new_indices}{affected_indices},{state_indices}->{new_state_indices}"
+        # We now put together the indices in the notation numpy's einsum requires. The
+        # ellipses stand for the broadcasting axes of the matrix and the state, if any.
+        einsum_indices = (
+            f"...{new_indices}{affected_indices},...{state_indices}->...{new_state_indices}"
+        )
 
         return self._einsum(einsum_indices, mat, state)
 
@@ -755,12 +1102,15 @@ class DefaultQubit(QubitDevice):
         device_wires = self.map_wires(wires)
 
         # reshape vectors
-        phases = self._cast(self._reshape(phases, [2] * len(device_wires)), dtype=self.C_DTYPE)
+        batch_size = self._get_batch_size(phases, 1)
+        shape = [2] * len(device_wires)
+        shape = shape if batch_size is None else [batch_size] + shape
+        phases = self._cast(self._reshape(phases, shape), dtype=self.C_DTYPE)
 
         state_indices = ABC[: self.num_wires]
         affected_indices = "".join(ABC_ARRAY[list(device_wires)].tolist())
 
-        einsum_indices = f"{affected_indices},{state_indices}->{state_indices}"
+        einsum_indices = f"...{affected_indices},...{state_indices}->...{state_indices}"
         return self._einsum(einsum_indices, phases, state)
 
     def reset(self):
@@ -776,7 +1126,7 @@ class DefaultQubit(QubitDevice):
         if self._state is None:
             return None
 
-        flat_state = self._flatten(self._state)
+        flat_state = self._flatten_state(self._state)
         real_state = self._real(flat_state)
         imag_state = self._imag(flat_state)
         prob = self.marginal_prob(real_state**2 + imag_state**2, wires)
@@ -177,6 +177,7 @@ class DefaultQubitJax(DefaultQubit):
         capabilities.update(
             passthru_interface="jax",
             supports_reversible_diff=False,
+            supports_broadcasting=False,
         )
         return capabilities
 
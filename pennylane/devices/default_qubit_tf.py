@@ -174,6 +174,7 @@ class DefaultQubitTF(DefaultQubit):
         capabilities.update(
             passthru_interface="tf",
             supports_reversible_diff=False,
+            supports_broadcasting=False,
         )
         return capabilities
 
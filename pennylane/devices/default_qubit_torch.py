@@ -286,7 +286,11 @@ class DefaultQubitTorch(DefaultQubit):
     @classmethod
     def capabilities(cls):
         capabilities = super().capabilities().copy()
-        capabilities.update(passthru_interface="torch", supports_reversible_diff=False)
+        capabilities.update(
+            passthru_interface="torch",
+            supports_reversible_diff=False,
+            supports_broadcasting=False,
+        )
         return capabilities
 
     def _get_unitary_matrix(self, unitary):
@@ -71,6 +71,9 @@ Utility functions
     compute_vjp
     batch_vjp
     vjp
+    compute_jvp
+    batch_jvp
+    jvp
 
 
 Registering autodifferentiation gradients
@@ -295,6 +298,7 @@ from .parameter_shift import param_shift
 from .parameter_shift_cv import param_shift_cv
 from .parameter_shift_hessian import param_shift_hessian
 from .vjp import compute_vjp, batch_vjp, vjp
+from .jvp import compute_jvp, batch_jvp, jvp
 from .hamiltonian_grad import hamiltonian_grad
 from .general_shift_rules import (
     eigvals_to_frequencies,
@@ -31,7 +31,12 @@ from .gradient_transform import (
     choose_grad_methods,
     gradient_analysis,
 )
-from .general_shift_rules import generate_shifted_tapes
+from .general_shift_rules import (
+    generate_shifted_tapes,
+    _supports_broadcasting,
+    _unstack_broadcasted_results,
+    _validate_broadcast,
+)
 
 
 @functools.lru_cache(maxsize=None)
@@ -164,6 +169,7 @@ def finite_diff(
     strategy="forward",
     f0=None,
     validate_params=True,
+    broadcast=False,
 ):
     r"""Transform a QNode to compute the finite-difference gradient of all gate
     parameters with respect to its inputs.
@@ -191,6 +197,10 @@ def finite_diff(
             the ``Operation.grad_method`` attribute and the circuit structure will be analyzed
             to determine if the trainable parameters support the finite-difference method.
             If ``False``, the finite-difference method will be applied to all parameters.
+        broadcast (bool): Whether or not to use parameter broadcasting to create
+            a single broadcasted tape per operation instead of one tape per shifted point.
+            This only reduces the number of tapes if the finite-difference formula
+            contains more than one shifted term, e.g., for ``strategy="center"``.
 
     Returns:
         tensor_like or tuple[list[QuantumTape], function]:
@@ -273,6 +283,9 @@ def finite_diff(
         )
         return [], lambda _: qml.math.zeros([tape.output_dim, 0])
 
+    if broadcast:
+        _validate_broadcast(tape)
+
     if validate_params:
         if "grad_method" not in tape._par_info[0]:
             gradient_analysis(tape, grad_fn=finite_diff)
@@ -311,11 +324,15 @@ def finite_diff(
             shapes.append(0)
             continue
 
-        g_tapes = generate_shifted_tapes(tape, i, shifts * h)
+        _broadcast = broadcast and _supports_broadcasting(tape, [i], len(shifts))
+        g_tapes = generate_shifted_tapes(tape, i, shifts * h, broadcast=_broadcast)
         gradient_tapes.extend(g_tapes)
-        shapes.append(len(g_tapes))
+        shapes.append(len(shifts))
 
     def processing_fn(results):
+        if broadcast:
+            results = _unstack_broadcasted_results(results, gradient_tapes)
+
         # HOTFIX: Apply the same squeezing as in qml.QNode to make the transform output consistent.
         # pylint: disable=protected-access
         if tape._qfunc_output is not None and not isinstance(tape._qfunc_output, Sequence):
@@ -378,7 +378,24 @@ def generate_multi_shift_rule(frequencies, shifts=None, orders=None):
     return _combine_shift_rules(rules)
 
 
-def generate_shifted_tapes(tape, index, shifts, multipliers=None):
+def _broadcast_shifted_parameter(param, shifts, multipliers):
+    """Stack the shifted values of a parameter along a leading broadcasting axis.
+
+    Args:
+        param (tensor_like): parameter to shift
+        shifts (Sequence[float or int]): shift values
+        multipliers (Sequence[float or int]): multiplier values
+
+    Returns:
+        tensor_like: the shifted parameters, with one more dimension than ``param``
+    """
+    shape = (len(shifts),) + (1,) * qml.math.ndim(param)
+    multipliers = qml.math.reshape(qml.math.convert_like(multipliers, param), shape)
+    shifts = qml.math.reshape(qml.math.convert_like(shifts, param), shape)
+    return param * multipliers + shifts
+
+
+def generate_shifted_tapes(tape, index, shifts, multipliers=None, broadcast=False):
     r"""Generate a list of tapes where one marked trainable parameter has
     been shifted by the provided shift values.
 
@@ -391,31 +408,35 @@ def generate_shifted_tapes(tape, index, shifts, multipliers=None):
             The length should match the one of ``shifts``. Each multiplier scales the
             corresponding gate parameter before the shift is applied. If not provided, the
             parameters will not be scaled.
+        broadcast (bool): If ``True``, a single broadcasted tape is created, in which the
+            shifted values of the parameter are stacked along the broadcasting axis.
+            This requires the operation of the parameter to support broadcasting.
 
     Returns:
         list[QuantumTape]: List of quantum tapes. In each tape the parameter indicated
             by ``index`` has been shifted by the values in ``shifts``. The number of tapes
-            matches the lenth of ``shifts`` and ``multipliers`` (if provided).
+            matches the lenth of ``shifts`` and ``multipliers`` (if provided), or is one
+            if ``broadcast=True``.
     """
-    params = list(tape.get_parameters())
+    param = tape.get_parameters()[index]
     if multipliers is None:
         multipliers = np.ones_like(shifts)
 
+    if broadcast:
+        new_param = _broadcast_shifted_parameter(param, shifts, multipliers)
+        return [tape.bind_new_parameters([new_param], [index])]
+
     tapes = []
 
     for shift, multiplier in zip(shifts, multipliers):
-        new_params = params.copy()
-        shifted_tape = tape.copy(copy_operations=True)
-        new_params[index] = new_params[index] * qml.math.convert_like(multiplier, new_params[index])
-        new_params[index] = new_params[index] + qml.math.convert_like(shift, new_params[index])
-
-        shifted_tape.set_parameters(new_params)
-        tapes.append(shifted_tape)
+        new_param = param * qml.math.convert_like(multiplier, param)
+        new_param = new_param + qml.math.convert_like(shift, new_param)
+        tapes.append(tape.bind_new_parameters([new_param], [index]))
 
     return tapes
 
 
-def generate_multishifted_tapes(tape, indices, shifts, multipliers=None):
+def generate_multishifted_tapes(tape, indices, shifts, multipliers=None, broadcast=False):
     r"""Generate a list of tapes where multiple marked trainable
     parameters have been shifted by the provided shift values.
 
@@ -430,29 +451,112 @@ def generate_multishifted_tapes(tape, indices, shifts, multipliers=None):
             of multiplier values of the same format as `shifts``. Each multiplier
             scales the corresponding gate parameter before the shift is applied.
             If not provided, the parameters will not be scaled.
+        broadcast (bool): If ``True``, a single broadcasted tape is created, in which the
+            shifted values of each parameter are stacked along the broadcasting axis.
+            This requires the operations of the parameters to support broadcasting.
 
     Returns:
         list[QuantumTape]: List of quantum tapes. Each tape has the marked parameters
             indicated by ``indices`` shifted by the values of ``shifts``. The number
             of tapes will match the summed lengths of all inner sequences in ``shifts``
-            and ``multipliers`` (if provided).
+            and ``multipliers`` (if provided), or is one if ``broadcast=True``.
     """
-    params = list(tape.get_parameters())
+    params = tape.get_parameters()
+    params = [params[idx] for idx in indices]
     if multipliers is None:
         multipliers = np.ones_like(shifts)
 
+    if broadcast:
+        new_params = [
+            _broadcast_shifted_parameter(p, np.array(shifts)[:, i], np.array(multipliers)[:, i])
+            for i, p in enumerate(params)
+        ]
+        return [tape.bind_new_parameters(new_params, indices)]
+
     tapes = []
 
     for _shifts, _multipliers in zip(shifts, multipliers):
-        new_params = params.copy()
-        shifted_tape = tape.copy(copy_operations=True)
-        for idx, shift, multiplier in zip(indices, _shifts, _multipliers):
-            dtype = getattr(new_params[idx], "dtype", float)
-            new_params[idx] = new_params[idx] * qml.math.convert_like(multiplier, new_params[idx])
-            new_params[idx] = new_params[idx] + qml.math.convert_like(shift, new_params[idx])
-            new_params[idx] = qml.math.cast(new_params[idx], dtype)
+        new_params = []
+        for p, shift, multiplier in zip(params, _shifts, _multipliers):
+            dtype = getattr(p, "dtype", float)
+            new_param = p * qml.math.convert_like(multiplier, p)
+            new_param = new_param + qml.math.convert_like(shift, new_param)
+            new_params.append(qml.math.cast(new_param, dtype))
 
-        shifted_tape.set_parameters(new_params)
-        tapes.append(shifted_tape)
+        tapes.append(tape.bind_new_parameters(new_params, indices))
 
     return tapes
+
+
+def _validate_broadcast(tape):
+    """Check that the shifted tapes of a tape can be broadcasted.
+
+    Args:
+        tape (.QuantumTape): input quantum tape
+
+    Raises:
+        ValueError: if the tape is broadcasted already, or if it returns multiple
+        measurements that are not all expectation values or variances
+    """
+    if tape.batch_size is not None:
+        raise ValueError(
+            "Broadcasting the parameter shifts is not supported for tapes that are "
+            "broadcasted already, as is the case for higher-order derivatives computed "
+            "with broadcast=True. Consider using param_shift_hessian instead."
+        )
+
+    if len(tape.measurements) > 1 and any(
+        m.return_type not in (qml.measurements.Expectation, qml.measurements.Variance)
+        for m in tape.measurements
+    ):
+        raise ValueError(
+            "Broadcasting the parameter shifts of tapes with multiple measurements is "
+            "only supported for expectation values and variances."
+        )
+
+
+def _supports_broadcasting(tape, indices, num_shifts):
+    """Whether the shifts of the given trainable parameters can be
+    stacked into a single broadcasted tape.
+
+    Args:
+        tape (.QuantumTape): input quantum tape
+        indices (Sequence[int]): indices of the trainable parameters to shift
+        num_shifts (int): number of shifted evaluations
+
+    Returns:
+        bool: ``True`` if there are at least two shifts and all operations
+        of the parameters support broadcasting
+    """
+    if num_shifts < 2:
+        return False
+
+    return all(
+        tape.get_operation(idx)[0] in qml.ops.qubit.attributes.supports_broadcasting
+        for idx in indices
+    )
+
+
+def _unstack_broadcasted_results(results, tapes):
+    """Split the results of broadcasted tapes into the results of the individual
+    shifted evaluations, such that they match the results of unbroadcasted tapes.
+
+    Args:
+        results (list[tensor_like]): results of the executed tapes
+        tapes (list[.QuantumTape]): the executed tapes
+
+    Returns:
+        list[tensor_like]: results with one entry per shifted evaluation
+    """
+    unstacked = []
+
+    for res, tape in zip(results, tapes):
+        if tape.batch_size is None:
+            unstacked.append(res)
+        elif len(tape.measurements) == 1:
+            # unbroadcasted devices wrap the result of a single measurement
+            unstacked.extend(qml.math.expand_dims(r, 0) for r in qml.math.unstack(res))
+        else:
+            unstacked.extend(qml.math.unstack(res))
+
+    return unstacked
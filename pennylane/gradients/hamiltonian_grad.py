@@ -25,7 +25,8 @@ def hamiltonian_grad(tape, idx):
         idx (int): index of parameter that we differentiate with respect to
     """
     op, p_idx = tape.get_operation(idx)
-    new_tape = tape.copy(copy_operations=True)
+    # the operations are shared with the original tape, as only a measurement is replaced
+    new_tape = tape.copy()
 
     # get position in queue
     queue_position = tape.observables.index(op)
@@ -0,0 +1,300 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains functions for computing the Jacobian-vector product
+of tapes.
+"""
+import numpy as np
+
+from pennylane import math
+
+
+def compute_jvp(tangent, jac):
+    """Convenience function to compute the Jacobian-vector product for a given
+    tangent vector and a Jacobian.
+
+    Args:
+        tangent (tensor_like): tangent vector of the tape parameters
+        jac (tensor_like): Jacobian matrix. The last dimension of ``jac``
+            should match the length of the flattened ``tangent`` vector.
+
+    Returns:
+        tensor_like: the flattened Jacobian-vector product
+
+    **Example**
+
+    >>> tangent = np.array([1.0, 0.0, 2.0])
+    >>> jac = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+    >>> qml.gradients.compute_jvp(tangent, jac)
+    array([0.7, 1.6])
+    """
+    if jac is None:
+        return None
+
+    tangent_row = math.reshape(tangent, [-1])
+    num = math.shape(tangent_row)[0]
+
+    if not isinstance(tangent_row, np.ndarray):
+        jac = math.convert_like(jac, tangent_row)
+        jac = math.cast(jac, tangent_row.dtype)
+
+    jac = math.reshape(jac, [-1, num])
+
+    try:
+        if math.allclose(tangent, 0):
+            # If the tangent vector is zero, then the
+            # corresponding element of the JVP will be zero.
+            res = math.convert_like(np.zeros([jac.shape[0]]), tangent)
+            return math.cast(res, tangent.dtype)
+    except (AttributeError, TypeError):
+        pass
+
+    return math.tensordot(jac, tangent_row, [[1], [0]])
+
+
+def jvp(tape, tangent, gradient_fn, gradient_kwargs=None):
+    r"""Generate the gradient tapes and processing function required to compute
+    the Jacobian-vector products of a tape.
+
+    Consider a function :math:`\mathbf{f}(\mathbf{x})`. The Jacobian is given by
+
+    .. math::
+
+        \mathbf{J}_{\mathbf{f}}(\mathbf{x}) = \begin{pmatrix}
+            \frac{\partial f_1}{\partial x_1} &\cdots &\frac{\partial f_1}{\partial x_n}\\
+            \vdots &\ddots &\vdots\\
+            \frac{\partial f_m}{\partial x_1} &\cdots &\frac{\partial f_m}{\partial x_n}\\
+        \end{pmatrix}.
+
+    In forward-mode differentiation, the chain rule is applied from the inputs onwards.
+    For example, consider the composition :math:`h = f\circ x: \mathbb{R} \rightarrow \mathbb{R}^m`,
+    where :math:`x: \mathbb{R} \rightarrow \mathbb{R}^n`. The derivative is:
+
+    .. math::
+
+        \frac{d h(t)}{d t} = \mathbf{J}_{\mathbf{f}}(\mathbf{x}) \frac{d \mathbf{x}}{d t}.
+
+    Denote :math:`\mathbf{t} = \frac{d \mathbf{x}}{d t}`; we can write this in the form
+    of a matrix multiplication:
+
+    .. math:: \left[\frac{d h(t)}{d t}\right]_{i} = \sum_{j=0}^n \mathbf{J}_{ij} ~ \mathbf{t}_j.
+
+    Thus, the derivative is given by the so-called **Jacobian-vector product**; the
+    product of the Jacobian :math:`\mathbf{J}` of the current node of interest and
+    the column-vector :math:`\mathbf{t}`, the tangent of the preceding inputs.
+
+    Only the columns of the Jacobian that are multiplied by non-zero tangent entries
+    contribute to the Jacobian-vector product. If the tangent vector is known when
+    the gradient tapes are generated, only the corresponding parameters are passed
+    to ``gradient_fn`` via the ``argnum`` keyword argument, and for the remaining
+    parameters no gradient tapes are created.
+
+    Args:
+        tape (.QuantumTape): quantum tape to differentiate
+        tangent (tensor_like): Tangent vector. Must have one entry per
+            trainable parameter of the tape.
+        gradient_fn (callable): the gradient transform to use to differentiate
+            the tape
+        gradient_kwargs (dict): dictionary of keyword arguments to pass when
+            determining the gradients of tapes
+
+    Returns:
+        tensor_like or None: Jacobian-vector product. Returns None if the tape
+        has no trainable parameters.
+
+    **Example**
+
+    Consider the following quantum tape, with two outputs and three parameters:
+
+    .. code-block:: python
+
+        x = np.array([0.1, 0.2, 0.3], requires_grad=True)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.RZ(x[2], wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.probs(wires=1)
+
+    We can use the ``jvp`` function to compute the Jacobian-vector product,
+    given a tangent vector:
+
+    >>> tangent = np.array([1.0, 0.0, 0.0])
+    >>> jvp_tapes, fn = qml.gradients.jvp(tape, tangent, qml.gradients.param_shift)
+
+    Since only the first entry of the tangent is non-zero, only the first
+    parameter is shifted:
+
+    >>> len(jvp_tapes)
+    2
+
+    Executing the JVP tapes, and applying the processing function:
+
+    >>> dev = qml.device("default.qubit", wires=2)
+    >>> fn(qml.execute(jvp_tapes, dev, gradient_fn=qml.gradients.param_shift))
+    tensor([-0.0489217,  0.0489217], requires_grad=True)
+    """
+    gradient_kwargs = gradient_kwargs or {}
+    num_params = len(tape.trainable_params)
+
+    if num_params == 0:
+        # The tape has no trainable parameters; the JVP
+        # is simply none.
+        return [], lambda _: None
+
+    try:
+        tangent_row = math.to_numpy(math.reshape(tangent, [-1]))
+
+        if np.allclose(tangent_row, 0):
+            # If the tangent vector is zero, then the
+            # JVP will be zero, and we can avoid a quantum computation.
+
+            def func(_):
+                res = math.convert_like(np.zeros([tape.output_dim]), tangent)
+                return math.cast(res, tangent.dtype)
+
+            return [], func
+
+        argnum = np.flatnonzero(tangent_row).tolist()
+
+        if len(argnum) < num_params and "argnum" not in gradient_kwargs:
+            # Only differentiate with respect to the parameters that
+            # are weighted by the tangent vector.
+            gradient_kwargs = {**gradient_kwargs, "argnum": argnum}
+
+    except (AttributeError, TypeError):
+        # the tangent vector is not concrete, for example
+        # due to tracing; the full Jacobian is required
+        pass
+
+    gradient_tapes, fn = gradient_fn(tape, **gradient_kwargs)
+
+    def processing_fn(results):
+        # postprocess results to compute the Jacobian
+        jac = fn(results)
+        return compute_jvp(tangent, jac)
+
+    return gradient_tapes, processing_fn
+
+
+def batch_jvp(tapes, tangents, gradient_fn, reduction="append", gradient_kwargs=None):
+    r"""Generate the gradient tapes and processing function required to compute
+    the Jacobian-vector products of a batch of tapes.
+
+    See :func:`~.jvp` for more details on Jacobian-vector products.
+
+    Args:
+        tapes (Sequence[.QuantumTape]): sequence of quantum tapes to differentiate
+        tangents (Sequence[tensor_like]): Sequence of tangent vectors. Must be the
+            same length as ``tapes``. Each tangent vector should have one entry per
+            trainable parameter of the corresponding tape.
+        gradient_fn (callable): the gradient transform to use to differentiate
+            the tapes
+        reduction (str): Determines how the Jacobian-vector products are returned.
+            If ``append``, then the output of the function will be of the form
+            ``List[tensor_like]``, with each element corresponding to the JVP of each
+            input tape. If ``extend``, then the output JVPs will be concatenated.
+        gradient_kwargs (dict): dictionary of keyword arguments to pass when
+            determining the gradients of tapes
+
+    Returns:
+        List[tensor_like or None]: list of Jacobian-vector products. ``None`` elements corresponds
+        to tapes with no trainable parameters.
+
+    **Example**
+
+    Consider the following quantum tapes:
+
+    .. code-block:: python
+
+        x = np.array([0.1, 0.2, 0.3], requires_grad=True)
+
+        def ansatz(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.RZ(x[2], wires=0)
+            qml.CNOT(wires=[0, 1])
+
+        with qml.tape.QuantumTape() as tape1:
+            ansatz(x)
+            qml.probs(wires=1)
+
+        with qml.tape.QuantumTape() as tape2:
+            ansatz(x)
+            qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        tapes = [tape1, tape2]
+
+    We can use the ``batch_jvp`` function to compute the Jacobian-vector product,
+    given a list of tangent vectors per tape:
+
+    >>> tangents = [np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 1.0])]
+    >>> jvp_tapes, fn = qml.gradients.batch_jvp(tapes, tangents, qml.gradients.param_shift)
+
+    Only the parameters with non-zero tangent entries are shifted; two tapes are
+    generated for ``tape1`` and four for ``tape2``:
+
+    >>> len(jvp_tapes)
+    6
+
+    Executing the JVP tapes, and applying the processing function:
+
+    >>> dev = qml.device("default.qubit", wires=2)
+    >>> fn(qml.execute(jvp_tapes, dev, gradient_fn=qml.gradients.param_shift))
+    [tensor([-0.0489217,  0.0489217], requires_grad=True),
+     tensor([-0.19866933], requires_grad=True)]
+
+    We have two JVPs; one per tape. Each one has the output dimension of the
+    corresponding tape.
+    """
+    gradient_kwargs = gradient_kwargs or {}
+    reshape_info = []
+    gradient_tapes = []
+    processing_fns = []
+
+    # Loop through the tapes and tangent vectors
+    for tape, tangent in zip(tapes, tangents):
+        g_tapes, fn = jvp(tape, tangent, gradient_fn, gradient_kwargs)
+
+        reshape_info.append(len(g_tapes))
+        processing_fns.append(fn)
+        gradient_tapes.extend(g_tapes)
+
+    def processing_fn(results):
+        jvps = []
+        start = 0
+
+        for t_idx in range(len(tapes)):
+            # extract the correct results from the flat list
+            res_len = reshape_info[t_idx]
+            res_t = results[start : start + res_len]
+            start += res_len
+
+            # postprocess results to compute the JVP
+            jvp_ = processing_fns[t_idx](res_t)
+
+            if jvp_ is None:
+                if reduction == "append":
+                    jvps.append(None)
+                continue
+
+            if isinstance(reduction, str):
+                getattr(jvps, reduction)(jvp_)
+            elif callable(reduction):
+                reduction(jvps, jvp_)
+
+        return jvps
+
+    return gradient_tapes, processing_fn
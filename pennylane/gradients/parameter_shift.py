@@ -36,6 +36,9 @@ from .general_shift_rules import (
     _iterate_shift_rule,
     frequencies_to_period,
     generate_shifted_tapes,
+    _supports_broadcasting,
+    _unstack_broadcasted_results,
+    _validate_broadcast,
 )
 
 
@@ -145,7 +148,9 @@ def _get_operation_recipe(tape, t_idx, shifts, order=1):
     return qml.math.stack([coeffs, mults, shifts]).T
 
 
-def expval_param_shift(tape, argnum=None, shifts=None, gradient_recipes=None, f0=None):
+def expval_param_shift(
+    tape, argnum=None, shifts=None, gradient_recipes=None, f0=None, broadcast=False
+):
     r"""Generate the parameter-shift tapes and postprocessing methods required
     to compute the gradient of a gate parameter with respect to an
     expectation value.
@@ -165,6 +170,8 @@ def expval_param_shift(tape, argnum=None, shifts=None, gradient_recipes=None, f0
         f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
             and the gradient recipe contains an unshifted term, this value is used,
             saving a quantum evaluation.
+        broadcast (bool): Whether or not to use parameter broadcasting to create
+            a single broadcasted tape per operation instead of one tape per shift angle.
 
     Returns:
         tuple[list[QuantumTape], function]: A tuple containing a
@@ -233,12 +240,16 @@ def expval_param_shift(tape, argnum=None, shifts=None, gradient_recipes=None, f0
 
         # generate the gradient tapes
         gradient_coeffs.append(coeffs)
-        g_tapes = generate_shifted_tapes(tape, idx, op_shifts, multipliers)
+        _broadcast = broadcast and _supports_broadcasting(tape, [idx], len(op_shifts))
+        g_tapes = generate_shifted_tapes(tape, idx, op_shifts, multipliers, _broadcast)
 
         gradient_tapes.extend(g_tapes)
-        shapes.append(len(g_tapes))
+        shapes.append(len(op_shifts))
 
     def processing_fn(results):
+        if broadcast:
+            results = _unstack_broadcasted_results(results, gradient_tapes)
+
         # Apply the same squeezing as in qml.QNode to make the transform output consistent.
         # pylint: disable=protected-access
         if tape._qfunc_output is not None and not isinstance(tape._qfunc_output, Sequence):
@@ -287,7 +298,7 @@ def expval_param_shift(tape, argnum=None, shifts=None, gradient_recipes=None, f0
     return gradient_tapes, processing_fn
 
 
-def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None):
+def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None, broadcast=False):
     r"""Generate the parameter-shift tapes and postprocessing methods required
     to compute the gradient of a gate parameter with respect to a
     variance value.
@@ -307,6 +318,8 @@ def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None):
         f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
             and the gradient recipe contains an unshifted term, this value is used,
             saving a quantum evaluation.
+        broadcast (bool): Whether or not to use parameter broadcasting to create
+            a single broadcasted tape per operation instead of one tape per shift angle.
 
     Returns:
         tuple[list[QuantumTape], function]: A tuple containing a
@@ -332,7 +345,9 @@ def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None):
     gradient_tapes = [expval_tape]
 
     # evaluate the analytic derivative of <A>
-    pdA_tapes, pdA_fn = expval_param_shift(expval_tape, argnum, shifts, gradient_recipes, f0)
+    pdA_tapes, pdA_fn = expval_param_shift(
+        expval_tape, argnum, shifts, gradient_recipes, f0, broadcast
+    )
     gradient_tapes.extend(pdA_tapes)
 
     # Store the number of first derivative tapes, so that we know
@@ -373,7 +388,7 @@ def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None):
         # may be non-zero. Here, we calculate the analytic derivatives of the <A^2>
         # observables.
         pdA2_tapes, pdA2_fn = expval_param_shift(
-            expval_sq_tape, argnum, shifts, gradient_recipes, f0
+            expval_sq_tape, argnum, shifts, gradient_recipes, f0, broadcast
         )
         gradient_tapes.extend(pdA2_tapes)
 
@@ -432,7 +447,13 @@ def var_param_shift(tape, argnum, shifts=None, gradient_recipes=None, f0=None):
 
 @gradient_transform
 def param_shift(
-    tape, argnum=None, shifts=None, gradient_recipes=None, fallback_fn=finite_diff, f0=None
+    tape,
+    argnum=None,
+    shifts=None,
+    gradient_recipes=None,
+    fallback_fn=finite_diff,
+    f0=None,
+    broadcast=False,
 ):
     r"""Transform a QNode to compute the parameter-shift gradient of all gate
     parameters with respect to its inputs.
@@ -465,6 +486,9 @@ def param_shift(
         f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
             and the gradient recipe contains an unshifted term, this value is used,
             saving a quantum evaluation.
+        broadcast (bool): Whether or not to use parameter broadcasting to create
+            a single broadcasted tape per operation instead of one tape per shift angle.
+            Operations that do not support broadcasting are shifted in separate tapes.
 
     Returns:
         tensor_like or tuple[list[QuantumTape], function]:
@@ -613,6 +637,20 @@ def param_shift(
         >>> fn(qml.execute(gradient_tapes, dev, None))
         [[-0.38751721 -0.18884787 -0.38355704]
          [ 0.69916862  0.34072424  0.69202359]]
+
+        Devices that support native parameter broadcasting, like ``default.qubit``,
+        can evaluate all shifts of an operation in a single execution. Passing
+        ``broadcast=True`` stacks the shifted values of each parameter into one
+        broadcasted tape, instead of creating one tape per shift:
+
+        >>> gradient_tapes, fn = qml.gradients.param_shift(tape, broadcast=True)
+        >>> len(gradient_tapes)
+        4
+        >>> [t.batch_size for t in gradient_tapes]
+        [None, 2, 2, 2]
+        >>> fn(qml.execute(gradient_tapes, dev, None))
+        [[-0.38751721 -0.18884787 -0.38355704]
+         [ 0.69916862  0.34072424  0.69202359]]
     """
 
     if any(m.return_type in [State, VnEntropy, MutualInfo] for m in tape.measurements):
@@ -628,6 +666,9 @@ def param_shift(
         )
         return [], lambda _: np.zeros((tape.output_dim, 0))
 
+    if broadcast:
+        _validate_broadcast(tape)
+
     gradient_analysis(tape, grad_fn=param_shift)
     method = "analytic" if fallback_fn is None else "best"
     diff_methods = grad_method_validation(method, tape)
@@ -659,9 +700,9 @@ def param_shift(
         gradient_recipes = [None] * len(argnum)
 
     if any(m.return_type is qml.measurements.Variance for m in tape.measurements):
-        g_tapes, fn = var_param_shift(tape, argnum, shifts, gradient_recipes, f0)
+        g_tapes, fn = var_param_shift(tape, argnum, shifts, gradient_recipes, f0, broadcast)
     else:
-        g_tapes, fn = expval_param_shift(tape, argnum, shifts, gradient_recipes, f0)
+        g_tapes, fn = expval_param_shift(tape, argnum, shifts, gradient_recipes, f0, broadcast)
 
     gradient_tapes.extend(g_tapes)
 
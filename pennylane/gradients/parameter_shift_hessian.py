@@ -32,6 +32,9 @@ from .general_shift_rules import (
     _combine_shift_rules,
     generate_shifted_tapes,
     generate_multishifted_tapes,
+    _supports_broadcasting,
+    _unstack_broadcasted_results,
+    _validate_broadcast,
 )
 
 
@@ -117,9 +120,13 @@ def _collect_recipes(tape, argnum, diff_methods, diagonal_shifts, off_diagonal_s
     return diag_recipes, partial_offdiag_recipes
 
 
-def _generate_offdiag_tapes(tape, idx, first_order_recipes, add_unshifted, tapes, coeffs):
+def _generate_offdiag_tapes(
+    tape, idx, first_order_recipes, add_unshifted, tapes, coeffs, broadcast=False
+):
     r"""Combine two univariate first order recipes and create
-    multi-shifted tapes to compute the off-diagonal entry of the Hessian."""
+    multi-shifted tapes to compute the off-diagonal entry of the Hessian.
+    If ``broadcast=True``, the shifts are stacked into a single broadcasted tape
+    wherever the shifted operations support it."""
     # pylint: disable=too-many-arguments
 
     recipe_i = first_order_recipes[idx[0]]
@@ -143,16 +150,19 @@ def _generate_offdiag_tapes(tape, idx, first_order_recipes, add_unshifted, tapes
 
     s = combined_rules[:, 3:5]
     m = combined_rules[:, 1:3]
-    new_tapes = generate_multishifted_tapes(tape, idx, s, m)
+    broadcast = broadcast and _supports_broadcasting(tape, idx, len(s))
+    new_tapes = generate_multishifted_tapes(tape, idx, s, m, broadcast)
     tapes.extend(new_tapes)
     coeffs.append(combined_rules[:, 0])
 
     return add_unshifted, unshifted_coeff
 
 
-def _generate_diag_tapes(tape, idx, diag_recipes, add_unshifted, tapes, coeffs):
+def _generate_diag_tapes(tape, idx, diag_recipes, add_unshifted, tapes, coeffs, broadcast=False):
     """Create the required parameter-shifted tapes for a single diagonal entry of
-    the Hessian using precomputed second-order shift rules."""
+    the Hessian using precomputed second-order shift rules. If ``broadcast=True``,
+    the shifts are stacked into a single broadcasted tape wherever the shifted
+    operation supports it."""
     # pylint: disable=too-many-arguments
     # Obtain the recipe for the diagonal.
     c, m, s = diag_recipes[idx].T
@@ -169,7 +179,8 @@ def _generate_diag_tapes(tape, idx, diag_recipes, add_unshifted, tapes, coeffs):
         unshifted_coeff = None
 
     # Create the shifted tapes for the diagonal entry and store them along with coefficients
-    new_tapes = generate_shifted_tapes(tape, idx, s, m)
+    broadcast = broadcast and _supports_broadcasting(tape, [idx], len(s))
+    new_tapes = generate_shifted_tapes(tape, idx, s, m, broadcast)
     tapes.extend(new_tapes)
     coeffs.append(c)
 
@@ -177,7 +188,7 @@ def _generate_diag_tapes(tape, idx, diag_recipes, add_unshifted, tapes, coeffs):
 
 
 def expval_hessian_param_shift(
-    tape, argnum, diff_methods, diagonal_shifts, off_diagonal_shifts, f0
+    tape, argnum, diff_methods, diagonal_shifts, off_diagonal_shifts, f0, broadcast=False
 ):
     r"""Generate the Hessian tapes that are used in the computation of the second derivative of a
     quantum tape, using analytical parameter-shift rules to do so exactly. Also define a
@@ -204,6 +215,8 @@ def expval_hessian_param_shift(
         f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
             and the Hessian tapes include the original input tape, the 'f0' value is used
             instead of evaluating the input tape, reducing the number of device invocations.
+        broadcast (bool): Whether or not to use parameter broadcasting to create a single
+            broadcasted tape per Hessian entry instead of one tape per shift angle.
 
     Returns:
         tuple[list[QuantumTape], function]: A tuple containing a list of generated tapes, in
@@ -233,17 +246,26 @@ def expval_hessian_param_shift(
 
         if i == j:
             add_unshifted, unshifted_coeffs[(i, i)] = _generate_diag_tapes(
-                tape, i, diag_recipes, add_unshifted, hessian_tapes, hessian_coeffs
+                tape, i, diag_recipes, add_unshifted, hessian_tapes, hessian_coeffs, broadcast
             )
         else:
             # Create tapes and coefficients for the off-diagonal entry by combining
             # the two univariate first-order derivative recipes.
             add_unshifted, unshifted_coeffs[(i, j)] = _generate_offdiag_tapes(
-                tape, (i, j), partial_offdiag_recipes, add_unshifted, hessian_tapes, hessian_coeffs
+                tape,
+                (i, j),
+                partial_offdiag_recipes,
+                add_unshifted,
+                hessian_tapes,
+                hessian_coeffs,
+                broadcast,
             )
     unshifted_coeffs = {key: val for key, val in unshifted_coeffs.items() if val is not None}
 
     def processing_fn(results):
+        if broadcast:
+            results = _unstack_broadcasted_results(results, hessian_tapes)
+
         # Apply the same squeezing as in qml.QNode to make the transform output consistent.
         # pylint: disable=protected-access
         if tape._qfunc_output is not None and not isinstance(tape._qfunc_output, Sequence):
@@ -295,7 +317,9 @@ def expval_hessian_param_shift(
 
 
 @hessian_transform
-def param_shift_hessian(tape, argnum=None, diagonal_shifts=None, off_diagonal_shifts=None, f0=None):
+def param_shift_hessian(
+    tape, argnum=None, diagonal_shifts=None, off_diagonal_shifts=None, f0=None, broadcast=False
+):
     r"""Transform a QNode to compute the parameter-shift Hessian with respect to its trainable
     parameters.
 
@@ -330,6 +354,9 @@ def param_shift_hessian(tape, argnum=None, diagonal_shifts=None, off_diagonal_sh
         f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
             and the Hessian tapes include the original input tape, the 'f0' value is used
             instead of evaluating the input tape, reducing the number of device invocations.
+        broadcast (bool): Whether or not to use parameter broadcasting to create a single
+            broadcasted tape per Hessian entry instead of one tape per shift angle.
+            Entries of operations that do not support broadcasting use separate tapes.
 
     Returns:
         tensor_like or tuple[tensor_like] or tuple[list[QuantumTape], function]:
@@ -437,6 +464,17 @@ def param_shift_hessian(tape, argnum=None, diagonal_shifts=None, off_diagonal_sh
         array([[0.        , 0.        ],
                [0.        , 0.05998862]])
 
+        On devices with native support for parameter broadcasting, such as ``default.qubit``,
+        ``broadcast=True`` reduces the number of executions to one per Hessian entry (plus the
+        unshifted tape):
+
+        >>> hessian_tapes, postproc_fn = qml.gradients.param_shift_hessian(tape, broadcast=True)
+        >>> len(hessian_tapes)
+        4
+        >>> postproc_fn(qml.execute(hessian_tapes, dev, None))
+        array([[-0.86883595,  0.04762358],
+               [ 0.04762358,  0.05998862]])
+
     """
 
     # Perform input validation before generating tapes.
@@ -460,6 +498,9 @@ def param_shift_hessian(tape, argnum=None, diagonal_shifts=None, off_diagonal_sh
         )
         return [], lambda _: qml.math.zeros((tape.output_dim, 0, 0))
 
+    if broadcast:
+        _validate_broadcast(tape)
+
     bool_argnum = _process_argnum(argnum, tape)
 
     compare_diag_to = qml.math.sum(qml.math.diag(bool_argnum))
@@ -505,5 +546,5 @@ def param_shift_hessian(tape, argnum=None, diagonal_shifts=None, off_diagonal_sh
         )
 
     return expval_hessian_param_shift(
-        tape, bool_argnum, diff_methods, diagonal_shifts, off_diagonal_shifts, f0
+        tape, bool_argnum, diff_methods, diagonal_shifts, off_diagonal_shifts, f0, broadcast
     )
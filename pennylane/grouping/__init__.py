@@ -37,5 +37,6 @@ from .utils import (
     is_qwc,
     observables_to_binary_matrix,
     qwc_complement_adj_matrix,
+    complement_adj_matrix,
 )
 from .pauli import pauli_group, pauli_mult, pauli_mult_with_phase, partition_pauli_group
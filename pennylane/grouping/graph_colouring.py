@@ -30,6 +30,10 @@ fewest number of colours (lowest "chromatic number") as possible.
 """
 
 import numpy as np
+import scipy
+
+from pennylane.bitmasks import pack_rows
+from pennylane.grouping.utils import _complement_adj_rows
 
 
 def largest_first(binary_observables, adj):
@@ -144,3 +148,220 @@ def recursive_largest_first(binary_observables, adj):  # pylint:disable=too-many
         coloured |= set(indices)
         uncoloured = set(np.arange(n_terms)) - coloured
     return colours
+
+
+def dsatur(binary_observables, adj=None, grouping_type="qwc"):
+    """Performs graph-colouring using the DSATUR heuristic.
+
+    The vertices are coloured one at a time with the smallest colour not used by any of their
+    neighbours. The next vertex to colour is the one with the largest number of distinct colours
+    among its neighbours (its saturation), with ties broken by the largest degree. DSATUR often
+    yields fewer colours than Largest Degree First at a comparable cost.
+
+    If the adjacency matrix is not provided, its rows are computed on the fly from the Pauli words
+    packed into 64-bit integers, such that the memory scales linearly in the number of vertices.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        adj (array[int] or scipy.sparse.spmatrix): the adjacency matrix of the Pauli graph. If not
+            provided, the adjacency is computed from ``binary_observables`` and ``grouping_type``.
+        grouping_type (str): the binary relation defining the edges of the complementary graph if
+            ``adj`` is not provided, can be ``'qwc'``, ``'commuting'`` or ``'anticommuting'``
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables = np.array([[1., 1., 0.],
+    ... [1., 0., 0.],
+    ... [0., 0., 1.],
+    ... [1., 0., 1.]])
+    >>> adj = np.array([[0., 0., 1.],
+    ... [0., 0., 1.],
+    ... [1., 1., 0.]])
+    >>> dsatur(binary_observables, adj)
+    {1: [array([0., 0., 1.])], 2: [array([1., 1., 0.]), array([1., 0., 0.])]}
+    """
+    adjacency_rows, n_terms = _adjacency_rows(binary_observables, adj, grouping_type)
+
+    degree = np.zeros(n_terms, dtype=np.int64)
+    chunk_size = max(1, 2**24 // max(1, 8 * n_terms))
+    for start in range(0, n_terms, chunk_size):
+        indices = np.arange(start, min(start + chunk_size, n_terms))
+        degree[indices] = adjacency_rows(indices).sum(axis=1)
+
+    # saturation dominates the degree in the priority of the uncoloured vertices
+    priority = degree.copy()
+    uncoloured = np.ones(n_terms, dtype=bool)
+    # rows label the colours, columns are set for the vertices with a neighbour of that colour
+    neighbour_colours = np.zeros((8, n_terms), dtype=bool)
+    colours = {}
+
+    for _ in range(n_terms):
+        vertex = np.argmax(priority)
+
+        # the last row is never set, such that a free colour is always found
+        colour = np.argmin(neighbour_colours[1:, vertex]) + 1
+        if colour + 1 >= len(neighbour_colours):
+            neighbour_colours = np.vstack([neighbour_colours, np.zeros_like(neighbour_colours)])
+
+        uncoloured[vertex] = False
+        priority[vertex] = -1
+        colours.setdefault(colour, []).append(binary_observables[vertex])
+
+        saturated = adjacency_rows(np.array([vertex]))[0] & uncoloured
+        saturated &= ~neighbour_colours[colour]
+        neighbour_colours[colour] |= saturated
+        priority[saturated] += n_terms + 1
+
+    return dict(sorted(colours.items()))
+
+
+def sorted_insertion(binary_observables, adj=None, grouping_type="qwc", coefficients=None):
+    """Performs graph-colouring using the Sorted Insertion heuristic.
+
+    The vertices are sorted by decreasing magnitude of the coefficients of the corresponding Pauli
+    words, and each vertex is inserted into the first colour without any of its neighbours. Grouping
+    the terms with the largest coefficients together tends to reduce the variance of the estimated
+    expectation value for a fixed number of measurements (see
+    `arXiv:1908.06942 <https://arxiv.org/abs/1908.06942>`_ and
+    `arXiv:2103.09115 <https://arxiv.org/abs/2103.09115>`_).
+
+    If the adjacency matrix is not provided, the adjacency is evaluated on the fly from the Pauli
+    words packed into 64-bit integers. For qubit-wise commutativity, each colour is then represented
+    by the union of its Pauli words, such that a vertex is only compared to the colours rather than
+    to all of the coloured vertices.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        adj (array[int] or scipy.sparse.spmatrix): the adjacency matrix of the Pauli graph. If not
+            provided, the adjacency is computed from ``binary_observables`` and ``grouping_type``.
+        grouping_type (str): the binary relation defining the edges of the complementary graph if
+            ``adj`` is not provided, can be ``'qwc'``, ``'commuting'`` or ``'anticommuting'``
+        coefficients (array[float]): the coefficients of the Pauli words. If not provided, the
+            vertices are inserted in the given order.
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables = np.array([[1., 1., 0.],
+    ... [1., 0., 0.],
+    ... [0., 0., 1.],
+    ... [1., 0., 1.]])
+    >>> adj = np.array([[0., 0., 1.],
+    ... [0., 0., 1.],
+    ... [1., 1., 0.]])
+    >>> sorted_insertion(binary_observables, adj, coefficients=[0.1, 0.2, 0.3])
+    {1: [array([0., 0., 1.])], 2: [array([1., 0., 0.]), array([1., 1., 0.])]}
+    """
+    n_terms = len(binary_observables) if adj is None else np.shape(adj)[0]
+    order = (
+        np.arange(n_terms)
+        if coefficients is None
+        else np.argsort(-np.abs(coefficients), kind="stable")
+    )
+
+    if adj is None and grouping_type == "qwc":
+        c_vec = _qwc_insertion(binary_observables, order)
+    else:
+        # in the sorted order, each vertex is only compared to the preceding vertices
+        if adj is None:
+            binary_observables = np.asarray(binary_observables)
+            adjacency_rows, _ = _adjacency_rows(binary_observables[order], None, grouping_type)
+        else:
+            adj = adj.tocsr() if scipy.sparse.issparse(adj) else np.asarray(adj)
+            adjacency_rows, _ = _adjacency_rows(None, adj[order][:, order], grouping_type)
+
+        sorted_colours = np.zeros(n_terms, dtype=int)
+        k = 0
+        chunk_size = max(1, 2**24 // max(1, 8 * n_terms))
+
+        for start in range(0, n_terms, chunk_size):
+            stop = min(start + chunk_size, n_terms)
+            for i, row in enumerate(adjacency_rows(np.arange(start, stop), stop), start=start):
+                taken = np.zeros(k + 2, dtype=bool)
+                taken[sorted_colours[:i][row[:i]]] = True
+                taken[0] = True
+                sorted_colours[i] = np.argmin(taken)
+                k = max(k, sorted_colours[i])
+
+        c_vec = np.zeros(n_terms, dtype=int)
+        c_vec[order] = sorted_colours
+
+    colours = {}
+    for vertex in order:
+        colours.setdefault(c_vec[vertex], []).append(binary_observables[vertex])
+
+    return dict(sorted(colours.items()))
+
+
+def _adjacency_rows(binary_observables, adj, grouping_type):
+    """Returns a function computing rows of the adjacency matrix of the Pauli graph as boolean
+    arrays, and the number of vertices.
+
+    The returned function takes the indices of the rows and, optionally, the number of leading
+    columns to compute. If ``adj`` is not provided, the rows are evaluated from the packed binary
+    representation of the Pauli words. Otherwise, they are read from the dense or sparse
+    adjacency matrix.
+    """
+    if adj is None:
+        binary_observables = np.asarray(binary_observables).astype(bool)
+        n_terms, n_cols = np.shape(binary_observables)
+        x = pack_rows(binary_observables[:, : n_cols // 2])
+        z = pack_rows(binary_observables[:, n_cols // 2 :])
+        return (
+            lambda rows, stop=None: _complement_adj_rows(x[:stop], z[:stop], rows, grouping_type),
+            n_terms,
+        )
+
+    if scipy.sparse.issparse(adj):
+        adj = scipy.sparse.csr_matrix(adj)
+        return lambda rows, stop=None: adj[rows, :stop].toarray().astype(bool), adj.shape[0]
+
+    adj = np.asarray(adj).astype(bool)
+    return lambda rows, stop=None: adj[rows, :stop], adj.shape[0]
+
+
+def _qwc_insertion(binary_observables, order):
+    """Inserts the Pauli words in the given order into the first qubit-wise commuting colour.
+
+    Each colour is stored as the union of the packed X and Z components of its Pauli words, which
+    acts on every qubit with the single Pauli operator shared by the Pauli words of the colour.
+    """
+    binary_observables = np.asarray(binary_observables).astype(bool)
+    n_terms, n_cols = np.shape(binary_observables)
+    x = pack_rows(binary_observables[:, : n_cols // 2])
+    z = pack_rows(binary_observables[:, n_cols // 2 :])
+
+    colour_x = np.zeros((8, x.shape[1]), dtype=np.uint64)
+    colour_z = np.zeros((8, x.shape[1]), dtype=np.uint64)
+    c_vec = np.zeros(n_terms, dtype=int)
+    k = 0
+
+    for vertex in order:
+        x_v, z_v = x[vertex], z[vertex]
+        conflict = (
+            (colour_x[:k] | colour_z[:k])
+            & (x_v | z_v)
+            & ((colour_x[:k] ^ x_v) | (colour_z[:k] ^ z_v))
+        ).any(axis=1)
+        colour = np.argmin(conflict) if k and not conflict.all() else k
+
+        if colour == k:
+            k += 1
+            if k > len(colour_x):
+                colour_x = np.vstack([colour_x, np.zeros_like(colour_x)])
+                colour_z = np.vstack([colour_z, np.zeros_like(colour_z)])
+
+        colour_x[colour] |= x_v
+        colour_z[colour] |= z_v
+        c_vec[vertex] = colour + 1
+
+    return c_vec
@@ -15,22 +15,30 @@
 This module contains the high-level Pauli-word-partitioning functionality used in measurement optimization.
 """
 
-from copy import copy
-
 import numpy as np
+
 import pennylane as qml
 
-from pennylane.grouping.graph_colouring import largest_first, recursive_largest_first
+from pennylane.grouping.graph_colouring import (
+    dsatur,
+    largest_first,
+    recursive_largest_first,
+    sorted_insertion,
+)
 from pennylane.grouping.utils import (
-    are_identical_pauli_words,
     binary_to_pauli,
+    complement_adj_matrix,
     observables_to_binary_matrix,
-    qwc_complement_adj_matrix,
 )
 from pennylane.wires import Wires
 
 GROUPING_TYPES = frozenset(["qwc", "commuting", "anticommuting"])
-GRAPH_COLOURING_METHODS = {"lf": largest_first, "rlf": recursive_largest_first}
+GRAPH_COLOURING_METHODS = {
+    "lf": largest_first,
+    "rlf": recursive_largest_first,
+    "dsatur": dsatur,
+    "si": sorted_insertion,
+}
 
 
 class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
@@ -57,15 +65,17 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             the Pauli words, can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or
             ``'anticommuting'``.
         graph_colourer (str): the heuristic algorithm to employ for graph
-            colouring, can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive
-            Largest First)
+            colouring, can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive
+            Largest First), ``'dsatur'`` (DSATUR) or ``'si'`` (Sorted Insertion)
+        coefficients (tensor_like): the coefficients of the Pauli words, used to order the
+            Pauli words by decreasing magnitude for the ``'si'`` method
 
     Raises:
         ValueError: if arguments specified for ``grouping_type`` or
             ``graph_colourer`` are not recognized
     """
 
-    def __init__(self, observables, grouping_type="qwc", graph_colourer="rlf"):
+    def __init__(self, observables, grouping_type="qwc", graph_colourer="rlf", coefficients=None):
 
         if grouping_type.lower() not in GROUPING_TYPES:
             raise ValueError(
@@ -82,11 +92,13 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
 
         self.graph_colourer = GRAPH_COLOURING_METHODS[graph_colourer.lower()]
         self.observables = observables
+        self.coefficients = coefficients
         self._wire_map = None
         self._n_qubits = None
         self.binary_observables = None
         self.adj_matrix = None
         self.grouped_paulis = None
+        self.grouping_indices = None
 
     def binary_repr(self, n_qubits=None, wire_map=None):
         """Converts the list of Pauli words to a binary matrix.
@@ -128,46 +140,54 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
         if self.binary_observables is None:
             self.binary_observables = self.binary_repr()
 
-        n_qubits = int(np.shape(self.binary_observables)[1] / 2)
-
-        if self.grouping_type == "qwc":
-            adj = qwc_complement_adj_matrix(self.binary_observables)
-
-        elif self.grouping_type in frozenset(["commuting", "anticommuting"]):
-            symplectic_form = np.block(
-                [
-                    [np.zeros((n_qubits, n_qubits)), np.eye(n_qubits)],
-                    [np.eye(n_qubits), np.zeros((n_qubits, n_qubits))],
-                ]
-            )
-            mat_prod = (
-                self.binary_observables @ symplectic_form @ np.transpose(self.binary_observables)
-            )
-
-            if self.grouping_type == "commuting":
-
-                adj = mat_prod % 2
-
-            elif self.grouping_type == "anticommuting":
-
-                adj = (mat_prod + 1) % 2
-                np.fill_diagonal(adj, 0)
-
-        return adj
+        return complement_adj_matrix(self.binary_observables, grouping_type=self.grouping_type)
 
     def colour_pauli_graph(self):
         """
         Runs the graph colouring heuristic algorithm to obtain the partitioned Pauli words.
 
+        The indices of the Pauli words in each partition are stored in the ``grouping_indices``
+        attribute.
+
         Returns:
             list[list[Observable]]: a list of the obtained groupings. Each grouping is itself a
             list of Pauli word ``Observable`` instances
         """
 
-        if self.adj_matrix is None:
-            self.adj_matrix = self.complement_adj_matrix_for_operator()
+        if self.binary_observables is None:
+            self.binary_observables = self.binary_repr()
+
+        # DSATUR and Sorted Insertion evaluate the adjacency on the fly from the binary
+        # representation if the adjacency matrix has not been constructed
+        if self.graph_colourer is dsatur:
+            coloured_binary_paulis = dsatur(
+                self.binary_observables, self.adj_matrix, grouping_type=self.grouping_type
+            )
+        elif self.graph_colourer is sorted_insertion:
+            coefficients = (
+                None if self.coefficients is None else np.abs(qml.math.unwrap(self.coefficients))
+            )
+            coloured_binary_paulis = sorted_insertion(
+                self.binary_observables,
+                self.adj_matrix,
+                grouping_type=self.grouping_type,
+                coefficients=coefficients,
+            )
+        else:
+            if self.adj_matrix is None:
+                self.adj_matrix = self.complement_adj_matrix_for_operator()
+
+            coloured_binary_paulis = self.graph_colourer(self.binary_observables, self.adj_matrix)
+
+        # the colourers return rows of the binary matrix, which are mapped back to their indices
+        positions = {}
+        for i in reversed(range(len(self.binary_observables))):
+            positions.setdefault(self.binary_observables[i].tobytes(), []).append(i)
 
-        coloured_binary_paulis = self.graph_colourer(self.binary_observables, self.adj_matrix)
+        self.grouping_indices = [
+            [positions[pauli_word.tobytes()].pop() for pauli_word in grouping]
+            for grouping in coloured_binary_paulis.values()
+        ]
 
         self.grouped_paulis = [
             [binary_to_pauli(pauli_word, wire_map=self._wire_map) for pauli_word in grouping]
@@ -194,7 +214,9 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
         grouping_type (str): The type of binary relation between Pauli words.
             Can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``.
         method (str): the graph coloring heuristic to use in solving minimum clique cover, which
-            can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive Largest First)
+            can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First), ``'dsatur'``
+            (DSATUR) or ``'si'`` (Sorted Insertion). The ``'dsatur'`` and ``'si'`` methods do not
+            construct the adjacency matrix and scale to Hamiltonians with many terms.
 
     Returns:
        tuple:
@@ -228,7 +250,7 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
             )
 
     pauli_grouping = PauliGroupingStrategy(
-        observables, grouping_type=grouping_type, graph_colourer=method
+        observables, grouping_type=grouping_type, graph_colourer=method, coefficients=coefficients
     )
     partitioned_paulis = pauli_grouping.colour_pauli_graph()
 
@@ -236,28 +258,9 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
         return partitioned_paulis
 
     partitioned_coeffs = [
-        qml.math.cast_like([0] * len(g), coefficients) for g in partitioned_paulis
+        qml.math.take(coefficients, indices, axis=0) for indices in pauli_grouping.grouping_indices
     ]
 
-    observables = copy(observables)
-    # we cannot delete elements from the coefficients tensor, so we
-    # use a proxy list memorising the indices for this logic
-    coeff_indices = list(range(qml.math.shape(coefficients)[0]))
-    for i, partition in enumerate(partitioned_paulis):
-        indices = []
-        for pauli_word in partition:
-            # find index of this pauli word in remaining original observables,
-            for observable in observables:
-                if are_identical_pauli_words(pauli_word, observable):
-                    ind = observables.index(observable)
-                    indices.append(coeff_indices[ind])
-                    observables.pop(ind)
-                    coeff_indices.pop(ind)
-                    break
-
-        # add a tensor of coefficients to the grouped coefficients
-        partitioned_coeffs[i] = qml.math.take(coefficients, indices, axis=0)
-
     # make sure the output is of the same format as the input
     # for these two frequent cases
     if isinstance(coefficients, list):
@@ -39,7 +39,7 @@ def optimize_measurements(observables, coefficients=None, grouping="qwc", colour
             the Pauli words comprising a Hamiltonian
         grouping (str): the binary symmetric relation to use for operator partitioning
         colouring_method (str): the graph-colouring heuristic to use in obtaining the operator
-            partitions
+            partitions, can be ``'lf'``, ``'rlf'``, ``'dsatur'`` or ``'si'``
 
     Returns:
         tuple:
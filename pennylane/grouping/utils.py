@@ -23,12 +23,15 @@ representation of Pauli words and applications, see:
 from functools import reduce
 
 import numpy as np
+import scipy
 
 import pennylane as qml
 from pennylane import PauliX, PauliY, PauliZ, Identity
 from pennylane.operation import Observable, Tensor
 from pennylane.wires import Wires
 
+from pennylane.bitmasks import pack_rows, parity
+
 # To make this quicker later on
 ID_MAT = np.eye(2)
 
@@ -743,12 +746,124 @@ def qwc_complement_adj_matrix(binary_observables):
     if not np.array_equal(binary_observables, binary_observables.astype(bool)):
         raise ValueError(f"Expected a binary array, instead got {binary_observables}")
 
-    m_terms = np.shape(binary_observables)[0]
-    adj = np.zeros((m_terms, m_terms))
+    return complement_adj_matrix(binary_observables, grouping_type="qwc")
+
+
+def complement_adj_matrix(binary_observables, grouping_type="qwc", chunk_size=None, sparse=False):
+    """Obtains the adjacency matrix for the complementary graph of the graph defined by a binary
+    relation between Pauli words in the binary representation.
+
+    Two Pauli words are connected in the complementary graph if they are not qubit-wise commuting
+    (``grouping_type="qwc"``), if they anticommute (``grouping_type="commuting"``), or if they are
+    distinct and commute (``grouping_type="anticommuting"``).
+
+    The X and Z components of the Pauli words are packed into 64-bit integers, such that the
+    relation is evaluated for all pairs of Pauli words with bitwise operations. The rows of the
+    adjacency matrix are computed in chunks to bound the memory used by the intermediate arrays.
+
+    Args:
+        binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
+            binary vector representation
+        grouping_type (str): the binary relation between the Pauli words, can be ``'qwc'``,
+            ``'commuting'`` or ``'anticommuting'``
+        chunk_size (int): number of rows of the adjacency matrix computed at once. If not
+            provided, the chunks are chosen such that each intermediate array holds at most
+            :math:`2^{24}` bytes.
+        sparse (bool): if ``True``, the adjacency matrix is returned as a
+            ``scipy.sparse.csr_matrix``
+
+    Returns:
+        array[array[float]] or scipy.sparse.csr_matrix: the adjacency matrix for the complement of
+        the graph
 
-    for i in range(m_terms):
-        for j in range(i + 1, m_terms):
-            adj[i, j] = int(not is_qwc(binary_observables[i], binary_observables[j]))
-            adj[j, i] = adj[i, j]
+    Raises:
+        ValueError: if the grouping type is not recognized or the chunk size is not positive
+
+    **Example**
+
+    >>> binary_observables
+    array([[1., 0., 1., 0., 0., 1.],
+           [0., 1., 1., 1., 0., 1.],
+           [0., 0., 0., 1., 0., 0.]])
+    >>> complement_adj_matrix(binary_observables, grouping_type="anticommuting")
+    array([[0., 0., 0.],
+           [0., 0., 1.],
+           [0., 1., 0.]])
+    """
+    if grouping_type not in ("qwc", "commuting", "anticommuting"):
+        raise ValueError(
+            f"Grouping type must be one of: ('qwc', 'commuting', 'anticommuting'), "
+            f"instead got {grouping_type}."
+        )
+
+    binary_observables = np.asarray(binary_observables).astype(bool)
+    m_terms, n_cols = np.shape(binary_observables)
+    n_qubits = n_cols // 2
+
+    x = pack_rows(binary_observables[:, :n_qubits])
+    z = pack_rows(binary_observables[:, n_qubits:])
+
+    if chunk_size is None:
+        chunk_size = max(1, 2**24 // max(1, 8 * m_terms))
+    elif chunk_size < 1:
+        raise ValueError(f"The chunk size must be a positive integer, instead got {chunk_size}.")
+
+    adj = np.zeros((m_terms, m_terms)) if not sparse else None
+    blocks = []
+
+    for start in range(0, m_terms, chunk_size):
+        stop = min(start + chunk_size, m_terms)
+
+        block = _complement_adj_rows(x, z, np.arange(start, stop), grouping_type)
+
+        if sparse:
+            blocks.append(scipy.sparse.csr_matrix(block, dtype=float))
+        else:
+            adj[start:stop] = block
+
+    if sparse:
+        return (
+            scipy.sparse.vstack(blocks, format="csr")
+            if blocks
+            else scipy.sparse.csr_matrix((m_terms, m_terms))
+        )
 
     return adj
+
+
+def _complement_adj_rows(x, z, rows, grouping_type):
+    """Computes rows of the adjacency matrix for the complementary graph from the packed X and Z
+    components of the Pauli words.
+
+    Args:
+        x (array[int]): packed X components of all Pauli words, as returned by ``pack_rows``
+        z (array[int]): packed Z components of all Pauli words, as returned by ``pack_rows``
+        rows (array[int]): indices of the Pauli words whose rows are computed
+        grouping_type (str): the binary relation between the Pauli words, can be ``'qwc'``,
+            ``'commuting'`` or ``'anticommuting'``
+
+    Returns:
+        array[bool]: array of shape ``(len(rows), len(x))`` with the requested rows
+    """
+    if grouping_type == "qwc":
+        # both Pauli words act non-trivially on a qubit with different Pauli operators
+        block = np.zeros((len(rows), len(x)), dtype=bool)
+        for w in range(x.shape[1]):
+            x_i, z_i = x[rows, w, np.newaxis], z[rows, w, np.newaxis]
+            conflict = (x_i | z_i) & (x[:, w] | z[:, w]) & ((x_i ^ x[:, w]) | (z_i ^ z[:, w]))
+            block |= conflict != 0
+
+        return block
+
+    # the symplectic inner product is the parity of the bits of x_i & z_j ^ z_i & x_j
+    product = np.zeros((len(rows), len(x)), dtype=np.uint64)
+    for w in range(x.shape[1]):
+        x_i, z_i = x[rows, w, np.newaxis], z[rows, w, np.newaxis]
+        product ^= (x_i & z[:, w]) ^ (z_i & x[:, w])
+    block = parity(product)
+
+    if grouping_type == "anticommuting":
+        block = ~block
+        block[np.arange(len(rows)), rows] = False
+
+    return block
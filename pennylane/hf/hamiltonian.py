@@ -16,8 +16,10 @@ This module contains the functions needed for computing the molecular Hamiltonia
 """
 # pylint: disable= too-many-branches, too-many-arguments, too-many-locals, too-many-nested-blocks
 import autograd.numpy as anp
+import numpy
+
 import pennylane as qml
-from pennylane import numpy as np
+from pennylane.bitmasks import jordan_wigner_words, merge_words, pauli_word_symbols
 from pennylane.hf.hartree_fock import generate_scf, nuclear_energy
 
 
@@ -197,7 +199,7 @@ def generate_fermionic_hamiltonian(mol, cutoff=1.0e-12, core=None, active=None):
 
         coeffs = anp.concatenate((core_constant, coeffs_one, coeffs_two))
         operators = [[]] + operators_one + operators_two
-        indices_sort = [operators.index(i) for i in sorted(operators)]
+        indices_sort = sorted(range(len(operators)), key=operators.__getitem__)
 
         return coeffs[indices_sort], sorted(operators)
 
@@ -240,52 +242,42 @@ def generate_hamiltonian(mol, cutoff=1.0e-12, core=None, active=None):
         Returns:
             Hamiltonian: the qubit Hamiltonian
         """
-        h_ferm = generate_fermionic_hamiltonian(mol, cutoff, core, active)(*args)
+        coeffs, operators = generate_fermionic_hamiltonian(mol, cutoff, core, active)(*args)
+        terms = [
+            n
+            for n, t in enumerate(operators)
+            if not (len(t) == 4 and (t[0] == t[1] or t[2] == t[3]))
+        ]
+        x, z, values, term_index, word_index = [], [], [], [], []
+        for length in sorted({len(operators[n]) for n in terms}):
+            group = [n for n in terms if len(operators[n]) == length]
+            x_group, z_group, c_group = jordan_wigner_words([operators[n] for n in group])
+
+            x.append(x_group.ravel())
+            z.append(z_group.ravel())
+            values.append((c_group * coeffs[anp.array(group)][:, anp.newaxis]).ravel())
+            term_index.append(numpy.repeat(group, 2**length))
+            word_index.append(numpy.tile(numpy.arange(2**length), len(group)))
+
+        # restore the order in which the Pauli words appear in the fermionic Hamiltonian
+        order = numpy.lexsort((numpy.concatenate(word_index), numpy.concatenate(term_index)))
+        x = numpy.concatenate(x)[order]
+        z = numpy.concatenate(z)[order]
+        values = anp.concatenate(values)[order]
+
+        words, values = merge_words(x, z, values)
+        nonzero = anp.abs(values) > cutoff
 
         ops = []
+        for word in (w for w, keep in zip(words, nonzero) if keep):
+            symbols = pauli_word_symbols(*word)
+            paulis = [_return_pauli(p)(wire) for wire, p in symbols]
+            if not paulis:
+                ops.append(qml.Identity(0))
+            else:
+                ops.append(paulis[0] if len(paulis) == 1 else qml.operation.Tensor(*paulis))
 
-        for n, t in enumerate(h_ferm[1]):
-
-            if len(t) == 0:
-                coeffs = anp.array([0.0])
-                coeffs = coeffs + np.array([h_ferm[0][n]])
-                ops = ops + [qml.Identity(0)]
-
-            elif len(t) == 2:
-                op = _generate_qubit_operator(t)
-                if op != 0:
-                    for i, o in enumerate(op[1]):
-                        if len(o) == 0:
-                            op[1][i] = qml.Identity(0)
-                        if len(o) == 1:
-                            op[1][i] = _return_pauli(o[0][1])(o[0][0])
-                        if len(o) > 1:
-                            k = qml.Identity(0)
-                            for o_ in o:
-                                k = k @ _return_pauli(o_[1])(o_[0])
-                            op[1][i] = k
-                    coeffs = np.concatenate([coeffs, np.array(op[0]) * h_ferm[0][n]])
-                    ops = ops + op[1]
-
-            elif len(t) == 4:
-                op = _generate_qubit_operator(t)
-                if op != 0:
-                    for i, o in enumerate(op[1]):
-                        if len(o) == 0:
-                            op[1][i] = qml.Identity(0)
-                        if len(o) == 1:
-                            op[1][i] = _return_pauli(o[0][1])(o[0][0])
-                        if len(o) > 1:
-                            k = qml.Identity(0)
-                            for o_ in o:
-                                k = k @ _return_pauli(o_[1])(o_[0])
-                            op[1][i] = k
-                    coeffs = np.concatenate([coeffs, np.array(op[0]) * h_ferm[0][n]])
-                    ops = ops + op[1]
-
-        h = simplify(qml.Hamiltonian(coeffs, ops), cutoff=cutoff)
-
-        return h
+        return qml.Hamiltonian(values[nonzero], ops)
 
     return hamiltonian
 
@@ -309,51 +301,13 @@ def _generate_qubit_operator(op):
     >>> q
     ([(0.5+0j), (-0.5+0j)], [[], [(0, 'Z')]]) # corresponds to :math:`\frac{1}{2}(I_0 - Z_0)`
     """
-    if len(op) == 1:
-        op = [((op[0], 1),)]
-
-    if len(op) == 2:
-        op = [((op[0], 1), (op[1], 0))]
-
-    if len(op) == 4:
-        op = [((op[0], 1), (op[1], 1), (op[2], 0), (op[3], 0))]
-
-        if op[0][0][0] == op[0][1][0] or op[0][2][0] == op[0][3][0]:
-            return 0
-
-    for t in op:
-        for l in t:
-            z = [(index, "Z") for index in range(l[0])]
-            x = z + [(l[0], "X"), 0.5]
-
-            if l[1]:
-                y = z + [(l[0], "Y"), -0.5j]
-
-            else:
-                y = z + [(l[0], "Y"), 0.5j]
-
-            if t.index(l) == 0:
-                q = [x, y]
-            else:
-                m = []
-                for t1 in q:
-                    for t2 in [x, y]:
-                        q1, c1 = _pauli_mult(t1[:-1], t2[:-1])
-                        m.append(q1 + [c1 * t1[-1] * t2[-1]])
-                q = m
-
-    c = [p[-1] for p in q]
-    o = [p[:-1] for p in q]
+    if len(op) == 4 and (op[0] == op[1] or op[2] == op[3]):
+        return 0
 
-    for item in o:
-        k = [i for i, x in enumerate(o) if x == item]
-        if len(k) >= 2:
-            for j in k[::-1][:-1]:
-                del o[j]
-                c[k[0]] = c[k[0]] + c[j]
-                del c[j]
+    x, z, c = jordan_wigner_words([op])
+    words, c = merge_words(x[0], z[0], c[0])
 
-    return c, o
+    return c.tolist(), [pauli_word_symbols(*w) for w in words]
 
 
 def simplify(h, cutoff=1.0e-12):
@@ -378,23 +332,18 @@ def simplify(h, cutoff=1.0e-12):
     """
     wiremap = dict(zip(h.wires, range(len(h.wires) + 1)))
 
-    c = []
-    o = []
-    for i, op in enumerate(h.ops):
+    terms = {}
+    for coeff, op in zip(h.coeffs, h.ops):
         op = qml.operation.Tensor(op).prune()
         op = qml.grouping.pauli_word_to_string(op, wire_map=wiremap)
-        if op not in o:
-            c.append(h.coeffs[i])
-            o.append(op)
-        else:
-            c[o.index(op)] += h.coeffs[i]
+        terms[op] = terms[op] + coeff if op in terms else coeff
 
     coeffs = []
     ops = []
-    nonzero_ind = np.argwhere(abs(np.array(c)) > cutoff).flatten()
-    for i in nonzero_ind:
-        coeffs.append(c[i])
-        ops.append(qml.grouping.string_to_pauli_word(o[i], wire_map=wiremap))
+    for op, coeff in terms.items():
+        if abs(coeff) > cutoff:
+            coeffs.append(coeff)
+            ops.append(qml.grouping.string_to_pauli_word(op, wire_map=wiremap))
 
     try:
         coeffs = qml.math.stack(coeffs)
@@ -404,58 +353,6 @@ def simplify(h, cutoff=1.0e-12):
     return qml.Hamiltonian(coeffs, ops)
 
 
-def _pauli_mult(p1, p2):
-    r"""Return the result of multiplication between two tensor products of Pauli operators.
-
-    The Pauli operator :math:`(P_0)` is denoted by [(0, 'P')], where :math:`P` represents
-    :math:`X`, :math:`Y` or :math:`Z`.
-
-    Args:
-        p1 (list[tuple[int, str]]): the first tensor product of Pauli operators
-        p2 (list[tuple[int, str]]): the second tensor product of Pauli operators
-
-    Returns
-        tuple(list[tuple[int, str]], complex): list of the Pauli operators and the coefficient
-
-    **Example**
-
-    >>> p1 = [(0, "X"), (1, "Y")]  # X_0 @ Y_1
-    >>> p2 = [(0, "X"), (2, "Y")]  # X_0 @ Y_2
-    >>> _pauli_mult(p1, p2)
-    ([(2, "Y"), (1, "Y")], 1.0) # p1 @ p2 = X_0 @ Y_1 @ X_0 @ Y_2
-    """
-    c = 1.0
-
-    t1 = [t[0] for t in p1]
-    t2 = [t[0] for t in p2]
-
-    k = []
-
-    for i in p1:
-        if i[0] in t1 and i[0] not in t2:
-            k.append((i[0], pauli_mult[i[1]]))
-        for j in p2:
-            if j[0] in t2 and j[0] not in t1:
-                k.append((j[0], pauli_mult[j[1]]))
-
-            if i[0] == j[0]:
-                if i[1] + j[1] in pauli_coeff:
-                    k.append((i[0], pauli_mult[i[1] + j[1]]))
-                    c = c * pauli_coeff[i[1] + j[1]]
-                else:
-                    k.append((i[0], pauli_mult[i[1] + j[1]]))
-
-    k = [i for i in k if "I" not in i[1]]
-
-    for item in k:
-        k_ = [i for i, x in enumerate(k) if x == item]
-        if len(k_) >= 2:
-            for j in k_[::-1][:-1]:
-                del k[j]
-
-    return k, c
-
-
 def _return_pauli(p):
     r"""Return the PennyLane Pauli operator.
 
@@ -476,36 +373,3 @@ def _return_pauli(p):
         return qml.PauliY
 
     return qml.PauliZ
-
-
-pauli_mult = {
-    "XX": "I",
-    "YY": "I",
-    "ZZ": "I",
-    "ZX": "Y",
-    "XZ": "Y",
-    "ZY": "X",
-    "YZ": "X",
-    "XY": "Z",
-    "YX": "Z",
-    "IX": "X",
-    "IY": "Y",
-    "IZ": "Z",
-    "XI": "X",
-    "YI": "Y",
-    "ZI": "Z",
-    "I": "I",
-    "II": "I",
-    "X": "X",
-    "Y": "Y",
-    "Z": "Z",
-}
-
-pauli_coeff = {
-    "ZX": 1.0j,
-    "XZ": -1.0j,
-    "ZY": -1.0j,
-    "YZ": 1.0j,
-    "XY": 1.0j,
-    "YX": -1.0j,
-}
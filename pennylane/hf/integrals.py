@@ -15,10 +15,34 @@
 This module contains the functions needed for computing integrals over basis functions.
 """
 # pylint: disable= unbalanced-tuple-unpacking, too-many-arguments
+import functools
 import itertools as it
+import math
+
 import autograd.numpy as anp
-import autograd.scipy as asp
-from scipy.special import factorial2 as fac2
+import numpy as np
+from autograd.extend import defvjp, primitive
+from autograd.tracer import isbox
+from scipy.special import gamma, gammainc
+
+# grid spacing, upper limit and Taylor expansion order of the tabulated Boys function
+BOYS_GRID_STEP = 0.05
+BOYS_GRID_MAX = 50.0
+BOYS_TAYLOR_ORDER = 6
+
+
+@functools.lru_cache()
+def fac2(n):
+    r"""Compute the double factorial :math:`n!!` of an integer, with :math:`n!! = 1` for
+    :math:`n \leq 0`.
+
+    Args:
+        n (int): the integer
+
+    Returns:
+        int: the double factorial
+    """
+    return math.prod(range(n, 0, -2))
 
 
 def primitive_norm(l, alpha):
@@ -118,15 +142,18 @@ def _generate_params(params, args):
 
     Returns:
         list(array[float]): basis set parameters
+
+    Parameters that are not being differentiated are returned as plain NumPy arrays, which avoids
+    the overhead of PennyLane tensors in the integral kernels.
     """
     basis_params = []
     c = 0
     for p in params:
         if p.requires_grad:
-            basis_params.append(args[c])
+            basis_params.append(args[c] if isbox(args[c]) else np.asarray(args[c]))
             c += 1
         else:
-            basis_params.append(p)
+            basis_params.append(np.asarray(p))
     return basis_params
 
 
@@ -189,28 +216,52 @@ def expansion(la, lb, ra, rb, alpha, beta, t):
     >>> c
     array([1.])
     """
+    if t < 0 or la < 0 or lb < 0 or t > (la + lb):
+        return 0.0
+
+    return _expansion_coefficients(la, lb, ra, rb, alpha, beta)[t]
+
+
+def _expansion_coefficients(la, lb, ra, rb, alpha, beta):
+    r"""Compute the Hermite Gaussian expansion coefficients :math:`E_t^{ij}` for all
+    :math:`0 \leq t \leq i + j`.
+
+    The coefficients are built iteratively from :math:`E_0^{00}` with the recursion relations
+    described in :func:`~.expansion`, first increasing :math:`i` and then :math:`j`, such that each
+    intermediate coefficient is computed only once.
+
+    Args:
+        la (integer): angular momentum component for the first Gaussian function
+        lb (integer): angular momentum component for the second Gaussian function
+        ra (float): position component of the the first Gaussian function
+        rb (float): position component of the the second Gaussian function
+        alpha (array[float]): exponent of the first Gaussian function
+        beta (array[float]): exponent of the second Gaussian function
+
+    Returns:
+        list[array[float]]: expansion coefficients for :math:`t = 0, \ldots, i + j`
+    """
     p = anp.array(alpha + beta)
     q = anp.array(alpha * beta / p)
     r = anp.array(ra - rb)
 
-    if la == lb == t == 0:
-        return anp.exp(-q * r**2)
-
-    if t < 0 or t > (la + lb):
-        return 0.0
+    coeffs = [anp.exp(-q * r**2)]
 
-    if lb == 0:
-        return (
-            (1 / (2 * p)) * expansion(la - 1, lb, ra, rb, alpha, beta, t - 1)
-            - (q * r / alpha) * expansion(la - 1, lb, ra, rb, alpha, beta, t)
-            + (t + 1) * expansion(la - 1, lb, ra, rb, alpha, beta, t + 1)
-        )
+    for factor in [-q * r / alpha] * la + [q * r / beta] * lb:
+        n = len(coeffs)
+        new_coeffs = []
+        for t in range(n + 1):
+            e = 0.0
+            if t > 0:
+                e = e + (1 / (2 * p)) * coeffs[t - 1]
+            if t < n:
+                e = e + factor * coeffs[t]
+            if t + 1 < n:
+                e = e + (t + 1) * coeffs[t + 1]
+            new_coeffs.append(e)
+        coeffs = new_coeffs
 
-    return (
-        (1 / (2 * p)) * expansion(la, lb - 1, ra, rb, alpha, beta, t - 1)
-        + (q * r / beta) * expansion(la, lb - 1, ra, rb, alpha, beta, t)
-        + (t + 1) * expansion(la, lb - 1, ra, rb, alpha, beta, t + 1)
-    )
+    return coeffs
 
 
 def gaussian_overlap(la, lb, ra, rb, alpha, beta):
@@ -464,6 +515,7 @@ def generate_kinetic(basis_a, basis_b):
     return kinetic_integral
 
 
+@primitive
 def _boys(n, t):
     r"""Evaluate the Boys function.
 
@@ -486,20 +538,78 @@ def _boys(n, t):
 
         \gamma(m, t) = \int_{0}^{t} x^{m-1} e^{-x} dx.
 
+    The Boys function is evaluated from a table of values computed with the incomplete Gamma
+    function on a grid of :math:`t` values, using the Taylor expansion
+
+    .. math::
+
+        F_n(t) = \sum_{k=0}^{6} \frac{F_{n+k}(t_i) (t_i - t)^k}{k!},
+
+    around the closest grid point :math:`t_i`. Non-integer orders and values of :math:`t` larger
+    than the grid are evaluated directly from the incomplete Gamma function. The derivative
+    :math:`dF_n(t)/dt = -F_{n+1}(t)` is used for differentiation.
+
     Args:
         n (float): order of the Boys function
         t (array[float]): exponent of the Boys function
 
     Returns:
-        float: value of the Boys function
+        (array[float]): value of the Boys function
     """
-    return anp.where(
-        t == 0,
-        1 / (2 * n + 1),
-        asp.special.gammainc(n + 0.5, t + (t == 0))
-        * asp.special.gamma(n + 0.5)
-        / (2 * (t + (t == 0)) ** (n + 0.5)),
-    )  # (t == 0) is added to avoid divide by zero
+    t = np.asarray(t, dtype=float)
+
+    if n != int(n):
+        return _boys_gamma(n, t)
+
+    n = int(n)
+    table = _boys_table(n + BOYS_TAYLOR_ORDER)
+
+    index = np.rint(np.minimum(t, BOYS_GRID_MAX) / BOYS_GRID_STEP).astype(int)
+    dt = index * BOYS_GRID_STEP - t
+
+    f = 0.0
+    for k in range(BOYS_TAYLOR_ORDER, -1, -1):
+        f = f * dt / (k + 1) + table[n + k][index]
+
+    if np.any(t > BOYS_GRID_MAX):
+        f = np.where(t > BOYS_GRID_MAX, _boys_gamma(n, np.maximum(t, BOYS_GRID_MAX)), f)
+
+    return f
+
+
+defvjp(_boys, lambda ans, n, t: lambda g: -g * _boys(n + 1, t), argnums=[1])
+
+
+@functools.lru_cache()
+def _boys_table(n_max):
+    r"""Tabulate the Boys function on a grid of exponents.
+
+    Args:
+        n_max (int): maximum order of the Boys function
+
+    Returns:
+        array[float]: values of the Boys function of orders :math:`0, \ldots, n_{max}` on the grid
+    """
+    n = np.arange(n_max + 1)[:, np.newaxis]
+    t = np.arange(round(BOYS_GRID_MAX / BOYS_GRID_STEP) + 1) * BOYS_GRID_STEP
+
+    return _boys_gamma(n, t)
+
+
+def _boys_gamma(n, t):
+    r"""Evaluate the Boys function from the lower incomplete Gamma function.
+
+    Args:
+        n (float or array[float]): order of the Boys function
+        t (array[float]): exponent of the Boys function
+
+    Returns:
+        array[float]: value of the Boys function
+    """
+    t_nonzero = np.where(t == 0, 1.0, t)  # F_n(0) = 1 / (2n + 1) is set below
+    f = gammainc(n + 0.5, t_nonzero) * gamma(n + 0.5) / (2 * t_nonzero ** (n + 0.5))
+
+    return np.where(t == 0, 1 / (2 * n + 1), f)
 
 
 def _hermite_coulomb(t, u, v, n, p, dr):
@@ -541,29 +651,53 @@ def _hermite_coulomb(t, u, v, n, p, dr):
     Returns:
         array[float]: value of the Hermite integral
     """
+    return _hermite_coulomb_memo(p, dr, t + u + v + n)(t, u, v, n)
+
+
+def _hermite_coulomb_memo(p, dr, n_max):
+    r"""Return a memoized function that evaluates the Hermite integrals :math:`R_{tuv}^n` with
+    :math:`t + u + v + n \leq n_{max}` for a fixed set of primitive Gaussian functions.
+
+    The Boys functions of all required orders are evaluated once, and the intermediate Hermite
+    integrals of the recursion described in :func:`~._hermite_coulomb` are computed only once and
+    shared by all requested integrals.
+
+    Args:
+        p (float): sum of the Gaussian exponents
+        dr (array[float]): distance between the center of the composite Gaussian and the nucleus
+        n_max (int): maximum value of :math:`t + u + v + n`
+
+    Returns:
+        function: function that computes :math:`R_{tuv}^n` from the integers ``t, u, v, n``
+    """
     x, y, z = dr[0], dr[1], dr[2]
     T = p * (dr**2).sum(axis=0)
-    r = 0
 
-    if t == u == v == 0:
-        return ((-2 * p) ** n) * _boys(n, T)
+    memo = {(0, 0, 0, n): ((-2 * p) ** n) * _boys(n, T) for n in range(n_max + 1)}
 
-    if t == u == 0:
-        if v > 1:
-            r = r + (v - 1) * _hermite_coulomb(t, u, v - 2, n + 1, p, dr)
-        r = r + z * _hermite_coulomb(t, u, v - 1, n + 1, p, dr)
-        return r
+    def hermite(t, u, v, n):
+        if (t, u, v, n) in memo:
+            return memo[(t, u, v, n)]
+
+        r = 0
+
+        if t == u == 0:
+            if v > 1:
+                r = r + (v - 1) * hermite(t, u, v - 2, n + 1)
+            r = r + z * hermite(t, u, v - 1, n + 1)
+        elif t == 0:
+            if u > 1:
+                r = r + (u - 1) * hermite(t, u - 2, v, n + 1)
+            r = r + y * hermite(t, u - 1, v, n + 1)
+        else:
+            if t > 1:
+                r = r + (t - 1) * hermite(t - 2, u, v, n + 1)
+            r = r + x * hermite(t - 1, u, v, n + 1)
 
-    if t == 0:
-        if u > 1:
-            r = r + (u - 1) * _hermite_coulomb(t, u - 2, v, n + 1, p, dr)
-        r = r + y * _hermite_coulomb(t, u - 1, v, n + 1, p, dr)
+        memo[(t, u, v, n)] = r
         return r
 
-    if t > 1:
-        r = r + (t - 1) * _hermite_coulomb(t - 2, u, v, n + 1, p, dr)
-    r = r + x * _hermite_coulomb(t - 1, u, v, n + 1, p, dr)
-    return r
+    return hermite
 
 
 def nuclear_attraction(la, lb, ra, rb, alpha, beta, r):
@@ -602,11 +736,14 @@ def nuclear_attraction(la, lb, ra, rb, alpha, beta, r):
     )
     dr = rgp - anp.array(r)[:, anp.newaxis, anp.newaxis]
 
+    e_t = _expansion_coefficients(l1, l2, ra[0], rb[0], alpha, beta)
+    e_u = _expansion_coefficients(m1, m2, ra[1], rb[1], alpha, beta)
+    e_v = _expansion_coefficients(n1, n2, ra[2], rb[2], alpha, beta)
+    hermite = _hermite_coulomb_memo(p, dr, l1 + l2 + m1 + m2 + n1 + n2)
+
     a = 0.0
     for t, u, v in it.product(*[range(l) for l in [l1 + l2 + 1, m1 + m2 + 1, n1 + n2 + 1]]):
-        a = a + expansion(l1, l2, ra[0], rb[0], alpha, beta, t) * expansion(
-            m1, m2, ra[1], rb[1], alpha, beta, u
-        ) * expansion(n1, n2, ra[2], rb[2], alpha, beta, v) * _hermite_coulomb(t, u, v, 0, p, dr)
+        a = a + e_t[t] * e_u[u] * e_v[v] * hermite(t, u, v, 0)
     a = a * 2 * anp.pi / p
     return a
 
@@ -733,19 +870,29 @@ def electron_repulsion(la, lb, lc, ld, ra, rb, rc, rd, alpha, beta, gamma, delta
         + delta * rd[:, anp.newaxis, anp.newaxis, anp.newaxis, anp.newaxis]
     ) / (gamma + delta)
 
-    g_t = [expansion(l1, l2, ra[0], rb[0], alpha, beta, t) for t in range(l1 + l2 + 1)]
-    g_u = [expansion(m1, m2, ra[1], rb[1], alpha, beta, u) for u in range(m1 + m2 + 1)]
-    g_v = [expansion(n1, n2, ra[2], rb[2], alpha, beta, v) for v in range(n1 + n2 + 1)]
-    g_r = [expansion(l3, l4, rc[0], rd[0], gamma, delta, r) for r in range(l3 + l4 + 1)]
-    g_s = [expansion(m3, m4, rc[1], rd[1], gamma, delta, s) for s in range(m3 + m4 + 1)]
-    g_w = [expansion(n3, n4, rc[2], rd[2], gamma, delta, w) for w in range(n3 + n4 + 1)]
+    g_t = _expansion_coefficients(l1, l2, ra[0], rb[0], alpha, beta)
+    g_u = _expansion_coefficients(m1, m2, ra[1], rb[1], alpha, beta)
+    g_v = _expansion_coefficients(n1, n2, ra[2], rb[2], alpha, beta)
+    g_r = _expansion_coefficients(l3, l4, rc[0], rd[0], gamma, delta)
+    g_s = _expansion_coefficients(m3, m4, rc[1], rd[1], gamma, delta)
+    g_w = _expansion_coefficients(n3, n4, rc[2], rd[2], gamma, delta)
+
+    # the Hermite integrals are shared by all combinations of the expansion coefficients
+    hermite = _hermite_coulomb_memo(
+        (p * q) / (p + q), p_ab - p_cd, l1 + l2 + l3 + l4 + m1 + m2 + m3 + m4 + n1 + n2 + n3 + n4
+    )
+
+    g_cd = [
+        ((r, s, w), (-1) ** (r + s + w) * g_r[r] * g_s[s] * g_w[w])
+        for r, s, w in it.product(range(l3 + l4 + 1), range(m3 + m4 + 1), range(n3 + n4 + 1))
+    ]
 
     g = 0.0
-    lengths = [l1 + l2 + 1, m1 + m2 + 1, n1 + n2 + 1, l3 + l4 + 1, m3 + m4 + 1, n3 + n4 + 1]
-    for t, u, v, r, s, w in it.product(*[range(length) for length in lengths]):
-        g = g + g_t[t] * g_u[u] * g_v[v] * g_r[r] * g_s[s] * g_w[w] * (
-            (-1) ** (r + s + w)
-        ) * _hermite_coulomb(t + r, u + s, v + w, 0, (p * q) / (p + q), p_ab - p_cd)
+    for t, u, v in it.product(range(l1 + l2 + 1), range(m1 + m2 + 1), range(n1 + n2 + 1)):
+        g_ab = 0.0
+        for (r, s, w), c in g_cd:
+            g_ab = g_ab + c * hermite(t + r, u + s, v + w, 0)
+        g = g + g_t[t] * g_u[u] * g_v[v] * g_ab
 
     g = g * 2 * (anp.pi**2.5) / (p * q * anp.sqrt(p + q))
 
@@ -15,6 +15,7 @@
 This module contains the functions needed for computing matrices.
 """
 # pylint: disable= too-many-branches
+import functools
 import itertools as it
 
 import autograd.numpy as anp
@@ -221,12 +222,50 @@ def generate_attraction_matrix(basis_functions, charges, r):
     return attraction
 
 
-def generate_repulsion_tensor(basis_functions):
+@functools.lru_cache()
+def _repulsion_indices(n):
+    r"""Return the canonical index quartets of the electron repulsion tensor and the maps that
+    scatter them into the full and packed tensors.
+
+    The electron repulsion integrals :math:`(ij|kl)` are invariant under :math:`i \leftrightarrow j`,
+    :math:`k \leftrightarrow l` and :math:`ij \leftrightarrow kl`. Only the quartets with
+    :math:`i \geq j`, :math:`k \geq l` and :math:`ij \geq kl` are unique, where the pair
+    :math:`(i, j)` is labelled by the compound index :math:`ij = i(i+1)/2 + j`.
+
+    Args:
+        n (int): number of basis functions
+
+    Returns:
+        tuple(list[tuple[int]], array[int], array[int]): the canonical quartets, an array of shape
+        ``(n, n, n, n)`` and an array of shape ``(n(n+1)/2, n(n+1)/2)`` holding, for each element of
+        the full and packed tensors, the position of its canonical quartet
+    """
+    pairs = [(i, j) for i in range(n) for j in range(i + 1)]
+    pair_index = anp.zeros((n, n), dtype=int)
+    packed_map = anp.zeros((len(pairs), len(pairs)), dtype=int)
+    quartets = []
+
+    for p, (i, j) in enumerate(pairs):
+        pair_index[i, j] = pair_index[j, i] = p
+        for q, (k, l) in enumerate(pairs[: p + 1]):
+            packed_map[p, q] = packed_map[q, p] = len(quartets)
+            quartets.append((i, j, k, l))
+
+    index_map = packed_map[pair_index[:, :, anp.newaxis, anp.newaxis], pair_index]
+    index_map.flags.writeable = packed_map.flags.writeable = False
+
+    return quartets, index_map, packed_map
+
+
+def generate_repulsion_tensor(basis_functions, packed=False):
     r"""Return a function that computes the electron repulsion tensor for a given set of basis
     functions.
 
     Args:
         basis_functions (list[~hf.basis_set.BasisFunction]): basis functions
+        packed (bool): if ``True``, the function returns the tensor in the packed format
+            :math:`(ij|kl)` with compound indices :math:`ij = i(i+1)/2 + j` for :math:`i \geq j`,
+            which has shape ``(n(n+1)/2, n(n+1)/2)`` for ``n`` basis functions
 
     Returns:
         function: function that computes the electron repulsion tensor
@@ -259,33 +298,18 @@ def generate_repulsion_tensor(basis_functions):
             array[array[float]]: the electron repulsion tensor
         """
         n = len(basis_functions)
-        repulsion_tensor = anp.zeros((n, n, n, n))
-        e_calc = []
-
-        for (i, a), (j, b), (k, c), (l, d) in it.product(enumerate(basis_functions), repeat=4):
-            if (i, j, k, l) not in e_calc:
-                args_abcd = []
-                if args:
-                    args_abcd.extend(arg[[i, j, k, l]] for arg in args)
-                repulsion_integral = generate_repulsion(a, b, c, d)(*args_abcd)
-
-                permutations = [
-                    (i, j, k, l),
-                    (k, l, i, j),
-                    (j, i, l, k),
-                    (l, k, j, i),
-                    (j, i, k, l),
-                    (l, k, i, j),
-                    (i, j, l, k),
-                    (k, l, j, i),
-                ]
-
-                o = anp.zeros((n, n, n, n))
-                for perm in permutations:
-                    o[perm] = 1.0
-                repulsion_tensor = repulsion_tensor + repulsion_integral * o
-                e_calc = e_calc + permutations
-        return repulsion_tensor
+        quartets, index_map, packed_map = _repulsion_indices(n)
+
+        integrals = []
+        for i, j, k, l in quartets:
+            args_abcd = []
+            if args:
+                args_abcd.extend(arg[[i, j, k, l]] for arg in args)
+            a, b, c, d = (basis_functions[idx] for idx in (i, j, k, l))
+            integrals.append(generate_repulsion(a, b, c, d)(*args_abcd))
+        integrals = anp.stack(integrals)
+
+        return integrals[packed_map] if packed else integrals[index_map]
 
     return repulsion
 
@@ -26,6 +26,7 @@ Execution functions and utilities
     ~execute
     ~interfaces.cache_execute
     ~interfaces.set_shots
+    ~interfaces.PersistentCache
 
 Supported interfaces
 ~~~~~~~~~~~~~~~~~~~~
@@ -41,6 +42,7 @@ Supported interfaces
     ~interfaces.torch
 
 """
+from .cache import PersistentCache
 from .execution import cache_execute, execute, INTERFACE_MAP, SUPPORTED_INTERFACES
 from .set_shots import set_shots
 
@@ -22,6 +22,8 @@ from autograd.numpy.numpy_boxes import ArrayBox
 import pennylane as qml
 from pennylane import numpy as np
 
+from .execution import DeviceVJP
+
 
 def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_diff=2, mode=None):
     """Execute a batch of tapes with Autograd parameters on a device.
@@ -232,10 +234,16 @@ def vjp(
                 # - gradient_fn is not differentiable
                 #
                 # so we cannot support higher-order derivatives.
-                with qml.tape.Unwrap(*tapes):
-                    jacs = gradient_fn(tapes, **gradient_kwargs)
+                if isinstance(gradient_fn, DeviceVJP):
+                    # The device computes the VJPs directly from the forward pass
+                    with qml.tape.Unwrap(*tapes):
+                        vjps = gradient_fn(tapes, dy, **gradient_kwargs)
+
+                else:
+                    with qml.tape.Unwrap(*tapes):
+                        jacs = gradient_fn(tapes, **gradient_kwargs)
 
-                vjps = [qml.gradients.compute_vjp(d, jac) for d, jac in zip(dy, jacs)]
+                    vjps = [qml.gradients.compute_vjp(d, jac) for d, jac in zip(dy, jacs)]
 
         return_vjps = [
             qml.math.to_numpy(v, max_depth=_n) if isinstance(v, ArrayBox) else v for v in vjps
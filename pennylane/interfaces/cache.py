@@ -0,0 +1,245 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Contains the :class:`PersistentCache`, an execution cache that stores
+results on disk so that they can be reused across processes.
+"""
+import copy
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import MutableMapping
+
+
+class PersistentCache(MutableMapping):
+    """Execution cache that stores results in a local SQLite database.
+
+    Unlike the in-memory cache created by :func:`~.execute`, the results stored in
+    a persistent cache outlive the Python process. Re-running a parameter sweep, restarting
+    a job, or running several workers on the same node can therefore reuse results that were
+    computed previously.
+
+    Entries are keyed by the process-independent :attr:`~.QuantumTape.fingerprint` of the tape,
+    combined with the name, version, wires and shots of the device that executed it. When the
+    total size of the stored results exceeds ``maxsize``, the least recently used entries are
+    evicted.
+
+    .. warning::
+
+        Stored results are serialized with :mod:`pickle` and unpickled when they are retrieved,
+        which can execute arbitrary code. Only use database files that were written by trusted
+        users, and do not place them in locations writable by untrusted users.
+
+    Args:
+        path (str): location of the database file; it is created if it does not exist
+        maxsize (int): maximum total size of the stored results, in bytes
+        timeout (float): number of seconds to wait for another process holding a lock
+            on the database before raising an error
+
+    **Example**
+
+    The cache can be passed to :func:`~.execute` or a QNode like any other cache:
+
+    .. code-block:: python
+
+        cache = qml.interfaces.PersistentCache("results.db")
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, cache=cache, diff_method="parameter-shift")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+    >>> circuit(0.5)
+    tensor(0.87758256, requires_grad=True)
+    >>> circuit(0.5)
+    tensor(0.87758256, requires_grad=True)
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    Results of devices that support backpropagation, such as ``default.qubit`` with the default
+    ``diff_method="best"``, are tracked by an autodifferentiation framework and are not stored.
+
+    Executing the QNode in a new Python session with a cache pointing to
+    the same file retrieves the result from disk, without executing the circuit.
+    """
+
+    def __init__(self, path, maxsize=2**30, timeout=60.0):
+        self.path = path
+        self.maxsize = maxsize
+
+        self._scope = ""
+        self._passthru = False
+        self._stats = Counter(hits=0, misses=0)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, value BLOB, size INTEGER, accessed REAL)"
+        )
+
+    @property
+    def hits(self):
+        """int: number of results that were retrieved from the cache"""
+        return self._stats["hits"]
+
+    @property
+    def misses(self):
+        """int: number of results that were not found in the cache, and were computed and stored"""
+        return self._stats["misses"]
+
+    @property
+    def currsize(self):
+        """int: total size of the stored results, in bytes"""
+        with self._lock:
+            (size,) = self._connection.execute("SELECT SUM(size) FROM results").fetchone()
+        return size or 0
+
+    def bind(self, device, shots=False, label="execute"):
+        """Returns a view of the cache whose keys account for the device the tapes are executed on.
+
+        The returned cache shares its storage and hit/miss counters with this cache.
+        Results of devices that support backpropagation are not stored.
+
+        Args:
+            device (.Device): device that executes the tapes
+            shots (None, int, list[int], bool): Shots the tapes are executed with. If ``False``
+                (the default), the shots of the device are used.
+            label (str): distinguishes between different kinds of results computed
+                for the same tape, for example results and gradients
+
+        Returns:
+            .PersistentCache: the bound cache
+        """
+        shots = device.shots if shots is False else shots
+        config = (
+            device.short_name,
+            device.version,
+            device.wires.tolist(),
+            str(shots),
+            str(getattr(device, "C_DTYPE", None)),
+            label,
+        )
+
+        bound_cache = copy.copy(self)
+        bound_cache._scope = hashlib.sha256(str(config).encode()).hexdigest()
+        bound_cache._passthru = "passthru_interface" in device.capabilities()
+        return bound_cache
+
+    def tape_key(self, tape):
+        """Returns the key under which the results of a tape are stored.
+
+        Args:
+            tape (.QuantumTape): the tape
+
+        Returns:
+            str: the key of the tape
+        """
+        return hashlib.sha256((self._scope + tape.fingerprint).encode()).hexdigest()
+
+    def __contains__(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM results WHERE key = ?", (str(key),)
+            ).fetchone()
+
+        return row is not None
+
+    def __getitem__(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE key = ?", (str(key),)
+            ).fetchone()
+
+            if row is None:
+                raise KeyError(key)
+
+            self._connection.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), str(key))
+            )
+
+        self._stats["hits"] += 1
+        return pickle.loads(row[0])
+
+    def __setitem__(self, key, value):
+        # Results are only passed to the cache after a failed lookup. Misses are counted
+        # when a result is stored rather than in ``__contains__``, since a QNode checks
+        # whether its tape is cached before the lookup made by ``cache_execute``.
+        if self._passthru:
+            # results of devices that support backpropagation are tracked
+            # by an autodifferentiation framework and cannot be restored from disk
+            return
+
+        value = pickle.dumps(value)
+
+        if len(value) > self.maxsize:
+            return
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (str(key), value, len(value), time.time()),
+            )
+            self._evict()
+
+        self._stats["misses"] += 1
+
+    def __delitem__(self, key):
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM results WHERE key = ?", (str(key),))
+
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self):
+        with self._lock:
+            keys = self._connection.execute("SELECT key FROM results").fetchall()
+        return (key for (key,) in keys)
+
+    def __len__(self):
+        with self._lock:
+            (length,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return length
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+
+    def close(self):
+        """Closes the connection to the database."""
+        self._connection.close()
+
+    def _evict(self):
+        """Removes the least recently used entries until the stored results fit into ``maxsize``."""
+        excess = self.currsize - self.maxsize
+
+        if excess <= 0:
+            return
+
+        evicted = []
+        rows = self._connection.execute("SELECT key, size FROM results ORDER BY accessed")
+
+        for key, size in rows:
+            if excess <= 0:
+                break
+
+            evicted.append((key,))
+            excess -= size
+
+        self._connection.executemany("DELETE FROM results WHERE key = ?", evicted)
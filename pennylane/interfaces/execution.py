@@ -27,6 +27,7 @@ from cachetools import LRUCache
 
 import pennylane as qml
 
+from .cache import PersistentCache
 from .set_shots import set_shots
 
 
@@ -56,8 +57,9 @@ def cache_execute(fn, cache, pass_kwargs=False, return_tuple=True, expand_fn=Non
     """Decorator that adds caching to a function that executes
     multiple tapes on a device.
 
-    This decorator makes use of :attr:`.QuantumTape.hash` to identify
-    unique tapes.
+    This decorator makes use of :attr:`.QuantumTape.fingerprint` to identify
+    unique tapes. Caches that provide a ``tape_key`` method, such as
+    :class:`~.PersistentCache`, may instead define their own keys.
 
     - If a tape does not match a hash in the cache, then the tape
       has not been previously executed. It is executed, and the result
@@ -113,8 +115,10 @@ def cache_execute(fn, cache, pass_kwargs=False, return_tuple=True, expand_fn=Non
         hashes = {}
         repeated = {}
 
+        tape_key = getattr(cache, "tape_key", lambda tape: tape.fingerprint)
+
         for i, tape in enumerate(tapes):
-            h = tape.hash
+            h = tape_key(tape)
 
             if h in hashes.values():
                 # Tape already exists within ``tapes``. Determine the
@@ -194,6 +198,109 @@ def cache_execute(fn, cache, pass_kwargs=False, return_tuple=True, expand_fn=Non
     return wrapper
 
 
+class DeviceVJP:
+    """Computes the vector-Jacobian products of tapes on the device, reusing the
+    forward pass of each tape.
+
+    The tapes are executed on the forward pass via ``device.execute_and_vjp``, which
+    returns the results together with one vector-Jacobian product function per tape.
+    These functions are stored by the position of their tape in the batch until the
+    backward pass, where the interfaces call this object with the tapes in the same
+    order and with their output gradients ``dy``. If the backward pass receives a
+    different number of tapes, they are executed again.
+
+    Args:
+        device (.Device): device that supports ``execute_and_vjp``
+        override_shots (int): the number of shots to use for the execution
+    """
+
+    def __init__(self, device, override_shots=False):
+        self.device = device
+        self.override_shots = override_shots
+        self._vjp_fns = []
+
+    def execute(self, tapes, **kwargs):
+        """Execute a batch of tapes, and store their vector-Jacobian product functions.
+
+        Args:
+            tapes (Sequence[.QuantumTape]): batch of tapes to execute
+            **kwargs: keyword arguments to pass to ``device.execute_and_vjp``
+
+        Returns:
+            list[array[float]]: the results of the tapes
+        """
+        res, self._vjp_fns = self._execute_and_vjp(tapes, **kwargs)
+        return res
+
+    def __call__(self, tapes, dys, **kwargs):
+        """Compute the vector-Jacobian products of a batch of tapes.
+
+        Args:
+            tapes (Sequence[.QuantumTape]): batch of tapes that were executed
+            dys (Sequence[tensor_like]): the output gradients of the tapes
+            **kwargs: keyword arguments to pass to ``device.execute_and_vjp``, if a
+                tape has to be executed again
+
+        Returns:
+            list[tensor_like]: the vector-Jacobian products, with the same
+            type and dtype as the corresponding output gradients
+        """
+        if len(tapes) != len(self._vjp_fns):
+            # the forward pass of this batch has not been stored
+            self.execute(tapes, **kwargs)
+
+        vjps = []
+
+        for vjp_fn, dy in zip(self._vjp_fns, dys):
+            vjp = vjp_fn(qml.math.to_numpy(dy))
+            vjps.append(qml.math.cast(qml.math.convert_like(vjp, dy), dy.dtype))
+
+        return vjps
+
+    def _execute_and_vjp(self, tapes, **kwargs):
+        """Execute the tapes on the device, returning the results and the
+        vector-Jacobian product functions. The final states are kept by the
+        device for each tape separately, so ``use_device_state`` does not apply."""
+        kwargs.pop("use_device_state", None)
+        execute_fn = set_shots(self.device, self.override_shots)(self.device.execute_and_vjp)
+        return execute_fn(tapes, **kwargs)
+
+
+def _batch_transform_broadcasted(device, fn):
+    """Wraps a function that executes a batch of tapes on a device, such that broadcasted
+    tapes are passed through :meth:`.Device.batch_transform` first.
+
+    The tapes of a gradient computation are executed without the batch transform of the device,
+    and may be broadcasted if they were created with ``broadcast=True``. The batch transform
+    expands them if the device cannot execute them as they are.
+
+    Args:
+        device (.Device): the device executing the tapes
+        fn (callable): the execution function, with signature ``fn(tapes)``
+
+    Returns:
+        callable: the wrapped execution function
+    """
+
+    def transform(tape):
+        if tape.batch_size is None:
+            return [tape], lambda res: res[0]
+
+        return device.batch_transform(tape)
+
+    @wraps(fn)
+    def wrapper(tapes, **kwargs):
+        tapes = list(tapes)
+
+        if all(tape.batch_size is None for tape in tapes):
+            return fn(tapes, **kwargs)
+
+        tapes, batch_fn = qml.transforms.map_batch_transform(transform, tapes)
+        return batch_fn(fn(tapes, **kwargs))
+
+    return wrapper
+
+
 def execute(
     tapes,
     device,
@@ -226,11 +333,13 @@ def execute(
             pass (``forward``) or the backward pass (``backward``). Only applies
             if the device is queried for the gradient; gradient transform
             functions available in ``qml.gradients`` are only supported on the backward
-            pass.
+            pass, with the exception of the JAX interface, where ``forward`` computes
+            Jacobian-vector products of the gradient transform.
         gradient_kwargs (dict): dictionary of keyword arguments to pass when
             determining the gradients of tapes
-        cache (bool): Whether to cache evaluations. This can result in
+        cache (bool or dict or Cache): Whether to cache evaluations. This can result in
             a significant reduction in quantum evaluations during gradient computations.
+            A :class:`~.PersistentCache` may be passed to reuse results across processes.
         cachesize (int): the size of the cache
         max_diff (int): If ``gradient_fn`` is a gradient transform, this option specifies
             the maximum number of derivatives to support. Increasing this value allows
@@ -319,7 +428,19 @@ def execute(
         cache = LRUCache(maxsize=cachesize, getsizeof=lambda x: qml.math.shape(x)[0])
         setattr(cache, "_persistent_cache", False)
 
-    batch_execute = set_shots(device, override_shots)(device.batch_execute)
+    gradient_cache = cache
+
+    if isinstance(cache, PersistentCache):
+        # results and device gradients of the same tape are stored separately
+        gradient_cache = cache.bind(device, override_shots, label="gradients")
+        cache = cache.bind(device, override_shots)
+
+    batch_execute = device.batch_execute
+
+    if device_batch_transform:
+        batch_execute = _batch_transform_broadcasted(device, batch_execute)
+
+    batch_execute = set_shots(device, override_shots)(batch_execute)
 
     if expand_fn == "device":
         expand_fn = lambda tape: device.expand_fn(tape, max_expansion=max_expansion)
@@ -367,6 +488,21 @@ def execute(
             gradient_fn = None
             _mode = "forward"
 
+        elif (
+            mode == "backward"
+            and gradient_kwargs.get("method") == "adjoint_jacobian"
+            and hasattr(device, "execute_and_vjp")
+            and not isinstance(gradient_cache, PersistentCache)
+        ):
+            # The device keeps the final state of each forward pass, and contracts
+            # the output gradients with the observables on the backward pass. Caching
+            # is disabled on the forward pass, such that every tape of the batch has
+            # a stored state. Jacobians stored in a persistent cache are reused instead.
+            gradient_fn = DeviceVJP(device, override_shots)
+            execute_fn = qml.interfaces.cache_execute(
+                gradient_fn.execute, cache=None, pass_kwargs=True
+            )
+
         elif mode == "backward":
             # disable caching on the forward pass
             execute_fn = qml.interfaces.cache_execute(batch_execute, cache=None)
@@ -374,16 +510,21 @@ def execute(
             # replace the backward gradient computation
             gradient_fn = qml.interfaces.cache_execute(
                 set_shots(device, override_shots)(device.gradients),
-                cache,
+                gradient_cache,
                 pass_kwargs=True,
                 return_tuple=False,
             )
 
     elif mode == "forward":
-        # In "forward" mode, gradients are automatically handled
-        # within execute_and_gradients, so providing a gradient_fn
-        # in this case would have ambiguous behaviour.
-        raise ValueError("Gradient transforms cannot be used with mode='forward'")
+        if INTERFACE_MAP.get(interface) != "jax":
+            # In "forward" mode, gradients are automatically handled
+            # within execute_and_gradients, so providing a gradient_fn
+            # in this case would have ambiguous behaviour.
+            raise ValueError("Gradient transforms cannot be used with mode='forward'")
+
+        # The JAX interface supports forward-mode differentiation of
+        # gradient transforms via Jacobian-vector products.
+        _mode = "forward"
 
     try:
         mapped_interface = INTERFACE_MAP[interface]
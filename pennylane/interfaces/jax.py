@@ -22,6 +22,7 @@ import jax.numpy as jnp
 import pennylane as qml
 from pennylane.measurements import Sample, Probability
 from pennylane.interfaces import InterfaceUnsupportedError
+from pennylane.interfaces.execution import DeviceVJP
 
 dtype = jnp.float64
 
@@ -83,7 +84,9 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
         mode (str): Whether the gradients should be computed on the forward
-            pass (``forward``) or the backward pass (``backward``).
+            pass (``forward``) or the backward pass (``backward``). If ``gradient_fn``
+            is a gradient transform, ``forward`` registers Jacobian-vector products
+            for forward-mode differentiation, for example via ``jax.jvp``.
 
     Returns:
         list[list[float]]: A nested list of tape results. Each element in
@@ -112,6 +115,17 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             _n=_n,
         )
 
+    if mode == "forward":
+        return _execute_jvp(
+            parameters,
+            tapes=tapes,
+            device=device,
+            execute_fn=execute_fn,
+            gradient_fn=gradient_fn,
+            gradient_kwargs=gradient_kwargs,
+            _n=_n,
+        )
+
     return _execute(
         parameters,
         tapes=tapes,
@@ -249,10 +263,16 @@ def _execute(
             return (tuple(res),)
 
         # Gradient function is a device method.
-        with qml.tape.Unwrap(*tapes):
-            jacs = gradient_fn(tapes, **gradient_kwargs)
+        if isinstance(gradient_fn, DeviceVJP):
+            # The device computes the VJPs directly from the forward pass
+            with qml.tape.Unwrap(*tapes):
+                vjps = gradient_fn(tapes, g, **gradient_kwargs)
+
+        else:
+            with qml.tape.Unwrap(*tapes):
+                jacs = gradient_fn(tapes, **gradient_kwargs)
 
-        vjps = [qml.gradients.compute_vjp(d, jac) for d, jac in zip(g, jacs)]
+            vjps = [qml.gradients.compute_vjp(d, jac) for d, jac in zip(g, jacs)]
         res = [[jnp.array(p) for p in v] for v in vjps]
         return (tuple(res),)
 
@@ -260,6 +280,77 @@ def _execute(
     return wrapped_exec(params)
 
 
+def _execute_jvp(
+    params,
+    tapes=None,
+    device=None,
+    execute_fn=None,
+    gradient_fn=None,
+    gradient_kwargs=None,
+    _n=1,
+):  # pylint: disable=dangerous-default-value,unused-argument
+    """The interface execution function used when forward mode was requested
+    with a gradient transform. Jacobian-vector products of the execute function
+    are computed by the registered JVP rule, shifting only those parameters
+    that are weighted by the tangent vector."""
+
+    # Copy a given tape with operations and set parameters
+    def cp_tape(t, a):
+        tc = t.copy(copy_operations=True)
+        tc.set_parameters(a)
+        return tc
+
+    @jax.custom_jvp
+    def wrapped_exec(params):
+        new_tapes = [cp_tape(t, a) for t, a in zip(tapes, params)]
+        with qml.tape.Unwrap(*new_tapes):
+            res, _ = execute_fn(new_tapes, **gradient_kwargs)
+
+        if len(tapes) > 1:
+            res = [jnp.array(r) for r in res]
+        else:
+            res = jnp.array(res)
+
+        return res
+
+    @wrapped_exec.defjvp
+    def wrapped_exec_jvp(primals, tangents):
+        (params,) = primals
+        (tangents,) = tangents
+        res = wrapped_exec(params)
+
+        tangents = [jnp.stack(t) if len(t) > 0 else jnp.zeros([0]) for t in tangents]
+
+        new_tapes = [cp_tape(t, a) for t, a in zip(tapes, params)]
+        with qml.tape.Unwrap(*new_tapes):
+            jvp_tapes, processing_fn = qml.gradients.batch_jvp(
+                new_tapes,
+                tangents,
+                gradient_fn,
+                reduction="append",
+                gradient_kwargs=gradient_kwargs,
+            )
+
+            partial_res = execute_fn(jvp_tapes)[0]
+
+        jvps = processing_fn(partial_res)
+
+        # Reshape the JVPs to match the structure of the results. Tapes
+        # without trainable parameters have a vanishing JVP.
+        results = res if len(tapes) > 1 else res[0:1]
+        jvps = [
+            jnp.zeros_like(r) if j is None else jnp.reshape(j, jnp.shape(r)).astype(r.dtype)
+            for r, j in zip(results, jvps)
+        ]
+
+        if len(tapes) == 1:
+            jvps = jnp.stack(jvps)
+
+        return res, jvps
+
+    return wrapped_exec(params)
+
+
 def _raise_vector_valued_fwd(tapes):
     """Raises an error for vector-valued tapes in forward mode due to incorrect
     results being produced.
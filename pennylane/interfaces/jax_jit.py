@@ -24,6 +24,7 @@ from jax.experimental import host_callback
 import numpy as np
 import pennylane as qml
 from pennylane.interfaces import InterfaceUnsupportedError
+from pennylane.interfaces.execution import DeviceVJP
 from pennylane.interfaces.jax import _raise_vector_valued_fwd
 
 dtype = jnp.float64
@@ -61,6 +62,11 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
     if max_diff > 1:
         raise InterfaceUnsupportedError("The JAX interface only supports first order derivatives.")
 
+    if mode == "forward" and gradient_fn is not None:
+        raise ValueError(
+            "Gradient transforms cannot be used with mode='forward' when using jax.jit."
+        )
+
     for tape in tapes:
         # set the trainable parameters
         params = tape.get_parameters(trainable_only=False)
@@ -209,6 +215,24 @@ def _execute(
 
             return (tuple(res),)
 
+        if isinstance(gradient_fn, DeviceVJP):
+
+            def device_vjp_wrapper(args):
+                """Compute the VJPs on the device from the forward pass."""
+                p = args[:-1]
+                dy = args[-1]
+
+                new_tapes = [cp_tape(t, a) for t, a in zip(tapes, p)]
+                with qml.tape.Unwrap(*new_tapes):
+                    vjps = gradient_fn(new_tapes, dy, **gradient_kwargs)
+
+                return [np.asarray(v, dtype=dtype) for v in vjps]
+
+            shapes = [jax.ShapeDtypeStruct((len(p),), dtype) for p in params]
+            vjps = host_callback.call(device_vjp_wrapper, tuple(params) + (g,), result_shape=shapes)
+            res = [[jnp.array(p) for p in v] for v in vjps]
+            return (tuple(res),)
+
         def jacs_wrapper(p):
             """Compute the jacs"""
             new_tapes = [cp_tape(t, a) for t, a in zip(tapes, p)]
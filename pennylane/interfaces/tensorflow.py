@@ -22,6 +22,8 @@ from tensorflow.python.eager import context
 
 import pennylane as qml
 
+from .execution import DeviceVJP
+
 
 def _compute_vjp(dy, jacs):
     # compute the vector-Jacobian product dy @ jac
@@ -170,7 +172,12 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
                     #
                     # so we cannot support higher-order derivatives.
                     with qml.tape.Unwrap(*tapes, params=params_unwrapped):
-                        vjps = _compute_vjp(dy, gradient_fn(tapes, **gradient_kwargs))
+                        if isinstance(gradient_fn, DeviceVJP):
+                            # The device computes the VJPs directly from the forward pass
+                            device_vjps = gradient_fn(tapes, dy, **gradient_kwargs)
+                            vjps = [v for vjp in device_vjps for v in qml.math.unstack(vjp)]
+                        else:
+                            vjps = _compute_vjp(dy, gradient_fn(tapes, **gradient_kwargs))
 
             variables = tfkwargs.get("variables", None)
             return (vjps, variables) if variables is not None else vjps
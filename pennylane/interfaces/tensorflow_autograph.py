@@ -22,6 +22,7 @@ import tensorflow as tf
 import pennylane as qml
 
 
+from .execution import DeviceVJP
 from .tensorflow import _compute_vjp
 
 
@@ -217,7 +218,12 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
                         params_unwrapped = _nest_params(all_params)
 
                         with qml.tape.Unwrap(*tapes, params=params_unwrapped):
-                            vjps = _compute_vjp(dy, gradient_fn(tapes, **gradient_kwargs))
+                            if isinstance(gradient_fn, DeviceVJP):
+                                # The device computes the VJPs directly from the forward pass
+                                device_vjps = gradient_fn(tapes, dy, **gradient_kwargs)
+                                vjps = [v for vjp in device_vjps for v in vjp]
+                            else:
+                                vjps = _compute_vjp(dy, gradient_fn(tapes, **gradient_kwargs))
 
                         return vjps
 
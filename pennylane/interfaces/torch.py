@@ -21,6 +21,8 @@ import torch
 
 import pennylane as qml
 
+from .execution import DeviceVJP
+
 
 def _compute_vjp(dy, jacs, device=None):
     vjps = []
@@ -181,10 +183,18 @@ class ExecuteTapes(torch.autograd.Function):
                 #
                 # so we cannot support higher-order derivatives.
 
-                with qml.tape.Unwrap(*ctx.tapes):
-                    jacs = ctx.gradient_fn(ctx.tapes, **ctx.gradient_kwargs)
+                if isinstance(ctx.gradient_fn, DeviceVJP):
+                    # The device computes the VJPs directly from the forward pass
+                    with qml.tape.Unwrap(*ctx.tapes):
+                        device_vjps = ctx.gradient_fn(ctx.tapes, dy, **ctx.gradient_kwargs)
+
+                    vjps = [v for vjp in device_vjps for v in vjp]
+
+                else:
+                    with qml.tape.Unwrap(*ctx.tapes):
+                        jacs = ctx.gradient_fn(ctx.tapes, **ctx.gradient_kwargs)
 
-                vjps = _compute_vjp(dy, jacs, device=ctx.torch_device)
+                    vjps = _compute_vjp(dy, jacs, device=ctx.torch_device)
 
         # The output of backward must match the input of forward.
         # Therefore, we return `None` for the gradient of `kwargs`.
@@ -28,5 +28,6 @@ from .postprocessing import (
 )
 from .utils import (
     kernel_matrix,
+    overlap_kernel_matrix,
     square_kernel_matrix,
 )
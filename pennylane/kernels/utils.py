@@ -14,10 +14,64 @@
 """
 This file contains functionalities that simplify working with kernels.
 """
+import pennylane as qml
 from pennylane import numpy as np
 
 
-def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
+def _evaluate(qnode, args, batch_size=None, postprocessing=None):
+    """Evaluates a function on a sequence of arguments.
+
+    If a batch size is given, the function must be a :class:`~.QNode`. The tapes of up to
+    ``batch_size`` evaluations are then constructed up front and executed together by a single
+    call to :func:`~.execute`, so that the device can process them as a batch.
+
+    Args:
+        qnode (callable): function to evaluate
+        args (list[tuple]): the positional arguments of each evaluation
+        batch_size (int): maximum number of tapes to execute together
+        postprocessing (callable): function applied to the output of each evaluation
+
+    Returns:
+        list[tensor_like]: the result of each evaluation
+    """
+    postprocessing = postprocessing or (lambda res: res)
+
+    if batch_size is None:
+        return [postprocessing(qnode(*a)) for a in args]
+
+    if not isinstance(qnode, qml.QNode):
+        raise ValueError(
+            "Kernels can only be evaluated in batches if they are QNodes. The processing of "
+            "the QNode output can be passed separately with the postprocessing argument."
+        )
+
+    if batch_size < 1:
+        raise ValueError("The batch size must be a positive integer.")
+
+    results = []
+    for start in range(0, len(args), batch_size):
+        tapes = []
+        for a in args[start : start + batch_size]:
+            qnode.construct(a, {})
+            tapes.append(qnode.tape)
+
+        res = qml.execute(
+            tapes,
+            device=qnode.device,
+            gradient_fn=qnode.gradient_fn,
+            interface=qnode.interface,
+            gradient_kwargs=qnode.gradient_kwargs,
+            **qnode.execute_kwargs,
+        )
+        results.extend(postprocessing(qml.math.squeeze(r)) for r in res)
+
+    qnode._update_original_device()  # pylint: disable=protected-access
+    return results
+
+
+def square_kernel_matrix(
+    X, kernel, assume_normalized_kernel=False, batch_size=None, postprocessing=None
+):
     r"""Computes the square matrix of pairwise kernel values for a given dataset.
 
     Args:
@@ -27,6 +81,12 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
         assume_normalized_kernel (bool, optional): Assume that the kernel is normalized, in
             which case the diagonal of the kernel matrix is set to 1, avoiding unnecessary
             computations.
+        batch_size (int, optional): If provided, ``kernel`` must be a :class:`~.QNode`, and
+            the circuits of up to ``batch_size`` pairs of datapoints are executed together in a
+            single call to :func:`~.execute`.
+        postprocessing (callable, optional): Function that maps the output of ``kernel`` to the
+            kernel value, for instance to select the probability of the zero state from a
+            :class:`~.QNode` returning :func:`~.probs` when evaluating it in batches.
 
     Returns:
         array[float]: The square matrix of kernel values.
@@ -51,32 +111,50 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
 
     >>> X = np.random.random((4, 2))
     >>> qml.kernels.square_kernel_matrix(X, kernel)
+    tensor([[1.        , 0.9532702 , 0.96864001, 0.90932897],
+            [0.9532702 , 1.        , 0.99727485, 0.95685561],
+            [0.96864001, 0.99727485, 1.        , 0.96605621],
+            [0.90932897, 0.95685561, 0.96605621, 1.        ]], requires_grad=True)
+
+    Since ``kernel`` is not a QNode, the circuits of the kernel matrix can only be executed
+    in batches if the QNode and the selection of the kernel value are passed separately:
+
+    >>> qml.kernels.square_kernel_matrix(
+    ...     X, circuit, batch_size=4, postprocessing=lambda probs: probs[0]
+    ... )
     tensor([[1.        , 0.9532702 , 0.96864001, 0.90932897],
             [0.9532702 , 1.        , 0.99727485, 0.95685561],
             [0.96864001, 0.99727485, 1.        , 0.96605621],
             [0.90932897, 0.95685561, 0.96605621, 1.        ]], requires_grad=True)
     """
     N = len(X)
-    matrix = [0] * N**2
+    matrix = [1.0] * N**2
 
-    for i in range(N):
-        for j in range(i, N):
-            if assume_normalized_kernel and i == j:
-                matrix[N * i + j] = 1.0
-            else:
-                matrix[N * i + j] = kernel(X[i], X[j])
-                matrix[N * j + i] = matrix[N * i + j]
+    pairs = [
+        (i, j) for i in range(N) for j in range(i, N) if not (assume_normalized_kernel and i == j)
+    ]
+    values = _evaluate(kernel, [(X[i], X[j]) for i, j in pairs], batch_size, postprocessing)
+
+    for (i, j), value in zip(pairs, values):
+        matrix[N * i + j] = value
+        matrix[N * j + i] = value
 
     return np.array(matrix).reshape((N, N))
 
 
-def kernel_matrix(X1, X2, kernel):
+def kernel_matrix(X1, X2, kernel, batch_size=None, postprocessing=None):
     r"""Computes the matrix of pairwise kernel values for two given datasets.
 
     Args:
         X1 (list[datapoint]): List of datapoints (first argument)
         X2 (list[datapoint]): List of datapoints (second argument)
         kernel ((datapoint, datapoint) -> float): Kernel function that maps datapoints to kernel value.
+        batch_size (int, optional): If provided, ``kernel`` must be a :class:`~.QNode`, and
+            the circuits of up to ``batch_size`` pairs of datapoints are executed together in a
+            single call to :func:`~.execute`.
+        postprocessing (callable, optional): Function that maps the output of ``kernel`` to the
+            kernel value, for instance to select the probability of the zero state from a
+            :class:`~.QNode` returning :func:`~.probs` when evaluating it in batches.
 
     Returns:
         array[float]: The square matrix of kernel values.
@@ -114,9 +192,85 @@ def kernel_matrix(X1, X2, kernel):
     N = len(X1)
     M = len(X2)
 
-    matrix = [0] * N * M
-    for i in range(N):
-        for j in range(M):
-            matrix[M * i + j] = kernel(X1[i], X2[j])
+    matrix = _evaluate(
+        kernel, [(X1[i], X2[j]) for i in range(N) for j in range(M)], batch_size, postprocessing
+    )
 
     return np.array(matrix).reshape((N, M))
+
+
+def overlap_kernel_matrix(X1, X2, state_fn, tile_size=None, batch_size=None):
+    r"""Computes the matrix of fidelity kernel values
+    :math:`k(x_1, x_2) = |\langle\psi(x_1)|\psi(x_2)\rangle|^2` from the embedded states.
+
+    Instead of executing one circuit per pair of datapoints, the state :math:`|\psi(x)\rangle`
+    of each datapoint is computed once, and the kernel matrix is obtained from the matrix
+    product of the stacked states. This requires a device that gives access to the state,
+    and scales linearly instead of quadratically in the number of circuit executions.
+
+    Args:
+        X1 (list[datapoint]): List of datapoints (first argument)
+        X2 (list[datapoint] or None): List of datapoints (second argument). If ``None``,
+            the square kernel matrix of ``X1`` is computed.
+        state_fn (datapoint -> array[complex]): Function that maps a datapoint to its embedded
+            state, for example a :class:`~.QNode` returning :func:`~.state`.
+        tile_size (int, optional): If provided, the kernel matrix is computed in blocks of
+            ``tile_size`` datapoints of each dataset, so that the states of at most
+            ``2 * tile_size`` datapoints are held in memory at the same time. The states of
+            ``X2`` are then recomputed for every block of ``X1``.
+        batch_size (int, optional): If provided, ``state_fn`` must be a :class:`~.QNode`, and
+            the circuits of up to ``batch_size`` datapoints are executed together.
+
+    Returns:
+        array[float]: The matrix of kernel values.
+
+    **Example:**
+
+    .. code-block :: python
+
+        dev = qml.device('default.qubit', wires=2, shots=None)
+        @qml.qnode(dev)
+        def embedding(x):
+            qml.templates.AngleEmbedding(x, wires=dev.wires)
+            return qml.state()
+
+    The kernel matrix coincides with the one of the kernel circuit applying the
+    embedding and its adjoint, but only requires one execution per datapoint:
+
+    >>> X = np.random.random((4, 2))
+    >>> qml.kernels.overlap_kernel_matrix(X, None, embedding)
+    tensor([[1.        , 0.9532702 , 0.96864001, 0.90932897],
+            [0.9532702 , 1.        , 0.99727485, 0.95685561],
+            [0.96864001, 0.99727485, 1.        , 0.96605621],
+            [0.90932897, 0.95685561, 0.96605621, 1.        ]], requires_grad=True)
+    """
+    square = X2 is None
+    X2 = X1 if square else X2
+
+    N = len(X1)
+    M = len(X2)
+    tile_size = tile_size or max(N, M, 1)
+
+    def states(X, start):
+        return qml.math.stack(
+            _evaluate(state_fn, [(x,) for x in X[start : start + tile_size]], batch_size)
+        )
+
+    blocks = {}
+    for i in range(0, N, tile_size):
+        states1 = states(X1, i)
+
+        for j in range(0, M, tile_size):
+            if square and j < i:
+                blocks[i, j] = qml.math.transpose(blocks[j, i])
+                continue
+
+            states2 = states1 if square and i == j else states(X2, j)
+            overlaps = qml.math.dot(states1, qml.math.transpose(qml.math.conj(states2)))
+            blocks[i, j] = qml.math.real(overlaps * qml.math.conj(overlaps))
+
+    rows = [
+        qml.math.concatenate([blocks[i, j] for j in range(0, M, tile_size)], axis=1)
+        for i in range(0, N, tile_size)
+    ]
+    return qml.math.concatenate(rows, axis=0)
@@ -19,6 +19,7 @@ and measurement samples using AnnotatedQueues.
 """
 # pylint: disable=too-many-instance-attributes
 import copy
+import hashlib
 import uuid
 import functools
 from enum import Enum
@@ -370,14 +371,17 @@ class MeasurementProcess:
 
     def __copy__(self):
         cls = self.__class__
+        copied_m = cls.__new__(cls)
 
-        if self.obs is not None:
-            return cls(self.return_type, obs=copy.copy(self.obs))
+        # the copy is created without calling __init__, such that it keeps all attributes
+        # and is not queued
+        for attr, value in vars(self).items():
+            setattr(copied_m, attr, value)
 
-        if self.log_base is not None:
-            return cls(self.return_type, wires=self._wires, log_base=self.log_base)
+        if self.obs is not None:
+            copied_m.obs = copy.copy(self.obs)
 
-        return cls(self.return_type, eigvals=self._eigvals, wires=self._wires)
+        return copied_m
 
     @property
     def wires(self):
@@ -514,6 +518,19 @@ class MeasurementProcess:
 
         return hash(fingerprint)
 
+    @property
+    def fingerprint(self):
+        """str: process-independent digest that uniquely represents the measurement process"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str((self.return_type, self.wires.tolist(), self.log_base)).encode())
+
+        if self.obs is not None:
+            digest.update(self.obs.fingerprint.encode())
+        elif self._eigvals is not None:
+            qml.operation._update_digest(digest, [self._eigvals])
+
+        return digest.hexdigest()
+
 
 def expval(op):
     r"""Expectation value of the supplied observable.
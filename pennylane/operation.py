@@ -95,6 +95,8 @@ and :math:`\mathbf{r} = (\I, \x_0, \p_0, \x_1, \p_1, \ldots)` for multi-mode ope
 # pylint:disable=access-member-before-definition
 import abc
 import copy
+import hashlib
+import inspect
 import itertools
 import functools
 import numbers
@@ -341,6 +343,122 @@ def classproperty(func):
 # =============================================================================
 
 
+FINGERPRINT_DECIMALS = 10
+"""int: number of decimals that numerical parameters are rounded to when computing fingerprints"""
+
+
+def _update_digest(digest, values, period=None):
+    """Feed a sequence of parameters or hyperparameters into a digest in a
+    process-independent manner.
+
+    Numerical values are rounded to ``FINGERPRINT_DECIMALS`` decimals and hashed via their
+    binary representation, and operators via their fingerprint. Sequences, dictionaries and
+    sets are hashed element by element, and classes and functions via their qualified name.
+    All other values are hashed via their string representation.
+
+    Args:
+        digest (hashlib._Hash): the digest to update
+        values (Iterable): the values to feed into the digest
+        period (float): if provided, the real part of numerical values is
+            reduced modulo ``period`` before hashing
+    """
+    for v in values:
+        if isinstance(v, (list, tuple)):
+            digest.update(b"[")
+            _update_digest(digest, v, period=period)
+            digest.update(b"]")
+            continue
+
+        if isinstance(v, dict):
+            digest.update(b"{")
+            _update_digest(digest, sorted(v.items(), key=lambda item: str(item[0])))
+            digest.update(b"}")
+            continue
+
+        if isinstance(v, (set, frozenset)):
+            digest.update(b"{")
+            _update_digest(digest, sorted(v, key=str))
+            digest.update(b"}")
+            continue
+
+        if isinstance(v, (Operator, qml.measurements.MeasurementProcess)):
+            digest.update(v.fingerprint.encode())
+            continue
+
+        if isinstance(v, type) or inspect.isroutine(v):
+            # the string representation of functions contains their memory address
+            digest.update(f"{getattr(v, '__module__', '')}.{v.__qualname__}".encode())
+            continue
+
+        numeric = isinstance(v, numbers.Number) or (hasattr(v, "shape") and hasattr(v, "dtype"))
+
+        if numeric and qml.math.is_abstract(v):
+            # abstract values, such as JAX tracers, have no concrete value, and tracers of
+            # the same shape share their string representation; they are hashed by identity
+            digest.update(f"<abstract {id(v)}>".encode())
+            continue
+
+        if numeric:
+            v = np.asarray(qml.math.unwrap([v])[0])
+
+            if v.dtype.kind in "biufc":
+                if period is not None:
+                    v = np.real(v) % period
+
+                v = v.astype(np.complex128 if v.dtype.kind == "c" else np.float64)
+                # adding zero removes the sign of negative zeros
+                v = np.round(v, FINGERPRINT_DECIMALS) + 0.0
+                digest.update(str(v.shape).encode())
+                digest.update(v.tobytes())
+                continue
+
+            if v.ndim > 0:
+                # the string representation of large arrays is truncated
+                digest.update(str(v.shape).encode())
+                _update_digest(digest, v.ravel().tolist(), period=period)
+                continue
+
+        digest.update(str(v).encode())
+
+
+def _parameter_snapshot(params):
+    """Copies the values of the parameters of an operator, such that a memoized fingerprint
+    can be validated against them.
+
+    Args:
+        params (list[Any]): parameters of the operator
+
+    Returns:
+        list[array] or None: NumPy copies of the parameters, or ``None`` if any of the
+        parameters is not a concrete numerical value
+    """
+    snapshot = []
+
+    for p in params:
+        if not (isinstance(p, numbers.Number) or (hasattr(p, "shape") and hasattr(p, "dtype"))):
+            return None
+
+        if qml.math.is_abstract(p):
+            return None
+
+        p = np.array(qml.math.unwrap([p])[0], copy=True)
+
+        if p.dtype.kind not in "biufc":
+            return None
+
+        snapshot.append(p)
+
+    return snapshot
+
+
+_PARAMETER_PERIODS = {
+    **dict.fromkeys(("RX", "RY", "RZ", "PhaseShift", "Rot"), 2 * np.pi),
+    **dict.fromkeys(("CRX", "CRY", "CRZ", "CRot"), 4 * np.pi),
+}
+"""dict[str, float]: periods of the parameters of rotation gates, used to identify
+operators whose parameters only differ by a multiple of the period"""
+
+
 def _process_data(op):
 
     # Use qml.math.real to take the real part. We may get complex inputs for
@@ -535,6 +653,55 @@ class Operator(abc.ABC):
             )
         )
 
+    @property
+    def fingerprint(self):
+        """str: Process-independent digest that uniquely represents the operator.
+
+        Unlike :attr:`~.Operator.hash`, the fingerprint does not depend on the salted
+        Python hash function, and is therefore identical across processes. It is computed
+        from the name, wires, hyperparameters and parameters of the operator, where numerical
+        parameters are rounded to ``FINGERPRINT_DECIMALS`` decimals. As for
+        :attr:`~.Operator.hash`, the angles of rotation gates are reduced modulo their period.
+
+        The fingerprint is memoized together with a copy of the parameter values, and only
+        recomputed when the name, wires or the value of any of the parameters change, including
+        in-place modifications of array parameters. Operators with parameters that are not
+        concrete numerical values are not memoized.
+
+        **Example**
+
+        >>> qml.RX(0.5, wires=0).fingerprint
+        '11ed11c94f71512d0230adee944ee673'
+        """
+        data = self.data
+        memo = self.__dict__.get("_fingerprint", None)
+
+        if (
+            memo is not None
+            and memo[0] == self.name
+            and memo[1] == self.wires
+            and len(memo[2]) == len(data)
+            and all(np.array_equal(a, qml.math.unwrap([b])[0]) for a, b in zip(memo[2], data))
+        ):
+            return memo[3]
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str((self.name, self.wires.tolist())).encode())
+        _update_digest(digest, self.hyperparameters.values())
+        digest.update(b"|")
+        period = _PARAMETER_PERIODS.get(self.name, None) if isinstance(self.name, str) else None
+        _update_digest(digest, self.data, period=period)
+
+        fingerprint = digest.hexdigest()
+
+        # store a copy of the current parameter values, such
+        # that the memoized fingerprint can be validated
+        snapshot = _parameter_snapshot(data)
+        self._fingerprint = (
+            None if snapshot is None else (self.name, self.wires, snapshot, fingerprint)
+        )
+        return fingerprint
+
     @staticmethod
     def compute_matrix(*params, **hyperparams):  # pylint:disable=unused-argument
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
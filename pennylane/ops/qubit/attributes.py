@@ -223,6 +223,7 @@ supports_broadcasting = Attribute(
         "IsingXX",
         "IsingYY",
         "IsingZZ",
+        "QubitStateVector",
     ]
 )
 """Attribute: Operations that support parameter broadcasting.
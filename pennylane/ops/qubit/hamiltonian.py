@@ -30,33 +30,14 @@ from pennylane.wires import Wires
 OBS_MAP = {"PauliX": "X", "PauliY": "Y", "PauliZ": "Z", "Hadamard": "H", "Identity": "I"}
 
 
-def _compute_grouping_indices(observables, grouping_type="qwc", method="rlf"):
+def _compute_grouping_indices(observables, grouping_type="qwc", method="rlf", coeffs=None):
 
-    # todo: directly compute the
-    # indices, instead of extracting groups of observables first
-    observable_groups = qml.grouping.group_observables(
-        observables, coefficients=None, grouping_type=grouping_type, method=method
+    grouping = qml.grouping.PauliGroupingStrategy(
+        observables, grouping_type=grouping_type, graph_colourer=method, coefficients=coeffs
     )
+    grouping.colour_pauli_graph()
 
-    observables = copy(observables)
-
-    indices = []
-    available_indices = list(range(len(observables)))
-    for partition in observable_groups:
-        indices_this_group = []
-        for pauli_word in partition:
-            # find index of this pauli word in remaining original observables,
-            for observable in observables:
-                if qml.grouping.utils.are_identical_pauli_words(pauli_word, observable):
-                    ind = observables.index(observable)
-                    indices_this_group.append(available_indices[ind])
-                    # delete this observable and its index, so it cannot be found again
-                    observables.pop(ind)
-                    available_indices.pop(ind)
-                    break
-        indices.append(indices_this_group)
-
-    return indices
+    return grouping.grouping_indices
 
 
 class Hamiltonian(Observable):
@@ -75,7 +56,9 @@ class Hamiltonian(Observable):
             Hamiltonian are executed on devices. The string refers to the type of binary relation between Pauli words.
             Can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or ``'anticommuting'``.
         method (str): The graph coloring heuristic to use in solving minimum clique cover for grouping, which
-            can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive Largest First). Ignored if ``grouping_type=None``.
+            can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First), ``'dsatur'`` (DSATUR) or ``'si'``
+            (Sorted Insertion, which orders the observables by decreasing magnitude of the coefficients).
+            Ignored if ``grouping_type=None``.
         id (str): name to be assigned to this Hamiltonian instance
 
     **Example:**
@@ -205,7 +188,7 @@ class Hamiltonian(Observable):
         if grouping_type is not None:
             with qml.tape.stop_recording():
                 self._grouping_indices = _compute_grouping_indices(
-                    self.ops, grouping_type=grouping_type, method=method
+                    self.ops, grouping_type=grouping_type, method=method, coeffs=self._coeffs
                 )
 
         coeffs_flat = [self._coeffs[i] for i in range(qml.math.shape(self._coeffs)[0])]
@@ -335,12 +318,13 @@ class Hamiltonian(Observable):
             grouping_type (str): The type of binary relation between Pauli words used to compute the grouping.
                 Can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``.
             method (str): The graph coloring heuristic to use in solving minimum clique cover for grouping, which
-                can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive Largest First).
+                can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First), ``'dsatur'`` (DSATUR) or
+                ``'si'`` (Sorted Insertion).
         """
 
         with qml.tape.stop_recording():
             self._grouping_indices = _compute_grouping_indices(
-                self.ops, grouping_type=grouping_type, method=method
+                self.ops, grouping_type=grouping_type, method=method, coeffs=self.coeffs
             )
 
     def simplify(self):
@@ -107,7 +107,8 @@ class QubitStateVector(Operation):
         2005).
 
     Args:
-        state (array[complex]): a state vector of size 2**len(wires)
+        state (array[complex]): a state vector of size 2**len(wires), or a broadcasted
+            batch of state vectors of shape ``(batch_size, 2**len(wires))``
         wires (Sequence[int] or int): the wire(s) the operation acts on
 
     **Example**
@@ -124,6 +125,9 @@ class QubitStateVector(Operation):
     num_params = 1
     """int: Number of trainable parameters that the operator depends on."""
 
+    ndim_params = (1,)
+    """tuple[int]: Number of dimensions per trainable parameter that the operator depends on."""
+
     grad_method = None
 
     # This is a temporary attribute to fix the operator queuing behaviour
@@ -26,7 +26,13 @@ from .openfermion_obs import (
 from .basis_set import BasisFunction, atom_basis_data, mol_basis_data
 from .convert import import_operator
 from .dipole import dipole_integrals, fermionic_dipole, dipole_moment
-from .hamiltonian import electron_integrals, fermionic_hamiltonian, diff_hamiltonian
+from .factorization import factorize, FactorizedHamiltonian
+from .hamiltonian import (
+    electron_integrals,
+    fermionic_hamiltonian,
+    diff_hamiltonian,
+    factorized_hamiltonian,
+)
 from .hartree_fock import scf, nuclear_energy, hf_energy
 from .integrals import (
     primitive_norm,
@@ -54,6 +60,7 @@ from .matrices import (
     core_matrix,
 )
 from .molecule import Molecule
+from .scan import hf_scan
 from .observable_hf import fermionic_observable, qubit_observable, jordan_wigner, simplify
 from .number import particle_number
 from .spin import spin2, spinz
@@ -0,0 +1,256 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the functions needed for the low-rank factorization of the two-electron
+integral tensor and the factorized molecular Hamiltonian.
+"""
+# pylint: disable=too-many-arguments
+import autograd.numpy as anp
+import numpy as np
+
+import pennylane as qml
+from pennylane.operation import AnyWires, Observable
+
+from .observable_hf import fermionic_observable, qubit_observable
+
+
+def factorize(two_electron, tol_factor=1.0e-5, tol_eigval=1.0e-5):
+    r"""Return the double-factorized form of a two-electron integral tensor.
+
+    The two-electron tensor :math:`V`, in
+    `chemist notation <http://vergil.chemistry.gatech.edu/notes/permsymm/permsymm.pdf>`_, is first
+    factorized in terms of symmetric matrices :math:`L^{(r)}` such that
+    :math:`V_{ijkl} = \sum_r^R L_{ij}^{(r)} L_{kl}^{(r) T}`, obtained from the eigenvalue
+    decomposition of :math:`V` reshaped into an :math:`N^2 \times N^2` matrix. The rank :math:`R`
+    is determined by a threshold error, and the factors are sorted by decreasing eigenvalue.
+    Then, each matrix :math:`L^{(r)}` is diagonalized and its eigenvalues (and corresponding
+    eigenvectors) are truncated at a threshold error.
+
+    Args:
+        two_electron (array[array[float]]): two-electron integral tensor in the molecular orbital
+            basis arranged in chemist notation
+        tol_factor (float): threshold error value for discarding the negligible factors
+        tol_eigval (float): threshold error value for discarding the negligible factor eigenvalues
+
+    Returns:
+        tuple(array[array[float]], list[array[float]], list[array[float]]): tuple containing
+        symmetric matrices (factors) approximating the two-electron integral tensor, truncated
+        eigenvalues of the generated factors, and truncated eigenvectors of the generated factors
+
+    **Example**
+
+    >>> symbols  = ['H', 'H']
+    >>> geometry = np.array([[0.0, 0.0, 0.0], [0.74, 0.0, 0.0]], requires_grad=False) / 0.5291772
+    >>> mol = qml.qchem.Molecule(symbols, geometry)
+    >>> core, one, two = qml.qchem.electron_integrals(mol)()
+    >>> two = np.swapaxes(two, 1, 3) # convert to chemist notation
+    >>> factors, eigvals, eigvecs = factorize(two, 1e-5, 1e-5)
+    >>> print(factors)
+    [[[-8.14472856e-01  1.40090654e-13]
+      [ 1.40149048e-13 -8.28642140e-01]]
+     [[-6.13796643e-14 -4.25688222e-01]
+      [-4.25688222e-01 -8.37577174e-14]]
+     [[ 1.06723440e-01  2.29272109e-15]
+      [ 2.91760024e-15 -1.04898533e-01]]]
+    """
+    shape = two_electron.shape
+
+    if len(shape) != 4 or len(set(shape)) != 1:
+        raise ValueError("The two-electron repulsion tensor must have a (N x N x N x N) shape.")
+
+    n = shape[0]
+    two = two_electron.reshape(n * n, n * n)
+
+    # the supermatrix is positive semidefinite, so its significant eigenvalues are positive
+    eigvals_r, eigvecs_r = anp.linalg.eigh(two)
+    keep = np.nonzero(eigvals_r > tol_factor)[0][::-1]
+
+    factors = anp.array(
+        [anp.sqrt(eigvals_r[r]) * eigvecs_r[:, r].reshape(n, n) for r in keep]
+    ).reshape(len(keep), n, n)
+
+    eigvals, eigvecs = [], []
+    for factor in factors:
+        eigvals_f, eigvecs_f = anp.linalg.eigh(factor)
+        keep_f = np.nonzero(anp.abs(eigvals_f) > tol_eigval)[0]
+        eigvals.append(eigvals_f[keep_f])
+        eigvecs.append(eigvecs_f[:, keep_f])
+
+    return factors, eigvals, eigvecs
+
+
+class FactorizedHamiltonian(Observable):
+    r"""A molecular Hamiltonian represented by the low-rank factors of its two-electron integrals.
+
+    The Hamiltonian is defined in terms of the core constant :math:`E`, the one-electron integrals
+    :math:`h_{pq}` and the factors :math:`L^{(r)}` of the two-electron integrals in chemist notation,
+    :math:`V_{pqrs} \approx \sum_r L_{pq}^{(r)} L_{rs}^{(r)}`, as
+
+    .. math::
+
+        H = E + \sum_{pq} \left(h_{pq} - \frac{1}{2} \sum_s V_{pssq} \right) E_{pq}
+        + \frac{1}{2} \sum_r \left( \sum_{pq} L_{pq}^{(r)} E_{pq} \right)^2,
+
+    where :math:`E_{pq} = \sum_{\sigma} c_{p\sigma}^{\dagger} c_{q\sigma}` is the spin-summed
+    excitation operator, mapped to qubits with the Jordan-Wigner transformation. The spin orbital
+    :math:`p\sigma` is mapped to the wire ``wires[2p + σ]``.
+
+    The Hamiltonian is stored with :math:`O(RN^2)` parameters for :math:`N` spatial orbitals,
+    instead of the :math:`O(N^4)` terms of its Pauli-word representation. The
+    ``default.qubit`` device evaluates its expectation value directly from the factors, by
+    applying the one-body operators to the state. The Pauli-word representation is only built
+    when requested with :meth:`~.FactorizedHamiltonian.hamiltonian`.
+
+    .. warning::
+
+        ``FactorizedHamiltonian`` observables can only be used to return expectation values.
+        Variances and samples are not supported.
+
+    **Details:**
+
+    * Number of wires: Any (twice the number of spatial orbitals)
+    * Number of parameters: 3
+    * Gradient recipe: None
+
+    Args:
+        core_constant (float): the contribution of the core orbitals and nuclei
+        one (array[float]): one-electron integrals in the molecular orbital basis
+        factors (array[float]): symmetric factors of the two-electron integrals, with shape
+            ``(R, N, N)``
+        wires (Sequence[int] or int): the wires the Hamiltonian acts on, by default
+            ``range(2 * N)``
+        do_queue (bool): Indicates whether the operator should be
+            immediately pushed into the Operator queue (optional)
+        id (str or None): String representing the operation (optional)
+
+    **Example**
+
+    >>> symbols  = ['H', 'H']
+    >>> geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]], requires_grad=False)
+    >>> mol = qml.qchem.Molecule(symbols, geometry)
+    >>> H = qml.qchem.factorized_hamiltonian(mol)()
+    >>> H.rank
+    3
+    >>> dev = qml.device("default.qubit", wires=4)
+    >>> @qml.qnode(dev)
+    ... def circuit():
+    ...     qml.BasisState(np.array([1, 1, 0, 0]), wires=range(4))
+    ...     return qml.expval(H)
+    >>> circuit()
+    tensor(-1.11671433, requires_grad=True)
+    """
+    num_wires = AnyWires
+    num_params = 3
+    """int: Number of trainable parameters that the operator depends on."""
+
+    grad_method = None
+
+    def __init__(self, core_constant, one, factors, wires=None, do_queue=True, id=None):
+        if qml.math.shape(one)[0] != qml.math.shape(factors)[-1]:
+            raise ValueError(
+                "The one-electron integrals and the factors must be defined for the same number "
+                f"of orbitals; got {qml.math.shape(one)[0]} and {qml.math.shape(factors)[-1]}."
+            )
+
+        if wires is None:
+            wires = range(2 * qml.math.shape(one)[0])
+
+        super().__init__(core_constant, one, factors, wires=wires, do_queue=do_queue, id=id)
+
+        if len(self.wires) != 2 * qml.math.shape(one)[0]:
+            raise ValueError(
+                f"The Hamiltonian of {qml.math.shape(one)[0]} orbitals acts on "
+                f"{2 * qml.math.shape(one)[0]} wires; got {len(self.wires)} wires."
+            )
+
+    @property
+    def rank(self):
+        """int: number of factors of the two-electron integrals"""
+        return qml.math.shape(self.data[2])[0]
+
+    def label(self, decimals=None, base_label=None, cache=None):
+        return super().label(decimals=decimals, base_label=base_label or "𝓗", cache=cache)
+
+    def hamiltonian(self):
+        r"""Return the Hamiltonian as a linear combination of Pauli words.
+
+        The two-electron integrals are reconstructed from the factors, such that the Pauli words
+        only include the contributions retained in the factorization.
+
+        Returns:
+            Hamiltonian: the qubit Hamiltonian acting on the wires of the observable
+        """
+        core_constant, one, factors = self.data
+        # h_pqrs = V_psqr in the convention of the two-electron integrals of fermionic_observable
+        two = anp.einsum("rps,rqt->pqts", factors, factors)
+
+        h = qubit_observable(fermionic_observable(anp.array([core_constant]), one, two))
+
+        if self.wires.tolist() == list(range(len(self.wires))):
+            return h
+
+        # map the spin orbitals to the wires of the observable
+        orbital_map = {i: i for i in range(len(self.wires))}
+        wire_map = {w: i for i, w in enumerate(self.wires)}
+        ops = [
+            qml.grouping.string_to_pauli_word(
+                qml.grouping.pauli_word_to_string(op, wire_map=orbital_map), wire_map=wire_map
+            )
+            for op in h.ops
+        ]
+
+        return qml.Hamiltonian(h.coeffs, ops)
+
+    @staticmethod
+    def compute_sparse_matrix(core_constant, one, factors):  # pylint: disable=arguments-differ
+        r"""Representation of the operator as a sparse canonical matrix in the computational basis
+        (static method).
+
+        The canonical matrix is the textbook matrix representation that does not consider wires.
+        Implicitly, this assumes that the wires of the operator correspond to the global wire
+        order.
+
+        .. seealso:: :meth:`~.FactorizedHamiltonian.sparse_matrix`
+
+        Args:
+            core_constant (float): the contribution of the core orbitals and nuclei
+            one (array[float]): one-electron integrals in the molecular orbital basis
+            factors (array[float]): symmetric factors of the two-electron integrals
+
+        Returns:
+            scipy.sparse.csr_matrix: sparse matrix
+        """
+        h = FactorizedHamiltonian(core_constant, one, factors, do_queue=False).hamiltonian()
+        return qml.utils.sparse_hamiltonian(h, wires=range(2 * qml.math.shape(one)[0]))
+
+    @staticmethod
+    def compute_matrix(core_constant, one, factors):  # pylint: disable=arguments-differ
+        r"""Representation of the operator as a canonical matrix in the computational basis
+        (static method).
+
+        The canonical matrix is the textbook matrix representation that does not consider wires.
+        Implicitly, this assumes that the wires of the operator correspond to the global wire
+        order.
+
+        .. seealso:: :meth:`~.FactorizedHamiltonian.matrix`
+
+        Args:
+            core_constant (float): the contribution of the core orbitals and nuclei
+            one (array[float]): one-electron integrals in the molecular orbital basis
+            factors (array[float]): symmetric factors of the two-electron integrals
+
+        Returns:
+            array: dense matrix
+        """
+        return FactorizedHamiltonian.compute_sparse_matrix(core_constant, one, factors).toarray()
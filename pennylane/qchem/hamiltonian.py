@@ -16,12 +16,17 @@ This module contains the functions needed for computing the molecular Hamiltonia
 """
 # pylint: disable= too-many-branches, too-many-arguments, too-many-locals, too-many-nested-blocks
 import autograd.numpy as anp
+import numpy as np
+import scipy
+from autograd.extend import defvjp, primitive
 
+from .factorization import FactorizedHamiltonian, factorize
 from .hartree_fock import nuclear_energy, scf
+from .matrices import _sparse_repulsion
 from .observable_hf import fermionic_observable, qubit_observable
 
 
-def electron_integrals(mol, core=None, active=None):
+def electron_integrals(mol, core=None, active=None, screening_threshold=0.0):
     r"""Return a function that computes the one- and two-electron integrals in the molecular orbital
     basis.
 
@@ -66,12 +71,17 @@ def electron_integrals(mol, core=None, active=None):
 
     The :math:`h_{\mu \nu}` and :math:`h_{\mu \nu \rho \sigma}` terms refer to the elements of the
     core matrix and the electron repulsion tensor, respectively, and :math:`C` is the molecular
-    orbital expansion coefficient matrix.
+    orbital expansion coefficient matrix. The two-electron integrals are transformed one index at
+    a time, and only the molecular orbitals in the core and active spaces are transformed. If the
+    electron repulsion integrals are screened, the first index is transformed using only the
+    integrals that are not screened.
 
     Args:
         mol (~qchem.molecule.Molecule): the molecule object
         core (list[int]): indices of the core orbitals
         active (list[int]): indices of the active orbitals
+        screening_threshold (float): threshold for the Cauchy-Schwarz screening of the electron
+            repulsion integrals in the atomic orbital basis, see :func:`~.repulsion_tensor`
 
     Returns:
         function: function that computes the core constant and the one- and two-electron integrals
@@ -107,40 +117,124 @@ def electron_integrals(mol, core=None, active=None):
         Returns:
             tuple[array[float]]: 1D tuple containing core constant, one- and two-electron integrals
         """
-        _, coeffs, _, h_core, repulsion_tensor = scf(mol)(*args)
-        one = anp.einsum("qr,rs,st->qt", coeffs.T, h_core, coeffs)
-        two = anp.swapaxes(
-            anp.einsum(
-                "ab,cd,bdeg,ef,gh->acfh", coeffs.T, coeffs.T, repulsion_tensor, coeffs, coeffs
-            ),
-            1,
-            3,
+        _, coeffs, _, h_core, repulsion_tensor = scf(mol, screening_threshold=screening_threshold)(
+            *args
         )
         core_constant = nuclear_energy(mol.nuclear_charges, mol.coordinates)(*args)
 
+        if screening_threshold:
+            repulsion_tensor = _sparse_repulsion(repulsion_tensor)
+
         if core is None and active is None:
+            one, two = _mo_integrals(coeffs, h_core, repulsion_tensor)
             return core_constant, one, two
 
-        for i in core:
-            core_constant = core_constant + 2 * one[i][i]
-            for j in core:
-                core_constant = core_constant + 2 * two[i][j][j][i] - two[i][j][i][j]
+        # the orbitals outside the core and active spaces are never transformed
+        one, two = _mo_integrals(coeffs[:, list(core) + list(active)], h_core, repulsion_tensor)
+        c, a = anp.arange(len(core)), anp.arange(len(core), len(core) + len(active))
 
-        for p in active:
-            for q in active:
-                for i in core:
-                    o = anp.zeros(one.shape)
-                    o[p, q] = 1.0
-                    one = one + (2 * two[i][p][q][i] - two[i][p][i][q]) * o
+        i, j = c[:, anp.newaxis], c[anp.newaxis, :]
+        core_constant = core_constant + 2 * anp.sum(one[c, c])
+        core_constant = core_constant + anp.sum(2 * two[i, j, j, i] - two[i, j, i, j])
 
-        one = one[anp.ix_(active, active)]
-        two = two[anp.ix_(active, active, active, active)]
+        i, p, q = c[:, anp.newaxis, anp.newaxis], a[:, anp.newaxis], a[anp.newaxis, :]
+        one = one[p, q] + anp.sum(2 * two[i, p, q, i] - two[i, p, i, q], axis=0)
+        two = two[anp.ix_(a, a, a, a)]
 
         return core_constant, one, two
 
     return _electron_integrals
 
 
+def _mo_integrals(coeffs, h_core, repulsion_tensor):
+    r"""Transform the core matrix and the electron repulsion tensor to the molecular orbital basis.
+
+    The two-electron integrals are transformed one index at a time, which scales as
+    :math:`O(n^4 m)` for :math:`n` basis functions and :math:`m` molecular orbitals. If the
+    electron repulsion tensor is given in the sparse format of :func:`~.repulsion_tensor`, the
+    first transformation scales with the number of its non-zero integrals instead.
+
+    Args:
+        coeffs (array[float]): molecular orbital coefficients
+        h_core (array[float]): core matrix
+        repulsion_tensor (array[float] or tuple(array[int], array[float])): electron repulsion
+            tensor, or the indices and values of its unique non-zero integrals
+
+    Returns:
+        tuple(array[float], array[float]): one- and two-electron integrals in the molecular orbital
+        basis
+    """
+    one = anp.einsum("qr,rs,st->qt", coeffs.T, h_core, coeffs)
+
+    if isinstance(repulsion_tensor, tuple):
+        two = _sparse_transformation(*repulsion_tensor, coeffs)
+    else:
+        two = anp.einsum("bdeg,gh->bdeh", repulsion_tensor, coeffs)
+
+    two = anp.einsum("bdeh,ef->bdfh", two, coeffs)
+    two = anp.einsum("dc,bdfh->bcfh", coeffs, two)
+    two = anp.einsum("ba,bcfh->acfh", coeffs, two)
+
+    return one, anp.swapaxes(two, 1, 3)
+
+
+def _sparse_transformation(quartets, values, coeffs):
+    r"""Transform the last index of the electron repulsion tensor given in the sparse format of
+    :func:`~.repulsion_tensor`.
+
+    Args:
+        quartets (array[int]): indices of the unique non-zero integrals, with shape ``(m, 4)``
+        values (array[float]): values of the unique non-zero integrals
+        coeffs (array[float]): molecular orbital coefficients
+
+    Returns:
+        array[float]: the electron repulsion tensor with its last index transformed
+    """
+    n = len(coeffs)
+    i, j, k, l = np.reshape(quartets, (-1, 4)).T
+
+    # all elements of the tensor that share the integral of a unique quartet
+    perms = [(i, j, k, l), (j, i, k, l), (i, j, l, k), (j, i, l, k)]
+    perms = np.stack(perms + [(c, d, a, b) for a, b, c, d in perms], axis=-1).reshape(4, -1)
+    elements, unique = np.unique(perms.T, axis=0, return_index=True)
+    source = np.repeat(np.arange(len(i)), 8)[unique]
+
+    rows = np.ravel_multi_index(tuple(elements[:, :3].T), (n, n, n))
+    two = _sparse_matmul(values[source], rows, elements[:, 3], (n**3, n), coeffs)
+
+    return anp.reshape(two, (n, n, n, -1))
+
+
+@primitive
+def _sparse_matmul(values, rows, cols, shape, matrix):
+    r"""Multiply a sparse matrix, given by the values of its non-zero elements and their rows and
+    columns, with a dense matrix.
+
+    Args:
+        values (array[float]): values of the non-zero elements
+        rows (array[int]): rows of the non-zero elements
+        cols (array[int]): columns of the non-zero elements
+        shape (tuple[int]): shape of the sparse matrix
+        matrix (array[float]): the dense matrix
+
+    Returns:
+        array[float]: the product of the matrices
+    """
+    return scipy.sparse.csr_matrix((values, (rows, cols)), shape=shape) @ matrix
+
+
+defvjp(
+    _sparse_matmul,
+    lambda ans, values, rows, cols, shape, matrix: lambda g: anp.sum(
+        g[rows] * matrix[cols], axis=1
+    ),
+    lambda ans, values, rows, cols, shape, matrix: lambda g: _sparse_matmul(
+        values, cols, rows, shape[::-1], g
+    ),
+    argnums=[0, 4],
+)
+
+
 def fermionic_hamiltonian(mol, cutoff=1.0e-12, core=None, active=None):
     r"""Return a function that computes the fermionic Hamiltonian.
 
@@ -219,3 +313,57 @@ def diff_hamiltonian(mol, cutoff=1.0e-12, core=None, active=None):
         return qubit_observable(h_ferm)
 
     return _molecular_hamiltonian
+
+
+def factorized_hamiltonian(mol, core=None, active=None, tol_factor=1.0e-5, tol_eigval=1.0e-5):
+    r"""Return a function that computes the molecular Hamiltonian in the low-rank factorized form.
+
+    The two-electron integrals are factorized with :func:`~.factorize`, and the Hamiltonian is
+    represented by the core constant, the one-electron integrals and the factors, truncated with
+    the eigenvalues of the factors, as a :class:`~.FactorizedHamiltonian`. Its expectation value is
+    computed by ``default.qubit`` without constructing the :math:`O(N^4)` Pauli words of the
+    Hamiltonian returned by :func:`~.diff_hamiltonian`.
+
+    Args:
+        mol (~qchem.molecule.Molecule): the molecule object
+        core (list[int]): indices of the core orbitals
+        active (list[int]): indices of the active orbitals
+        tol_factor (float): threshold error value for discarding the negligible factors
+        tol_eigval (float): threshold error value for discarding the negligible factor eigenvalues
+
+    Returns:
+        function: function that computes the factorized Hamiltonian
+
+    **Example**
+
+    >>> symbols  = ['H', 'H']
+    >>> geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]], requires_grad=False)
+    >>> mol = qml.qchem.Molecule(symbols, geometry)
+    >>> h = factorized_hamiltonian(mol)()
+    >>> h.rank
+    3
+    """
+
+    def _factorized_hamiltonian(*args):
+        r"""Compute the factorized Hamiltonian.
+
+        Args:
+            args (array[array[float]]): initial values of the differentiable parameters
+
+        Returns:
+            FactorizedHamiltonian: the factorized Hamiltonian
+        """
+        core_constant, one, two = electron_integrals(mol, core, active)(*args)
+
+        # convert the two-electron integrals to chemist notation
+        _, eigvals, eigvecs = factorize(anp.swapaxes(two, 1, 3), tol_factor, tol_eigval)
+
+        factors = anp.array(
+            [(vecs * vals) @ vecs.T for vals, vecs in zip(eigvals, eigvecs)]
+        ).reshape(len(eigvals), *one.shape)
+
+        return FactorizedHamiltonian(
+            anp.squeeze(core_constant), one, factors, wires=range(2 * len(one))
+        )
+
+    return _factorized_hamiltonian
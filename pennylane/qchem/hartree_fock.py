@@ -18,11 +18,15 @@ This module contains the functions needed for performing the self-consistent-fie
 import itertools
 
 import autograd.numpy as anp
+import numpy as np
+from autograd.tracer import getval, isbox
 
 from .matrices import core_matrix, mol_density_matrix, overlap_matrix, repulsion_tensor
 
 
-def scf(mol, n_steps=50, tol=1e-8):
+def scf(
+    mol, n_steps=50, tol=1e-8, diis_size=0, level_shift=0.0, guess=None, screening_threshold=0.0
+):
     r"""Return a function that performs the self-consistent-field calculations.
 
     In the Hartree-Fock method, molecular orbitals are typically constructed as a linear combination
@@ -85,10 +89,38 @@ def scf(mol, n_steps=50, tol=1e-8):
 
     which is solved with conventional methods iteratively.
 
+    The iterations can be accelerated with the direct inversion in the iterative subspace (DIIS)
+    method [`Pulay, Chem. Phys. Lett. 73, 393 (1980)
+    <https://doi.org/10.1016/0009-2614(80)80396-4>`_] by setting ``diis_size``. The Fock matrix
+    used to update the coefficients is then extrapolated from the Fock matrices of the previous
+    iterations such that the norm of the extrapolated commutator :math:`FPS - SPF`, which vanishes
+    at convergence, is minimized. The extrapolation coefficients are treated as constants when
+    differentiating the iterations. Convergence can further be stabilized by shifting the energies
+    of the virtual orbitals with a level shift. The converged orbital energies and coefficients are
+    obtained from the Fock matrix without extrapolation and level shift.
+
+    The overlap matrix, the core matrix and the electron repulsion tensor are stored in the
+    ``integral_cache`` attribute of the molecule, keyed by the basis set, the geometry and the
+    values of the differentiable parameters. Calculations that are not differentiated reuse the
+    integrals if they are repeated with the same key. When any of the arguments is traced by
+    autograd, for instance inside :func:`~.grad`, the integrals are always recomputed such that
+    their derivatives are available, and the cache is neither read nor updated. The number of
+    iterations, the convergence flag and the density-matrix changes and DIIS errors of all
+    iterations are stored in the ``scf_diagnostics`` attribute of the molecule.
+
     Args:
         mol (~qchem.molecule.Molecule): the molecule object
         n_steps (int): the number of iterations
         tol (float): convergence tolerance
+        diis_size (int): the number of previous Fock matrices used in the DIIS extrapolation. By
+            default, and whenever ``diis_size`` is smaller than two, no extrapolation is applied.
+        level_shift (float): energy shift of the virtual orbitals, in Hartree, applied during the
+            iterations
+        guess (array[float]): density matrix used as the initial guess, for instance the
+            converged density matrix of a nearby geometry. By default, the initial guess is
+            obtained from the core matrix.
+        screening_threshold (float): threshold for the Cauchy-Schwarz screening of the electron
+            repulsion integrals, see :func:`~.repulsion_tensor`
 
     Returns:
         function: function that performs the self-consistent-field calculations
@@ -116,21 +148,9 @@ def scf(mol, n_steps=50, tol=1e-8):
             tuple(array[float]): eigenvalues of the Fock matrix, molecular orbital coefficients,
             Fock matrix, core matrix
         """
-        basis_functions = mol.basis_set
-        charges = mol.nuclear_charges
-        r = mol.coordinates
         n_electron = mol.n_electrons
 
-        if r.requires_grad:
-            args_r = [[args[0][i]] * mol.n_basis[i] for i in range(len(mol.n_basis))]
-            args_ = [*args] + [anp.vstack(list(itertools.chain(*args_r)))]
-            rep_tensor = repulsion_tensor(basis_functions)(*args_[1:])
-            s = overlap_matrix(basis_functions)(*args_[1:])
-            h_core = core_matrix(basis_functions, charges, r)(*args_)
-        else:
-            rep_tensor = repulsion_tensor(basis_functions)(*args)
-            s = overlap_matrix(basis_functions)(*args)
-            h_core = core_matrix(basis_functions, charges, r)(*args)
+        s, h_core, rep_tensor = _integrals(mol, *args, screening_threshold=screening_threshold)
 
         s = s + anp.diag(anp.random.rand(len(s)) * 1.0e-12)
 
@@ -140,7 +160,15 @@ def scf(mol, n_steps=50, tol=1e-8):
         eigvals, w_fock = anp.linalg.eigh(x.T @ h_core @ x)  # initial guess for the scf problem
         coeffs = x @ w_fock
 
-        p = mol_density_matrix(n_electron, coeffs)
+        p = mol_density_matrix(n_electron, coeffs) if guess is None else guess
+
+        fock_history, error_history = [], []
+        diagnostics = {
+            "converged": False,
+            "n_iterations": 0,
+            "density_change": [],
+            "diis_error": [],
+        }
 
         for _ in range(n_steps):
 
@@ -148,25 +176,154 @@ def scf(mol, n_steps=50, tol=1e-8):
             k = anp.einsum("psqr,rs->pq", rep_tensor, p)
 
             fock_matrix = h_core + 2 * j - k
+            fock_orth = x.T @ fock_matrix @ x
 
-            eigvals, w_fock = anp.linalg.eigh(x.T @ fock_matrix @ x)
+            # the commutator FPS - SPF in the orthogonal basis vanishes at convergence
+            error = x.T @ (fock_matrix @ p @ s - s @ p @ fock_matrix) @ x
+            diagnostics["diis_error"].append(float(np.linalg.norm(getval(error))))
+
+            if diis_size > 1:
+                fock_history = (fock_history + [fock_orth])[-diis_size:]
+                error_history = (error_history + [getval(error)])[-diis_size:]
+                fock_orth = _diis_extrapolation(fock_history, error_history)
+
+            if level_shift:
+                occupied = x.T @ s @ p @ s @ x
+                fock_orth = fock_orth + level_shift * (anp.eye(len(s)) - occupied)
+
+            eigvals, w_fock = anp.linalg.eigh(fock_orth)
 
             coeffs = x @ w_fock
 
             p_update = mol_density_matrix(n_electron, coeffs)
 
-            if anp.linalg.norm(p_update - p) <= tol:
+            change = anp.linalg.norm(p_update - p)
+            diagnostics["n_iterations"] += 1
+            diagnostics["density_change"].append(float(getval(change)))
+
+            if change <= tol:
+                diagnostics["converged"] = True
                 break
 
             p = p_update
 
+        if diis_size > 1 or level_shift:
+            eigvals, w_fock = anp.linalg.eigh(x.T @ fock_matrix @ x)
+            coeffs = x @ w_fock
+
         mol.mo_coefficients = coeffs
+        mol.scf_diagnostics = diagnostics
 
         return eigvals, coeffs, fock_matrix, h_core, rep_tensor
 
     return _scf
 
 
+def _integrals(mol, *args, screening_threshold=0.0):
+    r"""Compute the overlap matrix, the core matrix and the electron repulsion tensor, or return
+    them from the integral cache of the molecule.
+
+    The cache is keyed by the angular momenta, exponents, contraction coefficients and centres of
+    the basis functions, the nuclear charges and coordinates, the values of the arguments and the
+    screening threshold, and holds the integrals of the last evaluated key. It is only used if
+    none of the arguments is being differentiated, since cached values carry no derivative
+    information. Differentiated calls recompute the integrals and leave the cache unchanged.
+
+    Args:
+        mol (~qchem.molecule.Molecule): the molecule object
+        args (array[array[float]]): initial values of the differentiable parameters
+        screening_threshold (float): threshold for the screening of the electron repulsion
+            integrals
+
+    Returns:
+        tuple(array[float]): overlap matrix, core matrix and electron repulsion tensor
+    """
+    basis_functions = mol.basis_set
+    charges = mol.nuclear_charges
+    r = mol.coordinates
+
+    key = None
+    if not any(isbox(arg) for arg in args):
+        key = (
+            tuple((np.shape(arg), np.asarray(arg, dtype=float).tobytes()) for arg in args),
+            tuple(
+                (
+                    tuple(bf.l),
+                    np.asarray(bf.alpha, dtype=float).tobytes(),
+                    np.asarray(bf.coeff, dtype=float).tobytes(),
+                    np.asarray(bf.r, dtype=float).tobytes(),
+                )
+                for bf in basis_functions
+            ),
+            tuple(charges),
+            np.asarray(r, dtype=float).tobytes(),
+            getattr(r, "requires_grad", False),
+            screening_threshold,
+        )
+
+        cache = getattr(mol, "integral_cache", None)
+        if cache is not None and key in cache:
+            return cache[key]
+
+    if r.requires_grad:
+        args_r = [[args[0][i]] * mol.n_basis[i] for i in range(len(mol.n_basis))]
+        args_ = [*args] + [anp.vstack(list(itertools.chain(*args_r)))]
+        rep_tensor = repulsion_tensor(basis_functions, screening_threshold=screening_threshold)(
+            *args_[1:]
+        )
+        s = overlap_matrix(basis_functions)(*args_[1:])
+        h_core = core_matrix(basis_functions, charges, r)(*args_)
+    else:
+        rep_tensor = repulsion_tensor(basis_functions, screening_threshold=screening_threshold)(
+            *args
+        )
+        s = overlap_matrix(basis_functions)(*args)
+        h_core = core_matrix(basis_functions, charges, r)(*args)
+
+    if key is not None:
+        mol.integral_cache = {key: (s, h_core, rep_tensor)}
+
+    return s, h_core, rep_tensor
+
+
+def _diis_extrapolation(fock_history, error_history):
+    r"""Extrapolate the Fock matrix with the DIIS method.
+
+    The extrapolated Fock matrix :math:`\sum_i c_i F_i` minimizes the norm of
+    :math:`\sum_i c_i e_i`, where :math:`e_i` are the errors of the previous iterations, subject to
+    :math:`\sum_i c_i = 1`. The coefficients are obtained from the values of the errors, such that
+    the extrapolation is linear in the Fock matrices when differentiated.
+
+    Args:
+        fock_history (list[array[float]]): Fock matrices of the previous iterations
+        error_history (list[array[float]]): errors of the previous iterations
+
+    Returns:
+        array[float]: the extrapolated Fock matrix
+    """
+    n = len(fock_history)
+
+    if n < 2:
+        return fock_history[-1]
+
+    errors = np.array([e.ravel() for e in error_history])
+    b = np.zeros((n + 1, n + 1))
+    b[:n, :n] = errors @ errors.T
+    b[:n, n] = b[n, :n] = -1.0
+
+    # rescale the error overlaps to keep the linear system well conditioned near convergence
+    scale = np.max(np.abs(np.diag(b[:n, :n])))
+    if scale > 0:
+        b[:n, :n] /= scale
+
+    rhs = np.zeros(n + 1)
+    rhs[n] = -1.0
+
+    c = np.linalg.lstsq(b, rhs, rcond=None)[0][:n]
+
+    return sum(c_i * f for c_i, f in zip(c, fock_history))
+
+
 def nuclear_energy(charges, r):
     r"""Return a function that computes the nuclear-repulsion energy.
 
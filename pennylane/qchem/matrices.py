@@ -15,9 +15,12 @@
 This module contains the functions needed for computing matrices.
 """
 # pylint: disable= too-many-branches
+import functools
 import itertools as it
 
 import autograd.numpy as anp
+import numpy as np
+from autograd.tracer import getval
 
 from .integrals import (
     attraction_integral,
@@ -271,12 +274,61 @@ def attraction_matrix(basis_functions, charges, r):
     return attraction
 
 
-def repulsion_tensor(basis_functions):
+@functools.lru_cache()
+def _repulsion_indices(n):
+    r"""Return the canonical index quartets of the electron repulsion tensor and the maps that
+    scatter them into the full and packed tensors.
+
+    The electron repulsion integrals :math:`(ij|kl)` are invariant under :math:`i \leftrightarrow j`,
+    :math:`k \leftrightarrow l` and :math:`ij \leftrightarrow kl`. Only the quartets with
+    :math:`i \geq j`, :math:`k \geq l` and :math:`ij \geq kl` are unique, where the pair
+    :math:`(i, j)` is labelled by the compound index :math:`ij = i(i+1)/2 + j`.
+
+    Args:
+        n (int): number of basis functions
+
+    Returns:
+        tuple(list[tuple[int]], array[int], array[int]): the canonical quartets, an array of shape
+        ``(n, n, n, n)`` and an array of shape ``(n(n+1)/2, n(n+1)/2)`` holding, for each element of
+        the full and packed tensors, the position of its canonical quartet
+    """
+    pairs = [(i, j) for i in range(n) for j in range(i + 1)]
+    pair_index = anp.zeros((n, n), dtype=int)
+    packed_map = anp.zeros((len(pairs), len(pairs)), dtype=int)
+    quartets = []
+
+    for p, (i, j) in enumerate(pairs):
+        pair_index[i, j] = pair_index[j, i] = p
+        for q, (k, l) in enumerate(pairs[: p + 1]):
+            packed_map[p, q] = packed_map[q, p] = len(quartets)
+            quartets.append((i, j, k, l))
+
+    index_map = packed_map[pair_index[:, :, anp.newaxis, anp.newaxis], pair_index]
+    index_map.flags.writeable = packed_map.flags.writeable = False
+
+    return quartets, index_map, packed_map
+
+
+def repulsion_tensor(basis_functions, packed=False, screening_threshold=0.0, sparse=False):
     r"""Return a function that computes the electron repulsion tensor for a given set of basis
     functions.
 
+    Negligible integrals can be screened with the Cauchy-Schwarz inequality
+    :math:`|(ij|kl)| \leq \sqrt{(ij|ij)} \sqrt{(kl|kl)}`, such that the integrals with an upper
+    bound smaller than ``screening_threshold`` are set to zero without being computed. The
+    diagonal integrals :math:`(ij|ij)` that make up the bounds are computed for all pairs of basis
+    functions, and are reused in the tensor.
+
     Args:
         basis_functions (list[~qchem.basis_set.BasisFunction]): basis functions
+        packed (bool): if ``True``, the function returns the tensor in the packed format
+            :math:`(ij|kl)` with compound indices :math:`ij = i(i+1)/2 + j` for :math:`i \geq j`,
+            which has shape ``(n(n+1)/2, n(n+1)/2)`` for ``n`` basis functions
+        screening_threshold (float): threshold for the upper bound of the integrals; the
+            integrals are not screened if the threshold is zero
+        sparse (bool): if ``True``, the function returns the indices of the unique quartets
+            :math:`i \geq j`, :math:`k \geq l`, :math:`ij \geq kl` that are not screened, with
+            shape ``(m, 4)``, and the values of their integrals
 
     Returns:
         function: function that computes the electron repulsion tensor
@@ -309,37 +361,65 @@ def repulsion_tensor(basis_functions):
             array[array[float]]: the electron repulsion tensor
         """
         n = len(basis_functions)
-        tensor = anp.zeros((n, n, n, n))
-        e_calc = []
-
-        for (i, a), (j, b), (k, c), (l, d) in it.product(enumerate(basis_functions), repeat=4):
-            if (i, j, k, l) not in e_calc:
-                args_abcd = []
-                if args:
-                    args_abcd.extend(arg[[i, j, k, l]] for arg in args)
-                integral = repulsion_integral(a, b, c, d)(*args_abcd)
-
-                permutations = [
-                    (i, j, k, l),
-                    (k, l, i, j),
-                    (j, i, l, k),
-                    (l, k, j, i),
-                    (j, i, k, l),
-                    (l, k, i, j),
-                    (i, j, l, k),
-                    (k, l, j, i),
-                ]
-
-                o = anp.zeros((n, n, n, n))
-                for perm in permutations:
-                    o[perm] = 1.0
-                tensor = tensor + integral * o
-                e_calc = e_calc + permutations
-        return tensor
+        quartets, index_map, packed_map = _repulsion_indices(n)
+
+        def integral(quartet):
+            args_abcd = [arg[list(quartet)] for arg in args]
+            a, b, c, d = (basis_functions[idx] for idx in quartet)
+            return repulsion_integral(a, b, c, d)(*args_abcd)
+
+        computed = {}
+        keep = list(range(len(quartets)))
+
+        if screening_threshold:
+            bounds = np.zeros((n, n))
+            for i, j in it.combinations_with_replacement(range(n), r=2):
+                computed[j, i, j, i] = integral((j, i, j, i))
+                bounds[i, j] = bounds[j, i] = np.sqrt(abs(getval(computed[j, i, j, i])))
+
+            keep = [
+                idx
+                for idx, (i, j, k, l) in enumerate(quartets)
+                if bounds[i, j] * bounds[k, l] >= screening_threshold
+            ]
+
+        values = [
+            computed[quartets[idx]] if quartets[idx] in computed else integral(quartets[idx])
+            for idx in keep
+        ]
+        values = anp.stack(values) if values else anp.zeros(0)
+
+        if sparse:
+            return np.array([quartets[idx] for idx in keep], dtype=int).reshape(-1, 4), values
+
+        if len(keep) < len(quartets):
+            # the screened quartets point to a zero prepended to the computed integrals
+            position = np.zeros(len(quartets), dtype=int)
+            position[keep] = np.arange(1, len(keep) + 1)
+            values = anp.concatenate([anp.zeros(1), values])[position]
+
+        return values[packed_map] if packed else values[index_map]
 
     return repulsion
 
 
+def _sparse_repulsion(rep_tensor):
+    r"""Return the electron repulsion tensor in the sparse format of :func:`~.repulsion_tensor`.
+
+    Args:
+        rep_tensor (array[float]): the electron repulsion tensor
+
+    Returns:
+        tuple(array[int], array[float]): the indices of the unique quartets :math:`i \geq j`,
+        :math:`k \geq l`, :math:`ij \geq kl` whose integrals are not zero, with shape ``(m, 4)``,
+        and the values of their integrals
+    """
+    quartets = np.array(_repulsion_indices(len(rep_tensor))[0], dtype=int).reshape(-1, 4)
+    quartets = quartets[getval(rep_tensor)[tuple(quartets.T)] != 0]
+
+    return quartets, rep_tensor[tuple(quartets.T)]
+
+
 def core_matrix(basis_functions, charges, r):
     r"""Return a function that computes the core matrix for a given set of basis functions.
 
@@ -115,6 +115,9 @@ class Molecule:
 
         self.mo_coefficients = None
 
+        self.integral_cache = {}
+        self.scf_diagnostics = None
+
     def atomic_orbital(self, index):
         r"""Return a function that evaluates an atomic orbital at a given position.
 
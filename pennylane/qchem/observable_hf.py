@@ -15,12 +15,11 @@
 This module contains the functions needed for creating fermionic and qubit observables.
 """
 # pylint: disable= too-many-branches,
-from functools import reduce
-
 import autograd.numpy as anp
+import numpy
 
 import pennylane as qml
-from pennylane import numpy as np
+from pennylane.bitmasks import jordan_wigner_words, merge_words, pauli_word_symbols
 
 
 def fermionic_observable(constant, one=None, two=None, cutoff=1.0e-12):
@@ -29,7 +28,9 @@ def fermionic_observable(constant, one=None, two=None, cutoff=1.0e-12):
     Args:
         constant (array[float]): the contribution of the core orbitals and nuclei
         one (array[float]): the one-particle molecular orbital integrals
-        two (array[float]): the two-particle molecular orbital integrals
+        two (array[float] or tuple(array[int], array[float])): the two-particle molecular orbital
+            integrals, or the indices of their non-zero elements, with shape ``(m, 4)``, and the
+            values of these elements, such that only the listed elements are expanded
         cutoff (float): cutoff value for discarding the negligible integrals
 
     Returns:
@@ -45,37 +46,53 @@ def fermionic_observable(constant, one=None, two=None, cutoff=1.0e-12):
     """
     coeffs = anp.array([])
 
+    # operators padded with -1 to four indices, used to sort them
+    padded = [numpy.full((0, 4), -1)]
+
     if constant != anp.array([0.0]):
         coeffs = anp.concatenate((coeffs, constant))
         operators = [[]]
+        padded.append(numpy.full((1, 4), -1))
     else:
         operators = []
 
     if one is not None:
         indices_one = anp.argwhere(abs(one) >= cutoff)
         # up-up + down-down terms
-        operators_one = (indices_one * 2).tolist() + (indices_one * 2 + 1).tolist()
+        operators_one = numpy.concatenate([indices_one * 2, indices_one * 2 + 1])
         coeffs_one = anp.tile(one[abs(one) >= cutoff], 2)
         coeffs = anp.concatenate((coeffs, coeffs_one))
-        operators = operators + operators_one
+        operators = operators + operators_one.tolist()
+        padded.append(numpy.pad(operators_one, ((0, 0), (0, 2)), constant_values=-1))
 
     if two is not None:
-        indices_two = anp.argwhere(abs(two) >= cutoff)
-        n = len(indices_two)
-        operators_two = (
-            [(indices_two[i] * 2).tolist() for i in range(n)]  # up-up-up-up
-            + [(indices_two[i] * 2 + [0, 1, 1, 0]).tolist() for i in range(n)]  # up-down-down-up
-            + [(indices_two[i] * 2 + [1, 0, 0, 1]).tolist() for i in range(n)]  # down-up-up-down
-            + [(indices_two[i] * 2 + 1).tolist() for i in range(n)]  # down-down-down-down
+        # only the non-negligible integrals are expanded into the spin blocks
+        if isinstance(two, tuple):
+            mask = abs(two[1]) >= cutoff
+            indices_two, values_two = numpy.reshape(two[0], (-1, 4))[mask], two[1][mask]
+        else:
+            mask = abs(two) >= cutoff
+            indices_two, values_two = numpy.argwhere(mask), two[mask]
+
+        operators_two = numpy.concatenate(
+            [
+                indices_two * 2,  # up-up-up-up
+                indices_two * 2 + [0, 1, 1, 0],  # up-down-down-up
+                indices_two * 2 + [1, 0, 0, 1],  # down-up-up-down
+                indices_two * 2 + 1,  # down-down-down-down
+            ]
         )
-        coeffs_two = anp.tile(two[abs(two) >= cutoff], 4) / 2
+        coeffs_two = anp.tile(values_two, 4) / 2
 
         coeffs = anp.concatenate((coeffs, coeffs_two))
-        operators = operators + operators_two
+        operators = operators + operators_two.tolist()
+        padded.append(operators_two)
 
-    indices_sort = [operators.index(i) for i in sorted(operators)]
+    # sort the operators lexicographically, with the shorter operators preceding the longer ones
+    # sharing their prefix as in the ordering of Python lists
+    indices_sort = numpy.lexsort(numpy.concatenate(padded).T[::-1])
 
-    return coeffs[indices_sort], sorted(operators)
+    return coeffs[indices_sort], [operators[i] for i in indices_sort]
 
 
 def qubit_observable(o_ferm, cutoff=1.0e-12):
@@ -101,23 +118,37 @@ def qubit_observable(o_ferm, cutoff=1.0e-12):
     ((-1+0j)) [Z0]
     + ((1+0j)) [I0]
     """
-    ops = []
-    coeffs = anp.array([])
+    coeffs, operators = o_ferm
+    terms = [
+        n for n, t in enumerate(operators) if not (len(t) == 4 and (t[0] == t[1] or t[2] == t[3]))
+    ]
 
-    for n, t in enumerate(o_ferm[1]):
-        if len(t) == 0:
-            ops = ops + [qml.Identity(0)]
-            coeffs = anp.array([0.0])
-            coeffs = coeffs + o_ferm[0][n]
-        else:
-            op = jordan_wigner(t)
-            if op != 0:
-                ops = ops + op[1]
-                coeffs = anp.concatenate([coeffs, anp.array(op[0]) * o_ferm[0][n]])
+    x, z, values, term_index, word_index = [], [], [], [], []
+    for length in sorted({len(operators[n]) for n in terms}):
+        group = [n for n in terms if len(operators[n]) == length]
+        x_group, z_group, c_group = jordan_wigner_words([operators[n] for n in group])
+
+        x.append(x_group.ravel())
+        z.append(z_group.ravel())
+        values.append((c_group * coeffs[anp.array(group)][:, anp.newaxis]).ravel())
+        term_index.append(numpy.repeat(group, 2**length))
+        word_index.append(numpy.tile(numpy.arange(2**length), len(group)))
+
+    if not values:
+        return qml.Hamiltonian([], [])
+
+    # restore the order in which the Pauli words appear in the fermionic operator
+    order = numpy.lexsort((numpy.concatenate(word_index), numpy.concatenate(term_index)))
+    x = numpy.concatenate(x)[order]
+    z = numpy.concatenate(z)[order]
+    values = anp.concatenate(values)[order]
 
-    o_qubit = simplify(qml.Hamiltonian(coeffs, ops), cutoff=cutoff)
+    words, values = merge_words(x, z, values)
+    nonzero = anp.abs(values) > cutoff
 
-    return o_qubit
+    return qml.Hamiltonian(
+        values[nonzero], [_pauli_word(*w) for w, keep in zip(words, nonzero) if keep]
+    )
 
 
 def jordan_wigner(op):
@@ -140,61 +171,13 @@ def jordan_wigner(op):
     >>> q
     ([(0.5+0j), (-0.5+0j)], [Identity(wires=[0]), PauliZ(wires=[0])]) # corresponds to :math:`\frac{1}{2}(I_0 - Z_0)`
     """
-    if len(op) == 1:
-        op = [((op[0], 1),)]
-
-    if len(op) == 2:
-        op = [((op[0], 1), (op[1], 0))]
-
-    if len(op) == 4:
-        op = [((op[0], 1), (op[1], 1), (op[2], 0), (op[3], 0))]
-
-        if op[0][0][0] == op[0][1][0] or op[0][2][0] == op[0][3][0]:
-            return 0
-
-    for t in op:
-        for l in t:
-            z = [(index, "Z") for index in range(l[0])]
-            x = z + [(l[0], "X"), 0.5]
-
-            if l[1]:
-                y = z + [(l[0], "Y"), -0.5j]
-
-            else:
-                y = z + [(l[0], "Y"), 0.5j]
-
-            if t.index(l) == 0:
-                q = [x, y]
-            else:
-                m = []
-                for t1 in q:
-                    for t2 in [x, y]:
-                        q1, c1 = _pauli_mult(t1[:-1], t2[:-1])
-                        m.append(q1 + [c1 * t1[-1] * t2[-1]])
-                q = m
-
-    c = [p[-1] for p in q]
-    o = [p[:-1] for p in q]
-
-    for item in o:
-        k = [i for i, x in enumerate(o) if x == item]
-        if len(k) >= 2:
-            for j in k[::-1][:-1]:
-                del o[j]
-                c[k[0]] = c[k[0]] + c[j]
-                del c[j]
+    if len(op) == 4 and (op[0] == op[1] or op[2] == op[3]):
+        return 0
 
-    pauli_map = {"X": qml.PauliX, "Y": qml.PauliY, "Z": qml.PauliZ}
-    for i, term in enumerate(o):
-        if len(term) == 0:
-            o[i] = qml.Identity(0)
-        if len(term) == 1:
-            o[i] = pauli_map[term[0][1]](term[0][0])
-        if len(term) > 1:
-            k = [pauli_map[t[1]](t[0]) for t in term]
-            o[i] = reduce(lambda x, y: x @ y, k)
+    x, z, c = jordan_wigner_words([op])
+    words, c = merge_words(x[0], z[0], c[0])
 
-    return c, o
+    return c.tolist(), [_pauli_word(*w) for w in words]
 
 
 def simplify(h, cutoff=1.0e-12):
@@ -219,21 +202,17 @@ def simplify(h, cutoff=1.0e-12):
     """
     wiremap = dict(zip(h.wires, range(len(h.wires) + 1)))
 
-    c, o = [], []
-    for i, op in enumerate(h.ops):
+    terms = {}
+    for coeff, op in zip(h.coeffs, h.ops):
         op = qml.operation.Tensor(op).prune()
         op = qml.grouping.pauli_word_to_string(op, wire_map=wiremap)
-        if op not in o:
-            c.append(h.coeffs[i])
-            o.append(op)
-        else:
-            c[o.index(op)] += h.coeffs[i]
+        terms[op] = terms[op] + coeff if op in terms else coeff
 
     coeffs, ops = [], []
-    nonzero_ind = np.argwhere(abs(np.array(c)) > cutoff).flatten()
-    for i in nonzero_ind:
-        coeffs.append(c[i])
-        ops.append(qml.grouping.string_to_pauli_word(o[i], wire_map=wiremap))
+    for op, coeff in terms.items():
+        if abs(coeff) > cutoff:
+            coeffs.append(coeff)
+            ops.append(qml.grouping.string_to_pauli_word(op, wire_map=wiremap))
 
     try:
         coeffs = qml.math.stack(coeffs)
@@ -243,86 +222,26 @@ def simplify(h, cutoff=1.0e-12):
     return qml.Hamiltonian(coeffs, ops)
 
 
-def _pauli_mult(p1, p2):
-    r"""Return the result of multiplication between two tensor products of Pauli operators.
-
-    The Pauli operator :math:`(P_0)` is denoted by [(0, 'P')], where :math:`P` represents
-    :math:`X`, :math:`Y` or :math:`Z`.
+def _pauli_word(x, z):
+    r"""Return the PennyLane Pauli word represented by a pair of X and Z bitmasks.
 
     Args:
-        p1 (list[tuple[int, str]]): the first tensor product of Pauli operators
-        p2 (list[tuple[int, str]]): the second tensor product of Pauli operators
+        x (int): X bitmask of the Pauli word
+        z (int): Z bitmask of the Pauli word
 
-    Returns
-        tuple(list[tuple[int, str]], complex): list of the Pauli operators and the coefficient
+    Returns:
+        Observable: the Pauli word, or the identity on wire 0 if both bitmasks are zero
 
     **Example**
 
-    >>> p1 = [(0, "X"), (1, "Y")]  # X_0 @ Y_1
-    >>> p2 = [(0, "X"), (2, "Y")]  # X_0 @ Y_2
-    >>> _pauli_mult(p1, p2)
-    ([(2, "Y"), (1, "Y")], 1.0) # p1 @ p2 = X_0 @ Y_1 @ X_0 @ Y_2
+    >>> _pauli_word(3, 6)
+    PauliX(wires=[0]) @ PauliY(wires=[1]) @ PauliZ(wires=[2])
     """
-    c = 1.0
-
-    t1 = [t[0] for t in p1]
-    t2 = [t[0] for t in p2]
-
-    k = []
-
-    for i in p1:
-        if i[0] in t1 and i[0] not in t2:
-            k.append((i[0], pauli_mult[i[1]]))
-        for j in p2:
-            if j[0] in t2 and j[0] not in t1:
-                k.append((j[0], pauli_mult[j[1]]))
-
-            if i[0] == j[0]:
-                if i[1] + j[1] in pauli_coeff:
-                    k.append((i[0], pauli_mult[i[1] + j[1]]))
-                    c = c * pauli_coeff[i[1] + j[1]]
-                else:
-                    k.append((i[0], pauli_mult[i[1] + j[1]]))
-
-    k = [i for i in k if "I" not in i[1]]
-
-    for item in k:
-        k_ = [i for i, x in enumerate(k) if x == item]
-        if len(k_) >= 2:
-            for j in k_[::-1][:-1]:
-                del k[j]
-
-    return k, c
-
-
-pauli_mult = {
-    "XX": "I",
-    "YY": "I",
-    "ZZ": "I",
-    "ZX": "Y",
-    "XZ": "Y",
-    "ZY": "X",
-    "YZ": "X",
-    "XY": "Z",
-    "YX": "Z",
-    "IX": "X",
-    "IY": "Y",
-    "IZ": "Z",
-    "XI": "X",
-    "YI": "Y",
-    "ZI": "Z",
-    "I": "I",
-    "II": "I",
-    "X": "X",
-    "Y": "Y",
-    "Z": "Z",
-}
-
-pauli_coeff = {
-    "ZX": 1.0j,
-    "XZ": -1.0j,
-    "ZY": -1.0j,
-    "YZ": 1.0j,
-    "XY": 1.0j,
-    "YX": -1.0j,
-}
+    pauli_map = {"X": qml.PauliX, "Y": qml.PauliY, "Z": qml.PauliZ}
+    symbols = pauli_word_symbols(x, z)
+    paulis = [pauli_map[symbol](wire) for wire, symbol in symbols]
+
+    if not paulis:
+        return qml.Identity(0)
+
+    return paulis[0] if len(paulis) == 1 else qml.operation.Tensor(*paulis)
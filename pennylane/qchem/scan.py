@@ -0,0 +1,312 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the functions needed for computing Hartree-Fock energies and nuclear
+gradients along a sequence of molecular geometries.
+"""
+# pylint: disable=too-many-arguments, too-many-locals
+import itertools as it
+
+import numpy as np
+
+from pennylane import numpy as pnp
+
+from .hartree_fock import scf
+from .integrals import (
+    contracted_norm,
+    electron_repulsion,
+    gaussian_kinetic,
+    gaussian_overlap,
+    nuclear_attraction,
+    primitive_norm,
+)
+from .matrices import _repulsion_indices, mol_density_matrix
+from .molecule import Molecule
+
+
+def hf_scan(mol, geometries, n_steps=50, tol=1e-8, screening_threshold=1e-12):
+    r"""Compute the Hartree-Fock energies and nuclear gradients of a molecule for a sequence of
+    geometries.
+
+    The self-consistent-field calculation of each geometry starts from the converged density
+    matrix of the previous geometry, which reduces the number of iterations for the closely
+    spaced geometries of a potential energy surface scan. The nuclear gradient of the restricted
+    Hartree-Fock energy is computed analytically as
+
+    .. math::
+
+        \frac{\partial E}{\partial R} = \sum_{\mu\nu} D_{\mu\nu}
+        \frac{\partial h_{\mu\nu}}{\partial R} + \sum_{\mu\nu\lambda\sigma}
+        \Gamma_{\mu\nu\lambda\sigma} \frac{\partial (\mu\nu|\lambda\sigma)}{\partial R}
+        - \sum_{\mu\nu} W_{\mu\nu} \frac{\partial S_{\mu\nu}}{\partial R}
+        + \frac{\partial E_{\text{nuc}}}{\partial R},
+
+    where :math:`D` is the density matrix, :math:`\Gamma` is the two-particle density matrix,
+    :math:`W` is the energy-weighted density matrix, :math:`h` is the core matrix and :math:`S` is
+    the overlap matrix. The derivative integrals are computed from Gaussian functions with shifted
+    angular momenta and contracted with the density matrices on the fly, such that neither the
+    derivative integrals nor an automatic differentiation graph of the integrals are stored.
+    Contributions of integrals that are negligible according to the Schwarz inequality
+    :math:`|(\mu\nu|\lambda\sigma)| \leq \sqrt{(\mu\nu|\mu\nu)} \sqrt{(\lambda\sigma|\lambda\sigma)}`
+    are skipped.
+
+    The normalized contraction coefficients of the basis functions, which do not depend on the
+    geometry, are computed once for the whole scan.
+
+    Args:
+        mol (~qchem.molecule.Molecule): the molecule object, which defines the atoms, the charge
+            and the basis set
+        geometries (Iterable[array[float]]): nuclear coordinates of each geometry, in atomic units
+        n_steps (int): the maximum number of self-consistent-field iterations for each geometry
+        tol (float): convergence tolerance of the self-consistent-field iterations
+        screening_threshold (float): threshold for the Schwarz screening of the electron repulsion
+            integrals and of the contributions of their derivatives to the gradient
+
+    Returns:
+        tuple(array[float], array[float]): the Hartree-Fock energies and the nuclear gradients,
+        with shape ``(n_geometries, n_atoms, 3)``
+
+    **Example**
+
+    >>> symbols  = ['H', 'H']
+    >>> mol = qml.qchem.Molecule(symbols, np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]]))
+    >>> geometries = [np.array([[0.0, 0.0, 0.0], [0.0, 0.0, d]]) for d in [1.2, 1.4, 1.6]]
+    >>> energies, gradients = qml.qchem.hf_scan(mol, geometries)
+    >>> energies
+    array([-1.11033388, -1.11671433, -1.10314097])
+    >>> gradients[:, 1, 2]
+    array([-0.10658557,  0.02845406,  0.09979325])
+    """
+    alpha = [pnp.array(a, dtype=float, requires_grad=False) for a in mol.alpha]
+    coeff = [pnp.array(c, dtype=float, requires_grad=False) for c in mol.coeff]
+    atoms = list(it.chain(*[[i] * n for i, n in enumerate(mol.n_basis)]))
+    shells = [
+        (tuple(l), np.asarray(a), _normalized_coefficients(l, np.asarray(a), np.asarray(c)))
+        for l, a, c in zip(mol.l, alpha, coeff)
+    ]
+
+    energies, gradients = [], []
+    density = None
+
+    for geometry in geometries:
+        geometry = pnp.array(geometry, dtype=float, requires_grad=False)
+        mol_g = Molecule(
+            mol.symbols,
+            geometry,
+            charge=mol.charge,
+            mult=mol.mult,
+            basis_name=mol.basis_name,
+            l=mol.l,
+            alpha=alpha,
+            coeff=coeff,
+        )
+
+        eigvals, coeffs, fock_matrix, h_core, rep_tensor = scf(
+            mol_g, n_steps, tol, guess=density, screening_threshold=screening_threshold
+        )()
+        eigvals, coeffs = np.asarray(eigvals), np.asarray(coeffs)
+        density = mol_density_matrix(mol_g.n_electrons, coeffs)
+
+        coordinates = np.asarray(geometry)
+        e_nuc, g_nuc = _nuclear_repulsion(mol_g.nuclear_charges, coordinates)
+
+        energies.append(
+            np.einsum("pq,qp", np.asarray(fock_matrix) + np.asarray(h_core), density) + e_nuc
+        )
+        gradients.append(
+            g_nuc
+            + _hf_electronic_gradient(
+                shells,
+                atoms,
+                mol_g.nuclear_charges,
+                coordinates,
+                mol_g.n_electrons,
+                eigvals,
+                coeffs,
+                np.asarray(rep_tensor),
+                screening_threshold,
+            )
+        )
+
+    return np.array(energies), np.array(gradients)
+
+
+def _normalized_coefficients(l, alpha, coeff):
+    r"""Return the contraction coefficients of a basis function multiplied by the normalization
+    constants of the primitive and contracted Gaussian functions.
+
+    Args:
+        l (tuple[int]): angular momentum of the basis function
+        alpha (array[float]): exponents of the primitive Gaussian functions
+        coeff (array[float]): contraction coefficients
+
+    Returns:
+        array[float]: normalized contraction coefficients
+    """
+    c = coeff * primitive_norm(l, alpha)
+    return c * contracted_norm(l, alpha, c)
+
+
+def _center_derivative(l, alpha, c):
+    r"""Return the derivatives of a contracted Gaussian function with respect to the coordinates
+    of its center as linear combinations of Gaussian functions with shifted angular momenta.
+
+    The derivative of a primitive Gaussian function :math:`x_A^i e^{-\alpha x_A^2}` with respect
+    to :math:`A_x` is :math:`2 \alpha x_A^{i+1} e^{-\alpha x_A^2} - i x_A^{i-1} e^{-\alpha x_A^2}`.
+
+    Args:
+        l (tuple[int]): angular momentum of the basis function
+        alpha (array[float]): exponents of the primitive Gaussian functions
+        c (array[float]): normalized contraction coefficients
+
+    Returns:
+        list[list[tuple[tuple[int], array[float]]]]: the angular momenta and coefficients of the
+        Gaussian functions of the derivative for each coordinate
+    """
+    terms = []
+    for d in range(3):
+        shift = np.eye(3, dtype=int)[d]
+        terms.append([(tuple(np.array(l) + shift), 2 * alpha * c)])
+        if l[d] > 0:
+            terms[-1].append((tuple(np.array(l) - shift), -l[d] * c))
+    return terms
+
+
+def _nuclear_repulsion(charges, coordinates):
+    r"""Compute the nuclear-repulsion energy and its gradient.
+
+    Args:
+        charges (list[int]): nuclear charges
+        coordinates (array[float]): nuclear positions
+
+    Returns:
+        tuple(float, array[float]): the nuclear-repulsion energy and its gradient
+    """
+    charges = np.array(charges, dtype=float)
+    dr = coordinates[:, np.newaxis] - coordinates
+    dist = np.linalg.norm(dr, axis=-1)
+    np.fill_diagonal(dist, np.inf)
+
+    qq = charges[:, np.newaxis] * charges / dist
+    return 0.5 * qq.sum(), -np.einsum("ij,ijk->ik", qq / dist**2, dr)
+
+
+def _hf_electronic_gradient(
+    shells, atoms, charges, coordinates, n_electrons, eigvals, coeffs, rep_tensor, threshold
+):
+    r"""Compute the gradient of the electronic Hartree-Fock energy with respect to the nuclear
+    coordinates from the derivative integrals.
+
+    By translational invariance, the derivative of an integral with respect to the position of a
+    nucleus or of the center of one of its basis functions is minus the sum of the derivatives
+    with respect to the other centers. Derivatives with respect to the centers on the same atom as
+    the last function of an integral are therefore never computed.
+
+    Args:
+        shells (list[tuple]): angular momentum, exponents and normalized contraction coefficients
+            of each basis function
+        atoms (list[int]): index of the atom of each basis function
+        charges (list[int]): nuclear charges
+        coordinates (array[float]): nuclear positions
+        n_electrons (int): number of electrons
+        eigvals (array[float]): molecular orbital energies
+        coeffs (array[float]): molecular orbital coefficients
+        rep_tensor (array[float]): electron repulsion tensor
+        threshold (float): threshold for the Schwarz bound of the two-electron contributions
+
+    Returns:
+        array[float]: the gradient of the electronic energy
+    """
+    n = len(shells)
+    n_occ = n_electrons // 2
+    r = coordinates[atoms]
+
+    d = 2 * coeffs[:, :n_occ] @ coeffs[:, :n_occ].T
+    w = 2 * (coeffs[:, :n_occ] * eigvals[:n_occ]) @ coeffs[:, :n_occ].T
+    derivatives = [_center_derivative(*shell) for shell in shells]
+
+    grad = np.zeros_like(coordinates)
+
+    # one-electron contributions, with the derivative acting on the first function of each pair,
+    # which by symmetry give half of the gradient
+    for i, j in it.product(range(n), repeat=2):
+        (_, alpha, _), (lb, beta, cb) = shells[i], shells[j]
+
+        for x, terms in enumerate(derivatives[i]):
+            ds = dt = 0.0
+            dv = np.zeros(len(charges))
+
+            for la, ca in terms:
+                if atoms[i] != atoms[j]:
+                    c_ab = ca[:, np.newaxis] * cb
+                    ds += (c_ab * gaussian_overlap(la, lb, r[i], r[j], alpha[:, None], beta)).sum()
+                    dt += (c_ab * gaussian_kinetic(la, lb, r[i], r[j], alpha[:, None], beta)).sum()
+
+                for k, c in enumerate(coordinates):
+                    if atoms[i] == atoms[j] == k:
+                        continue
+                    dv[k] -= (
+                        charges[k]
+                        * (
+                            (ca * cb[:, np.newaxis])
+                            * nuclear_attraction(la, lb, r[i], r[j], alpha, beta[:, None], c)
+                        ).sum()
+                    )
+
+            grad[atoms[i], x] += 2 * (d[i, j] * (dt + dv.sum()) - w[i, j] * ds)
+            grad[:, x] -= 2 * d[i, j] * dv
+
+    schwarz = np.sqrt(np.abs(np.einsum("ijij->ij", rep_tensor)))
+
+    for quartet in _repulsion_indices(n)[0]:
+        i, j, k, l = quartet
+        weight = (1 + (i != j)) * (1 + (k != l)) * (1 + ((i, j) != (k, l)))
+        # element of the two-particle density matrix, symmetrized over the permutations of the
+        # integrals
+        factor = weight * (
+            0.5 * d[i, j] * d[k, l] - 0.125 * (d[i, k] * d[j, l] + d[i, l] * d[j, k])
+        )
+
+        if abs(factor) * schwarz[i, j] * schwarz[k, l] < threshold:
+            continue
+
+        shell_quartet = [shells[idx] for idx in quartet]
+        ls = [s[0] for s in shell_quartet]
+        cs = [s[2] for s in shell_quartet]
+        exponents = [
+            s[1][(slice(None),) + (np.newaxis,) * pos] for pos, s in enumerate(shell_quartet)
+        ]
+        centers = [r[idx] for idx in quartet]
+
+        for pos, idx in enumerate(quartet[:3]):
+            if atoms[idx] == atoms[l]:
+                continue
+
+            for x, terms in enumerate(derivatives[idx]):
+                dg = 0.0
+                for l_shift, c_shift in terms:
+                    ls_x, cs_x = list(ls), list(cs)
+                    ls_x[pos], cs_x[pos] = l_shift, c_shift
+                    c_abcd = (
+                        cs_x[0]
+                        * cs_x[1][:, np.newaxis]
+                        * cs_x[2][:, np.newaxis, np.newaxis]
+                        * cs_x[3][:, np.newaxis, np.newaxis, np.newaxis]
+                    )
+                    dg += (c_abcd * electron_repulsion(*ls_x, *centers, *exponents)).sum()
+
+                grad[atoms[idx], x] += factor * dg
+                grad[atoms[l], x] -= factor * dg
+
+    return grad
@@ -22,7 +22,8 @@ import autograd.numpy as anp
 import numpy
 import pennylane as qml
 from pennylane import numpy as np
-from pennylane.qchem.observable_hf import simplify, jordan_wigner
+from pennylane.bitmasks import merge_words, pauli_word_masks, popcount
+from pennylane.qchem.observable_hf import _pauli_word, jordan_wigner, simplify
 from pennylane.wires import Wires
 
 
@@ -87,42 +88,33 @@ def _reduced_row_echelon(binary_matrix):
            [0, 0, 1, 0, 0, 1, 1, 0],
            [0, 0, 0, 1, 1, 0, 0, 1]])
     """
-    rref_mat = binary_matrix.copy()
-    shape = rref_mat.shape
-    icol = 0
+    shape = binary_matrix.shape
+    # each row is packed into bytes, so that a row operation XORs a few bytes per row
+    rref_mat = numpy.packbits(numpy.asarray(binary_matrix) % 2 == 1, axis=1)
+    irow = 0
 
-    for irow in range(shape[0]):
+    for icol in range(shape[1]):
+        if irow == shape[0]:
+            break
 
-        while icol < shape[1] and not rref_mat[irow][icol]:
+        # get the rows with a nonzero element in column icol
+        currcol = (rref_mat[:, icol // 8] >> (7 - icol % 8)) & 1 == 1
+        non_zero_idx = currcol[irow:].nonzero()[0]
 
-            # get the nonzero indices in the remainder of column icol
-            non_zero_idx = rref_mat[irow:, icol].nonzero()[0]
+        if len(non_zero_idx) == 0:  # if remainder of column icol is all zero
+            continue
 
-            if len(non_zero_idx) == 0:  # if remainder of column icol is all zero
-                icol += 1
-            else:
-                # find value and index of largest element in remainder of column icol
-                krow = irow + non_zero_idx[0]
+        # swap rows krow and irow
+        krow = irow + non_zero_idx[0]
+        rref_mat[[irow, krow]] = rref_mat[[krow, irow]]
+        currcol[[irow, krow]] = currcol[[krow, irow]]
 
-                # swap rows krow and irow
-                rref_mat[irow, icol:], rref_mat[krow, icol:] = (
-                    rref_mat[krow, icol:].copy(),
-                    rref_mat[irow, icol:].copy(),
-                )
-        if icol < shape[1] and rref_mat[irow][icol]:
+        # XOR the pivot row irow with all of the other rows that are nonzero in column icol
+        currcol[irow] = False
+        rref_mat[currcol] ^= rref_mat[irow]
+        irow += 1
 
-            # store remainder right hand side columns of the pivot row irow
-            rpvt_cols = rref_mat[irow, icol:].copy()
-
-            # get the column icol and set its irow element to 0 to avoid XORing pivot row with itself
-            currcol = rref_mat[:, icol].copy()
-            currcol[irow] = 0
-
-            # XOR the right hand side of the pivot row irow with all of the other rows
-            rref_mat[:, icol:] ^= np.outer(currcol, rpvt_cols)
-            icol += 1
-
-    return rref_mat.astype(int)
+    return numpy.unpackbits(rref_mat, axis=1, count=shape[1]).astype(int)
 
 
 def _kernel(binary_matrix):
@@ -362,52 +354,159 @@ def taper(h, generators, paulixops, paulix_sector):
     + ((0.1809270275619003+0j)) [X0]
     + ((0.7959678503869626+0j)) [Z0]
     """
-    u = clifford(generators, paulixops)
-    h = _observable_mult(_observable_mult(u, h), u)
-
-    val = np.ones(len(h.terms()[0])) * complex(1.0)
+    # the wires of h come first, such that the tapered wires keep their order in h
+    wireset = Wires.all_wires(
+        [h.wires] + [g.wires for g in generators] + [x.wires for x in paulixops]
+    )
+    wiremap = dict(zip(wireset, range(len(wireset))))
+    paulix_wires = [wiremap[x.wires[0]] for x in paulixops]
+
+    masks = pauli_word_masks(h.ops, wiremap)
+    if masks is None:
+        raise ValueError("The Hamiltonian must be a linear combination of Pauli words.")
+
+    x, z = masks
+    phase = numpy.zeros(len(x), dtype=int)
+    sign = numpy.ones(len(x))
+
+    # conjugate all Pauli words with each Clifford operator U_i = (X_i + tau_i) / sqrt(2)
+    for x_tau, z_tau, c_tau, x_q in _clifford_masks(generators, paulixops, wiremap):
+        x, z, phase, sign = _clifford_conjugate(x, z, phase, sign, x_tau, z_tau, c_tau, x_q)
+
+    # replace the Pauli-X operators acting on the tapered qubits with their eigenvalues
+    for w, eigenvalue in zip(paulix_wires, paulix_sector):
+        sign = sign * numpy.where((x >> w & 1 == 1) & (z >> w & 1 == 0), eigenvalue, 1)
+
+    # wires of the generators that h does not act on are only kept if the conjugated Pauli words
+    # act on them
+    support = int(numpy.bitwise_or.reduce(x | z)) if len(x) else 0
+    wires_tap = [
+        i
+        for i in range(len(wireset))
+        if i not in paulix_wires and (i < len(h.wires) or support >> i & 1)
+    ]
+    x_tap, z_tap = numpy.zeros_like(x), numpy.zeros_like(z)
+    for i, w in enumerate(wires_tap):
+        x_tap = x_tap | (x >> w & 1) << i
+        z_tap = z_tap | (z >> w & 1) << i
+
+    c = anp.multiply(sign * 1j**phase, qml.math.stack(h.terms()[0]))
+    words, c = merge_words(x_tap, z_tap, c)
+    nonzero = anp.abs(c) > 1.0e-12
+
+    tapered_ham = qml.Hamiltonian(
+        c[nonzero], [_pauli_word(*w) for w, keep in zip(words, nonzero) if keep]
+    )
+    # If simplified Hamiltonian is missing wires, then add wires manually for consistency
+    missing_wires = [i for i in range(len(wires_tap)) if i not in tapered_ham.wires]
+    if missing_wires:
+        identity_op = functools.reduce(
+            lambda i, j: i @ j, [qml.Identity(wire) for wire in missing_wires]
+        )
+        tapered_ham = qml.Hamiltonian(
+            np.array([*tapered_ham.coeffs, 0.0]), [*tapered_ham.ops, identity_op]
+        )
+    return tapered_ham
 
-    wireset = u.wires + h.wires
-    wiremap = dict(zip(wireset, range(len(wireset) + 1)))
-    paulix_wires = [x.wires[0] for x in paulixops]
 
-    for idx, w in enumerate(paulix_wires):
-        for i in range(len(h.terms()[0])):
-            s = qml.grouping.pauli_word_to_string(h.terms()[1][i], wire_map=wiremap)
-            if s[w] == "X":
-                val[i] *= paulix_sector[idx]
+def _clifford_masks(generators, paulixops, wire_map):
+    r"""Return the bitmask representation of the Clifford operators
+    :math:`U_i = (\sigma^{x}_{q_i} + \tau_i) / \sqrt{2}` built from the symmetry generators and
+    the Pauli-X operators.
 
-    o = []
-    wires_tap = [i for i in h.wires if i not in paulix_wires]
-    wiremap_tap = dict(zip(wires_tap, range(len(wires_tap) + 1)))
+    The bitmasks are cached for each set of generators and Pauli-X operators, such that several
+    observables can be tapered with the same Clifford operators without recomputing them.
 
-    for i in range(len(h.terms()[0])):
-        s = qml.grouping.pauli_word_to_string(h.terms()[1][i], wire_map=wiremap)
+    Args:
+        generators (list[Hamiltonian]): generators expressed as PennyLane Hamiltonians
+        paulixops (list[Operation]): list of single-qubit Pauli-X operators
+        wire_map (dict): dictionary containing all wire labels used in the Pauli words as keys, and
+            unique integer labels as their values
 
-        wires = [x for x in h.wires if x not in paulix_wires]
-        o.append(
-            qml.grouping.string_to_pauli_word(
-                "".join([s[wiremap[i]] for i in wires]), wire_map=wiremap_tap
-            )
+    Returns:
+        tuple[tuple[int, int, float, int]]: the X and Z bitmasks and the coefficient of each
+        generator, and the X bitmask of its Pauli-X operator
+    """
+    key = tuple(
+        (
+            qml.grouping.pauli_word_to_string(g.ops[0], wire_map=wire_map),
+            complex(g.coeffs[0]),
+            wire_map[x.wires[0]],
         )
+        for g, x in zip(generators, paulixops)
+    )
+    return _cached_clifford_masks(key)
 
-    c = anp.multiply(val, h.terms()[0])
-    c = qml.math.stack(c)
 
-    tapered_ham = simplify(qml.Hamiltonian(c, o))
-    # If simplified Hamiltonian is missing wires, then add wires manually for consistency
-    if wires_tap != list(tapered_ham.wires):
-        identity_op = functools.reduce(
-            lambda i, j: i @ j,
-            [
-                qml.Identity(wire)
-                for wire in Wires.unique_wires([tapered_ham.wires, Wires(wires_tap)])
-            ],
-        )
-        tapered_ham = qml.Hamiltonian(
-            np.array([*tapered_ham.coeffs, 0.0]), [*tapered_ham.ops, identity_op]
-        )
-    return tapered_ham
+@functools.lru_cache(maxsize=32)
+def _cached_clifford_masks(key):
+    r"""Compute the bitmasks of the Clifford operators from the Pauli strings and coefficients of
+    the symmetry generators and the wires of the Pauli-X operators.
+
+    Args:
+        key (tuple[tuple[str, complex, int]]): Pauli string and coefficient of each generator and
+            the wire of its Pauli-X operator
+
+    Returns:
+        tuple[tuple[int, int, float, int]]: the X and Z bitmasks and the coefficient of each
+        generator, and the X bitmask of its Pauli-X operator
+    """
+    dtype = int if key and len(key[0][0]) > 63 else numpy.uint64
+    masks = []
+    for pauli_string, coeff, wire in key:
+        x_tau = sum(1 << i for i, s in enumerate(pauli_string) if s in "XY")
+        z_tau = sum(1 << i for i, s in enumerate(pauli_string) if s in "ZY")
+        masks.append((dtype(x_tau), dtype(z_tau), coeff.real, dtype(1 << wire)))
+
+    return tuple(masks)
+
+
+def _clifford_conjugate(x, z, phase, sign, x_tau, z_tau, c_tau, x_q):
+    r"""Conjugate Pauli words with the Clifford operator
+    :math:`U = (\sigma^{x}_{q} + c\tau) / \sqrt{2}`.
+
+    A Pauli word :math:`P` that commutes with both :math:`\sigma^{x}_{q}` and :math:`\tau` is left
+    unchanged by the conjugation :math:`U P U`, while it is mapped to :math:`-P` if it
+    anti-commutes with both. The Pauli words anti-commuting with only one of them are mapped to
+    :math:`\pm c P \sigma^{x}_{q} \tau`, with the minus sign if :math:`P` anti-commutes with
+    :math:`\sigma^{x}_{q}`. Each Pauli word :math:`i^k \cdot s \cdot P` is represented by its
+    bitmasks :math:`(x, z)`, as described in :mod:`pennylane.bitmasks`, and by the
+    integer :math:`k` and the real sign :math:`s`.
+
+    Args:
+        x (array[int]): X bitmasks of the Pauli words
+        z (array[int]): Z bitmasks of the Pauli words
+        phase (array[int]): powers of the imaginary unit multiplying the Pauli words
+        sign (array[float]): real factors multiplying the Pauli words
+        x_tau (int): X bitmask of the generator :math:`\tau`
+        z_tau (int): Z bitmask of the generator :math:`\tau`
+        c_tau (float): coefficient :math:`c = \pm 1` of the generator
+        x_q (int): X bitmask of the Pauli-X operator :math:`\sigma^{x}_{q}`
+
+    Returns:
+        tuple(array[int], array[int], array[int], array[float]): the X and Z bitmasks, the phases
+        and the signs of the conjugated Pauli words
+    """
+    anti_x = (z & x_q) != 0
+    anti_tau = (popcount(x & z_tau) + popcount(z & x_tau)) % 2 == 1
+    mixed = anti_x ^ anti_tau
+
+    # P X_q tau = i^k P' where P' is the Pauli word with masks (x ^ x_q ^ x_tau, z ^ z_tau)
+    x_new, z_new = x ^ x_q ^ x_tau, z ^ z_tau
+    k = (
+        popcount(x & z)
+        + bin(int(x_tau & z_tau)).count("1")
+        + 2 * popcount(z & x_q)
+        + 2 * popcount(z & x_tau)
+        - popcount(x_new & z_new)
+    )
+
+    x = numpy.where(mixed, x_new, x)
+    z = numpy.where(mixed, z_new, z)
+    phase = phase + numpy.where(mixed, k, 0)
+    sign = sign * numpy.where(anti_x, -1, 1) * numpy.where(mixed, c_tau, 1)
+
+    return x, z, phase % 4, sign
 
 
 def optimal_sector(qubit_op, generators, active_electrons):
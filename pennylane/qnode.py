@@ -443,7 +443,11 @@ class QNode:
                     backprop_devices[mapped_interface], wires=device.wires, shots=device.shots
                 )
                 device.expand_fn = expand_fn
-                device.batch_transform = batch_transform
+
+                # the default batch transform is bound to the new device, such that it
+                # expands broadcasted circuits according to the capabilities of that device
+                if getattr(batch_transform, "__func__", None) is not qml.Device.batch_transform:
+                    device.batch_transform = batch_transform
 
                 return "backprop", {}, device
 
@@ -614,7 +618,11 @@ class QNode:
             and hasattr(cache, "__setitem__")
             and hasattr(cache, "__delitem__")
         )
-        self._tape_cached = using_custom_cache and self.tape.hash in cache
+        if isinstance(cache, qml.interfaces.PersistentCache):
+            cache = cache.bind(self.device, override_shots)
+
+        tape_key = getattr(cache, "tape_key", lambda tape: tape.fingerprint)
+        self._tape_cached = using_custom_cache and tape_key(self.tape) in cache
 
         res = qml.execute(
             [self.tape],
@@ -18,6 +18,7 @@ This module contains the base quantum tape.
 from collections import Counter, deque, defaultdict
 import contextlib
 import copy
+import hashlib
 from threading import RLock
 
 import pennylane as qml
@@ -927,6 +928,117 @@ class QuantumTape(AnnotatedQueue):
         self._update_batch_size()
         self._update_output_dim()
 
+    def bind_new_parameters(self, params, indices):
+        """Create a new tape in which some of the trainable parameters are replaced.
+
+        Only the operations and observables whose parameters change are copied. All other
+        operations, as well as the circuit metadata, are shared with the original tape
+        instead of being copied and recomputed, which makes this method considerably cheaper
+        than :meth:`~.copy` followed by :meth:`~.set_parameters` for large circuits.
+
+        .. warning::
+
+            As for ``copy(copy_operations=False)``, changing the parameters of a shared
+            operation in place, for example via :meth:`~.set_parameters`, changes
+            the parameters of both tapes.
+
+        Args:
+            params (Sequence[tensor_like]): the new parameter values
+            indices (Sequence[int]): the trainable parameter indices of the parameters
+                to replace, in the same order as ``params``
+
+        Returns:
+            .QuantumTape: the new tape
+
+        **Example**
+
+        .. code-block:: python
+
+            with QuantumTape() as tape:
+                qml.RX(0.432, wires=0)
+                qml.RY(0.543, wires=0)
+                qml.CNOT(wires=[0, 'a'])
+                qml.RX(0.133, wires='a')
+                qml.expval(qml.PauliZ(wires=[0]))
+
+        >>> new_tape = tape.bind_new_parameters([0.8], [1])
+        >>> new_tape.get_parameters()
+        [0.432, 0.8, 0.133]
+        >>> tape.get_parameters()
+        [0.432, 0.543, 0.133]
+        >>> new_tape.operations[0] is tape.operations[0]
+        True
+        """
+        if len(params) != len(indices):
+            raise ValueError("Number of provided parameters does not match.")
+
+        # copy each operation whose parameters change exactly once
+        copied = {}
+        for idx, p in zip(indices, params):
+            info = self._par_info[self.trainable_params[idx]]
+            op = info["op"]
+
+            if id(op) not in copied:
+                copied[id(op)] = copy.copy(op)
+
+                if isinstance(op, qml.operation.Tensor):
+                    # the parameters of a tensor product are stored in its factors,
+                    # which are shared with the original tensor product by copy.copy,
+                    # and its eigenvalues are cached
+                    copied[id(op)].obs = [copy.copy(o) for o in op.obs]
+                    copied[id(op)]._eigvals_cache = None
+
+            target, p_idx = copied[id(op)], info["p_idx"]
+
+            if isinstance(target, qml.operation.Tensor):
+                # Tensor.data is assembled from the factors on every access,
+                # so the parameter is set on the factor it belongs to
+                for factor in target.obs:
+                    if p_idx < len(factor.data):
+                        target = factor
+                        break
+                    p_idx -= len(factor.data)
+
+            target.data[p_idx] = p
+
+        for op in copied.values():
+            op._check_batching(op.data)
+
+        tape = QuantumTape()
+        tape._prep = [copied.get(id(op), op) for op in self._prep]
+        tape._ops = [copied.get(id(op), op) for op in self._ops]
+        tape._measurements = []
+        for m in self._measurements:
+            if id(m.obs) in copied:
+                # keep all other attributes of the measurement process
+                new_m = copy.copy(m)
+                new_m.obs = copied[id(m.obs)]
+                m = new_m
+
+            tape._measurements.append(m)
+
+        tape._par_info = {
+            i: {"op": copied.get(id(info["op"]), info["op"]), "p_idx": info["p_idx"]}
+            for i, info in self._par_info.items()
+        }
+        tape._trainable_params = self._trainable_params.copy()
+
+        tape.wires = self.wires
+        tape.num_wires = self.num_wires
+        tape.is_sampled = self.is_sampled
+        tape.all_sampled = self.all_sampled
+        tape._obs_sharing_wires = [copied.get(id(o), o) for o in self._obs_sharing_wires]
+        tape._obs_sharing_wires_id = self._obs_sharing_wires_id.copy()
+
+        if self._batch_size is None and all(op.batch_size is None for op in copied.values()):
+            tape._batch_size = None
+            tape._output_dim = self._output_dim
+        else:
+            tape._update_batch_size()
+            tape._update_output_dim()
+
+        return tape
+
     @staticmethod
     def _single_measurement_shape(measurement_process, device):
         """Auxiliary function of shape that determines the output
@@ -1575,3 +1687,33 @@ class QuantumTape(AnnotatedQueue):
         fingerprint.extend(m.hash for m in self.measurements)
         fingerprint.extend(self.trainable_params)
         return hash(tuple(fingerprint))
+
+    @property
+    def fingerprint(self):
+        """str: returns a process-independent digest uniquely representing the quantum tape
+
+        The fingerprint combines the fingerprints of the operations and measurements
+        of the tape with its trainable parameters. Since operators memoize their
+        fingerprints, only operations whose parameters changed since the last call
+        (for example, the shifted operation of a parameter-shift tape) are rehashed.
+
+        **Example**
+
+        >>> with qml.tape.QuantumTape() as tape:
+        ...     qml.RX(0.5, wires=0)
+        ...     qml.expval(qml.PauliZ(0))
+        >>> tape.fingerprint
+        '2d08d78d3bcc519456544b407e5397d2'
+        """
+        digest = hashlib.blake2b(digest_size=16)
+
+        for op in self.operations:
+            digest.update(op.fingerprint.encode())
+
+        digest.update(b"|")
+
+        for m in self.measurements:
+            digest.update(m.fingerprint.encode())
+
+        digest.update(str(self.trainable_params).encode())
+        return digest.hexdigest()
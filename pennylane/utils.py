@@ -28,6 +28,7 @@ import numpy as np
 import scipy
 
 import pennylane as qml
+from pennylane.bitmasks import parity, pauli_word_masks, popcount
 
 
 def __getattr__(name):
@@ -164,11 +165,16 @@ def sparse_hamiltonian(H, wires=None):
     else:
         wires = qml.wires.Wires(wires)
 
+    coeffs = qml.math.toarray(H.data)
+    # the first wire corresponds to the most significant bit of the computational basis states
+    masks = pauli_word_masks(H.ops, {w: len(wires) - 1 - i for i, w in enumerate(wires)})
+
+    if masks is not None:
+        return _sparse_pauli_sum(coeffs, *masks, num_wires=len(wires))
+
     n = len(wires)
     matrix = scipy.sparse.csr_matrix((2**n, 2**n), dtype="complex128")
 
-    coeffs = qml.math.toarray(H.data)
-
     temp_mats = []
     for coeff, op in zip(coeffs, H.ops):
         obs = []
@@ -216,6 +222,62 @@ def sparse_hamiltonian(H, wires=None):
     return matrix
 
 
+_SPARSE_CHUNK_SIZE = 2**22
+"""int: maximum number of matrix elements that are computed at once when
+building the sparse matrix of a sum of Pauli words"""
+
+
+def _sparse_pauli_sum(coeffs, x_masks, z_masks, num_wires):
+    r"""Computes the sparse matrix of a linear combination of Pauli words given by their bitmasks.
+
+    Pauli words that share an X-mask :math:`x` have the same sparsity pattern, with the
+    non-zero elements in positions :math:`(j \oplus x, j)`. The terms are therefore grouped
+    by their X-mask, and the elements of all terms in a group are accumulated into a single
+    dense array of length :math:`2^n` before the sparse matrix is assembled.
+
+    Args:
+        coeffs (array[complex]): coefficients of the Pauli words
+        x_masks (array[int]): X-masks of the Pauli words, with the first wire corresponding to
+            the most significant bit
+        z_masks (array[int]): Z-masks of the Pauli words
+        num_wires (int): number of wires
+
+    Returns:
+        csr_matrix: the sparse matrix of dimension :math:`(2^n, 2^n)`
+    """
+    dim = 2**num_wires
+    num_y = popcount(x_masks & z_masks)
+    phases = np.asarray(coeffs, dtype=np.complex128) * np.array([1, 1j, -1, -1j])[num_y % 4]
+
+    # the masks are used as indices of the computational basis states
+    x_masks, z_masks = x_masks.astype(np.int64), z_masks.astype(np.int64)
+
+    # sort the terms by X-mask, such that terms sharing a sparsity pattern are contiguous
+    order = np.argsort(x_masks, kind="stable")
+    x_unique, group = np.unique(x_masks[order], return_inverse=True)
+
+    cols = np.arange(dim, dtype=np.int64)
+    data = np.zeros((len(x_unique), dim), dtype=np.complex128)
+    chunk_size = max(1, _SPARSE_CHUNK_SIZE // dim)
+
+    for start in range(0, len(order), chunk_size):
+        terms = order[start : start + chunk_size]
+        signs = 1 - 2 * parity(cols & z_masks[terms, np.newaxis])
+        elements = phases[terms, np.newaxis] * signs
+
+        # sum the elements of the terms of each group within the chunk
+        chunk_group = group[start : start + chunk_size]
+        boundaries = np.flatnonzero(np.diff(chunk_group, prepend=-1))
+        data[chunk_group[boundaries]] += np.add.reduceat(elements, boundaries, axis=0)
+
+    rows = cols ^ x_unique[:, np.newaxis]
+    matrix = scipy.sparse.coo_matrix(
+        (data.ravel(), (rows.ravel(), np.tile(cols, len(x_unique)))), shape=(dim, dim)
+    ).tocsr()
+    matrix.eliminate_zeros()
+    return matrix
+
+
 def _flatten(x):
     """Iterate recursively through an arbitrarily nested structure in depth-first order.
 
@@ -18,7 +18,7 @@ Unit tests for the :mod:`pennylane.devices.DefaultMixed` device.
 import pytest
 import pennylane as qml
 from pennylane import QubitStateVector, BasisState, DeviceError
-from pennylane.devices import DefaultMixed
+from pennylane.devices import DefaultMixed, default_mixed
 from pennylane.ops import (
     Identity,
     PauliZ,
@@ -988,6 +988,140 @@ class TestApply:
         assert np.allclose(dev.state, target, atol=tol, rtol=0)
 
 
+class TestNoiseShortcuts:
+    """Tests that dephasing and depolarizing channels, which are applied without summing
+    over their Kraus operators, act on the state like their Kraus operators."""
+
+    @staticmethod
+    def _random_state(nr_wires):
+        """Returns a random density matrix on ``nr_wires`` wires."""
+        dim = 2**nr_wires
+        mat = np.random.random((dim, dim)) + 1j * np.random.random((dim, dim))
+        rho = mat @ mat.conj().T
+        return rho / np.trace(rho)
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.PhaseDamping(0.3, wires=1),
+            qml.PhaseFlip(0.2, wires=0),
+            qml.PhaseFlip(0.9, wires=2),
+            qml.DepolarizingChannel(0.4, wires=1),
+            qml.DepolarizingChannel(1.0, wires=2),
+        ],
+    )
+    def test_matches_kraus_operators(self, op, mocker, tol):
+        """Tests that the channel gives the same state as the sum over its Kraus operators,
+        without calling `_apply_channel()`."""
+        nr_wires = 3
+        rho = np.reshape(self._random_state(nr_wires), [2] * 2 * nr_wires)
+
+        dev = qml.device("default.mixed", wires=nr_wires)
+        dev._state = rho
+        dev._apply_channel(op.kraus_matrices(), op.wires)
+        expected = dev._state
+
+        spy = mocker.spy(DefaultMixed, "_apply_channel")
+        dev._state = rho
+        dev._apply_operation(op)
+
+        spy.assert_not_called()
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    def test_einsum_indices_cached(self):
+        """Tests that the einsum indices of a channel are only built once for each
+        combination of the number of wires and the target wires."""
+        default_mixed._channel_indices.cache_clear()
+
+        dev = qml.device("default.mixed", wires=3)
+        dev.apply([qml.Hadamard(0), qml.CNOT(wires=[0, 1]), qml.Hadamard(0), qml.Hadamard(2)])
+
+        info = default_mixed._channel_indices.cache_info()
+        assert info.misses == 3
+        assert info.hits == 1
+
+
+class TestChannelFusion:
+    """Tests for absorbing unitary operations into the channels that follow them."""
+
+    ops = [
+        Hadamard(wires=0),
+        CNOT(wires=[0, 1]),
+        qml.RY(0.3, wires=1),
+        AmplitudeDamping(0.2, wires=1),
+        qml.RX(0.7, wires=0),
+        PauliZ(wires=0),
+        ResetError(0.1, 0.2, wires=0),
+        qml.CRX(0.5, wires=[2, 0]),
+        PauliError("XY", 0.3, wires=[0, 2]),
+        qml.RX(0.1, wires=2),
+        qml.PhaseDamping(0.4, wires=2),
+        qml.RY(-0.3, wires=1),
+        DepolarizingChannel(0.2, wires=1),
+    ]
+
+    def test_same_state(self, tol):
+        """Tests that fusing operations does not change the final state."""
+        dev = qml.device("default.mixed", wires=3)
+        dev_fused = qml.device("default.mixed", wires=3, fuse_channels=True)
+
+        dev.apply(self.ops)
+        dev_fused.apply(self.ops)
+
+        assert np.allclose(dev_fused.state, dev.state, atol=tol, rtol=0)
+
+    def test_fused_operations(self, mocker):
+        """Tests that only unitaries acting within the wires of the next channel are absorbed,
+        and that dephasing and depolarizing channels are not fused."""
+        dev = qml.device("default.mixed", wires=3, fuse_channels=True)
+        fused = dev._fuse_channels(self.ops)
+
+        assert [op.name for op, _ in fused] == [
+            "Hadamard",
+            "CNOT",
+            "AmplitudeDamping",
+            "ResetError",
+            "PauliError",
+            "RX",
+            "PhaseDamping",
+            "RY",
+            "DepolarizingChannel",
+        ]
+        assert [kraus is None for _, kraus in fused] == [
+            True,
+            True,
+            False,
+            False,
+            False,
+            True,
+            True,
+            True,
+            True,
+        ]
+
+        spy = mocker.spy(DefaultMixed, "_apply_channel")
+        dev.apply(self.ops)
+        assert spy.call_count == 7
+
+    def test_backprop(self, tol):
+        """Tests that the gradient through fused operations is correct."""
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.RY(2 * x, wires=0)
+            AmplitudeDamping(0.3, wires=0)
+            return qml.expval(PauliZ(0))
+
+        dev = qml.device("default.mixed", wires=1)
+        dev_fused = qml.device("default.mixed", wires=1, fuse_channels=True)
+
+        x = qml.numpy.array(0.4, requires_grad=True)
+        res = qml.grad(qml.QNode(circuit, dev_fused, diff_method="backprop"))(x)
+        expected = qml.grad(qml.QNode(circuit, dev, diff_method="backprop"))(x)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
 class TestInit:
     """Tests related to device initializtion"""
 
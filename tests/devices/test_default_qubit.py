@@ -1154,7 +1154,7 @@ class TestDefaultQubitIntegration:
             "supports_reversible_diff": True,
             "supports_inverse_operations": True,
             "supports_analytic_computation": True,
-            "supports_broadcasting": False,
+            "supports_broadcasting": True,
             "passthru_devices": {
                 "torch": "default.qubit.torch",
                 "tf": "default.qubit.tf",
@@ -2528,10 +2528,280 @@ class TestHamiltonianSupport:
         with pytest.raises(AssertionError, match="Hamiltonian must be used with shots=None"):
             dev.expval(H)
 
+    @staticmethod
+    def _pauli_hamiltonian(coeffs):
+        obs = [
+            qml.PauliX("a") @ qml.PauliY(2),
+            qml.PauliZ("a") @ qml.PauliZ(0),
+            qml.PauliY(0) @ qml.PauliY("a") @ qml.PauliX(2),
+            qml.Identity(2),
+            qml.PauliZ(2) @ qml.PauliX(0),
+        ]
+        return qml.Hamiltonian(coeffs, obs)
+
+    @staticmethod
+    def _ops(x):
+        return [
+            qml.RX(x[0], wires=0),
+            qml.RY(x[1], wires="a"),
+            qml.CNOT(wires=[0, 2]),
+            qml.RX(x[2], wires=2),
+            qml.CRY(x[3], wires=["a", 0]),
+            qml.S(wires=2),
+        ]
+
+    def test_pauli_words_expval(self, mocker, tol):
+        """Tests that the expectation value of a Hamiltonian consisting of Pauli words
+        is computed without constructing its matrix."""
+        dev = qml.device("default.qubit", wires=[0, "a", 2])
+        dev.apply(self._ops([0.1, 0.5, -0.3, 1.2]))
+        H = self._pauli_hamiltonian([0.4, -0.2, 1.1, 0.3, 0.7])
+
+        spy = mocker.spy(qml.utils, "sparse_hamiltonian")
+        res = dev.expval(H)
+
+        Hmat = qml.matrix(H, wire_order=dev.wires)
+        expected = np.real(dev.state.conj() @ Hmat @ dev.state)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 1  # only called by qml.matrix
+
+    def test_non_pauli_hamiltonian_expval(self, mocker, tol):
+        """Tests that the expectation value of a Hamiltonian with observables that are not
+        Pauli words is computed from its sparse matrix."""
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply([qml.RX(0.4, wires=0), qml.CNOT(wires=[0, 1])])
+
+        H = qml.Hamiltonian([0.5, 0.2], [qml.Hadamard(0), qml.PauliZ(0) @ qml.PauliZ(1)])
+        spy = mocker.spy(dev, "_pauli_words_expval")
+        res = dev.expval(H)
+
+        expected = np.real(dev.state.conj() @ qml.matrix(H, wire_order=[0, 1]) @ dev.state)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        spy.assert_not_called()
+
+    def test_pauli_words_expval_backprop(self, tol):
+        """Tests that the expectation value of Pauli words is differentiable with respect to
+        the gate parameters and the coefficients of the Hamiltonian."""
+        dev = qml.device("default.qubit", wires=[0, "a", 2])
+
+        def circuit(x, coeffs):
+            self._ops(x)
+            return qml.expval(self._pauli_hamiltonian(coeffs))
+
+        x = np.array([0.1, 0.5, -0.3, 1.2], requires_grad=True)
+        coeffs = np.array([0.4, -0.2, 1.1, 0.3, 0.7], requires_grad=True)
+
+        res = qml.grad(qml.QNode(circuit, dev, diff_method="backprop"))(x, coeffs)
+        expected = qml.grad(qml.QNode(circuit, dev, diff_method="parameter-shift"))(x, coeffs)
+
+        assert np.allclose(res[0], expected[0], atol=tol, rtol=0)
+        assert np.allclose(res[1], expected[1], atol=tol, rtol=0)
+
+    @staticmethod
+    def _factorized_hamiltonian(wires):
+        rng = np.random.default_rng(42)
+        one = rng.normal(size=(3, 3))
+        factors = rng.normal(size=(2, 3, 3))
+        one, factors = one + one.T, factors + np.swapaxes(factors, 1, 2)
+        return qml.qchem.FactorizedHamiltonian(0.3, one, factors, wires=wires)
+
+    def test_factorized_hamiltonian_expval(self, mocker, tol):
+        """Tests that the expectation value of a factorized Hamiltonian is computed from its
+        factors, without constructing its Pauli words."""
+        wires = [5, "a", 2, 0, "b", 1]
+        dev = qml.device("default.qubit", wires=["b", 0, 1, "a", 2, 5])
+        state = np.random.default_rng(7).normal(size=(64, 2)) @ np.array([1, 1j])
+        dev._apply_state_vector(state / np.linalg.norm(state), dev.wires)
+
+        H = self._factorized_hamiltonian(wires)
+        expected = np.real(
+            dev.state.conj() @ qml.matrix(H.hamiltonian(), wire_order=dev.wires) @ dev.state
+        )
+
+        spy = mocker.spy(qml.qchem.FactorizedHamiltonian, "hamiltonian")
+        res = dev.expval(H)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        spy.assert_not_called()
+
+    def test_factorized_hamiltonian_backprop(self, tol):
+        """Tests that the expectation value of a factorized Hamiltonian is differentiable with
+        respect to the gate parameters."""
+        dev = qml.device("default.qubit", wires=6)
+        H = self._factorized_hamiltonian(range(6))
+
+        def circuit(x, h):
+            qml.BasisState(np.array([1, 1, 0, 0, 0, 0]), wires=range(6))
+            qml.DoubleExcitation(x[0], wires=[0, 1, 2, 3])
+            qml.SingleExcitation(x[1], wires=[1, 5])
+            return qml.expval(h)
+
+        x = np.array([0.4, -0.7], requires_grad=True)
+
+        res = qml.grad(qml.QNode(circuit, dev, diff_method="backprop"))(x, H)
+        expected = qml.grad(qml.QNode(circuit, dev, diff_method="backprop"))(x, H.hamiltonian())
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_error_factorized_hamiltonian_finite_shots(self):
+        """Tests that an error is raised for the expectation value of a factorized Hamiltonian
+        with finite shots."""
+        dev = qml.device("default.qubit", wires=6, shots=10)
+
+        with pytest.raises(AssertionError, match="must be used with shots=None"):
+            dev.expval(self._factorized_hamiltonian(range(6)))
+
+
+class TestGateFusion:
+    """Tests for the fusion of adjacent operations into dense unitaries."""
+
+    @staticmethod
+    def _circuit_ops():
+        return [
+            qml.Hadamard(wires=0),
+            qml.RX(0.3, wires=1),
+            qml.CNOT(wires=[0, 1]),
+            qml.RZ(-0.7, wires=2),
+            qml.S(wires=1).inv(),
+            qml.CRY(1.2, wires=[2, 0]),
+            qml.Toffoli(wires=[0, 1, 3]),
+            qml.IsingXX(0.4, wires=[3, 2]),
+            qml.T(wires=3),
+            qml.PauliY(wires=1),
+            qml.MultiRZ(0.5, wires=[0, 1, 2, 3]),
+            qml.SWAP(wires=[1, 3]),
+        ]
+
+    def test_invalid_fusion_max_wires(self):
+        """Test that an error is raised if the maximum number of fused wires is not positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            qml.device("default.qubit", wires=2, fusion_max_wires=0)
+
+    @pytest.mark.parametrize("max_wires", [1, 2, 3, 4])
+    def test_fused_state_matches_unfused(self, max_wires, tol):
+        """Test that the final state is identical with and without fusion."""
+        dev = qml.device("default.qubit", wires=4)
+        dev_fused = qml.device("default.qubit", wires=4, fusion_max_wires=max_wires)
+
+        dev.apply(self._circuit_ops())
+        dev_fused.apply(self._circuit_ops())
+
+        assert np.allclose(dev_fused.state, dev.state, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "max_wires, expected_wires",
+        [
+            (
+                1,
+                [
+                    [0],
+                    [1],
+                    [0, 1],
+                    [2],
+                    [1],
+                    [2, 0],
+                    [0, 1, 3],
+                    [3, 2],
+                    [3],
+                    [1],
+                    [0, 1, 2, 3],
+                    [1, 3],
+                ],
+            ),
+            (2, [[0, 1], [2, 1], [2, 0], [0, 1, 3], [3, 2], [1], [0, 1, 2, 3], [1, 3]]),
+            (3, [[0, 1, 2], [0, 1, 3], [3, 2, 1], [0, 1, 2, 3], [1, 3]]),
+            (4, [[0, 1, 2, 3]]),
+        ],
+    )
+    def test_fused_blocks(self, max_wires, expected_wires):
+        """Test that adjacent operations are grouped into blocks of at most ``max_wires`` wires."""
+        dev = qml.device("default.qubit", wires=4, fusion_max_wires=max_wires)
+        fused = dev._fuse_operations(self._circuit_ops())
+
+        assert [op.wires.tolist() for op in fused] == expected_wires
+
+    def test_single_operations_not_fused(self):
+        """Test that operations that cannot be merged with a neighbour are left untouched."""
+        ops = [qml.RX(0.1, wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.2, wires=1)]
+        dev = qml.device("default.qubit", wires=2, fusion_max_wires=1)
+
+        assert dev._fuse_operations(ops) == ops
+
+    def test_fusion_interrupted_by_snapshot(self):
+        """Test that snapshots are not absorbed into a fused block and see the correct state."""
+        dev = qml.device("default.qubit", wires=2, fusion_max_wires=2)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.Snapshot("superposition")
+            qml.CNOT(wires=[0, 1])
+            qml.Identity(wires=1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        snapshots = qml.snapshots(circuit)()
+
+        assert np.allclose(snapshots["superposition"], np.array([1, 0, 1, 0]) / np.sqrt(2))
+        assert np.isclose(snapshots["execution_results"], 1.0)
+
+    def test_fusion_with_state_preparation(self, tol):
+        """Test that fusion is compatible with state preparation operations."""
+        state = np.array([1, 1j, -1, 0]) / np.sqrt(3)
+        ops = [
+            qml.QubitStateVector(state, wires=[0, 1]),
+            qml.RX(0.4, wires=0),
+            qml.CZ(wires=[0, 1]),
+        ]
+
+        dev = qml.device("default.qubit", wires=2)
+        dev_fused = qml.device("default.qubit", wires=2, fusion_max_wires=2)
+
+        dev.apply(ops)
+        dev_fused.apply(ops)
+
+        assert isinstance(dev_fused._fuse_operations(ops)[0], qml.QubitStateVector)
+        assert np.allclose(dev_fused.state, dev.state, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("fusion_max_wires", [None, 1, 2])
+    @pytest.mark.parametrize(
+        "state_prep",
+        [qml.QubitStateVector(np.array([0, 1]), wires=0), qml.BasisState([1], wires=0)],
+    )
+    def test_state_preparation_after_identity(self, fusion_max_wires, state_prep):
+        """Test that an error is raised if a state preparation follows an identity, which is
+        removed by fusion."""
+        dev = qml.device("default.qubit", wires=1, fusion_max_wires=fusion_max_wires)
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.apply([qml.Identity(wires=0), state_prep])
+
+    def test_fusion_qnode_gradient(self, tol):
+        """Test that a QNode using a fusing device can be differentiated."""
+        dev = qml.device("default.qubit", wires=3, fusion_max_wires=3)
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(x[1], wires=1)
+            qml.CRZ(x[0], wires=[1, 2])
+            return qml.expval(qml.PauliZ(1))
+
+        x = np.array([0.3, -0.8], requires_grad=True)
+        res = circuit(x)
+        grad = qml.grad(circuit)(x)
+
+        expected = np.cos(x[0]) * np.cos(x[1])
+        expected_grad = [-np.sin(x[0]) * np.cos(x[1]), -np.cos(x[0]) * np.sin(x[1])]
+
+        assert np.isclose(res, expected, atol=tol, rtol=0)
+        assert np.allclose(grad, expected_grad, atol=tol, rtol=0)
+
 
 class TestBroadcastingSupport:
-    """Tests that the device correctly makes use of ``broadcast_expand`` to
-    execute broadcasted tapes."""
+    """Tests that the device executes broadcasted tapes with a broadcasted state, and makes use
+    of ``broadcast_expand`` to execute broadcasted tapes with finite shots."""
 
     @pytest.mark.parametrize("x", [0.2, [0.1, 0.6, 0.3], [0.1]])
     @pytest.mark.parametrize("shots", [None, 100000])
@@ -2548,7 +2818,8 @@ class TestBroadcastingSupport:
 
         out = circuit(np.array(x))
 
-        assert circuit.device.num_executions == (1 if isinstance(x, float) else len(x))
+        expanded = shots is not None and not isinstance(x, float)
+        assert circuit.device.num_executions == (len(x) if expanded else 1)
         tol = 1e-10 if shots is None else 1e-2
         assert qml.math.allclose(out, qml.math.cos(x), atol=tol, rtol=0)
 
@@ -2565,10 +2836,10 @@ class TestBroadcastingSupport:
             qml.RX(y, wires=1)
             return [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1))]
 
-        out = circuit(x, y)
+        out = circuit(np.array(x), np.array(y))
         expected = qml.math.stack([qml.math.cos(x) * qml.math.ones_like(y), -qml.math.sin(y)]).T
 
-        assert circuit.device.num_executions == len(y)
+        assert circuit.device.num_executions == (1 if shots is None else len(y))
         tol = 1e-10 if shots is None else 1e-2
         assert qml.math.allclose(out, expected, atol=tol, rtol=0)
 
@@ -2588,9 +2859,124 @@ class TestBroadcastingSupport:
             qml.RX(y, wires=1)
             return qml.expval(H)
 
-        out = circuit(x, y)
+        out = circuit(np.array(x), np.array(y))
         expected = 0.3 * qml.math.cos(x) * qml.math.ones_like(y) - 0.9 * qml.math.sin(y)
 
-        assert circuit.device.num_executions == len(y)
+        assert circuit.device.num_executions == (1 if shots is None else len(y))
         tol = 1e-10 if shots is None else 1e-2
         assert qml.math.allclose(out, expected, atol=tol, rtol=0)
+
+    @staticmethod
+    def _broadcasted_circuit(x, state):
+        """Circuit with broadcasted parameters, applying every kind of operation kernel."""
+        qml.QubitStateVector(state, wires=[2, 0])
+        qml.RX(x, wires=0)
+        qml.CNOT(wires=[0, 1])
+        qml.Toffoli(wires=[1, 0, 2])
+        qml.CZ(wires=[2, 0])
+        qml.SWAP(wires=[0, 2])
+        qml.Hadamard(wires=1)
+        qml.S(wires=1)
+        qml.CRY(x, wires=[2, 0])
+        qml.MultiRZ(x, wires=[0, 1, 2])
+        qml.QubitUnitary(qml.QFT(wires=[0, 1, 2]).matrix(), wires=[2, 0, 1])
+        qml.RY(x, wires=1).inv()
+
+    @pytest.mark.parametrize("fusion_max_wires", [None, 2])
+    @pytest.mark.parametrize("state_batched", [False, True])
+    @pytest.mark.parametrize(
+        "measurements",
+        [
+            lambda: qml.expval(qml.PauliZ(0)),
+            lambda: [qml.expval(qml.PauliX(1)), qml.var(qml.PauliZ(0) @ qml.PauliY(2))],
+            lambda: qml.expval(qml.Projector([1, 0], wires=[2, 0])),
+            lambda: qml.var(
+                qml.Hermitian(np.diag([1.0, 2.0, 3.0, 4.0], requires_grad=False), wires=[1, 0])
+            ),
+            lambda: qml.probs(wires=[2, 0]),
+            lambda: qml.state(),
+        ],
+    )
+    def test_broadcasted_state(self, measurements, state_batched, fusion_max_wires):
+        """Test that a broadcasted circuit is executed once with a broadcasted state, and
+        that the results match those of the expanded circuits."""
+        x = np.array([0.1, 0.7, 1.3, -0.4])
+        state = np.eye(4)[[0, 3, 1, 2]] if state_batched else np.array([0.6, 0, 0, 0.8])
+        x, state = np.array(x, requires_grad=False), np.array(state, requires_grad=False)
+
+        def circuit(x):
+            self._broadcasted_circuit(x, state)
+            return measurements()
+
+        dev = qml.device("default.qubit", wires=3, fusion_max_wires=fusion_max_wires)
+        tape = qml.transforms.make_tape(circuit)(x)
+        tapes, _ = dev.batch_transform(tape)
+        res = dev.execute(tape)
+
+        expanded_tapes, fn = qml.transforms.broadcast_expand(tape)
+        expected = fn(qml.execute(expanded_tapes, qml.device("default.qubit", wires=3), None))
+
+        assert tapes == [tape]
+        assert dev.num_executions == 1
+        assert np.allclose(res, expected, atol=1e-10, rtol=0)
+
+    def test_broadcasted_state_backprop(self):
+        """Test that the gradient of a broadcasted circuit executed with a broadcasted
+        state matches the gradient of the expanded circuits."""
+        dev = qml.device("default.qubit", wires=3)
+        x = np.array([0.1, 0.7, 1.3, -0.4], requires_grad=True)
+
+        def circuit(x):
+            self._broadcasted_circuit(x, np.array([0.6, 0, 0, 0.8]))
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliX(2))
+
+        qnode = qml.QNode(circuit, dev, diff_method="backprop")
+        expanded = qml.transforms.broadcast_expand(qml.QNode(circuit, dev, diff_method="backprop"))
+
+        jac = qml.jacobian(lambda x: np.sum(qnode(x), axis=1))(x)
+        expected = qml.jacobian(lambda x: np.sum(expanded(x), axis=1))(x)
+
+        assert np.allclose(jac, expected, atol=1e-10, rtol=0)
+
+    @pytest.mark.parametrize("diff_method", ["parameter-shift", "finite-diff", "adjoint"])
+    def test_broadcasted_state_device_gradients(self, diff_method):
+        """Test that broadcasted circuits are expanded before the gradient is computed
+        with a gradient transform or the device, and that the Jacobian matches backpropagation."""
+        dev = qml.device("default.qubit", wires=2)
+        x = np.array([0.5, 0.2, 0.3], requires_grad=True)
+        y = np.array(0.4, requires_grad=True)
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.CRY(y, wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        qnode = qml.QNode(circuit, dev, diff_method=diff_method)
+        jac = qml.jacobian(qnode)(x, y)
+        expected = qml.jacobian(qml.QNode(circuit, dev, diff_method="backprop"))(x, y)
+
+        tol = 1e-6 if diff_method == "finite-diff" else 1e-10
+        assert all(np.allclose(j, e, atol=tol, rtol=0) for j, e in zip(jac, expected))
+
+    @pytest.mark.parametrize(
+        "measurements",
+        [
+            lambda: qml.expval(qml.Hamiltonian([0.3, 0.5], [qml.PauliZ(0), qml.PauliX(1)])),
+            lambda: qml.density_matrix(wires=[0]),
+            lambda: qml.sample(qml.PauliZ(0)),
+        ],
+    )
+    def test_expanded_measurements(self, measurements):
+        """Test that broadcasted circuits with measurements that are not broadcasted are
+        expanded into one circuit per batch element."""
+        dev = qml.device("default.qubit", wires=3, shots=None)
+        x = np.array([0.1, 0.7, 1.3])
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=0)
+            measurements()
+
+        tapes, _ = dev.batch_transform(tape)
+
+        assert len(tapes) == 3
+        assert all(t.batch_size is None for t in tapes)
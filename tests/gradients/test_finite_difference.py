@@ -465,6 +465,37 @@ class TestFiniteDiffIntegration:
         expected = np.array([[-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize(
+        "measurements",
+        [
+            lambda: qml.expval(qml.PauliZ(0) @ qml.PauliX(1)),
+            lambda: (qml.expval(qml.PauliZ(0)), qml.var(qml.PauliX(1))),
+            lambda: qml.probs(wires=[0, 1]),
+        ],
+    )
+    def test_broadcast(self, approx_order, strategy, measurements, tol):
+        """Tests that broadcasting the shifted points of each parameter
+        does not change the gradient"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            measurements()
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy)
+        expected = fn(dev.batch_execute(tapes))
+
+        tapes, fn = finite_diff(tape, approx_order=approx_order, strategy=strategy, broadcast=True)
+        assert [t.batch_size for t in tapes if t.batch_size is not None] == [approx_order] * 2
+
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == expected.shape
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
     def test_single_expectation_value_with_argnum_all(self, approx_order, strategy, tol):
         """Tests correct output shape and evaluation for a tape
         with a single expval output where all parameters are chosen to compute
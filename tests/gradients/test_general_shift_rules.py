@@ -433,6 +433,30 @@ class TestGenerateShiftedTapes:
         assert res[0].get_parameters(trainable_only=False) == [0.2 * 1.0 + 0.3, 2.0, 3.0, 4.0]
         assert res[1].get_parameters(trainable_only=False) == [0.5 * 1.0 + 0.6, 2.0, 3.0, 4.0]
 
+    def test_broadcast(self):
+        """Test that the function creates a single broadcasted tape if requested"""
+
+        with qml.tape.QuantumTape() as tape:
+            qml.PauliZ(0)
+            qml.RX(1.0, wires=0)
+            qml.CNOT(wires=[0, 2])
+            qml.Rot(2.0, 3.0, 4.0, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {0, 2}
+        shifts = [0.3, 0.6, -0.1]
+        multipliers = [0.2, 0.5, 1.0]
+        res = generate_shifted_tapes(tape, 1, shifts, multipliers, broadcast=True)
+
+        assert len(res) == 1
+        assert res[0].batch_size == 3
+        params = res[0].get_parameters(trainable_only=False)
+        assert params[:2] == [1.0, 2.0] and params[3] == 4.0
+        assert np.allclose(params[2], [0.2 * 3.0 + 0.3, 0.5 * 3.0 + 0.6, 3.0 - 0.1])
+        # the input tape is not modified
+        assert tape.get_parameters(trainable_only=False) == [1.0, 2.0, 3.0, 4.0]
+        assert tape.batch_size is None
+
 
 class TestGenerateMultishiftedTapes:
     """Tests for the generate_multishifted_tapes function"""
@@ -499,3 +523,30 @@ class TestGenerateMultishiftedTapes:
         assert len(res) == len(shifts)
         for new_tape, exp in zip(res, expected):
             assert new_tape.get_parameters(trainable_only=False) == exp
+
+    def test_broadcast(self):
+        """Test that the function creates a single broadcasted tape if requested"""
+
+        with qml.tape.QuantumTape() as tape:
+            qml.PauliZ(0)
+            qml.RX(1.0, wires=0)
+            qml.CNOT(wires=[0, 2])
+            qml.Rot(2.0, 3.0, 4.0, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {0, 2}
+        shifts = [[0.3, -0.6], [0.2, 0.6], [0.6, 0.0]]
+        multipliers = [[0.2, 0.5], [-0.3, 0], [1.0, 1]]
+        expected = [
+            [0.5 * 1.0 - 0.6, 0 * 1.0 + 0.6, 1 * 1.0 + 0.0],
+            2.0,
+            [0.2 * 3.0 + 0.3, -0.3 * 3.0 + 0.2, 1.0 * 3.0 + 0.6],
+            4.0,
+        ]
+
+        res = generate_multishifted_tapes(tape, [1, 0], shifts, multipliers, broadcast=True)
+
+        assert len(res) == 1
+        assert res[0].batch_size == len(shifts)
+        for par, exp in zip(res[0].get_parameters(trainable_only=False), expected):
+            assert np.allclose(par, exp)
@@ -0,0 +1,289 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the gradients.jvp module."""
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.gradients import param_shift
+
+
+class TestComputeJVP:
+    """Tests for the numeric computation of JVPs"""
+
+    def test_computation(self):
+        """Test that the correct JVP is returned"""
+        tangent = np.array([1.0, 2.0, 3.0])
+        jac = np.array([[[1.0, 0.1, 0.2], [0.2, 0.6, 0.1]], [[0.4, -0.7, 1.2], [-0.5, -0.6, 0.7]]])
+
+        jvp = qml.gradients.compute_jvp(tangent, jac)
+
+        assert jvp.shape == (4,)
+        assert np.allclose(jvp, np.tensordot(jac, tangent, axes=[[2], [0]]).flatten())
+
+    def test_jacobian_is_none(self):
+        """A None Jacobian returns a None JVP"""
+        tangent = np.array([1.0, 2.0])
+        jvp = qml.gradients.compute_jvp(tangent, None)
+        assert jvp is None
+
+    def test_zero_tangent(self):
+        """A zero tangent vector will return a zero vector"""
+        tangent = np.zeros([3])
+        jac = np.array([[1.0, 0.1, 0.2], [0.2, 0.6, 0.1]])
+
+        jvp = qml.gradients.compute_jvp(tangent, jac)
+        assert np.all(jvp == np.zeros([2]))
+
+
+class TestJVP:
+    """Tests for the jvp function"""
+
+    def test_no_trainable_parameters(self):
+        """A tape with no trainable parameters will simply return None"""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {}
+        tangent = np.array([])
+        tapes, fn = qml.gradients.jvp(tape, tangent, param_shift)
+
+        assert not tapes
+        assert fn(tapes) is None
+
+    def test_zero_tangent(self):
+        """A zero tangent vector will return no tapes and a zero vector"""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.RX(0.6, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.probs(wires=[0, 1])
+
+        tape.trainable_params = {0, 1}
+        tangent = np.array([0.0, 0.0])
+        tapes, fn = qml.gradients.jvp(tape, tangent, param_shift)
+
+        assert not tapes
+        assert np.all(fn(tapes) == np.zeros([4]))
+
+    def test_single_expectation_value(self, tol):
+        """Tests correct output shape and evaluation for a tape
+        with a single expval output"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tape.trainable_params = {0, 1}
+        tangent = np.array([1.0, 2.0])
+
+        tapes, fn = qml.gradients.jvp(tape, tangent, param_shift)
+        assert len(tapes) == 4
+
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (1,)
+
+        expected = -np.sin(y) * np.sin(x) + 2 * np.cos(y) * np.cos(x)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("gradient_fn", [param_shift, qml.gradients.finite_diff])
+    def test_only_tangent_parameters_shifted(self, gradient_fn, tol):
+        """Tests that only the parameters with non-zero tangent entries are shifted"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+        z = 0.123
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.RZ(z, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.probs(wires=[0, 1])
+
+        tape.trainable_params = {0, 1, 2}
+        tangent = np.array([0.0, 0.5, 0.0])
+
+        tapes, fn = qml.gradients.jvp(tape, tangent, gradient_fn)
+        all_tapes, jac_fn = gradient_fn(tape)
+        assert len(tapes) < len(all_tapes)
+
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (4,)
+
+        jac = jac_fn(dev.batch_execute(all_tapes))
+        expected = np.reshape(jac, [-1, 3]) @ tangent
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_prob_expectation_values(self, tol):
+        """Tests correct output shape and evaluation for a tape
+        with prob and expval outputs"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+            qml.probs(wires=[0, 1])
+
+        tape.trainable_params = {0, 1}
+        tangent = np.array([1.0, -1.0])
+
+        tapes, fn = qml.gradients.jvp(tape, tangent, param_shift)
+        assert len(tapes) == 4
+
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (5,)
+
+        dx = np.array(
+            [
+                -np.sin(x),
+                -np.cos(y / 2) ** 2 * np.sin(x) / 2,
+                -np.sin(y / 2) ** 2 * np.sin(x) / 2,
+                np.sin(y / 2) ** 2 * np.sin(x) / 2,
+                np.cos(y / 2) ** 2 * np.sin(x) / 2,
+            ]
+        )
+        dy = np.array(
+            [
+                0,
+                -np.cos(x / 2) ** 2 * np.sin(y) / 2,
+                np.cos(x / 2) ** 2 * np.sin(y) / 2,
+                np.sin(x / 2) ** 2 * np.sin(y) / 2,
+                -np.sin(x / 2) ** 2 * np.sin(y) / 2,
+            ]
+        )
+        assert np.allclose(res, dx - dy, atol=tol, rtol=0)
+
+    def test_autograd(self, tol):
+        """Tests that the output of the JVP transform
+        can be differentiated using autograd."""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        params = np.array([0.543, -0.654], requires_grad=True)
+
+        def cost_fn(x, tangent):
+            with qml.tape.QuantumTape() as tape:
+                qml.RX(x[0], wires=[0])
+                qml.RY(x[1], wires=[1])
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+            tape.trainable_params = {0, 1}
+            tapes, fn = qml.gradients.jvp(tape, tangent, param_shift)
+            return fn(dev.batch_execute(tapes))[0]
+
+        tangent = np.array([1.0, 0.0], requires_grad=False)
+        res = qml.grad(cost_fn)(params, tangent)
+
+        x, y = params
+        expected = np.array([-np.cos(x) * np.sin(y), -np.sin(x) * np.cos(y)])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
+class TestBatchJVP:
+    """Tests for the batch JVP function"""
+
+    def test_one_tape_no_trainable_parameters(self):
+        """A tape with no trainable parameters will simply return None"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(0.4, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RX(0.4, wires=0)
+            qml.RX(0.6, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+
+        tape1.trainable_params = {}
+        tape2.trainable_params = {0, 1}
+
+        tapes = [tape1, tape2]
+        tangents = [np.array([]), np.array([1.0, 1.0])]
+
+        v_tapes, fn = qml.gradients.batch_jvp(tapes, tangents, param_shift)
+        assert len(v_tapes) == 4
+
+        res = fn(dev.batch_execute(v_tapes))
+        assert res[0] is None
+        assert res[1] is not None
+
+    def test_reduction_append(self):
+        """Test the 'append' reduction strategy"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(0.4, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RX(0.4, wires=0)
+            qml.RX(0.6, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.probs(wires=[0, 1])
+
+        tape1.trainable_params = {0}
+        tape2.trainable_params = {0, 1}
+
+        tapes = [tape1, tape2]
+        tangents = [np.array([1.0]), np.array([0.0, 1.0])]
+
+        v_tapes, fn = qml.gradients.batch_jvp(tapes, tangents, param_shift, reduction="append")
+        assert len(v_tapes) == 4
+
+        res = fn(dev.batch_execute(v_tapes))
+        assert len(res) == 2
+        assert res[0].shape == (1,)
+        assert res[1].shape == (4,)
+
+    def test_reduction_extend(self):
+        """Test the 'extend' reduction strategy"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(0.4, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RX(0.4, wires=0)
+            qml.RX(0.6, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.probs(wires=[0, 1])
+
+        tape1.trainable_params = {0}
+        tape2.trainable_params = {0, 1}
+
+        tapes = [tape1, tape2]
+        tangents = [np.array([1.0]), np.array([1.0, 1.0])]
+
+        v_tapes, fn = qml.gradients.batch_jvp(tapes, tangents, param_shift, reduction="extend")
+        assert len(v_tapes) == 6
+
+        res = fn(dev.batch_execute(v_tapes))
+        assert len(res) == 5
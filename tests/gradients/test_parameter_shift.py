@@ -1097,6 +1097,134 @@ class TestParameterShiftRule:
         assert np.isclose(qml.jacobian(qnode)(par).item().val, qml.jacobian(reference_qnode)(par))
 
 
+class TestParamShiftBroadcast:
+    """Tests for the parameter-shift rule with broadcasted shifted tapes"""
+
+    @staticmethod
+    def _tape(measurements, x):
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x[0], wires=0)
+            qml.CRY(x[1], wires=[0, 1])
+            qml.Rot(x[2], x[0], x[1], wires=1)
+            qml.IsingXX(x[2], wires=[0, 1])
+            measurements()
+        return tape
+
+    @pytest.mark.parametrize(
+        "measurements",
+        [
+            lambda: qml.expval(qml.PauliZ(0)),
+            lambda: (qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1))),
+            lambda: (qml.expval(qml.PauliZ(0)), qml.var(qml.PauliX(1))),
+            lambda: qml.var(qml.Hermitian(np.diag([0.3, -1.2]), wires=1)),
+            lambda: qml.probs(wires=[0, 1]),
+        ],
+    )
+    def test_matches_unbroadcasted(self, measurements, tol):
+        """Test that broadcasting the shifts of each operation reduces the
+        number of tapes and does not change the gradient."""
+        dev = qml.device("default.qubit", wires=2)
+        tape = self._tape(measurements, np.array([0.4, -0.7, 1.1]))
+
+        tapes, fn = param_shift(tape)
+        expected = fn(dev.batch_execute(tapes))
+
+        broadcasted_tapes, fn = param_shift(tape, broadcast=True)
+        num_unshifted = len([t for t in broadcasted_tapes if t.batch_size is None])
+        assert len(broadcasted_tapes) < len(tapes)
+        assert num_unshifted <= 3
+        assert all(t.batch_size in (None, 2, 4) for t in broadcasted_tapes)
+
+        res = fn(dev.batch_execute(broadcasted_tapes))
+        assert res.shape == expected.shape
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_unsupported_operations_not_broadcasted(self, tol):
+        """Test that the shifts of operations that do not support broadcasting
+        are applied in separate tapes."""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.CRX(-0.2, wires=[0, 1]).inv()
+            qml.expval(qml.PauliZ(1))
+
+        tapes, fn = param_shift(tape, broadcast=True)
+        assert [t.batch_size for t in tapes] == [2, None, None, None, None]
+
+        res = fn(dev.batch_execute(tapes))
+        tapes, fn = param_shift(tape)
+        assert np.allclose(res, fn(dev.batch_execute(tapes)), atol=tol, rtol=0)
+
+    def test_broadcasted_tape_error(self):
+        """Test that an error is raised for tapes that are broadcasted already."""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(np.array([0.4, 0.1]), wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="tapes that are broadcasted already"):
+            param_shift(tape, broadcast=True)
+
+    def test_multiple_measurements_with_probs_error(self):
+        """Test that an error is raised for multiple measurements that are not all
+        expectation values or variances."""
+        tape = self._tape(
+            lambda: (qml.expval(qml.PauliZ(0)), qml.probs(wires=[1])), np.array([0.4, -0.7, 1.1])
+        )
+
+        with pytest.raises(ValueError, match="only supported for expectation values"):
+            param_shift(tape, broadcast=True)
+
+    def test_qnode_jacobian(self, tol):
+        """Test that the QNode Jacobian is computed with one execution per operation
+        if broadcast=True is passed as gradient keyword argument."""
+        dev = qml.device("default.qubit", wires=2)
+        x = np.array([0.4, -0.7, 1.1], requires_grad=True)
+
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.CRY(x[1], wires=[0, 1])
+            qml.RY(x[2], wires=1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        qnode = qml.QNode(circuit, dev, diff_method="parameter-shift", broadcast=True)
+        jac = qml.jacobian(qnode)(x)
+        expected = qml.jacobian(qml.QNode(circuit, dev, diff_method="backprop"))(x)
+        assert np.allclose(jac, expected, atol=tol, rtol=0)
+
+        dev._num_executions = 0
+        qml.jacobian(qnode)(x)
+        assert dev.num_executions == 4
+
+    def test_device_without_broadcasting(self, tol):
+        """Test that the broadcasted tapes are expanded on devices that do not
+        support broadcasting."""
+        dev = qml.device("default.mixed", wires=2)
+        x = np.array([0.4, -0.7, 1.1], requires_grad=True)
+
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.CRY(x[1], wires=[0, 1])
+            qml.RY(x[2], wires=1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tape = qml.tape.QuantumTape()
+        with tape:
+            circuit(x)
+
+        tapes, fn = param_shift(tape)
+        expected = fn(dev.batch_execute(tapes))
+
+        broadcasted_tapes, fn = param_shift(tape, broadcast=True)
+        assert any(t.batch_size is not None for t in broadcasted_tapes)
+        res = fn(qml.execute(broadcasted_tapes, dev, None))
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        qnode = qml.QNode(circuit, dev, diff_method="parameter-shift", broadcast=True)
+        expected = qml.jacobian(qml.QNode(circuit, dev, diff_method="parameter-shift"))(x)
+        assert np.allclose(qml.jacobian(qnode)(x), expected, atol=tol, rtol=0)
+
+
 class TestParamShiftGradients:
     """Test that the transform is differentiable"""
 
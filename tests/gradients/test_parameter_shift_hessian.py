@@ -1018,6 +1018,59 @@ class TestParameterShiftHessian:
 
         assert all(t == q == e for t, q, e in zip(transform, qnode, expected))
 
+    @pytest.mark.parametrize(
+        "measurements",
+        [
+            lambda: qml.expval(qml.PauliZ(0) @ qml.PauliZ(1)),
+            lambda: [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliX(1))],
+            lambda: qml.probs(wires=[0, 1]),
+        ],
+    )
+    def test_broadcast(self, measurements):
+        """Test that broadcasting the shifts of each Hessian entry reduces the number
+        of tapes and does not change the Hessian."""
+        dev = qml.device("default.qubit", wires=2)
+        x = np.array([0.5, 0.2, -0.4], requires_grad=True)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x[0], wires=0)
+            qml.CRY(x[1], wires=[0, 1])
+            qml.Rot(x[2], x[0], x[1], wires=1)
+            measurements()
+
+        tapes, fn = qml.gradients.param_shift_hessian(tape)
+        expected = fn(dev.batch_execute(tapes))
+
+        broadcasted_tapes, fn = qml.gradients.param_shift_hessian(tape, broadcast=True)
+        hessian = fn(dev.batch_execute(broadcasted_tapes))
+
+        assert np.allclose(hessian, expected)
+        # at most one tape per Hessian entry and one for the unshifted circuit
+        num_params = len(tape.trainable_params)
+        assert len(broadcasted_tapes) <= num_params * (num_params + 1) // 2 + 1
+        assert len(broadcasted_tapes) < len(tapes)
+
+    def test_broadcast_device_without_broadcasting(self):
+        """Test that the broadcasted Hessian tapes are expanded on devices that do not
+        support broadcasting."""
+        dev = qml.device("default.mixed", wires=2)
+        x = np.array([0.5, 0.2, -0.4], requires_grad=True)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x[0], wires=0)
+            qml.CRY(x[1], wires=[0, 1])
+            qml.Rot(x[2], x[0], x[1], wires=1)
+            qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        tapes, fn = qml.gradients.param_shift_hessian(tape)
+        expected = fn(dev.batch_execute(tapes))
+
+        broadcasted_tapes, fn = qml.gradients.param_shift_hessian(tape, broadcast=True)
+        assert any(t.batch_size is not None for t in broadcasted_tapes)
+        hessian = fn(qml.execute(broadcasted_tapes, dev, None))
+
+        assert np.allclose(hessian, expected)
+
 
 class TestParamShiftHessianWithKwargs:
     """Test the parameter-shift Hessian computation when manually
@@ -16,7 +16,14 @@ Unit tests for heuristic Pauli graph colouring functions in ``grouping/graph_col
 """
 import pytest
 import numpy as np
-from pennylane.grouping.graph_colouring import largest_first, recursive_largest_first
+import scipy
+from pennylane.grouping.graph_colouring import (
+    dsatur,
+    largest_first,
+    recursive_largest_first,
+    sorted_insertion,
+)
+from pennylane.grouping.utils import complement_adj_matrix
 
 
 class TestGraphcolouringFunctions:
@@ -72,9 +79,13 @@ class TestGraphcolouringFunctions:
         dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
         lf_colouring = largest_first(dummy_terms, adjacency_matrix)
         rlf_colouring = recursive_largest_first(dummy_terms, adjacency_matrix)
+        dsatur_colouring = dsatur(dummy_terms, adjacency_matrix)
+        si_colouring = sorted_insertion(dummy_terms, adjacency_matrix)
 
         assert self.verify_graph_colour_solution(adjacency_matrix, lf_colouring)
         assert self.verify_graph_colour_solution(adjacency_matrix, rlf_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, dsatur_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, si_colouring)
 
     term_counts = list(range(10))
 
@@ -87,6 +98,50 @@ class TestGraphcolouringFunctions:
         dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
         lf_colouring = largest_first(dummy_terms, adjacency_matrix)
         rlf_colouring = recursive_largest_first(dummy_terms, adjacency_matrix)
+        dsatur_colouring = dsatur(dummy_terms, adjacency_matrix)
+        si_colouring = sorted_insertion(dummy_terms, adjacency_matrix)
 
         assert self.verify_graph_colour_solution(adjacency_matrix, lf_colouring)
         assert self.verify_graph_colour_solution(adjacency_matrix, rlf_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, dsatur_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, si_colouring)
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("colourer", [dsatur, sorted_insertion])
+    def test_colouring_from_binary_observables(self, grouping_type, colourer):
+        """Tests that the colourers evaluating the adjacency from the binary representation agree
+        with the colourings of the dense and sparse adjacency matrices."""
+        rng = np.random.default_rng(42)
+        n_terms, n_qubits = 60, 70
+        paulis = rng.integers(1, 4, size=(n_terms, n_qubits)) * (
+            rng.random((n_terms, n_qubits)) < 0.1
+        )
+        binary_observables = np.hstack([paulis % 2, paulis // 2]).astype(float)
+
+        adj = complement_adj_matrix(binary_observables, grouping_type)
+        colouring = colourer(binary_observables, grouping_type=grouping_type)
+
+        vertices = {row.tobytes(): i for i, row in enumerate(binary_observables)}
+        dummy_colouring = {
+            colour: [[vertices[row.tobytes()]] for row in grouping]
+            for colour, grouping in colouring.items()
+        }
+        assert self.verify_graph_colour_solution(adj, dummy_colouring)
+
+        for matrix in [adj, scipy.sparse.csr_matrix(adj)]:
+            expected = colourer(binary_observables, matrix)
+            assert len(colouring) == len(expected)
+            for grouping, expected_grouping in zip(colouring.values(), expected.values()):
+                assert np.array_equal(grouping, expected_grouping)
+
+    def test_sorted_insertion_order(self):
+        """Tests that Sorted Insertion inserts the vertices by decreasing magnitude of the
+        coefficients."""
+        adjacency_matrix = np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0]])
+        dummy_terms = np.reshape(list(range(3)), (3, 1))
+
+        colouring = sorted_insertion(dummy_terms, adjacency_matrix)
+        assert {c: [t[0] for t in g] for c, g in colouring.items()} == {1: [0, 2], 2: [1]}
+
+        colouring = sorted_insertion(dummy_terms, adjacency_matrix, coefficients=[0.1, -0.5, 0.2])
+        assert {c: [t[0] for t in g] for c, g in colouring.items()} == {1: [1], 2: [2, 0]}
@@ -308,6 +308,49 @@ class TestGroupObservables:
 
         assert grouping_instance._wire_map == wire_map
 
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("method", ["lf", "rlf", "dsatur", "si"])
+    def test_coefficients_match_observables(self, grouping_type, method):
+        """Tests that the grouped coefficients correspond to the grouped observables for all
+        graph colouring methods, including duplicate observables."""
+        obs = [
+            PauliX(0) @ PauliZ(1),
+            PauliZ(0),
+            PauliY(1),
+            PauliX(0) @ PauliZ(1),
+            PauliX(0) @ PauliY(2),
+            PauliZ(1) @ PauliZ(2),
+        ]
+        coeffs = [0.1, -0.2, 0.3, 0.4, -0.5, 0.6]
+
+        obs_groups, coeff_groups = group_observables(obs, coeffs, grouping_type, method)
+
+        grouped = [
+            (pauli, c) for group in zip(obs_groups, coeff_groups) for pauli, c in zip(*group)
+        ]
+        assert sorted(c for _, c in grouped) == sorted(coeffs)
+        for pauli, c in grouped:
+            assert any(
+                c == coeff and are_identical_pauli_words(pauli, o) for o, coeff in zip(obs, coeffs)
+            )
+
+        strategy = PauliGroupingStrategy(obs, grouping_type, method, coefficients=coeffs)
+        strategy.colour_pauli_graph()
+        assert sorted(i for g in strategy.grouping_indices for i in g) == list(range(len(obs)))
+        assert [[coeffs[i] for i in g] for g in strategy.grouping_indices] == coeff_groups
+
+    def test_sorted_insertion_grouping(self):
+        """Tests that the Sorted Insertion method groups the observables by decreasing magnitude
+        of the coefficients."""
+        obs = [PauliX(0), PauliX(1), PauliZ(0), PauliZ(1)]
+        coeffs = [0.1, 0.2, -0.3, 0.4]
+
+        obs_groups, coeff_groups = group_observables(obs, coeffs, "qwc", "si")
+
+        assert coeff_groups == [[0.4, -0.3], [0.2, 0.1]]
+        assert are_identical_pauli_words(obs_groups[0][0], PauliZ(1))
+        assert are_identical_pauli_words(obs_groups[1][1], PauliX(0))
+
     def test_return_list_coefficients(self):
         """Tests that if the coefficients are given as a list, the groups
         are likewise lists."""
@@ -14,6 +14,8 @@
 """
 Unit tests for the :mod:`grouping` utility functions in ``grouping/utils.py``.
 """
+import itertools
+
 import pytest
 import numpy as np
 import pennylane as qml
@@ -32,6 +34,7 @@ from pennylane.grouping.utils import (
     is_qwc,
     observables_to_binary_matrix,
     qwc_complement_adj_matrix,
+    complement_adj_matrix,
 )
 
 
@@ -307,6 +310,47 @@ class TestGroupingUtils:
         with pytest.raises(ValueError, match="Expected a binary array, instead got"):
             qwc_complement_adj_matrix(not_binary_observables)
 
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("chunk_size", [None, 1, 7])
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_complement_adj_matrix(self, grouping_type, chunk_size, sparse):
+        """Tests that the ``complement_adj_matrix`` function agrees with the pairwise
+        commutation relations of the Pauli words."""
+        wire_map = {i: i for i in range(10)}
+        rng = np.random.default_rng(42)
+        observables = [
+            string_to_pauli_word("".join(rng.choice(list("IXYZ"), size=10)), wire_map=wire_map)
+            for _ in range(20)
+        ]
+        binary_observables = observables_to_binary_matrix(observables, wire_map=wire_map)
+
+        expected = np.zeros((20, 20))
+        for i, j in itertools.product(range(20), repeat=2):
+            if grouping_type == "qwc":
+                expected[i, j] = not is_qwc(binary_observables[i], binary_observables[j])
+            else:
+                commute = is_commuting(observables[i], observables[j], wire_map=wire_map)
+                expected[i, j] = not commute if grouping_type == "commuting" else commute and i != j
+
+        adj = complement_adj_matrix(
+            binary_observables, grouping_type=grouping_type, chunk_size=chunk_size, sparse=sparse
+        )
+        if sparse:
+            adj = adj.toarray()
+
+        assert np.all(adj == expected)
+
+    def test_complement_adj_matrix_exceptions(self):
+        """Tests that the ``complement_adj_matrix`` function raises an exception for an unknown
+        grouping type or a non-positive chunk size."""
+        binary_observables = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        with pytest.raises(ValueError, match="Grouping type must be one of"):
+            complement_adj_matrix(binary_observables, grouping_type="commutative")
+
+        with pytest.raises(ValueError, match="The chunk size must be a positive integer"):
+            complement_adj_matrix(binary_observables, chunk_size=0)
+
     @pytest.mark.parametrize(
         "pauli_word,wire_map,expected_string",
         [
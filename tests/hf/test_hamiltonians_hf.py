@@ -21,7 +21,6 @@ from pennylane import Identity, PauliX, PauliY, PauliZ
 from pennylane import numpy as np
 from pennylane.hf.hamiltonian import (
     _generate_qubit_operator,
-    _pauli_mult,
     _return_pauli,
     simplify,
     generate_electron_integrals,
@@ -303,23 +302,6 @@ def test_generate_qubit_operator(f_operator, q_operator):
     assert result == q_operator
 
 
-@pytest.mark.parametrize(
-    ("p1", "p2", "p_ref"),
-    [
-        (
-            [(0, "X"), (1, "Y")],  # X_0 @ Y_1
-            [(0, "X"), (2, "Y")],  # X_0 @ Y_2
-            ([(2, "Y"), (1, "Y")], 1.0),  # X_0 @ Y_1 @ X_0 @ Y_2
-        ),
-    ],
-)
-def test_pauli_mult(p1, p2, p_ref):
-    r"""Test that _generate_qubit_operator returns the correct operator."""
-    result = _pauli_mult(p1, p2)
-
-    assert result == p_ref
-
-
 @pytest.mark.parametrize(
     ("symbol", "operator"),
     [
@@ -454,6 +454,26 @@ def test_repulsion_tensor_nodiff(symbols, geometry, e_ref):
     assert np.allclose(e, e_ref)
 
 
+@pytest.mark.parametrize(
+    ("symbols", "geometry"),
+    [
+        (
+            ["H", "H", "H"],
+            np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.3]], requires_grad=False),
+        )
+    ],
+)
+def test_repulsion_tensor_packed(symbols, geometry):
+    r"""Test that the packed repulsion tensor contains the elements of the full tensor."""
+    mol = Molecule(symbols, geometry, charge=1)
+    e = generate_repulsion_tensor(mol.basis_set)()
+    e_packed = generate_repulsion_tensor(mol.basis_set, packed=True)()
+
+    pairs = [(i, j) for i in range(3) for j in range(i + 1)]
+    assert e_packed.shape == (6, 6)
+    assert np.allclose(e_packed, [[e[i, j, k, l] for k, l in pairs] for i, j in pairs])
+
+
 @pytest.mark.parametrize(
     ("symbols", "geometry", "alpha", "c_ref"),
     [
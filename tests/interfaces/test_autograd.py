@@ -143,10 +143,10 @@ class TestAutogradExecuteUnitTests:
         spy.assert_called()
 
     def test_backward_mode(self, mocker):
-        """Test that backward mode uses the `device.batch_execute` and `device.gradients` pathway"""
+        """Test that backward mode uses the `device.execute_and_vjp` pathway"""
         dev = qml.device("default.qubit", wires=1)
-        spy_execute = mocker.spy(qml.devices.DefaultQubit, "batch_execute")
-        spy_gradients = mocker.spy(qml.devices.DefaultQubit, "gradients")
+        spy_execute = mocker.spy(qml.devices.DefaultQubit, "execute_and_vjp")
+        spy_vjp = mocker.spy(qml.devices.DefaultQubit, "adjoint_vjp")
 
         def cost(a):
             with qml.tape.QuantumTape() as tape:
@@ -167,10 +167,13 @@ class TestAutogradExecuteUnitTests:
 
         assert dev.num_executions == 1
         spy_execute.assert_called()
-        spy_gradients.assert_not_called()
+        spy_vjp.assert_not_called()
 
         qml.jacobian(cost)(a)
-        spy_gradients.assert_called()
+        spy_vjp.assert_called()
+
+        # the gradient computation only executes the forward pass once more
+        assert dev.num_executions == 2
 
 
 class TestBatchTransformExecution:
@@ -342,8 +345,8 @@ class TestCaching:
         assert expected_runs_ideal < expected_runs
 
     def test_caching_adjoint_backward(self):
-        """Test that caching reduces the number of adjoint evaluations
-        when mode=backward"""
+        """Test that a single adjoint evaluation is required when
+        mode=backward, with and without caching"""
         dev = qml.device("default.qubit", wires=2)
         params = np.array([0.1, 0.2, 0.3])
 
@@ -364,18 +367,16 @@ class TestCaching:
                 gradient_kwargs={"method": "adjoint_jacobian"},
             )[0]
 
-        # Without caching, 3 evaluations are required.
-        # 1 for the forward pass, and one per output dimension
-        # on the backward pass.
+        # A single evaluation is required, since the backward pass
+        # for each output dimension reuses the final state of the
+        # forward pass.
         qml.jacobian(cost)(params, cache=None)
-        assert dev.num_executions == 3
+        assert dev.num_executions == 1
 
-        # With caching, only 2 evaluations are required. One
-        # for the forward pass, and one for the backward pass.
         dev._num_executions = 0
         jac_fn = qml.jacobian(cost)
         grad1 = jac_fn(params, cache=True)
-        assert dev.num_executions == 2
+        assert dev.num_executions == 1
 
 
 execute_kwargs = [
@@ -0,0 +1,299 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the persistent execution cache"""
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.gradients import param_shift
+from pennylane.interfaces import PersistentCache, execute
+
+
+def _tape(x, y=0.2, shots_wire=0):
+    with qml.tape.QuantumTape() as tape:
+        qml.RX(x, wires=0)
+        qml.CNOT(wires=[0, 1])
+        qml.RY(y, wires=1)
+        qml.expval(qml.PauliZ(shots_wire))
+
+    return tape
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.db"))
+    yield cache
+    cache.close()
+
+
+class TestPersistentCacheMapping:
+    """Tests for the mapping interface of the persistent cache"""
+
+    def test_set_and_get(self, cache):
+        """Test that results can be stored and retrieved"""
+        cache["a"] = np.array([0.1, 0.2])
+        cache["b"] = {"00": 5, "11": 3}
+
+        assert "a" in cache
+        assert np.allclose(cache["a"], [0.1, 0.2])
+        assert cache["b"] == {"00": 5, "11": 3}
+        assert len(cache) == 2
+        assert set(cache) == {"a", "b"}
+
+    def test_missing_key(self, cache):
+        """Test that a KeyError is raised for missing keys"""
+        with pytest.raises(KeyError):
+            cache["a"]  # pylint: disable=pointless-statement
+
+        with pytest.raises(KeyError):
+            del cache["a"]
+
+    def test_delete_and_clear(self, cache):
+        """Test that entries can be deleted and the cache cleared"""
+        cache["a"] = np.array(1.0)
+        cache["b"] = np.array(2.0)
+
+        del cache["a"]
+        assert "a" not in cache
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.currsize == 0
+
+    def test_hits_and_misses(self, cache):
+        """Test that the cache counts hits and misses"""
+        cache["a"] = np.array(1.0)
+        cache["b"] = np.array(2.0)
+
+        assert "a" in cache
+        assert "c" not in cache
+        _ = cache["a"]
+
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    def test_persisted_across_instances(self, cache):
+        """Test that stored results are available to other cache instances"""
+        cache["a"] = np.array([1.0, 2.0])
+
+        other_cache = PersistentCache(cache.path)
+        assert np.allclose(other_cache["a"], [1.0, 2.0])
+        other_cache.close()
+
+    def test_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted once the
+        total size of the results exceeds the maximum size"""
+        value = np.zeros(100)
+        cache = PersistentCache(str(tmp_path / "cache.db"), maxsize=3.5 * len(pickle.dumps(value)))
+
+        cache["a"] = value
+        cache["b"] = value
+        cache["c"] = value
+
+        # access 'a', such that 'b' is the least recently used entry
+        _ = cache["a"]
+        cache["d"] = value
+
+        assert set(cache) == {"a", "c", "d"}
+        assert cache.currsize <= cache.maxsize
+        cache.close()
+
+    def test_result_larger_than_maxsize(self, tmp_path):
+        """Test that results larger than the maximum size are not stored"""
+        cache = PersistentCache(str(tmp_path / "cache.db"), maxsize=10)
+        cache["a"] = np.zeros(100)
+
+        assert len(cache) == 0
+        assert cache.misses == 0
+        cache.close()
+
+
+class TestTapeKey:
+    """Tests for the keys the persistent cache assigns to tapes"""
+
+    def test_identical_tapes(self, cache):
+        """Test that identical tapes have the same key"""
+        assert cache.tape_key(_tape(0.1)) == cache.tape_key(_tape(0.1))
+
+    def test_different_tapes(self, cache):
+        """Test that tapes that differ in their parameters or measurements have different keys"""
+        keys = {
+            cache.tape_key(_tape(0.1)),
+            cache.tape_key(_tape(0.2)),
+            cache.tape_key(_tape(0.1, y=0.3)),
+            cache.tape_key(_tape(0.1, shots_wire=1)),
+        }
+        assert len(keys) == 4
+
+    def test_trainable_params(self, cache):
+        """Test that the trainable parameters are part of the key"""
+        tape = _tape(0.1)
+        key = cache.tape_key(tape)
+
+        tape.trainable_params = [1]
+        assert cache.tape_key(tape) != key
+
+    def test_bound_to_device(self, cache):
+        """Test that the key depends on the device configuration the cache is bound to"""
+        tape = _tape(0.1)
+        dev = qml.device("default.qubit", wires=2)
+
+        keys = {
+            cache.tape_key(tape),
+            cache.bind(dev).tape_key(tape),
+            cache.bind(dev, shots=100).tape_key(tape),
+            cache.bind(dev, label="gradients").tape_key(tape),
+            cache.bind(qml.device("default.qubit", wires=3)).tape_key(tape),
+            cache.bind(qml.device("default.mixed", wires=2)).tape_key(tape),
+        }
+        assert len(keys) == 6
+        assert cache.bind(dev).tape_key(tape) == cache.bind(dev, shots=None).tape_key(tape)
+
+    def test_bound_cache_shares_storage(self, cache):
+        """Test that a bound cache shares its storage and counters with the original cache"""
+        bound_cache = cache.bind(qml.device("default.qubit", wires=2))
+        bound_cache["a"] = np.array(1.0)
+
+        assert "a" in cache
+        assert np.allclose(bound_cache["a"], 1.0)
+        assert cache.hits == 1
+
+    def test_key_independent_of_process(self, cache):
+        """Test that the key of a tape is identical in a different Python process"""
+        code = (
+            "import pennylane as qml\n"
+            "from pennylane.interfaces import PersistentCache\n"
+            "with qml.tape.QuantumTape() as tape:\n"
+            "    qml.RX(0.1, wires=0)\n"
+            "    qml.CNOT(wires=[0, 1])\n"
+            "    qml.RY(0.2, wires=1)\n"
+            "    qml.expval(qml.PauliZ(0))\n"
+            f"cache = PersistentCache({cache.path!r})\n"
+            "dev = qml.device('default.qubit', wires=2)\n"
+            "print(cache.bind(dev).tape_key(tape))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        dev = qml.device("default.qubit", wires=2)
+        assert out.strip() == cache.bind(dev).tape_key(_tape(0.1))
+
+
+class TestPersistentCacheExecution:
+    """Tests for executing tapes with a persistent cache"""
+
+    def test_execute_reuses_results(self, cache):
+        """Test that results stored by one execution are reused by a later execution"""
+        dev = qml.device("default.qubit", wires=2)
+        tapes = [_tape(0.1), _tape(0.2)]
+
+        res = execute(tapes, dev, gradient_fn=None, cache=cache)
+        assert dev.num_executions == 2
+        assert len(cache) == 2
+
+        res_cached = execute([_tape(0.1), _tape(0.2)], dev, gradient_fn=None, cache=cache)
+        assert dev.num_executions == 2
+        assert cache.hits == 2
+        assert np.allclose(res, res_cached)
+
+    def test_device_configuration(self, cache):
+        """Test that results are not shared between different device configurations"""
+        dev = qml.device("default.qubit", wires=2)
+        execute([_tape(0.1)], dev, gradient_fn=None, cache=cache)
+
+        dev_shots = qml.device("default.qubit", wires=2, shots=10)
+        execute([_tape(0.1)], dev_shots, gradient_fn=None, cache=cache)
+
+        assert dev_shots.num_executions == 1
+        assert len(cache) == 2
+
+    def test_param_shift_gradient(self, cache, tol):
+        """Test that the shifted tapes of a parameter-shift gradient are cached"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def cost(x):
+            return execute([_tape(x[0], x[1])], dev, gradient_fn=param_shift, cache=cache)[0]
+
+        x = np.array([0.1, 0.2], requires_grad=True)
+        grad = qml.jacobian(cost)(x)
+        num_executions = dev.num_executions
+
+        grad_cached = qml.jacobian(cost)(x)
+
+        assert dev.num_executions == num_executions
+        assert np.allclose(grad, grad_cached, atol=tol, rtol=0)
+
+    def test_device_gradients(self, cache, tol):
+        """Test that device gradients computed on the backward pass are stored
+        separately from the results"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def cost(x):
+            return execute(
+                [_tape(x[0], x[1])],
+                dev,
+                gradient_fn="device",
+                gradient_kwargs={"method": "adjoint_jacobian"},
+                mode="backward",
+                cache=cache,
+            )[0]
+
+        x = np.array([0.1, 0.2], requires_grad=True)
+        grad = qml.jacobian(cost)(x)
+        grad_cached = qml.jacobian(cost)(x)
+
+        expected = [-np.sin(x[0]), 0]
+        assert np.allclose(grad, expected, atol=tol, rtol=0)
+        assert np.allclose(grad_cached, expected, atol=tol, rtol=0)
+        assert cache.hits == 1
+
+    def test_backprop_results_not_stored(self, cache, tol):
+        """Test that results computed via backpropagation are not stored"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, cache=cache, diff_method="backprop")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        x = np.array(0.3, requires_grad=True)
+        grad = qml.grad(circuit)(x)
+
+        assert np.isclose(grad, -np.sin(x), atol=tol, rtol=0)
+        assert len(cache) == 0
+        assert cache.misses == 0
+
+    def test_qnode(self, cache):
+        """Test that a QNode can use a persistent cache"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, cache=cache, diff_method="parameter-shift")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        x = np.array(0.3, requires_grad=True)
+        res = circuit(x)
+        res_cached = circuit(x)
+
+        assert dev.num_executions == 1
+        assert np.isclose(res, res_cached)
+        assert circuit._tape_cached
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -65,7 +65,10 @@ class TestJaxExecuteUnitTests:
 
     def test_incorrect_mode(self, interface):
         """Test that an error is raised if an gradient transform
-        is used with mode=forward"""
+        is used with mode=forward when jitting"""
+        if interface == "jax-python":
+            pytest.skip("Gradient transforms support mode=forward without jitting")
+
         a = jnp.array([0.1, 0.2])
 
         dev = qml.device("default.qubit", wires=1)
@@ -141,10 +144,10 @@ class TestJaxExecuteUnitTests:
         spy.assert_called()
 
     def test_backward_mode(self, interface, mocker):
-        """Test that backward mode uses the `device.batch_execute` and `device.gradients` pathway"""
+        """Test that backward mode uses the `device.execute_and_vjp` pathway"""
         dev = qml.device("default.qubit", wires=1)
-        spy_execute = mocker.spy(qml.devices.DefaultQubit, "batch_execute")
-        spy_gradients = mocker.spy(qml.devices.DefaultQubit, "gradients")
+        spy_execute = mocker.spy(qml.devices.DefaultQubit, "execute_and_vjp")
+        spy_vjp = mocker.spy(qml.devices.DefaultQubit, "adjoint_vjp")
 
         def cost(a):
             with qml.tape.QuantumTape() as tape:
@@ -166,10 +169,13 @@ class TestJaxExecuteUnitTests:
 
         assert dev.num_executions == 1
         spy_execute.assert_called()
-        spy_gradients.assert_not_called()
+        spy_vjp.assert_not_called()
 
         jax.grad(cost)(a)
-        spy_gradients.assert_called()
+        spy_vjp.assert_called()
+
+        # the gradient computation only executes the forward pass once more
+        assert dev.num_executions == 2
 
     def test_max_diff_error(self, interface):
         """Test that an error is being raised if max_diff > 1 for the JAX
@@ -197,6 +203,72 @@ class TestJaxExecuteUnitTests:
             )
 
 
+def _probs_tape(a):
+    """Returns a tape with three parameters and a probability output"""
+    with qml.tape.QuantumTape() as tape:
+        qml.RY(a[0], wires=0)
+        qml.RX(a[1], wires=0)
+        qml.RY(a[2], wires=1)
+        qml.CNOT(wires=[0, 1])
+        qml.probs(wires=[0, 1])
+
+    return tape
+
+
+class TestJaxForwardMode:
+    """Tests for forward-mode differentiation of gradient transforms using
+    Jacobian-vector products"""
+
+    @pytest.mark.parametrize("gradient_fn", [param_shift, qml.gradients.finite_diff])
+    def test_jvp(self, gradient_fn, tol):
+        """Test that jax.jvp returns the correct Jacobian-vector product"""
+        dev = qml.device("default.qubit", wires=2)
+        a = jnp.array([0.1, 0.2, 0.3])
+        tangent = jnp.array([0.5, -1.0, 2.0])
+
+        def cost(a, mode):
+            return execute(
+                [_probs_tape(a)], dev, gradient_fn=gradient_fn, mode=mode, interface="jax-python"
+            )[0][0]
+
+        res, jvp = jax.jvp(lambda x: cost(x, "forward"), (a,), (tangent,))
+        jac = jax.jacobian(lambda x: cost(x, "backward"))(a)
+
+        assert np.allclose(res, cost(a, "backward"), atol=tol, rtol=0)
+        assert jvp.shape == res.shape
+        assert np.allclose(jvp, jac @ tangent, atol=tol, rtol=0)
+
+    def test_only_tangent_parameters_shifted(self):
+        """Test that only the parameters with non-zero tangent entries are shifted"""
+        dev = qml.device("default.qubit", wires=2)
+        a = jnp.array([0.1, 0.2, 0.3])
+        tangent = jnp.array([0.0, 1.0, 0.0])
+
+        def cost(a):
+            return execute(
+                [_probs_tape(a)], dev, gradient_fn=param_shift, mode="forward", interface="jax"
+            )[0][0]
+
+        jax.jvp(cost, (a,), (tangent,))
+
+        # one forward execution, and one shifted pair for the tangent direction
+        assert dev.num_executions == 3
+
+    def test_jacfwd(self, tol):
+        """Test that jax.jacfwd can be used with gradient transforms"""
+        dev = qml.device("default.qubit", wires=2)
+        a = jnp.array([0.1, 0.2, 0.3])
+
+        def cost(a, mode):
+            return execute(
+                [_probs_tape(a)], dev, gradient_fn=param_shift, mode=mode, interface="jax-python"
+            )[0][0]
+
+        res = jax.jacfwd(lambda x: cost(x, "forward"))(a)
+        expected = jax.jacobian(lambda x: cost(x, "backward"))(a)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
 @pytest.mark.parametrize("interface", ["jax-jit", "jax-python"])
 class TestCaching:
     """Test for caching behaviour"""
@@ -348,18 +420,15 @@ class TestCaching:
                 gradient_kwargs={"method": "adjoint_jacobian"},
             )[0][0]
 
-        # Without caching, 2 evaluations are required.
-        # 1 for the forward pass, and one per output dimension
-        # on the backward pass.
+        # A single evaluation is required, since the backward
+        # pass reuses the final state of the forward pass.
         jax.grad(cost)(params, cache=None)
-        assert dev.num_executions == 2
+        assert dev.num_executions == 1
 
-        # With caching, also 2 evaluations are required. One
-        # for the forward pass, and one for the backward pass.
         dev._num_executions = 0
         jac_fn = jax.grad(cost)
         grad1 = jac_fn(params, cache=True)
-        assert dev.num_executions == 2
+        assert dev.num_executions == 1
 
 
 execute_kwargs = [
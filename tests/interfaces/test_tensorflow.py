@@ -99,10 +99,10 @@ class TestTensorFlowExecuteUnitTests:
         spy.assert_called()
 
     def test_backward_mode(self, mocker):
-        """Test that backward mode uses the `device.batch_execute` and `device.gradients` pathway"""
+        """Test that backward mode uses the `device.execute_and_vjp` pathway"""
         dev = qml.device("default.qubit", wires=1)
-        spy_execute = mocker.spy(qml.devices.DefaultQubit, "batch_execute")
-        spy_gradients = mocker.spy(qml.devices.DefaultQubit, "gradients")
+        spy_execute = mocker.spy(qml.devices.DefaultQubit, "execute_and_vjp")
+        spy_vjp = mocker.spy(qml.devices.DefaultQubit, "adjoint_vjp")
         a = tf.Variable([0.1, 0.2])
 
         with tf.GradientTape() as t:
@@ -122,10 +122,11 @@ class TestTensorFlowExecuteUnitTests:
 
         assert dev.num_executions == 1
         spy_execute.assert_called()
-        spy_gradients.assert_not_called()
+        spy_vjp.assert_not_called()
 
         j = t.jacobian(res, a)
-        spy_gradients.assert_called()
+        spy_vjp.assert_called()
+        assert dev.num_executions == 1
 
 
 class TestCaching:
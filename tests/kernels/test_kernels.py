@@ -90,6 +90,125 @@ class TestKernelMatrix:
         assert np.allclose(K1, K1_expected)
         assert np.allclose(K2, K2_expected)
 
+    @staticmethod
+    def _circuits(num_wires=2):
+        """Returns a kernel QNode and a QNode returning the embedded state."""
+        dev = qml.device("default.qubit", wires=num_wires)
+
+        @qml.qnode(dev)
+        def kernel(x1, x2):
+            qml.templates.AngleEmbedding(x1, wires=dev.wires)
+            qml.adjoint(qml.templates.AngleEmbedding)(x2, wires=dev.wires)
+            return qml.expval(qml.Projector([0] * num_wires, wires=dev.wires))
+
+        @qml.qnode(dev)
+        def embedding(x):
+            qml.templates.AngleEmbedding(x, wires=dev.wires)
+            return qml.state()
+
+        return kernel, embedding
+
+    @pytest.mark.parametrize("batch_size", [1, 4, 100])
+    def test_batched_kernel(self, batch_size, mocker):
+        """Test that evaluating a QNode kernel in batches gives the same kernel matrices,
+        while executing the circuits of each batch together."""
+        kernel, _ = self._circuits()
+        X1 = np.random.random((5, 2))
+        X2 = np.random.random((3, 2))
+
+        K1_expected = kern.square_kernel_matrix(X1, kernel, assume_normalized_kernel=True)
+        K2_expected = kern.kernel_matrix(X1, X2, kernel)
+
+        spy = mocker.spy(qml, "execute")
+        K1 = kern.square_kernel_matrix(
+            X1, kernel, assume_normalized_kernel=True, batch_size=batch_size
+        )
+        K2 = kern.kernel_matrix(X1, X2, kernel, batch_size=batch_size)
+
+        assert np.allclose(K1, K1_expected)
+        assert np.allclose(K2, K2_expected)
+        assert spy.call_count == math.ceil(10 / batch_size) + math.ceil(15 / batch_size)
+
+    def test_batched_kernel_postprocessing(self):
+        """Test that a QNode kernel with post-processing of its output can be evaluated in
+        batches."""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x1, x2):
+            qml.templates.AngleEmbedding(x1, wires=dev.wires)
+            qml.adjoint(qml.templates.AngleEmbedding)(x2, wires=dev.wires)
+            return qml.probs(wires=dev.wires)
+
+        X1 = np.random.random((3, 2))
+        X2 = np.random.random((2, 2))
+        kernel = lambda x1, x2: circuit(x1, x2)[0]
+        postprocessing = lambda probs: probs[0]
+
+        K1 = kern.square_kernel_matrix(X1, circuit, batch_size=2, postprocessing=postprocessing)
+        K2 = kern.kernel_matrix(X1, X2, circuit, batch_size=2, postprocessing=postprocessing)
+
+        assert np.allclose(K1, kern.square_kernel_matrix(X1, kernel))
+        assert np.allclose(K2, kern.kernel_matrix(X1, X2, kernel))
+        assert np.allclose(K2, kern.kernel_matrix(X1, X2, circuit, postprocessing=postprocessing))
+
+    def test_batched_kernel_not_qnode(self):
+        """Test that an error is raised if a kernel that is not a QNode is evaluated in batches."""
+        with pytest.raises(ValueError, match="can only be evaluated in batches if they are QNodes"):
+            kern.kernel_matrix([0.1], [0.2], _laplace_kernel, batch_size=2)
+
+    def test_batched_kernel_invalid_batch_size(self):
+        """Test that an error is raised if the batch size is not positive."""
+        kernel, _ = self._circuits()
+
+        with pytest.raises(ValueError, match="batch size must be a positive integer"):
+            kern.kernel_matrix(np.zeros((1, 2)), np.zeros((1, 2)), kernel, batch_size=0)
+
+    @pytest.mark.parametrize("tile_size", [None, 1, 2, 10])
+    @pytest.mark.parametrize("batch_size", [None, 3])
+    def test_overlap_kernel_matrix(self, tile_size, batch_size):
+        """Test that the kernel matrix computed from the overlaps of the embedded states
+        equals the one of the kernel circuit."""
+        kernel, embedding = self._circuits()
+        X1 = np.random.random((5, 2))
+        X2 = np.random.random((3, 2))
+
+        K1 = kern.overlap_kernel_matrix(
+            X1, None, embedding, tile_size=tile_size, batch_size=batch_size
+        )
+        K2 = kern.overlap_kernel_matrix(
+            X1, X2, embedding, tile_size=tile_size, batch_size=batch_size
+        )
+
+        assert K1.shape == (5, 5)
+        assert K2.shape == (5, 3)
+        assert np.allclose(K1, kern.square_kernel_matrix(X1, kernel))
+        assert np.allclose(K2, kern.kernel_matrix(X1, X2, kernel))
+
+    def test_overlap_kernel_matrix_states_computed_once(self):
+        """Test that each state is computed only once if the kernel matrix is not tiled."""
+        history = []
+
+        def state_fn(x):
+            history.append(x)
+            return np.array([np.cos(x), np.sin(x)])
+
+        X = [0.1, 0.4, 0.2]
+        K = kern.overlap_kernel_matrix(X, None, state_fn)
+
+        assert history == X
+        assert np.allclose(K, np.cos(np.subtract.outer(X, X)) ** 2)
+
+    def test_overlap_kernel_matrix_gradient(self):
+        """Test that the overlap kernel matrix can be differentiated with respect to the data."""
+        kernel, embedding = self._circuits()
+        X = pnp.array(np.random.random((3, 2)), requires_grad=True)
+
+        grad = qml.grad(lambda X: pnp.sum(kern.overlap_kernel_matrix(X, None, embedding)))(X)
+        expected = qml.grad(lambda X: pnp.sum(kern.square_kernel_matrix(X, kernel)))(X)
+
+        assert np.allclose(grad, expected)
+
 
 class TestKernelPolarity:
     """Tests kernel methods to compute polarity."""
@@ -121,6 +121,7 @@ separately_tested_ops = [
     "DiagonalQubitUnitary",
     "PauliRot",
     "MultiRZ",
+    "QubitStateVector",
 ]
 
 
@@ -292,6 +293,16 @@ class TestSupportsBroadcasting:
         assert qml.math.allclose(mat1, single_mats)
         assert qml.math.allclose(mat2, single_mats)
 
+    def test_qubit_state_vector(self):
+        """Test that QubitStateVector, which is marked as supporting parameter broadcasting,
+        actually does support broadcasting."""
+        state = np.eye(8)[[0, 3, 6]]
+
+        op = qml.QubitStateVector(state, wires=[0, "4", 1])
+
+        assert op.batch_size == 3
+        assert qml.QubitStateVector(state[0], wires=[0, "4", 1]).batch_size is None
+
     @pytest.mark.parametrize(
         "pauli_word, wires", [("XYZ", [0, "4", 1]), ("II", [1, 5]), ("X", [7])]
     )
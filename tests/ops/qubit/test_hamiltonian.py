@@ -1374,6 +1374,20 @@ class TestGrouping:
         H3.compute_grouping(method="lf")
         assert H3.grouping_indices == [[2, 1], [0]]
 
+    @pytest.mark.parametrize("method,indices", [("dsatur", [[0, 1], [2]]), ("si", [[2, 1], [0]])])
+    def test_grouping_scalable_methods(self, method, indices):
+        """Tests the DSATUR and Sorted Insertion grouping methods, the latter of which
+        inserts the observables by decreasing magnitude of the coefficients."""
+        obs = [qml.PauliX(0), qml.PauliX(1), qml.PauliZ(0)]
+        coeffs = [1.0, -2.0, 3.0]
+
+        H = qml.Hamiltonian(coeffs, obs, grouping_type="qwc", method=method)
+        assert H.grouping_indices == indices
+
+        H = qml.Hamiltonian(coeffs, obs)
+        H.compute_grouping(method=method)
+        assert H.grouping_indices == indices
+
 
 class TestHamiltonianEvaluation:
     """Test the usage of a Hamiltonian as an observable"""
@@ -1856,3 +1870,26 @@ class TestHamiltonianDifferentiation:
             match="Adjoint differentiation method does not support Hamiltonian observables",
         ):
             grad_fn(coeffs, param)
+
+    def test_adjoint_differentiation(self, tol):
+        """Test that the adjoint differentiation method computes the gradient of a
+        Hamiltonian expectation value with respect to the circuit parameters."""
+        dev = qml.device("default.qubit", wires=2)
+
+        coeffs = pnp.array([-0.05, 0.17], requires_grad=False)
+        param = pnp.array(1.7, requires_grad=True)
+
+        def circuit(coeffs, param):
+            qml.RX(param, wires=0)
+            qml.RY(param, wires=0)
+            return qml.expval(
+                qml.Hamiltonian(
+                    coeffs,
+                    [qml.PauliX(0), qml.PauliZ(0)],
+                )
+            )
+
+        grad = qml.grad(qml.QNode(circuit, dev, diff_method="adjoint"))(coeffs, param)
+        expected = qml.grad(qml.QNode(circuit, dev, diff_method="parameter-shift"))(coeffs, param)
+
+        assert np.allclose(grad, expected, atol=tol, rtol=0)
@@ -0,0 +1,111 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the low-rank factorization of the two-electron integrals and the factorized
+molecular Hamiltonian.
+"""
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane import qchem
+
+symbols = ["H", "H", "H", "H"]
+geometry = np.array(
+    [[0.0, 0.0, 0.0], [0.0, 0.0, 1.5], [0.0, 1.5, 0.0], [0.0, 1.5, 1.5]], requires_grad=False
+)
+
+
+@pytest.mark.parametrize(("tol_factor", "tol_eigval"), [(1e-12, 1e-12), (1e-5, 1e-5)])
+def test_factorize(tol_factor, tol_eigval):
+    r"""Test that factorize returns factors that reconstruct the two-electron tensor within the
+    threshold and eigendecompositions that reconstruct the factors."""
+    mol = qchem.Molecule(symbols, geometry)
+    _, _, two = qchem.electron_integrals(mol)()
+    two = np.swapaxes(two, 1, 3)
+
+    factors, eigvals, eigvecs = qchem.factorize(two, tol_factor, tol_eigval)
+
+    assert factors.shape[1:] == (4, 4)
+    assert np.allclose(factors, np.swapaxes(factors, 1, 2))
+    assert np.allclose(np.einsum("rij,rkl->ijkl", factors, factors), two, atol=10 * tol_factor)
+
+    for factor, vals, vecs in zip(factors, eigvals, eigvecs):
+        assert np.allclose((vecs * vals) @ vecs.T, factor, atol=10 * tol_eigval)
+
+
+def test_factorize_rank():
+    r"""Test that factorize discards the negligible factors and sorts them by decreasing norm."""
+    mol = qchem.Molecule(
+        ["H", "H"], np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]], requires_grad=False)
+    )
+    _, _, two = qchem.electron_integrals(mol)()
+
+    factors, _, _ = qchem.factorize(np.swapaxes(two, 1, 3))
+    norms = np.linalg.norm(factors, axis=(1, 2))
+
+    assert len(factors) == 3
+    assert np.all(norms[:-1] >= norms[1:])
+
+
+def test_factorize_shape_error():
+    r"""Test that factorize raises an error if the two-electron tensor has an invalid shape."""
+    with pytest.raises(ValueError, match="must have a"):
+        qchem.factorize(np.ones((2, 2, 2, 3)))
+
+
+def test_factorized_hamiltonian():
+    r"""Test that the Pauli-word representation of a factorized Hamiltonian has the spectrum of
+    the molecular Hamiltonian."""
+    mol = qchem.Molecule(symbols, geometry)
+    h_ref = qchem.diff_hamiltonian(mol)()
+
+    h = qchem.factorized_hamiltonian(mol, tol_factor=1e-12, tol_eigval=1e-12)()
+
+    assert isinstance(h, qchem.FactorizedHamiltonian)
+    assert h.wires.tolist() == list(range(8))
+
+    eig = np.linalg.eigvalsh(h.matrix())
+    eig_ref = np.linalg.eigvalsh(qml.matrix(h_ref, wire_order=range(8)))
+
+    assert np.allclose(eig, eig_ref)
+
+
+def test_factorized_hamiltonian_wires():
+    r"""Test that the Pauli words of a factorized Hamiltonian act on its custom wires."""
+    mol = qchem.Molecule(
+        ["H", "H"], np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]], requires_grad=False)
+    )
+    h = qchem.factorized_hamiltonian(mol)()
+    wires = ["a", "b", "c", "d"]
+
+    h_wires = qchem.FactorizedHamiltonian(*h.data, wires=wires).hamiltonian()
+
+    assert set(h_wires.wires) == set(wires)
+    assert np.allclose(
+        qml.matrix(h_wires, wire_order=wires), qml.matrix(h.hamiltonian(), wire_order=range(4))
+    )
+
+
+@pytest.mark.parametrize(
+    ("one", "factors", "wires", "msg"),
+    [
+        (np.ones((2, 2)), np.ones((3, 3, 3)), None, "same number of orbitals"),
+        (np.ones((2, 2)), np.ones((3, 2, 2)), [0, 1, 2], "acts on 4 wires"),
+    ],
+)
+def test_factorized_hamiltonian_error(one, factors, wires, msg):
+    r"""Test that FactorizedHamiltonian raises an error for inconsistent arguments."""
+    with pytest.raises(ValueError, match=msg):
+        qchem.FactorizedHamiltonian(0.0, one, factors, wires=wires)
@@ -105,6 +105,64 @@ def test_electron_integrals(symbols, geometry, core, active, e_core, one_ref, tw
     assert np.allclose(two, two_ref)
 
 
+def test_electron_integrals_screening():
+    r"""Test that the integrals computed from the screened repulsion tensor match the integrals
+    computed without screening, up to the phases of the molecular orbitals."""
+    geometry = np.array([[0.0, 0.0, 2.5 * i] for i in range(4)], requires_grad=False)
+    mol = qchem.Molecule(["H", "Li", "H", "H"], geometry, charge=1)
+
+    e, one, two = qchem.electron_integrals(mol)()
+    e_screened, one_screened, two_screened = qchem.electron_integrals(
+        mol, screening_threshold=1e-10
+    )()
+
+    assert np.allclose(e, e_screened)
+    assert np.allclose(np.linalg.eigvalsh(one), np.linalg.eigvalsh(one_screened), atol=1e-8)
+    assert np.allclose(np.linalg.norm(two), np.linalg.norm(two_screened), atol=1e-8)
+
+
+def test_electron_integrals_screening_gradient():
+    r"""Test that the gradient of the integrals computed from the screened repulsion tensor
+    matches the gradient of the integrals computed without screening."""
+    geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]], requires_grad=False)
+    alpha = np.array([[3.42525091, 0.62391373, 0.1688554]] * 2, requires_grad=True)
+    mol = qchem.Molecule(["H", "H"], geometry, alpha=alpha)
+
+    def cost(alpha, screening_threshold):
+        _, one, two = qchem.electron_integrals(mol, screening_threshold=screening_threshold)(alpha)
+        return np.sum(one**2) + np.sum(two**2)
+
+    g = autograd.grad(cost)(alpha, 0.0)
+    g_screened = autograd.grad(cost)(alpha, 1e-12)
+
+    assert np.allclose(g_screened, g)
+
+
+@pytest.mark.parametrize(
+    ("core", "active"), [([0], [1, 2, 3]), ([0, 1], [3, 5]), ([], [1, 2]), ([2], [0, 4])]
+)
+def test_electron_integrals_active_space(core, active):
+    r"""Test that the integrals of an active space, computed from the core and active molecular
+    orbitals only, are the corresponding elements of the integrals of all orbitals, with the
+    contributions of the core orbitals."""
+    geometry = np.array([[0.0, 0.0, 1.5 * i] for i in range(4)], requires_grad=False)
+    mol = qchem.Molecule(["H"] * 4, geometry, basis_name="6-31g")
+
+    e, one, two = qchem.electron_integrals(mol)()
+    e_active, one_active, two_active = qchem.electron_integrals(mol, core=core, active=active)()
+
+    e_ref = e + sum(2 * one[i, i] for i in core)
+    e_ref = e_ref + sum(2 * two[i, j, j, i] - two[i, j, i, j] for i in core for j in core)
+    one_ref = [
+        [one[p, q] + sum(2 * two[i, p, q, i] - two[i, p, i, q] for i in core) for q in active]
+        for p in active
+    ]
+
+    assert np.allclose(e_active, e_ref)
+    assert np.allclose(one_active, one_ref)
+    assert np.allclose(two_active, two[np.ix_(active, active, active, active)])
+
+
 @pytest.mark.parametrize(
     ("symbols", "geometry", "alpha", "coeffs_h_ref", "ops_h_ref"),
     [
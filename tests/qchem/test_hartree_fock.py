@@ -58,6 +58,92 @@ def test_scf(symbols, geometry, v_fock, coeffs, fock_matrix, h_core, repulsion_t
     assert np.allclose(e, repulsion_tensor)
 
 
+def test_scf_diis_level_shift():
+    r"""Test that the DIIS extrapolation and the level shift converge to the same solution as the
+    plain iterations, and that DIIS requires fewer iterations."""
+    geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 3.0]], requires_grad=False)
+    mol = qchem.Molecule(["Li", "H"], geometry)
+
+    v_ref, _, f_ref, _, _ = qchem.scf(mol)()
+    n_plain = mol.scf_diagnostics["n_iterations"]
+
+    for kwargs in [{"diis_size": 8}, {"diis_size": 8, "level_shift": 0.5}]:
+        v, _, f, _, _ = qchem.scf(mol, **kwargs)()
+
+        assert mol.scf_diagnostics["converged"]
+        assert np.allclose(v, v_ref)
+        assert np.allclose(f, f_ref)
+
+    qchem.scf(mol, diis_size=8)()
+    diagnostics = mol.scf_diagnostics
+
+    assert diagnostics["n_iterations"] < n_plain
+    assert len(diagnostics["density_change"]) == diagnostics["n_iterations"]
+    assert len(diagnostics["diis_error"]) == diagnostics["n_iterations"]
+    assert diagnostics["density_change"][-1] <= 1e-8
+
+
+def test_scf_guess():
+    r"""Test that the iterations started from the converged density matrix of a nearby geometry
+    converge to the same solution in fewer iterations."""
+    mol = qchem.Molecule(
+        ["Li", "H"], np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 3.0]], requires_grad=False)
+    )
+    qchem.scf(mol)()
+    guess = qchem.mol_density_matrix(mol.n_electrons, mol.mo_coefficients)
+
+    mol = qchem.Molecule(
+        ["Li", "H"], np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 3.05]], requires_grad=False)
+    )
+    v_ref, _, f_ref, _, _ = qchem.scf(mol)()
+    n_ref = mol.scf_diagnostics["n_iterations"]
+
+    v, _, f, _, _ = qchem.scf(mol, guess=guess)()
+
+    assert np.allclose(v, v_ref)
+    assert np.allclose(f, f_ref)
+    assert mol.scf_diagnostics["n_iterations"] < n_ref
+
+
+def test_scf_not_converged():
+    r"""Test that the diagnostics report calculations which are not converged."""
+    geometry = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 0.0], [1.0, 0.0, 0.0]], requires_grad=False)
+    mol = qchem.Molecule(["H", "H", "H"], geometry, charge=1)
+    qchem.scf(mol, n_steps=2)()
+
+    assert not mol.scf_diagnostics["converged"]
+    assert mol.scf_diagnostics["n_iterations"] == 2
+
+
+def test_integral_cache():
+    r"""Test that the integrals are reused for repeated calculations with the same parameters, and
+    not cached when the parameters are differentiated."""
+    geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]], requires_grad=False)
+    alpha = np.array([[3.42525091, 0.62391373, 0.1688554]] * 2, requires_grad=True)
+    mol = qchem.Molecule(["H", "H"], geometry, alpha=alpha)
+
+    autograd.grad(lambda a: qchem.hf_energy(mol)(a)[0])(alpha)
+    assert not mol.integral_cache
+
+    _, _, _, h_core, rep_tensor = qchem.scf(mol)(alpha)
+    assert len(mol.integral_cache) == 1
+
+    _, _, _, h_core_cached, rep_tensor_cached = qchem.scf(mol)(alpha)
+    assert h_core_cached is h_core
+    assert rep_tensor_cached is rep_tensor
+
+    _, _, _, h_core_new, _ = qchem.scf(mol)(alpha * 1.1)
+    assert h_core_new is not h_core
+    assert len(mol.integral_cache) == 1
+    assert not np.allclose(h_core_new, h_core)
+
+    # differentiated calls neither read nor update the cache
+    cache = dict(mol.integral_cache)
+    grad = autograd.grad(lambda a: qchem.hf_energy(mol)(a)[0])(alpha * 1.1)
+    assert mol.integral_cache == cache
+    assert np.any(grad != 0)
+
+
 @pytest.mark.parametrize(
     ("symbols", "geometry", "charge", "basis_name", "e_ref"),
     [
@@ -133,6 +133,22 @@ class TestAuxiliary:
         f = qchem.integrals._boys(n, t)
         assert np.allclose(f, f_ref)
 
+    @pytest.mark.parametrize("n", [0, 1, 4, 12])
+    def test_boys_table(self, n):
+        r"""Test that the tabulated Boys function agrees with the incomplete Gamma function."""
+        t = np.array([0.0, 1e-8, 0.024, 0.5, 3.14159, 17.3, 49.99, 50.01, 120.0])
+        f_ref = qchem.integrals._boys_gamma(n, t)
+
+        assert np.allclose(qchem.integrals._boys(n, t), f_ref, rtol=1e-12, atol=0)
+
+    def test_boys_gradient(self):
+        r"""Test that the derivative of the Boys function is computed from the Boys function of
+        the next order."""
+        t = np.array(1.3, requires_grad=True)
+        grad = autograd.grad(lambda t: qchem.integrals._boys(2, t))(t)
+
+        assert np.allclose(grad, -qchem.integrals._boys(3, 1.3))
+
     @pytest.mark.parametrize(
         ("t", "u", "v", "n", "p", "dr", "h_ref"),
         [
@@ -150,6 +166,18 @@ class TestAuxiliary:
         h = qchem.integrals._hermite_coulomb(t, u, v, n, p, dr)
         assert np.allclose(h, h_ref)
 
+    def test_hermite_coulomb_memo(self):
+        r"""Test that the memoized Hermite integrals computed from a single table are correct."""
+        p, dr = 1.25, np.array([0.3, -0.4, 0.5])
+        hermite = qchem.integrals._hermite_coulomb_memo(p, dr, 6)
+
+        assert np.allclose(hermite(2, 1, 3, 0), -1.0722141590831973)
+        assert np.allclose(hermite(1, 2, 1, 0), -0.14447687797709316)
+        assert np.allclose(
+            qchem.integrals._hermite_coulomb(0, 4, 2, 0, 6.85050183, np.array([1.0, 0.0, -2.0])),
+            0.25076047141144375,
+        )
+
 
 class TestOverlap:
     """Tests for overlap integrals"""
@@ -572,6 +572,105 @@ class TestRepulsionMat:
         e = qchem.repulsion_tensor(mol.basis_set)()
         assert np.allclose(e, e_ref)
 
+    @pytest.mark.parametrize("n", [1, 2, 3, 5])
+    def test_repulsion_indices(self, n):
+        r"""Test that the canonical quartets of the repulsion tensor are unique under the 8-fold
+        permutational symmetry and that the index maps cover the full and packed tensors."""
+        quartets, index_map, packed_map = qchem.matrices._repulsion_indices(n)
+        n_pairs = n * (n + 1) // 2
+
+        assert len(quartets) == n_pairs * (n_pairs + 1) // 2
+        assert index_map.shape == (n, n, n, n)
+        assert packed_map.shape == (n_pairs, n_pairs)
+
+        for idx, (i, j, k, l) in enumerate(quartets):
+            for perm in [(i, j, k, l), (j, i, k, l), (i, j, l, k), (k, l, i, j), (l, k, j, i)]:
+                assert index_map[perm] == idx
+
+    @pytest.mark.parametrize(
+        ("symbols", "geometry"),
+        [
+            (
+                ["H", "H", "H"],
+                np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.3]], requires_grad=False),
+            )
+        ],
+    )
+    def test_repulsion_tensor_packed(self, symbols, geometry):
+        r"""Test that the packed repulsion tensor contains the elements of the full tensor."""
+        mol = qchem.Molecule(symbols, geometry, charge=1)
+        e = qchem.repulsion_tensor(mol.basis_set)()
+        e_packed = qchem.repulsion_tensor(mol.basis_set, packed=True)()
+
+        pairs = [(i, j) for i in range(3) for j in range(i + 1)]
+        assert e_packed.shape == (6, 6)
+        assert np.allclose(e_packed, [[e[i, j, k, l] for k, l in pairs] for i, j in pairs])
+
+    @pytest.mark.parametrize(
+        ("symbols", "geometry", "alpha"),
+        [
+            (
+                ["H", "H"],
+                np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]], requires_grad=False),
+                np.array(
+                    [[3.42525091, 0.62391373, 0.1688554], [3.42525091, 0.62391373, 0.1688554]],
+                    requires_grad=True,
+                ),
+            )
+        ],
+    )
+    def test_gradient_repulsion_tensor(self, symbols, geometry, alpha):
+        r"""Test that the gradient of the repulsion tensor is the sum of the gradients of its
+        elements computed from the individual repulsion integrals."""
+        mol = qchem.Molecule(symbols, geometry, alpha=alpha)
+        basis = mol.basis_set
+        g = autograd.grad(lambda a: qchem.repulsion_tensor(basis)(a).sum())(alpha)
+
+        g_ref = np.zeros_like(alpha)
+        for i, j, k, l in np.ndindex(2, 2, 2, 2):
+            integral = qchem.repulsion_integral(basis[i], basis[j], basis[k], basis[l])
+            g_ijkl = autograd.grad(lambda a: integral(a[[i, j, k, l]]))(alpha)
+            g_ref = g_ref + g_ijkl
+
+        assert np.allclose(g, g_ref)
+
+    @pytest.mark.parametrize("threshold", [1e-6, 1e-10])
+    def test_repulsion_tensor_screening(self, threshold):
+        r"""Test that the screened repulsion tensor only differs from the full tensor by
+        integrals smaller than the threshold, and that the screened integrals are zero."""
+        geometry = np.array([[0.0, 0.0, 3.0 * i] for i in range(6)], requires_grad=False)
+        mol = qchem.Molecule(["H"] * 6, geometry)
+
+        e = qchem.repulsion_tensor(mol.basis_set)()
+        e_screened = qchem.repulsion_tensor(mol.basis_set, screening_threshold=threshold)()
+        quartets, values = qchem.repulsion_tensor(
+            mol.basis_set, screening_threshold=threshold, sparse=True
+        )()
+
+        assert np.allclose(e_screened, e, atol=threshold, rtol=0)
+        assert np.count_nonzero(e_screened) < np.count_nonzero(e)
+        assert len(quartets) < len(qchem.matrices._repulsion_indices(6)[0])
+        assert np.allclose(values, [e[tuple(q)] for q in quartets])
+
+        screened = np.ones(e.shape, dtype=bool)
+        for i, j, k, l in quartets:
+            for perm in [(i, j, k, l), (j, i, k, l), (i, j, l, k), (k, l, i, j), (l, k, j, i)]:
+                screened[perm] = screened[perm[::-1]] = False
+        assert np.all(e_screened[screened] == 0.0)
+
+    def test_repulsion_tensor_screening_gradient(self):
+        r"""Test that the screened repulsion tensor is differentiable."""
+        geometry = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]], requires_grad=False)
+        alpha = np.array([[3.42525091, 0.62391373, 0.1688554]] * 2, requires_grad=True)
+        basis = qchem.Molecule(["H", "H"], geometry, alpha=alpha).basis_set
+
+        g = autograd.grad(lambda a: qchem.repulsion_tensor(basis)(a).sum())(alpha)
+        g_screened = autograd.grad(
+            lambda a: qchem.repulsion_tensor(basis, screening_threshold=1e-10)(a).sum()
+        )(alpha)
+
+        assert np.allclose(g_screened, g)
+
 
 class TestCoreMat:
     """Tests for core matrix"""
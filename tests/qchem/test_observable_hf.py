@@ -194,6 +194,21 @@ def test_fermionic_observable(core_constant, integral_one, integral_two, f_ref):
     assert f[1] == f_ref[1]  # fermionic operators
 
 
+def test_fermionic_observable_sparse():
+    r"""Test that fermionic_observable returns the same observable for two-particle integrals
+    given by the indices and values of their non-zero elements."""
+    one = np.array([[-1.25, 0.1], [0.1, -0.47]])
+    two = np.zeros((2, 2, 2, 2))
+    two[0, 0, 0, 0], two[0, 1, 1, 0], two[1, 0, 1, 0], two[1, 1, 1, 1] = 0.68, 0.66, 1e-14, 0.71
+    indices = np.argwhere(two != 0)
+
+    f = qchem.fermionic_observable(np.array([0.7]), one, two)
+    f_sparse = qchem.fermionic_observable(np.array([0.7]), one, (indices, two[two != 0]))
+
+    assert np.allclose(f_sparse[0], f[0])
+    assert f_sparse[1] == f[1]
+
+
 @pytest.mark.parametrize(
     ("f_observable", "q_observable"),
     [
@@ -319,20 +334,45 @@ def test_jordan_wigner_zero_output(f_obs, q_obs):
 
 
 @pytest.mark.parametrize(
-    ("p1", "p2", "p_ref"),
+    ("x", "z", "word"),
     [
-        (
-            [(0, "X"), (1, "Y")],  # X_0 @ Y_1
-            [(0, "X"), (2, "Y")],  # X_0 @ Y_2
-            ([(2, "Y"), (1, "Y")], 1.0),  # X_0 @ Y_1 @ X_0 @ Y_2
-        ),
+        (0, 0, qml.Identity(0)),
+        (0, 4, qml.PauliZ(2)),
+        (3, 6, qml.PauliX(0) @ qml.PauliY(1) @ qml.PauliZ(2)),
     ],
 )
-def test_pauli_mult(p1, p2, p_ref):
-    r"""Test that _pauli_mult returns the correct operator."""
-    result = qchem.observable_hf._pauli_mult(p1, p2)
+def test_pauli_word(x, z, word):
+    r"""Test that _pauli_word returns the Pauli word encoded by the bitmasks."""
+    result = qchem.observable_hf._pauli_word(x, z)
+
+    assert qml.Hamiltonian([1.0], [result]).compare(qml.Hamiltonian([1.0], [word]))
+
+
+def test_qubit_observable_gradient():
+    r"""Test that the coefficients of the qubit observable are differentiable with respect to the
+    coefficients of the fermionic observable."""
+    ops = [[0, 0], [1, 0], [0, 1], [1, 1]]
+    # derivatives of the coefficients of I, Z_0, Y_0 X_1, X_0 X_1, Y_0 Y_1, X_0 Y_1 and Z_1
+    jac_ref = np.array(
+        [
+            [0.5, 0.0, 0.0, 0.5],
+            [-0.5, 0.0, 0.0, 0.0],
+            [0.0, 0.25j, -0.25j, 0.0],
+            [0.0, 0.25, 0.25, 0.0],
+            [0.0, 0.25, 0.25, 0.0],
+            [0.0, -0.25j, 0.25j, 0.0],
+            [0.0, 0.0, 0.0, -0.5],
+        ]
+    )
+
+    def coeffs(c):
+        h = qchem.qubit_observable((c, ops))
+        return np.stack([np.real(h.coeffs), np.imag(h.coeffs)])
+
+    c = np.array([1.0, 0.5, 0.3, 2.0], requires_grad=True)
+    jac = qml.jacobian(coeffs)(c)
 
-    assert result == p_ref
+    assert np.allclose(jac[0] + 1j * jac[1], jac_ref)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,112 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for computing Hartree-Fock energies and nuclear gradients along geometry scans.
+"""
+import autograd
+import pytest
+
+from pennylane import numpy as np
+from pennylane import qchem
+from pennylane.qchem.scan import _nuclear_repulsion
+
+
+@pytest.mark.parametrize(
+    ("symbols", "geometries"),
+    [
+        (
+            ["H", "H"],
+            [np.array([[0.0, 0.0, 0.0], [0.0, 0.0, d]]) for d in [1.2, 1.4, 1.6]],
+        ),
+        (
+            ["H", "H", "H"],
+            [
+                np.array([[0.0, 1.0, 0.1], [0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]),
+                np.array([[0.0, 1.1, 0.1], [0.0, 0.0, 0.0], [1.1, 0.0, -0.1]]),
+            ],
+        ),
+    ],
+)
+def test_hf_scan_energy(symbols, geometries):
+    r"""Test that hf_scan returns the Hartree-Fock energies of all geometries."""
+    charge = len(symbols) % 2
+    mol = qchem.Molecule(symbols, geometries[0], charge=charge)
+
+    energies, gradients = qchem.hf_scan(mol, geometries)
+
+    e_ref = [
+        qchem.hf_energy(qchem.Molecule(symbols, np.array(g, requires_grad=False), charge=charge))()
+        for g in geometries
+    ]
+
+    assert np.allclose(energies, np.squeeze(e_ref))
+    assert gradients.shape == (len(geometries), len(symbols), 3)
+
+
+@pytest.mark.parametrize(
+    ("symbols", "geometry", "g_ref"),
+    [
+        (
+            ["H", "H"],
+            np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]]),
+            # HF gradient computed with pyscf using rnuc_grad_method().kernel()
+            np.array([[0.0, 0.0, 0.3650435], [0.0, 0.0, -0.3650435]]),
+        ),
+        (
+            ["H", "Li"],
+            np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 2.0]]),
+            # HF gradient computed with pyscf using rnuc_grad_method().kernel()
+            np.array([[0.0, 0.0, 0.21034957], [0.0, 0.0, -0.21034957]]),
+        ),
+    ],
+)
+def test_hf_scan_gradient(symbols, geometry, g_ref):
+    r"""Test that hf_scan returns the correct nuclear gradients."""
+    mol = qchem.Molecule(symbols, geometry)
+    _, gradients = qchem.hf_scan(mol, [geometry])
+
+    assert np.allclose(gradients[0], g_ref)
+
+
+def test_hf_scan_gradient_finite_difference():
+    r"""Test that the nuclear gradients returned by hf_scan match the finite-difference derivatives
+    of the Hartree-Fock energy for a geometry without symmetry."""
+    geometry = np.array([[0.0, 1.0, 0.1], [0.0, 0.0, 0.0], [1.0, -0.2, 0.0]])
+    mol = qchem.Molecule(["H", "H", "H"], geometry, charge=1)
+    delta = 1e-4
+
+    _, gradients = qchem.hf_scan(mol, [geometry], tol=1e-12)
+
+    shifts = [delta * np.eye(geometry.size)[i].reshape(geometry.shape) for i in range(9)]
+    energies, _ = qchem.hf_scan(
+        mol, [geometry + s for s in shifts] + [geometry - s for s in shifts], tol=1e-12
+    )
+    g_ref = (energies[:9] - energies[9:]) / (2 * delta)
+
+    assert np.allclose(gradients[0], g_ref.reshape(geometry.shape), atol=1e-6)
+    assert np.allclose(gradients[0].sum(axis=0), 0.0)
+
+
+def test_nuclear_repulsion():
+    r"""Test that the nuclear-repulsion energy and gradient match nuclear_energy."""
+    charges = [8, 1, 1]
+    geometry = np.array([[0.0, 0.0, 0.2], [0.0, 1.4, -0.9], [0.1, -1.4, -0.9]], requires_grad=True)
+
+    e, g = _nuclear_repulsion(charges, np.array(geometry))
+
+    e_ref = qchem.nuclear_energy(charges, geometry)(geometry)
+    g_ref = autograd.grad(lambda r: qchem.nuclear_energy(charges, geometry)(r)[0])(geometry)
+
+    assert np.allclose(e, e_ref)
+    assert np.allclose(g, g_ref)
@@ -15,14 +15,20 @@
 Unit tests for functions needed for qubit tapering.
 """
 import functools
+import itertools
 
 import pytest
 import scipy
 
 import pennylane as qml
 from pennylane import numpy as np
+from pennylane.bitmasks import pauli_word_masks
+from pennylane.qchem.observable_hf import _pauli_word
 from pennylane.qchem.tapering import (
     _binary_matrix,
+    _cached_clifford_masks,
+    _clifford_conjugate,
+    _clifford_masks,
     _kernel,
     _observable_mult,
     _reduced_row_echelon,
@@ -196,6 +202,27 @@ def test_reduced_row_echelon(binary_matrix, result):
     assert (rref_bin_mat == result).all()
 
 
+@pytest.mark.parametrize("shape", [(12, 20), (40, 18), (5, 70)])
+def test_reduced_row_echelon_packed(shape):
+    r"""Test that _reduced_row_echelon returns the reduced row echelon form of matrices whose rows
+    are packed into several bytes."""
+    binary_matrix = np.random.default_rng(1234).integers(0, 2, size=shape)
+    rref_bin_mat = _reduced_row_echelon(binary_matrix)
+
+    nonzero_rows = rref_bin_mat[rref_bin_mat.any(axis=1)]
+    pivots = nonzero_rows.argmax(axis=1)
+
+    # the nonzero rows are on top, their pivots increase and are the only nonzero column entries
+    assert not rref_bin_mat[len(nonzero_rows) :].any()
+    assert np.all(np.diff(pivots) > 0)
+    assert np.array_equal(rref_bin_mat[: len(pivots), pivots], np.eye(len(pivots)))
+
+    # the row space is unchanged, which is checked with the kernel of the reduced matrix
+    nullspace = _kernel(nonzero_rows)
+    assert len(nullspace) + len(pivots) == shape[1]
+    assert not (binary_matrix @ nullspace.T % 2).any()
+
+
 @pytest.mark.parametrize(
     ("binary_matrix", "result"),
     [
@@ -394,6 +421,76 @@ def test_transform_hamiltonian(symbols, geometry, generator, paulixops, paulix_s
         assert term[1].compare(ham_ref.terms()[1][i])
 
 
+@pytest.mark.parametrize("wires", [[0, 3, 1, 2], ["a", "d", 1, 0.5]])
+def test_taper_wire_order(wires):
+    r"""Test that the tapered wires are the wires of the Hamiltonian, in their order, when the
+    generators act on other wires."""
+    h = qml.Hamiltonian([2.0, 1.0], [qml.PauliZ(wires[0]), qml.PauliX(wires[1])])
+    generators = [qml.Hamiltonian([1.0], [qml.PauliZ(wires[2]) @ qml.PauliZ(wires[3])])]
+    paulixops = [qml.PauliX(wires[2])]
+
+    ham_calc = qml.taper(h, generators, paulixops, [1])
+    ham_ref = qml.Hamiltonian([2.0, 1.0], [qml.PauliZ(0), qml.PauliX(1)])
+
+    assert ham_calc.compare(ham_ref)
+
+
+@pytest.mark.parametrize(
+    ("generators", "paulixops"),
+    [
+        (
+            [
+                qml.Hamiltonian([1.0], [qml.PauliZ(0) @ qml.PauliZ(1)]),
+                qml.Hamiltonian([-1.0], [qml.PauliZ(0) @ qml.PauliZ(2)]),
+            ],
+            [qml.PauliX(1), qml.PauliX(2)],
+        ),
+        (
+            [qml.Hamiltonian([1.0], [qml.PauliX(0) @ qml.PauliY(1) @ qml.PauliZ(2)])],
+            [qml.PauliX(2)],
+        ),
+    ],
+)
+def test_clifford_conjugate(generators, paulixops):
+    r"""Test that the Clifford transformation of all Pauli words computed with their bitmasks
+    agrees with the transformation :math:`U P U` computed with the matrix of the Clifford
+    operator."""
+    wire_map = {0: 0, 1: 1, 2: 2}
+    words = [
+        qml.grouping.string_to_pauli_word("".join(s), wire_map=wire_map)
+        for s in itertools.product("IXYZ", repeat=3)
+    ]
+
+    x, z = pauli_word_masks(words, wire_map)
+    phase, sign = np.zeros(len(words), dtype=int), np.ones(len(words))
+    for x_tau, z_tau, c_tau, x_q in _clifford_masks(generators, paulixops, wire_map):
+        x, z, phase, sign = _clifford_conjugate(x, z, phase, sign, x_tau, z_tau, c_tau, x_q)
+
+    u = qml.utils.sparse_hamiltonian(clifford(generators, paulixops), wires=[0, 1, 2]).toarray()
+    for word, x_p, z_p, k, s in zip(words, x, z, phase, sign):
+        p = qml.matrix(word, wire_order=[0, 1, 2])
+        p_conj = qml.matrix(_pauli_word(int(x_p), int(z_p)), wire_order=[0, 1, 2])
+        assert np.allclose(u @ p @ u, s * 1j**k * p_conj)
+
+
+def test_taper_reuses_clifford():
+    r"""Test that tapering several observables with the same generators reuses the bitmasks of the
+    Clifford operators."""
+    generators = [
+        qml.Hamiltonian([1.0], [qml.PauliZ(0) @ qml.PauliZ(1)]),
+        qml.Hamiltonian([1.0], [qml.PauliZ(0) @ qml.PauliZ(2)]),
+        qml.Hamiltonian([1.0], [qml.PauliZ(0) @ qml.PauliZ(3)]),
+    ]
+    paulixops = [qml.PauliX(1), qml.PauliX(2), qml.PauliX(3)]
+
+    _cached_clifford_masks.cache_clear()
+    for observable in [qml.qchem.particle_number(4), qml.qchem.spinz(4)]:
+        qml.taper(observable, generators, paulixops, [1, -1, -1])
+
+    assert _cached_clifford_masks.cache_info().misses == 1
+    assert _cached_clifford_masks.cache_info().hits == 1
+
+
 @pytest.mark.parametrize(
     ("symbols", "geometry", "charge", "generators", "num_electrons", "result"),
     [
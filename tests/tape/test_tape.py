@@ -13,6 +13,8 @@
 # limitations under the License.
 """Unit tests for the QuantumTape"""
 import copy
+import subprocess
+import sys
 from this import d
 import warnings
 from collections import defaultdict
@@ -879,6 +881,108 @@ class TestParameters:
 
         assert np.all(obs.data[0] == H2)
 
+    def test_bind_new_parameters(self, make_tape):
+        """Test that binding new parameters creates a new tape that only copies
+        the operations whose parameters change"""
+        tape, params = make_tape
+        tape.trainable_params = [0, 2, 3]
+
+        new_tape = tape.bind_new_parameters([-0.5, 0.8], [0, 2])
+
+        assert new_tape.get_parameters(trainable_only=False) == [-0.5, 0.123, 0.546, 0.8, 0.76]
+        assert tape.get_parameters(trainable_only=False) == params
+
+        assert new_tape.operations[0] is not tape.operations[0]
+        # both changed parameters belong to the same Rot operation
+        assert new_tape.operations[1] is not tape.operations[1]
+        assert new_tape.operations[2:] == tape.operations[2:]
+        assert new_tape.measurements == tape.measurements
+
+        assert new_tape.trainable_params == tape.trainable_params
+        assert new_tape.wires == tape.wires
+        assert new_tape.output_dim == tape.output_dim
+        assert new_tape.batch_size is None
+
+        # the new tape matches a copy with set parameters
+        copied_tape = tape.copy(copy_operations=True)
+        copied_tape.set_parameters([-0.5, 0.546, 0.8])
+        assert new_tape.hash == copied_tape.hash
+
+    def test_bind_new_parameters_measurement(self):
+        """Test that binding a new observable parameter creates a new measurement"""
+        H = np.array([[1, 0], [0, -1]])
+
+        with QuantumTape() as tape:
+            qml.RX(0.32, wires=0)
+            qml.expval(qml.Hermitian(H, wires=0))
+            qml.expval(qml.PauliZ(1))
+
+        tape.measurements[0].id = "hermitian"
+        H2 = np.array([[0, 1], [1, 1]])
+
+        with QuantumTape() as outer_tape:
+            new_tape = tape.bind_new_parameters([H2], [1])
+
+        # the new measurement is not queued
+        assert outer_tape.measurements == []
+
+        assert new_tape.operations == tape.operations
+        assert new_tape.measurements[1] is tape.measurements[1]
+        assert new_tape.measurements[0] is not tape.measurements[0]
+        assert new_tape.measurements[0].return_type is tape.measurements[0].return_type
+        assert new_tape.measurements[0].id == "hermitian"
+        assert np.all(new_tape.observables[0].data[0] == H2)
+        assert np.all(tape.observables[0].data[0] == H)
+        assert new_tape.get_operation(1)[0] is new_tape.observables[0]
+
+    def test_bind_new_parameters_tensor(self):
+        """Test that binding a new parameter of an observable in a tensor product
+        creates a new tensor product, whose factors and eigenvalues are updated"""
+        A = np.array([[1.0, 0.5], [0.5, -1.0]])
+        B = np.array([[2.0, 0.3], [0.3, 0.1]])
+
+        def make_tape(obs):
+            with QuantumTape() as tape:
+                qml.RX(0.4, wires=0)
+                qml.RY(0.3, wires=1)
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.Hermitian(obs, wires=0) @ qml.PauliZ(1))
+            return tape
+
+        tape = make_tape(A)
+        dev = qml.device("default.qubit", wires=2)
+        dev.batch_execute([tape])
+
+        new_tape = tape.bind_new_parameters([B], [2])
+
+        assert np.all(new_tape.observables[0].data[0] == B)
+        assert np.all(tape.observables[0].data[0] == A)
+        assert new_tape.observables[0].obs[1] is not tape.observables[0].obs[1]
+
+        res, expected, original = dev.batch_execute([new_tape, make_tape(B), make_tape(A)])
+        assert np.allclose(res, expected)
+        assert np.allclose(dev.batch_execute([tape])[0], original)
+
+    def test_bind_new_parameters_batch_size(self):
+        """Test that the batch size is updated if a broadcasted parameter is bound"""
+        with QuantumTape() as tape:
+            qml.RX(0.32, wires=0)
+            qml.RY(0.1, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        new_tape = tape.bind_new_parameters([np.array([0.1, 0.2, 0.3])], [1])
+
+        assert new_tape.batch_size == 3
+        assert new_tape.output_dim == 3
+        assert tape.batch_size is None
+
+    def test_bind_new_parameters_error(self, make_tape):
+        """Test that an error is raised if the numbers of parameters and indices differ"""
+        tape, _ = make_tape
+
+        with pytest.raises(ValueError, match="Number of provided parameters does not match"):
+            tape.bind_new_parameters([0.54, 0.2], [0])
+
 
 class TestInverseAdjoint:
     """Tests for tape inversion"""
@@ -1884,6 +1988,193 @@ class TestHashing:
         assert tape1.hash == tape2.hash
 
 
+def _fingerprint_tape(x, y=0.2):
+    with qml.tape.QuantumTape() as tape:
+        qml.RX(x, wires=[0])
+        qml.CRY(y, wires=[0, 1])
+        qml.CNOT(wires=[0, 1])
+        qml.expval(qml.Hamiltonian([0.1, 0.2], [qml.PauliX(0), qml.PauliZ(0) @ qml.PauliY(1)]))
+
+    return tape
+
+
+class TestFingerprint:
+    """Tests for the process-independent tape fingerprint"""
+
+    def test_identical(self):
+        """Tests that identical tapes have the same fingerprint, independent
+        of the datatype of the parameters"""
+        tape1 = _fingerprint_tape(0.3)
+        tape2 = _fingerprint_tape(np.array(0.3))
+        tape3 = _fingerprint_tape(qml.numpy.array(0.3, requires_grad=True))
+
+        assert tape1.fingerprint == tape2.fingerprint == tape3.fingerprint
+
+    def test_different(self):
+        """Tests that tapes with different parameters, measurements or
+        trainable parameters have different fingerprints"""
+        tape = _fingerprint_tape(0.3)
+        tape.trainable_params = [0]
+
+        with qml.tape.QuantumTape() as tape_var:
+            qml.RX(0.3, wires=[0])
+            qml.CRY(0.2, wires=[0, 1])
+            qml.CNOT(wires=[0, 1])
+            qml.var(qml.PauliZ(0))
+
+        fingerprints = {
+            _fingerprint_tape(0.3).fingerprint,
+            _fingerprint_tape(0.4).fingerprint,
+            _fingerprint_tape(0.3, y=0.5).fingerprint,
+            tape.fingerprint,
+            tape_var.fingerprint,
+        }
+        assert len(fingerprints) == 5
+
+    def test_rounding(self):
+        """Tests that parameters are rounded before computing the fingerprint"""
+        x = 0.3
+        assert _fingerprint_tape(x).fingerprint == _fingerprint_tape(x + 1e-13).fingerprint
+        assert _fingerprint_tape(0.0).fingerprint == _fingerprint_tape(-0.0).fingerprint
+
+    def test_rotation_modulo_identical(self):
+        """Tests that tapes with rotation angles differing by their period have
+        the same fingerprint"""
+        tape1 = _fingerprint_tape(np.pi / 2, y=np.pi / 4)
+        tape2 = _fingerprint_tape(np.pi / 2 - 2 * np.pi, y=np.pi / 4 + 4 * np.pi)
+
+        assert tape1.fingerprint == tape2.fingerprint
+        assert tape1.fingerprint != _fingerprint_tape(np.pi / 2, y=np.pi / 4 + 2 * np.pi)
+
+    def test_set_parameters(self):
+        """Tests that the fingerprint is updated when the parameters of the tape change"""
+        tape = _fingerprint_tape(0.3)
+        fingerprint = tape.fingerprint
+
+        tape.set_parameters([0.4, 0.2, 0.1, 0.2])
+        assert tape.fingerprint == _fingerprint_tape(0.4).fingerprint != fingerprint
+
+        tape.set_parameters([0.3, 0.2, 0.1, 0.2])
+        assert tape.fingerprint == fingerprint
+
+    def test_memoized(self, mocker):
+        """Tests that only the operators whose parameters changed are rehashed"""
+        tape = _fingerprint_tape(0.3)
+        _ = tape.fingerprint
+
+        spy = mocker.spy(qml.operation, "_update_digest")
+        shifted_tape = tape.copy(copy_operations=True)
+        params = shifted_tape.get_parameters()
+        shifted_tape.set_parameters([0.4] + params[1:])
+        _ = shifted_tape.fingerprint
+
+        # the hyperparameters and the data of the shifted RX gate
+        assert spy.call_count == 2
+        assert shifted_tape.fingerprint == _fingerprint_tape(0.4).fingerprint
+
+    def test_in_place_parameter_change(self):
+        """Tests that the memoized fingerprint is invalidated when an array
+        parameter is modified in place"""
+        A = np.diag([1.0, -1.0])
+
+        with QuantumTape() as tape:
+            qml.RX(0.3, wires=0)
+            qml.expval(qml.Hermitian(A, wires=0))
+
+        fingerprint = tape.fingerprint
+        A[0, 0] = 2.0
+
+        assert tape.fingerprint != fingerprint
+
+        with QuantumTape() as expected:
+            qml.RX(0.3, wires=0)
+            qml.expval(qml.Hermitian(np.diag([2.0, -1.0]), wires=0))
+
+        assert tape.fingerprint == expected.fingerprint
+
+    def test_hyperparameters_hashed_by_value(self):
+        """Tests that hyperparameters that are dictionaries containing large arrays,
+        or functions, are hashed by their value"""
+
+        class DummyOp(qml.operation.Operation):
+            num_wires = 1
+
+            def __init__(self, config, wires):
+                self._hyperparameters = {"config": config}
+                super().__init__(wires=wires)
+
+        def make_function():
+            def f():
+                pass
+
+            return f
+
+        def g():
+            pass
+
+        x = np.zeros(2000)
+        y = np.zeros(2000)
+        y[1000] = 1.0
+
+        assert str({"x": x}) == str({"x": y})
+        assert DummyOp({"x": x}, wires=0).fingerprint != DummyOp({"x": y}, wires=0).fingerprint
+        assert (
+            DummyOp({"x": x}, wires=0).fingerprint == DummyOp({"x": x.copy()}, wires=0).fingerprint
+        )
+
+        # the string representations of the functions contain their memory address
+        f1, f2 = make_function(), make_function()
+        assert str(f1) != str(f2)
+        assert DummyOp(f1, wires=0).fingerprint == DummyOp(f2, wires=0).fingerprint
+        assert DummyOp(f1, wires=0).fingerprint != DummyOp(g, wires=0).fingerprint
+
+    @pytest.mark.jax
+    def test_abstract_parameters(self):
+        """Tests that tapes with distinct abstract parameters have distinct fingerprints,
+        such that cached executions of jitted tapes are not shared"""
+        import jax
+
+        dev = qml.device("default.qubit.jax", wires=1)
+
+        def make_tape(x):
+            with QuantumTape() as tape:
+                qml.RX(x, wires=0)
+                qml.expval(qml.PauliZ(0))
+            return tape
+
+        @jax.jit
+        def fingerprints_differ(x, y):
+            return make_tape(x).fingerprint != make_tape(y).fingerprint
+
+        assert fingerprints_differ(0.1, 0.2)
+
+        @jax.jit
+        def cost(x, y):
+            tapes = [make_tape(x), make_tape(y)]
+            res = qml.execute(tapes, dev, gradient_fn="backprop", interface="jax", cache=True)
+            return jax.numpy.stack([r[0] for r in res])
+
+        assert np.allclose(cost(0.1, 0.2), np.cos([0.1, 0.2]))
+
+    def test_process_independent(self):
+        """Tests that the fingerprint of a tape is identical in a different Python process"""
+        code = (
+            "import pennylane as qml\n"
+            "with qml.tape.QuantumTape() as tape:\n"
+            "    qml.RX(0.3, wires=[0])\n"
+            "    qml.CRY(0.2, wires=[0, 1])\n"
+            "    qml.CNOT(wires=[0, 1])\n"
+            "    H = qml.Hamiltonian([0.1, 0.2], [qml.PauliX(0), qml.PauliZ(0) @ qml.PauliY(1)])\n"
+            "    qml.expval(H)\n"
+            "print(tape.fingerprint)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert out.strip() == _fingerprint_tape(0.3).fingerprint
+
+
 def cost(tape, dev):
     return qml.execute([tape], dev, interface="autograd", gradient_fn=qml.gradients.param_shift)
 
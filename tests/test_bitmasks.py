@@ -0,0 +1,163 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the bitmask representation of Pauli words in ``bitmasks.py``.
+"""
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane import Identity, PauliX, PauliY, PauliZ
+from pennylane.bitmasks import (
+    jordan_wigner_words,
+    merge_words,
+    pack_rows,
+    parity,
+    pauli_word_masks,
+    pauli_word_symbols,
+    popcount,
+)
+
+
+class TestPauliWordMasks:
+    """Tests for the encoding and decoding of Pauli words as bitmasks."""
+
+    def test_pauli_word_masks(self):
+        """Tests the bitmask encoding of Pauli words"""
+        wire_map = {"a": 0, "b": 1, "c": 2}
+        ops = [PauliX("a") @ PauliY("c"), PauliZ("b") @ PauliY("a"), Identity("c")]
+
+        x, z = pauli_word_masks(ops, wire_map)
+
+        assert x.dtype == np.uint64
+        assert np.all(x == [0b101, 0b001, 0])
+        assert np.all(z == [0b100, 0b011, 0])
+
+    def test_pauli_word_masks_reversed_wire_map(self):
+        """Tests the bitmask encoding of Pauli words with the first wire corresponding to the most
+        significant bit, as used for the computational basis states of a device"""
+        wire_map = {"a": 2, "b": 1, "c": 0}
+        ops = [PauliX("a") @ PauliY("c"), PauliZ("b") @ PauliY("a"), Identity("c")]
+
+        x, z = pauli_word_masks(ops, wire_map)
+
+        assert np.all(x == [0b101, 0b100, 0])
+        assert np.all(z == [0b001, 0b110, 0])
+        assert np.all(popcount(x & z) == [1, 1, 0])
+
+    def test_pauli_word_masks_large_wire_map(self):
+        """Tests that Pauli words acting on more than 63 wires are encoded as Python integers"""
+        x, z = pauli_word_masks([PauliX(70) @ PauliZ(0)], {w: w for w in range(71)})
+
+        assert x.dtype == object
+        assert x.tolist() == [2**70]
+        assert z.tolist() == [1]
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.Hadamard(0),
+            qml.Hermitian(np.eye(4), wires=[0, 1]),
+            PauliX(0) @ PauliZ(0),
+            PauliZ(2),
+        ],
+    )
+    def test_pauli_word_masks_unsupported(self, op):
+        """Tests that observables which are not Pauli words acting on distinct wires of the wire
+        map cannot be encoded as bitmasks"""
+        assert pauli_word_masks([PauliX(1), op], {0: 0, 1: 1}) is None
+
+    @pytest.mark.parametrize(
+        ("x", "z", "word"),
+        [
+            (0, 0, []),
+            (0, 4, [(2, "Z")]),
+            (3, 6, [(0, "X"), (1, "Y"), (2, "Z")]),
+            (2**70, 0, [(70, "X")]),
+        ],
+    )
+    def test_pauli_word_symbols(self, x, z, word):
+        """Tests that pauli_word_symbols returns the Pauli word encoded by the bitmasks"""
+        assert pauli_word_symbols(x, z) == word
+
+
+class TestBitCounting:
+    """Tests for the functions counting the set bits of bitmasks."""
+
+    masks = [0, 1, 2**63 + 5, 2**64 - 1, 0x5555555555555555]
+
+    @pytest.mark.parametrize("dtype", [np.uint64, object])
+    def test_popcount(self, dtype):
+        """Tests that popcount counts the set bits of each bitmask"""
+        res = popcount(np.array(self.masks, dtype=dtype))
+        assert res.tolist() == [bin(m).count("1") for m in self.masks]
+
+    @pytest.mark.parametrize("dtype", [np.uint64, object])
+    def test_parity(self, dtype):
+        """Tests that parity returns the parity of the number of set bits of each bitmask"""
+        res = parity(np.array([self.masks, self.masks[::-1]], dtype=dtype))
+
+        assert res.shape == (2, len(self.masks))
+        assert res[0].tolist() == [bin(m).count("1") % 2 == 1 for m in self.masks]
+
+    def test_pack_rows(self):
+        """Tests that pack_rows packs each row of a binary matrix into 64-bit integers"""
+        matrix = np.zeros((2, 70), dtype=bool)
+        matrix[0, [0, 65]] = True
+        matrix[1, 63] = True
+
+        packed = pack_rows(matrix)
+
+        assert packed.shape == (2, 2)
+        assert np.all(popcount(packed).sum(axis=1) == [2, 1])
+
+
+class TestJordanWignerWords:
+    """Tests for the bitmask representation of the Jordan-Wigner mapping."""
+
+    @pytest.mark.parametrize(
+        ("f_obs", "x_ref", "z_ref", "c_ref"),
+        [
+            (
+                [[0], [2]],
+                # a_0^dagger = (X_0 - iY_0) / 2 and a_2^dagger = Z_0 Z_1 (X_2 - iY_2) / 2
+                [[1, 1], [4, 4]],
+                [[0, 1], [3, 7]],
+                [[0.5, -0.5j], [0.5, -0.5j]],
+            ),
+            (
+                [[1, 0]],
+                # a_1^dagger a_0 = (i Y_0 X_1 + X_0 X_1 + Y_0 Y_1 - i X_0 Y_1) / 4
+                [[3, 3, 3, 3]],
+                [[1, 0, 3, 2]],
+                [[0.25j, 0.25, 0.25, -0.25j]],
+            ),
+        ],
+    )
+    def test_jordan_wigner_words(self, f_obs, x_ref, z_ref, c_ref):
+        r"""Test that jordan_wigner_words returns the correct Pauli words in the bitmask
+        representation."""
+        x, z, c = jordan_wigner_words(f_obs)
+
+        assert np.all(x == x_ref)
+        assert np.all(z == z_ref)
+        assert np.allclose(c, c_ref)
+
+    def test_jordan_wigner_words_large_index(self):
+        r"""Test that jordan_wigner_words supports operators acting on more than 64 qubits."""
+        x, z, c = jordan_wigner_words([[70, 70]])
+        words, c = merge_words(x[0], z[0], c[0])
+
+        assert words == [(0, 0), (0, 2**70)]
+        assert np.allclose(c, [0.5, -0.5])
@@ -14,8 +14,10 @@
 """
 Unit tests for the :mod:`pennylane` :class:`QubitDevice` class.
 """
+import copy
 import pytest
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from random import random
 
 import pennylane as qml
@@ -891,6 +893,308 @@ class TestBatchExecution:
         assert np.allclose(res[0], dev.execute(empty_tape), rtol=tol, atol=0)
 
 
+class TestParallelBatchExecution:
+    """Tests for the parallel execution of batches in the batch_execute method."""
+
+    @staticmethod
+    def _tapes(n_tapes):
+        tapes = []
+        for x in np.linspace(0, np.pi, n_tapes):
+            with qml.tape.QuantumTape() as tape:
+                qml.RX(x, wires=0)
+                qml.CNOT(wires=[0, 1])
+                qml.RY(2 * x, wires=1)
+                qml.expval(qml.PauliZ(wires=0)), qml.expval(qml.PauliZ(wires=1))
+            tapes.append(tape)
+
+        return tapes
+
+    def test_invalid_max_workers(self):
+        """Tests that an error is raised if the number of workers is not positive."""
+        with pytest.raises(DeviceError, match="number of workers must be a positive integer"):
+            qml.device("default.qubit", wires=2, max_workers=0)
+
+    def test_invalid_batch_executor(self):
+        """Tests that an error is raised for an unknown batch executor."""
+        with pytest.raises(DeviceError, match="Unknown batch executor"):
+            qml.device("default.qubit", wires=2, max_workers=2, batch_executor="cluster")
+
+    @pytest.mark.parametrize("n_tapes", [2, 5, 8])
+    @pytest.mark.parametrize("max_workers", [1, 3, 4])
+    def test_thread_pool_result(self, n_tapes, max_workers, tol):
+        """Tests that the results of a parallel batch match those of a sequential
+        batch and are returned in the order the tapes were submitted."""
+        tapes = self._tapes(n_tapes)
+
+        dev = qml.device("default.qubit", wires=2)
+        dev_parallel = qml.device("default.qubit", wires=2, max_workers=max_workers)
+
+        expected = dev.batch_execute(tapes)
+        res = dev_parallel.batch_execute(tapes)
+
+        assert len(res) == n_tapes
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_process_pool_result(self, tol):
+        """Tests that a batch can be distributed over a process pool."""
+        tapes = self._tapes(4)
+
+        dev = qml.device("default.qubit", wires=2)
+        dev_parallel = qml.device("default.qubit", wires=2, max_workers=2, batch_executor="process")
+
+        res = dev_parallel.batch_execute(tapes)
+
+        assert np.allclose(res, dev.batch_execute(tapes), atol=tol, rtol=0)
+
+    def test_user_executor(self, mocker, tol):
+        """Tests that a user-provided executor is used and not shut down by the device."""
+        tapes = self._tapes(3)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            spy = mocker.spy(executor, "map")
+            dev = qml.device("default.qubit", wires=2, max_workers=3, batch_executor=executor)
+
+            res = dev.batch_execute(tapes)
+            res_again = dev.batch_execute(tapes)
+
+        expected = qml.device("default.qubit", wires=2).batch_execute(tapes)
+
+        assert spy.call_count == 2
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert np.allclose(res_again, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("batch_executor", ["thread", "process"])
+    def test_pool_reused(self, batch_executor, mocker, tol):
+        """Tests that the pool created by the device is reused by the following batches,
+        and that it is not copied along with the device."""
+        tapes = self._tapes(4)
+        dev = qml.device("default.qubit", wires=2, max_workers=2, batch_executor=batch_executor)
+
+        res = dev.batch_execute(tapes)
+        executor = dev._executor
+        spy = mocker.spy(executor, "map")
+        res_again = dev.batch_execute(tapes)
+
+        assert dev._executor is executor
+        assert spy.call_count == 1
+        assert np.allclose(res_again, res, atol=tol, rtol=0)
+        assert copy.deepcopy(dev)._executor is None
+
+    def test_workers_use_device_clones(self, mocker):
+        """Tests that the circuits are executed on copies of the device."""
+        dev = qml.device("default.qubit", wires=2, max_workers=2)
+        spy = mocker.spy(QubitDevice, "execute")
+
+        dev.batch_execute(self._tapes(4))
+
+        assert spy.call_count == 4
+        assert all(call.args[0] is not dev for call in spy.call_args_list)
+
+    @pytest.mark.parametrize("batch_executor", ["thread", "process"])
+    def test_final_state_copied_back(self, batch_executor, tol):
+        """Tests that the device is left in the state of the last circuit of the batch,
+        as it is after a sequential batch."""
+        tapes = self._tapes(5)
+
+        dev = qml.device("default.qubit", wires=2, shots=10)
+        dev_parallel = qml.device(
+            "default.qubit", wires=2, shots=10, max_workers=2, batch_executor=batch_executor
+        )
+
+        dev.batch_execute(tapes)
+        dev_parallel.batch_execute(tapes)
+
+        assert np.allclose(dev_parallel.state, dev.state, atol=tol, rtol=0)
+        assert np.allclose(dev_parallel._pre_rotated_state, dev._pre_rotated_state, atol=tol)
+        assert dev_parallel._samples.shape == (10, 2)
+
+        # the last tape prepares a computational basis state
+        assert np.all(dev_parallel._samples == dev._samples)
+
+    def test_executions_tracked(self):
+        """Tests that the executions carried out by the workers are recorded
+        by the device and its tracker."""
+        dev = qml.device("default.qubit", wires=2, max_workers=2)
+
+        with qml.Tracker(dev) as tracker:
+            dev.batch_execute(self._tapes(5))
+
+        assert dev.num_executions == 5
+        assert tracker.totals == {"executions": 5, "batches": 1, "batch_len": 5}
+        assert dev.tracker is tracker
+
+
+class TestPackedSamples:
+    """Tests for storing samples as one integer per shot."""
+
+    @staticmethod
+    def _devices(packed, num_wires=3):
+        """Returns a device holding the given packed samples and a device
+        holding the same samples in binary representation."""
+        dev_packed = qml.device("default.qubit", wires=num_wires, shots=len(packed))
+        dev_packed._packed_samples = packed
+
+        dev_binary = qml.device("default.qubit", wires=num_wires, shots=len(packed))
+        dev_binary._samples = QubitDevice.states_to_binary(packed, num_wires)
+
+        return dev_packed, dev_binary
+
+    def test_invalid_sampling_workers(self):
+        """Tests that an error is raised if the number of sampling workers is not positive."""
+        with pytest.raises(DeviceError, match="number of sampling workers must be a positive"):
+            qml.device("default.qubit", wires=2, packed_samples=True, sampling_workers=0)
+
+    def test_no_shots(self):
+        """Tests that an error is raised if packed samples are generated without shots."""
+        dev = qml.device("default.qubit", wires=2, packed_samples=True)
+
+        with pytest.raises(QuantumFunctionError, match="number of shots has to be explicitly set"):
+            dev.generate_packed_samples()
+
+    @pytest.mark.parametrize("sampling_workers", [None, 1, 3])
+    def test_samples_independent_of_workers(self, sampling_workers, monkeypatch):
+        """Tests that the packed samples only depend on the global random state,
+        and not on the number of workers drawing them."""
+        monkeypatch.setattr(QubitDevice, "_sample_chunk_size", 7)
+
+        dev = qml.device("default.qubit", wires=2, shots=100)
+        dev_packed = qml.device(
+            "default.qubit",
+            wires=2,
+            shots=100,
+            packed_samples=True,
+            sampling_workers=sampling_workers,
+        )
+
+        for d in (dev, dev_packed):
+            d.apply([qml.Hadamard(0), qml.RY(0.4, wires=1)])
+
+        np.random.seed(42)
+        expected = QubitDevice.generate_packed_samples(dev)
+        np.random.seed(42)
+        res = dev_packed.generate_packed_samples()
+
+        assert res.shape == (100,)
+        assert np.array_equal(res, expected)
+
+    def test_sample_distribution(self):
+        """Tests that the packed samples follow the probability distribution of the state."""
+        dev = qml.device("default.qubit", wires=3, shots=100000, packed_samples=True)
+        dev.apply([qml.RX(0.6, wires=0), qml.CNOT(wires=[0, 2]), qml.Hadamard(1)])
+
+        samples = dev.generate_packed_samples()
+        prob = np.bincount(samples, minlength=8) / dev.shots
+
+        assert np.allclose(prob, dev.analytic_probability(), atol=0.01, rtol=0)
+        assert np.all(prob[dev.analytic_probability() == 0] == 0)
+
+    def test_binary_samples_created_on_demand(self):
+        """Tests that the binary representation of packed samples is only created when
+        the samples are accessed, and that setting binary samples discards packed ones."""
+        packed = np.array([0, 5, 3, 7, 5])
+        dev, _ = self._devices(packed)
+
+        assert dev._binary_samples is None
+        assert np.array_equal(dev._samples, QubitDevice.states_to_binary(packed, 3))
+
+        dev._samples = None
+        assert dev._packed_samples is None
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            qml.PauliZ(1),
+            qml.PauliX(0) @ qml.PauliZ(2),
+            qml.PauliY(2) @ qml.PauliX(0) @ qml.Hadamard(1),
+            qml.Hermitian(np.diag([1.0, 2.0, 3.0, 4.0]), wires=[2, 0]),
+            qml.Identity(1) @ qml.PauliZ(0),
+        ],
+    )
+    def test_statistics_match_binary_samples(self, obs, tol):
+        """Tests that statistics computed from packed samples equal those computed
+        from the same samples in binary representation, without creating the binary samples."""
+        packed = np.random.randint(8, size=40)
+        dev_packed, dev_binary = self._devices(packed)
+
+        assert np.allclose(dev_packed.sample(obs), dev_binary.sample(obs), atol=tol, rtol=0)
+        assert np.allclose(dev_packed.expval(obs), dev_binary.expval(obs), atol=tol, rtol=0)
+        assert np.allclose(
+            dev_packed.var(obs, shot_range=[10, 30], bin_size=10),
+            dev_binary.var(obs, shot_range=[10, 30], bin_size=10),
+            atol=tol,
+            rtol=0,
+        )
+        assert dev_packed.sample(obs, counts=True) == dev_binary.sample(obs, counts=True)
+        assert dev_packed._binary_samples is None
+
+    @pytest.mark.parametrize("wires", [[0, 1, 2], [2, 0], [1]])
+    def test_probability_and_counts_match_binary_samples(self, wires, tol):
+        """Tests that probabilities and counts computed from packed samples equal those
+        computed from the same samples in binary representation."""
+        packed = np.random.randint(8, size=40)
+        dev_packed, dev_binary = self._devices(packed)
+
+        assert np.allclose(
+            dev_packed.estimate_probability(wires=wires),
+            dev_binary.estimate_probability(wires=wires),
+            atol=tol,
+            rtol=0,
+        )
+        assert np.allclose(
+            dev_packed.estimate_probability(wires=wires, bin_size=8),
+            dev_binary.estimate_probability(wires=wires, bin_size=8),
+            atol=tol,
+            rtol=0,
+        )
+
+        measurement = qml.sample(wires=wires)
+        assert dev_packed.sample(measurement, counts=True) == dev_binary.sample(
+            measurement, counts=True
+        )
+        assert dev_packed._binary_samples is None
+
+    def test_counts_all_wires(self):
+        """Tests the counts of packed samples if no wires are provided."""
+        dev, _ = self._devices(np.array([0, 5, 3, 5, 5, 0]))
+
+        res = dev.sample(qml.sample(), counts=True)
+        assert res == {"000": 2, "011": 1, "101": 3}
+
+        res = dev.sample(qml.sample(), bin_size=3, counts=True)
+        assert res == [{"000": 1, "011": 1, "101": 1}, {"000": 1, "101": 2}]
+
+    def test_qnode_execution(self, tol):
+        """Tests that a QNode executed on a device with packed samples returns
+        the same results as on a device with binary samples."""
+
+        def circuit():
+            qml.RX(0.5, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(0.3, wires=2)
+            return (
+                qml.expval(qml.PauliZ(0) @ qml.PauliX(2)),
+                qml.probs(wires=[2, 1]),
+                qml.var(qml.PauliY(1)),
+            )
+
+        dev = qml.device("default.qubit", wires=3, shots=1000)
+        dev_packed = qml.device(
+            "default.qubit", wires=3, shots=1000, packed_samples=True, sampling_workers=2
+        )
+
+        np.random.seed(7)
+        res = qml.QNode(circuit, dev_packed)()
+
+        np.random.seed(7)
+        dev.generate_samples = lambda: QubitDevice.states_to_binary(
+            QubitDevice.generate_packed_samples(dev), 3
+        )
+        expected = qml.QNode(circuit, dev)()
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert dev_packed._binary_samples is None
+
+
 class TestShotList:
     """Tests for passing shots as a list"""
 
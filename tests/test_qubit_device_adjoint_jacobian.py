@@ -296,6 +296,158 @@ class TestAdjointJacobian:
         ):
             res = dev.adjoint_jacobian(tape)
 
+    def test_invalid_obs_batch_size(self, dev):
+        """Test that an error is raised if the observable batch size is not positive."""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.1, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="observable batch size must be a positive integer"):
+            dev.adjoint_jacobian(tape, obs_batch_size=0)
+
+    @pytest.mark.parametrize("obs_batch_size", [1, 2, 3, 5])
+    def test_obs_batch_size(self, obs_batch_size, tol, mocker):
+        """Test that processing the observables in batches gives the same Jacobian,
+        while the derivatives of the operations are computed only once."""
+        dev = qml.device("default.qubit", wires=3)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.Rot(0.1, -0.3, 0.7, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(-0.2, wires=2)
+            qml.CRX(0.9, wires=[1, 2])
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliX(1) @ qml.PauliY(2))
+            qml.expval(qml.Hermitian(np.diag([1.0, 2.0]), wires=2))
+            qml.expval(qml.PauliY(0) @ qml.PauliZ(1))
+
+        tape.trainable_params = {0, 1, 3, 5}
+        expected = dev.adjoint_jacobian(tape)
+
+        spy = mocker.spy(qml._qubit_device, "operation_derivative")
+        res = dev.adjoint_jacobian(tape, obs_batch_size=obs_batch_size)
+
+        assert res.shape == (4, 4)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == len(tape.trainable_params)
+
+    def test_hamiltonian_gradient(self, tol):
+        """Test that the gradient of a Hamiltonian expectation value is the
+        weighted sum of the gradients of its terms."""
+        dev = qml.device("default.qubit", wires=3)
+
+        coeffs = [0.3, -1.2, 0.5]
+        terms = [qml.PauliZ(0) @ qml.PauliZ(2), qml.PauliX(1), qml.Identity(0)]
+
+        def ansatz():
+            qml.RX(0.4, wires=0)
+            qml.RY(-0.8, wires=1)
+            qml.CNOT(wires=[0, 2])
+            qml.RZ(1.1, wires=2)
+            qml.RY(0.5, wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            ansatz()
+            qml.expval(qml.Hamiltonian(coeffs, terms))
+            qml.expval(qml.PauliZ(1))
+
+        tape.trainable_params = {0, 1, 2, 3}
+
+        with qml.tape.QuantumTape() as tape_terms:
+            ansatz()
+            for term in terms:
+                qml.expval(term)
+
+        res = dev.adjoint_jacobian(tape, obs_batch_size=1)
+        jac_terms = dev.adjoint_jacobian(tape_terms)
+
+        assert res.shape == (2, 4)
+        assert np.allclose(res[0], np.array(coeffs) @ jac_terms, atol=tol, rtol=0)
+
+    def test_hamiltonian_trainable_coefficients(self):
+        """Test that an error is raised if the coefficients of a Hamiltonian are trainable."""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.expval(qml.Hamiltonian([0.3, -1.2], [qml.PauliZ(0), qml.PauliX(1)]))
+
+        tape.trainable_params = {0, 2}
+        msg = "does not support Hamiltonian observables with trainable coefficients"
+
+        with pytest.raises(qml.QuantumFunctionError, match=msg):
+            dev.adjoint_jacobian(tape)
+
+        with pytest.raises(qml.QuantumFunctionError, match=msg):
+            dev.adjoint_vjp(tape, np.array([1.0]))
+
+
+class TestAdjointVJP:
+    """Tests for the adjoint_vjp and execute_and_vjp methods"""
+
+    @staticmethod
+    def _tape(x, y):
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=0)
+            qml.Rot(0.1, y, 0.7, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(-0.2, wires=2)
+            qml.CRX(0.9, wires=[1, 2])
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliX(1) @ qml.PauliY(2))
+            qml.expval(qml.Hermitian(np.diag([1.0, 2.0]), wires=2))
+            qml.expval(qml.Hamiltonian([0.3, -1.2], [qml.PauliY(0), qml.PauliZ(1)]))
+
+        tape.trainable_params = {0, 2, 4, 5}
+        return tape
+
+    def test_adjoint_vjp(self, tol, mocker):
+        """Test that the VJP is the output gradient contracted with the Jacobian,
+        computed with a single backward sweep of a single bra"""
+        dev = qml.device("default.qubit", wires=3)
+        tape = self._tape(0.4, -0.3)
+        dy = np.array([1.0, -0.5, 0.0, 2.0])
+
+        expected = dy @ dev.adjoint_jacobian(tape)
+
+        spy = mocker.spy(dev, "_adjoint_sweep")
+        res = dev.adjoint_vjp(tape, dy)
+
+        assert res.shape == (4,)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 1
+        assert len(spy.call_args[0][1]) == 1
+
+    def test_zero_dy(self):
+        """Test that a zero output gradient returns a zero VJP without execution"""
+        dev = qml.device("default.qubit", wires=3)
+        tape = self._tape(0.4, -0.3)
+
+        res = dev.adjoint_vjp(tape, np.zeros(4))
+
+        assert np.allclose(res, np.zeros(4))
+        assert dev.num_executions == 0
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_execute_and_vjp(self, max_workers, tol):
+        """Test that execute_and_vjp returns the results of the tapes, and VJP functions
+        that use the final state of the corresponding forward pass"""
+        dev = qml.device("default.qubit", wires=3, max_workers=max_workers)
+        tapes = [self._tape(0.4, -0.3), self._tape(-1.2, 0.8)]
+        dys = [np.array([1.0, -0.5, 0.0, 2.0]), np.array([0.0, 1.0, 1.0, -1.0])]
+
+        expected_res = dev.batch_execute(tapes)
+        expected_vjps = [dy @ dev.adjoint_jacobian(t) for t, dy in zip(tapes, dys)]
+
+        dev._num_executions = 0
+        res, vjp_fns = dev.execute_and_vjp(tapes)
+        vjps = [vjp_fn(dy) for vjp_fn, dy in zip(vjp_fns, dys)]
+
+        assert np.allclose(res, expected_res, atol=tol, rtol=0)
+        assert np.allclose(vjps, expected_vjps, atol=tol, rtol=0)
+        assert dev.num_executions == 2
+
 
 class TestAdjointJacobianQNode:
     """Test QNode integration with the adjoint_jacobian method"""
@@ -270,6 +270,45 @@ class TestSparse:
 
         assert np.allclose(sparse_matrix.toarray(), ref_matrix)
 
+    @pytest.mark.parametrize("wires", [None, [2, 0, 3, 1], [1, 3, 4, 0, 2]])
+    def test_pauli_words_match_tensor_products(self, wires):
+        """Tests that the sparse matrix of a Hamiltonian consisting of Pauli words matches
+        the sum of the matrices of its terms"""
+        coeffs = [0.5, -0.2, 1.3, 0.7, -1.1]
+        obs = [
+            PauliX(0) @ PauliY(1) @ PauliZ(3),
+            PauliY(2),
+            Identity(0) @ PauliZ(1),
+            PauliY(3) @ PauliY(0) @ PauliX(2),
+            PauliX(1) @ PauliY(2) @ Identity(3),
+        ]
+        H = qml.Hamiltonian(coeffs, obs)
+        wire_order = H.wires if wires is None else qml.wires.Wires(wires)
+
+        expected = sum(c * Tensor(o).sparse_matrix(wires=wire_order) for c, o in zip(coeffs, obs))
+        res = qml.utils.sparse_hamiltonian(H, wires=wires)
+
+        assert np.allclose(res.toarray(), expected.toarray())
+
+    def test_non_pauli_observables(self):
+        """Tests that Hamiltonians with single-qubit observables that are not Pauli
+        operators are supported"""
+        H = qml.Hamiltonian([0.3, 0.4], [qml.Hadamard(0) @ PauliZ(1), PauliX(1)])
+        expected = 0.3 * np.kron(qml.Hadamard(0).matrix(), np.diag([1, -1])) + 0.4 * np.kron(
+            np.eye(2), PauliX(0).matrix()
+        )
+
+        res = qml.utils.sparse_hamiltonian(H)
+        assert np.allclose(res.toarray(), expected)
+
+    def test_cancelling_terms(self):
+        """Tests that elements of Pauli words that cancel are not stored"""
+        H = qml.Hamiltonian([0.5, 0.5, -1.0], [PauliX(0), PauliX(0), PauliX(0) @ Identity(1)])
+        res = qml.utils.sparse_hamiltonian(H)
+
+        assert res.nnz == 0
+        assert res.shape == (4, 4)
+
     def test_sparse_format(self):
         """Tests that sparse_hamiltonian returns a scipy.sparse.csr_matrix object"""
 